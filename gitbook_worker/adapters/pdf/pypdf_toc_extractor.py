@@ -45,7 +45,11 @@ class PyPdfTocExtractor(PdfTocExtractorPort):
         if self._PdfReader is None:
             raise RuntimeError("pypdf is not available")
 
-        reader = self._PdfReader(str(pdf_file))
+        return self.extract_from_reader(self._PdfReader(str(pdf_file)))
+
+    def extract_from_reader(self, reader) -> list[PdfTocEntry]:
+        """Flatten the outline of an already opened ``PdfReader``."""
+
         outline = getattr(reader, "outline", None) or getattr(reader, "outlines", None)
         if not outline:
             return []
@@ -28,12 +28,15 @@ class SvglibSvgToPdfConverter(SvgToPdfConverterPort):
             raise RuntimeError("svglib/reportlab are not available")
 
         # svglib can be sensitive to working directory and relative paths.
+        # The target may live in another directory (e.g. the SVG-PDF cache),
+        # so it is resolved before switching into the SVG's folder.
+        target = pdf_file.resolve()
         old_cwd = os.getcwd()
         try:
             os.chdir(svg_file.parent)
             drawing = self._svg2rlg(str(svg_file.name))
             if not drawing:
                 raise ValueError("svglib could not parse SVG")
-            self._renderPDF.drawToFile(drawing, str(pdf_file.name))
+            self._renderPDF.drawToFile(drawing, str(target))
         finally:
             os.chdir(old_cwd)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import logging
+import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, Tuple, Union
 
 from gitbook_worker.core.ports.svg_to_pdf import SvgToPdfConverterPort
 
+SVG_JOBS_ENV = "GITBOOK_WORKER_SVG_JOBS"
+
 
 @dataclass(frozen=True)
 class SvgToPdfResult:
@@ -14,6 +18,21 @@ class SvgToPdfResult:
     used_converter: str | None
 
 
+@dataclass(frozen=True)
+class SvgToPdfBatchResult:
+    """Outcome of one file of :func:`ensure_svg_pdfs`."""
+
+    svg_file: Path
+    pdf_file: Path
+    converted: bool
+    used_converter: str | None
+    seconds: float
+    error: str | None = None
+
+
+SvgToPdfJob = Union[Path, Tuple[Path, Union[Path, None]]]
+
+
 def default_svg_to_pdf_converters() -> list[SvgToPdfConverterPort]:
     """Return available SVG->PDF converter adapters.
 
@@ -57,6 +76,14 @@ def _order_converters(
     return ordered
 
 
+def _pdf_is_current(svg_file: Path, pdf_file: Path) -> bool:
+    try:
+        return pdf_file.stat().st_mtime >= svg_file.stat().st_mtime
+    except OSError:
+        # Missing PDF, or best-effort: if stat fails, try conversion.
+        return False
+
+
 def ensure_svg_pdf(
     svg_file: Path,
     *,
@@ -82,13 +109,8 @@ def ensure_svg_pdf(
     resolved_svg = svg_file.resolve()
     target_pdf = (pdf_file or resolved_svg.with_suffix(".pdf")).resolve()
 
-    try:
-        if target_pdf.exists():
-            if target_pdf.stat().st_mtime >= resolved_svg.stat().st_mtime:
-                return SvgToPdfResult(converted=True, used_converter=None)
-    except OSError:
-        # Best-effort: if stat fails, try conversion.
-        pass
+    if _pdf_is_current(resolved_svg, target_pdf):
+        return SvgToPdfResult(converted=True, used_converter=None)
 
     target_pdf.parent.mkdir(parents=True, exist_ok=True)
 
@@ -109,3 +131,152 @@ def ensure_svg_pdf(
             log.debug("SVG→PDF converter '%s' failed: %s", converter.name, exc)
 
     return SvgToPdfResult(converted=False, used_converter=None)
+
+
+# Converters of a pool worker, created once per process by the initializer.
+_WORKER_CONVERTERS: list[SvgToPdfConverterPort] | None = None
+
+
+def _init_svg_worker(converters: list[SvgToPdfConverterPort] | None) -> None:
+    global _WORKER_CONVERTERS
+    _WORKER_CONVERTERS = (
+        converters if converters is not None else default_svg_to_pdf_converters()
+    )
+
+
+def _convert_one(
+    svg_file: Path,
+    pdf_file: Path,
+    prefer: Sequence[str] | None,
+    converters: Iterable[SvgToPdfConverterPort] | None,
+) -> SvgToPdfBatchResult:
+    start = time.perf_counter()
+    error = None
+    try:
+        result = ensure_svg_pdf(
+            svg_file, pdf_file=pdf_file, prefer=prefer, converters=converters
+        )
+    except Exception as exc:  # pragma: no cover - adapters catch their errors
+        result = SvgToPdfResult(converted=False, used_converter=None)
+        error = f"{type(exc).__name__}: {exc}"
+    return SvgToPdfBatchResult(
+        svg_file=svg_file,
+        pdf_file=pdf_file,
+        converted=result.converted,
+        used_converter=result.used_converter,
+        seconds=time.perf_counter() - start,
+        error=error,
+    )
+
+
+def _convert_in_worker(
+    svg_file: Path, pdf_file: Path, prefer: Sequence[str] | None
+) -> SvgToPdfBatchResult:
+    return _convert_one(svg_file, pdf_file, prefer, _WORKER_CONVERTERS)
+
+
+def _resolve_svg_jobs(workers: int | None, count: int) -> int:
+    if workers is None:
+        raw = os.environ.get(SVG_JOBS_ENV, "").strip()
+        try:
+            workers = int(raw) if raw else 0
+        except ValueError:
+            workers = 0
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, count))
+
+
+def ensure_svg_pdfs(
+    jobs: Iterable[SvgToPdfJob],
+    *,
+    prefer: Sequence[str] | None = None,
+    converters: Iterable[SvgToPdfConverterPort] | None = None,
+    workers: int | None = None,
+    logger: logging.Logger | None = None,
+) -> list[SvgToPdfBatchResult]:
+    """Convert many SVG files, spreading the work over a process pool.
+
+    ``jobs`` contains SVG paths or ``(svg, pdf)`` pairs (``pdf=None`` means
+    next to the SVG). Every file goes through :func:`ensure_svg_pdf`, so
+    up-to-date PDFs are skipped. ``workers`` defaults to
+    ``GITBOOK_WORKER_SVG_JOBS`` or one process per CPU; with one worker (or a
+    single file) the batch runs in-process. ``converters`` are pickled to the
+    workers, otherwise each worker instantiates the default adapters once.
+
+    Returns one result per job in input order, including the time spent and
+    the converter that produced the PDF.
+    """
+
+    log = logger or logging.getLogger(__name__)
+    pairs: list[tuple[Path, Path]] = []
+    for job in jobs:
+        svg_file, pdf_file = job if isinstance(job, tuple) else (job, None)
+        svg_file = Path(svg_file)
+        pairs.append((svg_file, Path(pdf_file or svg_file.with_suffix(".pdf"))))
+    if not pairs:
+        return []
+
+    # Up-to-date PDFs are answered here so the pool only sees real work.
+    results: list[SvgToPdfBatchResult | None] = []
+    pending: list[int] = []
+    for index, (svg_file, pdf_file) in enumerate(pairs):
+        if svg_file.suffix.lower() == ".svg" and _pdf_is_current(svg_file, pdf_file):
+            results.append(
+                SvgToPdfBatchResult(svg_file, pdf_file, True, None, seconds=0.0)
+            )
+        else:
+            results.append(None)
+            pending.append(index)
+
+    converter_list = list(converters) if converters is not None else None
+    count = _resolve_svg_jobs(workers, len(pending)) if pending else 0
+    start = time.perf_counter()
+    if count == 1:
+        for index in pending:
+            svg_file, pdf_file = pairs[index]
+            results[index] = _convert_one(svg_file, pdf_file, prefer, converter_list)
+    elif count > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=count,
+            initializer=_init_svg_worker,
+            initargs=(converter_list,),
+        ) as pool:
+            futures = {
+                index: pool.submit(_convert_in_worker, *pairs[index], prefer)
+                for index in pending
+            }
+            for index, future in futures.items():
+                svg_file, pdf_file = pairs[index]
+                try:
+                    results[index] = future.result()
+                except Exception as exc:
+                    results[index] = SvgToPdfBatchResult(
+                        svg_file,
+                        pdf_file,
+                        converted=False,
+                        used_converter=None,
+                        seconds=0.0,
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+
+    done = [item for item in results if item is not None]
+    for item in done:
+        log.debug(
+            "SVG → PDF %s: %s (%.2fs, %s)",
+            "ok" if item.converted else "failed",
+            item.svg_file,
+            item.seconds,
+            item.used_converter or ("cached" if item.converted else item.error),
+        )
+    if pending:
+        log.info(
+            "Converted %d of %d SVG files → PDF with %d process(es) in %.2fs",
+            sum(1 for item in done if item.used_converter),
+            len(pending),
+            count,
+            time.perf_counter() - start,
+        )
+    return done
@@ -110,6 +110,55 @@ def initialize_luaotfload_cache() -> None:
         logging.getLogger("conftest").warning("Font cache initialization timed out")
 
 
+# Per-cache directory overrides; unset so every cache lands below the
+# temporary ``GITBOOK_WORKER_CACHE_DIR`` of the test.
+_CACHE_DIR_OVERRIDES = (
+    "GITBOOK_WORKER_BUILD_CACHE_DIR",
+    "GITBOOK_WORKER_EMOJI_ASSET_DIR",
+    "GITBOOK_WORKER_IMAGE_INDEX_DIR",
+    "GITBOOK_WORKER_LATEX_CACHE_DIR",
+    "GITBOOK_WORKER_PDF_METRICS_CACHE_DIR",
+    "GITBOOK_WORKER_PREPROCESS_CACHE_DIR",
+    "GITBOOK_WORKER_SUMMARY_CACHE_DIR",
+    "GITBOOK_WORKER_SVG_PDF_CACHE_DIR",
+    "GITBOOK_WORKER_URL_CACHE_DIR",
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_root(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> pathlib.Path:
+    """Point the persistent gitbook-worker caches at a per-test directory.
+
+    Summary index, build, URL, emoji asset and the other caches default to
+    ``~/.cache/gitbook-worker``; tests must neither read nor fill it.
+    """
+    from gitbook_worker.tools.utils.cache import CACHE_ROOT_ENV
+
+    root = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv(CACHE_ROOT_ENV, str(root))
+    for name in _CACHE_DIR_OVERRIDES:
+        monkeypatch.delenv(name, raising=False)
+    return root
+
+
+@pytest.fixture(autouse=True)
+def reset_font_inventory() -> Iterator[None]:
+    """Drop the publisher's per-process font inventory around every test.
+
+    Tests monkeypatch ``_which``/``_run`` to fake ``fc-list`` and
+    ``luaotfload-tool``; a snapshot from an earlier test must not leak in.
+    """
+    publisher = sys.modules.get("gitbook_worker.tools.publishing.publisher")
+    if publisher is not None:
+        publisher._invalidate_font_inventory()
+    yield
+    publisher = sys.modules.get("gitbook_worker.tools.publishing.publisher")
+    if publisher is not None:
+        publisher._invalidate_font_inventory()
+
+
 @pytest.fixture
 def logger(request: pytest.FixtureRequest) -> Iterator[logging.Logger]:
     """Provide a test-specific logger that writes to GH_TEST_LOGS_DIR."""
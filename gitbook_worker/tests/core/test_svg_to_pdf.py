@@ -4,7 +4,9 @@ import time
 import os
 from pathlib import Path
 
-from gitbook_worker.core.application.svg_to_pdf import ensure_svg_pdf
+import pytest
+
+from gitbook_worker.core.application.svg_to_pdf import ensure_svg_pdf, ensure_svg_pdfs
 
 
 class _FakeOkConverter:
@@ -81,3 +83,68 @@ def test_ensure_svg_pdf_returns_false_without_converters(tmp_path: Path) -> None
     result = ensure_svg_pdf(svg, converters=[], prefer=("whatever",))
     assert result.converted is False
     assert result.used_converter is None
+
+
+def test_svglib_adapter_writes_to_target_directory(tmp_path: Path) -> None:
+    pytest.importorskip("svglib")
+    from gitbook_worker.adapters.svg.svglib_svg_to_pdf import SvglibSvgToPdfConverter
+
+    source = tmp_path / "assets"
+    source.mkdir()
+    svg = source / "demo.svg"
+    svg.write_text(
+        "<svg xmlns='http://www.w3.org/2000/svg' width='10' height='10'>"
+        "<rect width='5' height='5'/></svg>",
+        encoding="utf-8",
+    )
+    pdf = tmp_path / "cache" / "entry.pdf"
+    pdf.parent.mkdir()
+
+    SvglibSvgToPdfConverter().convert(svg_file=svg, pdf_file=pdf)
+
+    assert pdf.read_bytes().startswith(b"%PDF")
+    assert sorted(p.name for p in source.iterdir()) == ["demo.svg"]
+
+
+def test_ensure_svg_pdfs_reports_timing_and_converter(tmp_path: Path) -> None:
+    svgs = []
+    for name in ("a", "b", "c"):
+        svg = tmp_path / f"{name}.svg"
+        svg.write_text("<svg width='10' height='10'></svg>", encoding="utf-8")
+        svgs.append(svg)
+    current = tmp_path / "c.pdf"
+    current.write_bytes(b"%PDF-1.4\n%old\n")
+    os.utime(svgs[2], (time.time() - 100, time.time() - 100))
+    custom = tmp_path / "out" / "b.pdf"
+
+    results = ensure_svg_pdfs(
+        [svgs[0], (svgs[1], custom), svgs[2]],
+        converters=[_FakeFailConverter(), _FakeOkConverter()],
+        workers=1,
+    )
+
+    assert [item.svg_file for item in results] == svgs
+    assert [item.pdf_file for item in results] == [
+        tmp_path / "a.pdf",
+        custom,
+        current,
+    ]
+    assert [item.used_converter for item in results] == ["ok", "ok", None]
+    assert all(item.converted and item.seconds >= 0 for item in results)
+    assert custom.exists()
+    assert current.read_bytes().endswith(b"%old\n")
+
+
+def test_ensure_svg_pdfs_uses_process_pool(tmp_path: Path) -> None:
+    svgs = []
+    for index in range(4):
+        svg = tmp_path / f"fig{index}.svg"
+        svg.write_text("<svg width='10' height='10'></svg>", encoding="utf-8")
+        svgs.append(svg)
+
+    results = ensure_svg_pdfs(svgs, converters=[_FakeOkConverter()], workers=2)
+
+    assert [item.svg_file for item in results] == svgs
+    assert all(item.used_converter == "ok" for item in results)
+    assert all(svg.with_suffix(".pdf").exists() for svg in svgs)
+    assert ensure_svg_pdfs([], workers=2) == []
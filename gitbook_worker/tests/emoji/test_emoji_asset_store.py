@@ -0,0 +1,148 @@
+"""Tests for the persistent emoji asset store and the prefetch command."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from gitbook_worker.tools.emoji import inline_emojis, prefetch_emojis
+from gitbook_worker.tools.emoji.asset_store import (
+    HIT,
+    MISSING,
+    UNKNOWN,
+    EmojiAssetStore,
+)
+
+SVG = b"<svg xmlns='http://www.w3.org/2000/svg'><circle r='5'/></svg>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: Counter = Counter()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        type(self).hits[self.path] += 1
+        body = SVG if self.path == "/twemoji/svg/1f642.svg" else b""
+        self.send_response(200 if body else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def emoji_server(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Counter]:
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    monkeypatch.setenv("GITBOOK_WORKER_EMOJI_ASSET_DIR", str(tmp_path / "store"))
+    monkeypatch.delenv("GITBOOK_WORKER_EMOJI_OFFLINE", raising=False)
+    monkeypatch.setattr(inline_emojis, "CACHE_DIR", tmp_path / "legacy")
+    _Handler.hits = Counter()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(inline_emojis, "TWEMOJI_SVG", base + "/twemoji/svg/{slug}.svg")
+    monkeypatch.setattr(inline_emojis, "TWEMOJI_PNG", base + "/twemoji/png/{slug}.png")
+    monkeypatch.setattr(
+        inline_emojis, "OPENMOJI_BLACK", base + "/openmoji/{slug_upper}.svg"
+    )
+    try:
+        yield _Handler.hits
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_prefetch_fills_store_and_inlining_runs_offline(
+    emoji_server: Counter, tmp_path: Path
+) -> None:
+    content = tmp_path / "content"
+    content.mkdir()
+    (content / "chapter.md").write_text("Hallo 🙂 und ⚠️ 🙂\n", encoding="utf-8")
+
+    result = prefetch_emojis.prefetch([str(content)])
+
+    assert result == {"total": 2, "available": 1, "downloaded": 1, "missing": ["⚠️"]}
+    assert emoji_server["/twemoji/svg/1f642.svg"] == 1
+    # Both slug variants of the warning sign were tried with every provider.
+    assert emoji_server["/twemoji/svg/26a0.svg"] == 1
+    assert emoji_server["/openmoji/26A0-FE0F.svg"] == 1
+    assert not (tmp_path / "legacy").exists()
+
+    # Negative entries are persisted: a second prefetch sends no requests.
+    emoji_server.clear()
+    again = prefetch_emojis.prefetch([str(content)])
+    assert again["downloaded"] == 0
+    assert not emoji_server
+
+    html = tmp_path / "in.html"
+    html.write_text("<p>🙂 🙂 ⚠️</p>", encoding="utf-8")
+    coverage = inline_emojis.inline_file(html, tmp_path / "out.html", offline=True)
+
+    assert (coverage["total"], coverage["replaced"]) == (3, 2)
+    assert coverage["missing"] == {"⚠️": 1}
+    assert (tmp_path / "out.html").read_text(encoding="utf-8").count("<circle") == 2
+    assert not emoji_server
+
+
+def test_store_round_trip_and_miss_expiry(tmp_path: Path) -> None:
+    store = EmojiAssetStore(root=tmp_path / "pack", miss_ttl_seconds=60)
+    store.put("twemoji_svg_1f642.svg", SVG)
+    store.put("twemoji_png_1f642.png", b"\x89PNG")
+    store.put_missing("twemoji_svg_26a0.svg")
+    assert store.lookup("twemoji_svg_1f642.svg") == (HIT, SVG)
+    store.flush()
+    store.close()
+
+    reopened = EmojiAssetStore(root=tmp_path / "pack", miss_ttl_seconds=60)
+    assert reopened.lookup("twemoji_svg_1f642.svg") == (HIT, SVG)
+    assert reopened.lookup("twemoji_png_1f642.png") == (HIT, b"\x89PNG")
+    assert reopened.lookup("twemoji_svg_26a0.svg") == (MISSING, None)
+    assert reopened.lookup("openmoji_26a0.svg") == (UNKNOWN, None)
+    assert reopened.counts() == {"assets": 2, "missing": 1}
+    reopened.close()
+
+    expired = EmojiAssetStore(root=tmp_path / "pack", miss_ttl_seconds=0)
+    time.sleep(0.01)
+    assert expired.lookup("twemoji_svg_26a0.svg") == (UNKNOWN, None)
+
+
+def test_parallel_prefetch_counts_every_asset_and_close_releases_packs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store = EmojiAssetStore(root=tmp_path / "pack")
+    emojis = [chr(0x1F600 + offset) for offset in range(64)]
+    for emoji in emojis:
+        slug = inline_emojis.emoji_to_slug(emoji)
+        store.put(f"twemoji_svg_{slug}.svg", SVG)
+    store.flush()
+
+    def slow_lookup(key: str, lookup=store.lookup):
+        time.sleep(0.001)  # let the worker threads interleave
+        return lookup(key)
+
+    monkeypatch.setattr(store, "lookup", slow_lookup)
+    fetcher = inline_emojis.EmojiAssetFetcher(store=store, offline=False, jobs=8)
+
+    resolved = fetcher.prefetch(emojis * 2)
+
+    assert len(resolved) == len(fetcher.cache) == 64
+    assert all(asset is not None for asset in resolved.values())
+    assert fetcher.stats["twemoji_svg"] == 64
+    assert store._maps
+
+    fetcher.close()
+    assert not store._maps
+    # The store maps its packs again on demand.
+    assert (
+        store.lookup(f"twemoji_svg_{inline_emojis.emoji_to_slug(emojis[0])}.svg")[0]
+        == HIT
+    )
+    store.close()
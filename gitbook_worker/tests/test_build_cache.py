@@ -0,0 +1,112 @@
+import os
+import time
+from pathlib import Path
+
+from gitbook_worker.tools.publishing import publisher
+from gitbook_worker.tools.publishing.build_cache import BuildCache, BuildFingerprint
+
+
+def _pdf(path: Path, payload: bytes = b"%PDF-1.7 demo") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return path
+
+
+def test_fingerprint_depends_on_values_and_file_content(tmp_path):
+    source = tmp_path / "chapter.md"
+    source.write_text("one", encoding="utf-8")
+
+    def key() -> str:
+        fingerprint = BuildFingerprint()
+        fingerprint.add_value("options", {"toc": True, "lang": "de"})
+        fingerprint.add_file("markdown", source)
+        return fingerprint.hexdigest()
+
+    first = key()
+    assert key() == first
+    source.write_text("two", encoding="utf-8")
+    assert key() != first
+
+
+def test_store_and_restore_roundtrip(tmp_path):
+    cache = BuildCache(root=tmp_path / "cache")
+    built = _pdf(tmp_path / "publish" / "book.pdf")
+
+    assert not cache.restore("ab" * 32, tmp_path / "restored.pdf")
+    cache.store("ab" * 32, built)
+
+    restored = tmp_path / "other" / "book.pdf"
+    assert cache.restore("ab" * 32, restored)
+    assert restored.read_bytes() == built.read_bytes()
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = BuildCache(root=tmp_path / "cache")
+    for index, key in enumerate(("aa" * 32, "bb" * 32, "cc" * 32)):
+        cache.store(key, _pdf(tmp_path / f"{index}.pdf"))
+        entry = cache.root / key[:2] / f"{key}.pdf"
+        stamp = time.time() - 100 + index
+        os.utime(entry, (stamp, stamp))
+
+    # Reusing the oldest entry protects it from eviction.
+    assert cache.restore("aa" * 32, tmp_path / "hit.pdf")
+    cache.max_entries = 2
+    assert cache.prune() == 1
+
+    remaining = {path.stem for path in cache.entries()}
+    assert remaining == {"aa" * 32, "cc" * 32}
+
+
+def test_prune_respects_size_and_age(tmp_path):
+    cache = BuildCache(root=tmp_path / "cache", max_bytes=10, max_age_days=1)
+    cache.store("dd" * 32, _pdf(tmp_path / "big.pdf", b"x" * 20))
+    assert cache.entries() == []
+
+    cache = BuildCache(root=tmp_path / "cache2", max_age_days=1)
+    cache.store("ee" * 32, _pdf(tmp_path / "old.pdf"))
+    entry = cache.entries()[0]
+    stale = time.time() - 3 * 86400
+    os.utime(entry, (stale, stale))
+    assert cache.prune() == 1
+
+
+def test_run_pandoc_restores_cached_pdf(monkeypatch, tmp_path):
+    md = tmp_path / "doc.md"
+    md.write_text("# Demo\n\n![fig](img.png)\n", encoding="utf-8")
+    image = tmp_path / "img.png"
+    image.write_bytes(b"png-v1")
+    pdf = tmp_path / "out" / "doc.pdf"
+    runs: list[list[str]] = []
+
+    def fake_run(cmd, check=True, capture=False, env=None):
+        runs.append(cmd)
+        _pdf(Path(cmd[cmd.index("-o") + 1]), b"%PDF " + str(len(runs)).encode())
+
+    publisher._reset_pandoc_defaults_cache()
+    monkeypatch.setattr(publisher, "_run", fake_run)
+    monkeypatch.setattr(publisher, "_get_pandoc_version", lambda: (3, 1, 12))
+    monkeypatch.setattr(
+        publisher, "_select_emoji_font", lambda color: ("Twemoji Mozilla", False)
+    )
+    monkeypatch.setattr(publisher, "_build_font_header", lambda **_: "% fonts\n")
+    monkeypatch.setattr(publisher, "_decide_bxcoloremoji", lambda options: False)
+    monkeypatch.delenv("ERDA_KEEP_LATEX_TEMP", raising=False)
+
+    cache = BuildCache(root=tmp_path / "cache")
+
+    def build() -> None:
+        publisher._run_pandoc(
+            str(md), str(pdf), resource_paths=[str(tmp_path)], build_cache=cache
+        )
+
+    build()
+    assert len(runs) == 1
+    pdf.unlink()
+
+    build()
+    assert len(runs) == 1
+    assert pdf.read_bytes() == b"%PDF 1"
+
+    image.write_bytes(b"png-v2")
+    build()
+    assert len(runs) == 2
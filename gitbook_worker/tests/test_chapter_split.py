@@ -0,0 +1,146 @@
+from pathlib import Path
+
+from pypdf import PdfReader, PdfWriter
+
+from gitbook_worker.tools.publishing import publisher
+from gitbook_worker.tools.publishing.chapter_split import (
+    ChapterFragment,
+    chapter_title,
+    merge_chapter_pdfs,
+)
+
+
+def _blank_pdf(path: Path, pages: int, bookmark: str | None = None) -> Path:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+    if bookmark:
+        writer.add_outline_item(bookmark, 0)
+    with path.open("wb") as handle:
+        writer.write(handle)
+    return path
+
+
+def test_chapter_title_strips_attributes():
+    assert chapter_title("intro\n\n## Setup & Run {#setup}\n") == "Setup & Run"
+    assert chapter_title("no heading") is None
+
+
+def test_merge_chapter_pdfs_builds_outline_and_labels(tmp_path):
+    fragments = [
+        ChapterFragment(
+            index=index,
+            source=tmp_path / f"{name}.md",
+            markdown=tmp_path / f"{index:04d}.md",
+            pdf=_blank_pdf(tmp_path / f"{index:04d}.pdf", pages, f"{name} section"),
+            title=name.title(),
+        )
+        for index, (name, pages) in enumerate((("intro", 2), ("usage", 3)), start=1)
+    ]
+
+    out = tmp_path / "book.pdf"
+    assert merge_chapter_pdfs(fragments, out) == 5
+
+    reader = PdfReader(str(out))
+    assert reader.page_labels == ["1", "2", "2-1", "2-2", "2-3"]
+    top_level = [item.title for item in reader.outline if not isinstance(item, list)]
+    assert top_level == ["Intro", "Usage"]
+    assert reader.get_destination_page_number(reader.outline[2]) == 2
+
+
+def test_convert_a_folder_chapter_split_renders_fragments(monkeypatch, tmp_path):
+    book = tmp_path / "book"
+    book.mkdir()
+    (book / "a.md").write_text("# Alpha\n\nText\n", encoding="utf-8")
+    (book / "b.md").write_text("# Beta\n\nMore\n", encoding="utf-8")
+    (book / "SUMMARY.md").write_text(
+        "# Summary\n\n* [Alpha](a.md)\n* [Beta](b.md)\n", encoding="utf-8"
+    )
+
+    calls: list[dict] = []
+
+    def fake_run_pandoc(md_path, pdf_out, **kwargs):
+        calls.append({"md": Path(md_path).read_text(encoding="utf-8"), **kwargs})
+        _blank_pdf(Path(pdf_out), 1)
+
+    monkeypatch.setattr(publisher, "_run_pandoc", fake_run_pandoc)
+
+    out = tmp_path / "publish" / "book.pdf"
+    publisher.convert_a_folder(
+        str(book),
+        str(out),
+        publish_dir=str(tmp_path / "publish"),
+        metadata={"title": ["Buch"], "author": ["ERDA"]},
+        chapter_split=True,
+        chapter_jobs=1,
+    )
+
+    assert len(calls) == 2
+    assert "# Alpha" in calls[0]["md"] and "# Beta" in calls[1]["md"]
+    assert calls[0]["metadata"]["title"] == ["Buch"]
+    assert "title" not in calls[1]["metadata"]
+    assert all(call["add_toc"] is False for call in calls)
+    assert len(PdfReader(str(out)).pages) == 2
+
+
+def test_parse_pdf_options_chapter_split():
+    parsed = publisher._parse_pdf_options({"chapter_split": "yes", "chapter_jobs": 3})
+    assert parsed["chapter_split"] is True
+    assert parsed["chapter_jobs"] == 3
+    assert "chapter_split" not in publisher._parse_pdf_options({})
+
+
+def test_chapter_split_markdown_matches_single_pass(monkeypatch, tmp_path):
+    book = tmp_path / "book"
+    book.mkdir()
+    (book / "a.md").write_text(
+        "# Alpha & Omega\n\n![x](../.gitbook/assets/x.png)\n", encoding="utf-8"
+    )
+    (book / "b.md").write_text(
+        "# Beta & Gamma\n\n![y](../.gitbook/assets/y.png)\n", encoding="utf-8"
+    )
+    (book / "SUMMARY.md").write_text(
+        "# Summary\n\n* [Alpha](a.md)\n* [Beta](b.md)\n", encoding="utf-8"
+    )
+    fragments: list[str] = []
+
+    def fake_run_pandoc(md_path, pdf_out, **kwargs):
+        fragments.append(Path(md_path).read_text(encoding="utf-8"))
+        _blank_pdf(Path(pdf_out), 1)
+
+    monkeypatch.setattr(publisher, "_run_pandoc", fake_run_pandoc)
+
+    def build(name: str, **kwargs) -> str:
+        out = tmp_path / "publish" / f"{name}.pdf"
+        publisher.convert_a_folder(
+            str(book),
+            str(out),
+            keep_converted_markdown=True,
+            publish_dir=str(tmp_path / "publish"),
+            **kwargs,
+        )
+        return out.with_suffix(".md").read_text(encoding="utf-8")
+
+    single = build("single")
+    fragments.clear()
+    chapters = build("chapters", chapter_split=True, chapter_jobs=1)
+
+    assert chapters == single
+    assert len(fragments) == 2
+    for fragment, title in zip(fragments, ("Alpha \\& Omega", "Beta \\& Gamma")):
+        assert f"# {title}" in fragment
+        assert "../.gitbook" not in fragment
+
+
+def test_chapter_jobs_default_to_one_inside_build_workers(monkeypatch, tmp_path):
+    # setenv first so that the values set by the worker init are undone.
+    for key in (publisher.CHAPTER_JOBS_ENV, publisher.SVG_JOBS_ENV):
+        monkeypatch.setenv(key, "")
+        monkeypatch.delenv(key)
+    for key in publisher._TEMP_ENV_KEYS:
+        monkeypatch.setenv(key, str(tmp_path))
+    monkeypatch.setattr(publisher.tempfile, "tempdir", publisher.tempfile.tempdir)
+
+    publisher._init_build_worker(str(tmp_path), [])
+
+    assert publisher.os.environ[publisher.CHAPTER_JOBS_ENV] == "1"
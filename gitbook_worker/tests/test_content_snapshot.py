@@ -0,0 +1,107 @@
+"""Tests for the per-run content-tree snapshot."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from gitbook_worker.tools.publishing import document_types
+from gitbook_worker.tools.publishing.summary_generator import (
+    SubMode,
+    SummaryMode,
+    build_summary_tree,
+)
+from gitbook_worker.tools.utils.content_snapshot import (
+    ContentSnapshot,
+    active_snapshot,
+    invalidate_content,
+    use_content_snapshot,
+)
+from gitbook_worker.tools.validators.frontmatter_checker import check_frontmatter_tree
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _book(root: Path) -> Path:
+    _write(root / "README.md", "# Book\n")
+    _write(
+        root / "chapters" / "README.md",
+        "---\ndoc_type: part\ntitle: Teil\n---\n# Chapters\n",
+    )
+    _write(
+        root / "chapters" / "01-intro.md",
+        "---\ndoc_type: chapter\n---\n# Intro\n\nText\n",
+    )
+    _write(root / "chapters" / "nested" / "deep.md", "# Deep\n")
+    _write(root / ".gitbook" / "hidden.md", "# Hidden\n")
+    _write(root / "publish" / "skip.md", "---\n: broken\n---\n")
+    return root
+
+
+def test_snapshot_walk_matches_rglob_and_reuses_reads(tmp_path: Path) -> None:
+    root = _book(tmp_path / "book")
+    (root / "linked").symlink_to(root / "chapters", target_is_directory=True)
+    snapshot = ContentSnapshot(root)
+
+    assert list(snapshot.rglob(root, ".md")) == list(root.rglob("*.md"))
+    assert list(snapshot.rglob(root, ".md", skip_dirs={"publish", ".gitbook"})) == [
+        path
+        for path in root.rglob("*.md")
+        if not {"publish", ".gitbook"} & set(path.relative_to(root).parts)
+    ]
+
+    intro = snapshot.document(root / "chapters" / "01-intro.md")
+    assert intro.frontmatter == {"doc_type": "chapter"}
+    assert intro.first_heading == "Intro"
+    assert snapshot.document(root / "chapters" / "01-intro.md") is intro
+    assert len(intro.sha256) == 64
+
+
+def test_snapshot_picks_up_writes_and_explicit_invalidation(tmp_path: Path) -> None:
+    root = _book(tmp_path / "book")
+    chapter = root / "chapters" / "01-intro.md"
+    with use_content_snapshot(root) as snapshot:
+        assert active_snapshot(chapter) is snapshot
+        assert active_snapshot(tmp_path) is None
+        assert snapshot.document(chapter).first_heading == "Intro"
+
+        chapter.write_text("# Introduction\n", encoding="utf-8")
+        assert snapshot.document(chapter).first_heading == "Introduction"
+
+        # Same size and mtime: only an explicit invalidation reveals the edit.
+        stat = chapter.stat()
+        chapter.write_text("# Introductiom\n", encoding="utf-8")
+        os.utime(chapter, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert snapshot.document(chapter).first_heading == "Introduction"
+        invalidate_content(chapter)
+        assert snapshot.document(chapter).first_heading == "Introductiom"
+
+        _write(root / "chapters" / "02-next.md", "# Next\n")
+        names = [path.name for path in snapshot.rglob(root / "chapters", ".md")]
+        assert "02-next.md" in names
+    assert active_snapshot(root) is None
+
+
+def test_steps_share_one_read_per_file_inside_snapshot(tmp_path: Path) -> None:
+    root = _book(tmp_path / "book")
+
+    def run_steps() -> tuple:
+        records, issues = document_types.collect_documents_with_issues(root)
+        tree = build_summary_tree(root, SummaryMode.GITBOOK_STYLE, SubMode.NONE)
+        frontmatter = check_frontmatter_tree(root)
+        return records, issues, tree.to_lines(), frontmatter
+
+    expected = run_steps()
+    with use_content_snapshot(root) as snapshot:
+        assert run_steps() == expected
+        files_read = snapshot.misses
+        assert run_steps() == expected
+        assert snapshot.misses == files_read
+
+    markdown_files = len(list(root.rglob("*.md")))
+    directories = len([path for path in root.rglob("*") if path.is_dir()]) + 1
+    assert files_read <= markdown_files + directories
@@ -75,6 +75,22 @@ def test_run_docker_build_uses_packaged_dockerfile_path():
     assert ".github" not in dockerfile.parts
 
 
+def test_run_docker_mounts_persistent_luatex_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(run_docker, "REPO_ROOT", tmp_path)
+    args = run_docker.build_docker_args("shell", use_dynamic=True)
+
+    mount = run_docker.LUATEX_CACHE_MOUNTS[True]
+    assert mount == "/usr/local/texlive/current/texmf-var/luatex-cache"
+    volume = f"--run-arg=erda-smart-worker-luatex-cache:{mount}"
+    assert volume in args
+    env_index = args.index(f"GITBOOK_WORKER_LUATEX_CACHE_DIR={mount}")
+    assert args[env_index - 1] == "--env"
+    assert args.index("--it") > env_index
+
+    without = run_docker.build_docker_args("shell", use_dynamic=True, font_cache=False)
+    assert volume not in without
+
+
 def log_to_logger(logger, message, stdout=None, stderr=None):
     """Write a message and optional command output to the logger."""
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -5,9 +5,14 @@ import textwrap
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
 from pypdf import PdfWriter
 
 from gitbook_worker import __version__
+from gitbook_worker.tools.publishing.table_strategy import (
+    TableReportSink,
+    iter_table_report,
+)
 from gitbook_worker.tools.quality import editorial_acceptance
 from gitbook_worker.tools.quality import editorial_metrics as editorial_metrics_module
 from gitbook_worker.tools.quality.editorial_common import (
@@ -22,14 +27,17 @@ from gitbook_worker.tools.quality.editorial_common import (
 from gitbook_worker.tools.quality.editorial_metrics import (
     _check_pdf_script_samples,
     _check_pdf_text_overflow,
+    analyze_markdown_files,
     analyze_pdf,
     analyze_table_reports,
     collect_editorial_metrics,
+    discover_table_layout_reports,
     format_console_summary,
     main as editorial_metrics_main,
     write_findings_csv,
     write_findings_sarif,
 )
+from gitbook_worker.tools.quality.pdf_metrics_cache import PdfMetricsCache
 
 
 def _write_markdown(path: Path, body: str) -> None:
@@ -295,6 +303,42 @@ def test_markdown_metrics_reuses_existing_quality_signals(tmp_path: Path) -> Non
     assert "references.ai.tasks_detected" in rule_ids
 
 
+def test_markdown_analysis_on_process_pool_matches_sequential_run(
+    tmp_path: Path,
+) -> None:
+    files = []
+    for index in range(6):
+        role = "source" if index % 2 == 0 else "target"
+        lang = "ja" if role == "source" else "pl"
+        path = tmp_path / role / f"chapter-{index}.md"
+        _write_markdown(
+            path,
+            f"""
+            ---
+            content_id: ch-{index // 2}
+            content_lang: {lang}
+            ---
+            # Chapter {index}
+            TODO: check https://doi.org/10.1234/example-{index}
+            ## Chapter {index}
+            """,
+        )
+        files.append(path)
+    broken = tmp_path / "source" / "broken.md"
+    _write_markdown(broken, "---\ntitle: [oops\n---\n# Broken\n")
+    files.extend([broken, files[0], tmp_path / "missing.md"])
+    profile = _multilingual_profile()
+
+    sequential = analyze_markdown_files(tmp_path, files, profile, workers=1)
+    parallel = analyze_markdown_files(tmp_path, files, profile, workers=2)
+
+    assert parallel[0] == sequential[0]
+    assert parallel[1] == sequential[1]
+    assert sequential[0]["files_total"] == 9
+    assert sequential[0]["duplicate_headings_total"] == 7
+    assert sequential[0]["inline_reference_tasks_total"] == 6
+
+
 def test_pdf_metrics_detect_empty_text_layer(tmp_path: Path) -> None:
     pdf = tmp_path / "blank.pdf"
     writer = PdfWriter()
@@ -313,6 +357,44 @@ def test_pdf_metrics_detect_empty_text_layer(tmp_path: Path) -> None:
     assert any(finding.rule_id == "pdf.text.empty_document" for finding in findings)
 
 
+def test_pdf_metrics_cache_reuses_unchanged_pdfs(monkeypatch, tmp_path: Path) -> None:
+    pdf = tmp_path / "publish" / "blank.pdf"
+    pdf.parent.mkdir()
+    writer = PdfWriter()
+    writer.add_blank_page(width=300, height=200)
+    with pdf.open("wb") as handle:
+        writer.write(handle)
+    cache = PdfMetricsCache(root=tmp_path / "cache")
+    profile = _multilingual_profile()
+
+    first, first_findings = analyze_pdf(tmp_path, pdf, profile, metrics_cache=cache)
+    monkeypatch.setattr(
+        editorial_metrics_module,
+        "analyze_pdf_document",
+        lambda *args, **kwargs: pytest.fail("unchanged PDF was parsed again"),
+    )
+    second, second_findings = analyze_pdf(tmp_path, pdf, profile, metrics_cache=cache)
+
+    assert first["metrics_cache"]["status"] == "miss"
+    assert second["metrics_cache"]["status"] == "hit"
+    assert second["metrics_cache"]["pdf_sha256"] == first["metrics_cache"]["pdf_sha256"]
+    assert {**second, "metrics_cache": None} == {**first, "metrics_cache": None}
+    assert second_findings == first_findings
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [entry["artifact"] for entry in cache.iter_entries()] == [
+        "publish/blank.pdf"
+    ]
+
+    stricter = AcceptanceProfile(name="other", pdf=PdfProfile())
+    with pytest.raises(pytest.fail.Exception):
+        analyze_pdf(tmp_path, pdf, stricter, metrics_cache=cache)
+
+    trend = editorial_acceptance.build_trend_record(
+        [{"metrics": {"pdf": [first, second]}}], {"status": "passed"}
+    )
+    assert trend["pdfs_reused"] == ["publish/blank.pdf"]
+
+
 def test_pdf_textlayer_replacement_signals_are_not_font_failures(
     monkeypatch, tmp_path: Path
 ) -> None:
@@ -621,73 +703,76 @@ def test_publish_metadata_summary_order_and_release_docs_drift(
     assert report["metrics"]["release_docs"]["layout_claims_total"] == 1
 
 
+_TABLE_REPORT_RECORDS = (
+    {
+        "source_path": "content/chapter.md",
+        "table_index": 2,
+        "heading": "Risk Matrix",
+        "selected_paper": "a3-landscape",
+        "method": "lowest-score-fallback",
+        "columns": 9,
+        "evaluations": [
+            {
+                "paper": "a4-portrait",
+                "acceptable": False,
+                "score": 32.5,
+                "unbreakable_overflow_mm": 18.2,
+                "max_cell_lines": 17,
+                "reasons": ["long-token"],
+            },
+            {
+                "paper": "a3-landscape",
+                "acceptable": False,
+                "score": 12.0,
+                "overflow_mm": 4.5,
+                "average_row_lines": 6.2,
+                "reasons": ["dense-table"],
+            },
+        ],
+    },
+    {
+        "source_path": "content/chapter.md",
+        "table_index": 3,
+        "heading": "Risk Matrix",
+        "selected_paper": "a4-landscape",
+        "method": "override",
+        "override": {
+            "paper": "a4-landscape",
+            "reason": "Editorial review keeps the table on one page.",
+        },
+    },
+    {
+        "source_path": "content/appendix.md",
+        "table_index": 1,
+        "heading": "Appendix Scores",
+        "selected_paper": "a4-landscape",
+        "method": "editorial-best-fit",
+        "evaluations": [
+            {
+                "paper": "a4-portrait",
+                "acceptable": False,
+                "score": 21.0,
+                "overflow_mm": 9.5,
+                "reasons": ["narrow-columns"],
+            },
+            {
+                "paper": "a4-landscape",
+                "acceptable": True,
+                "score": 3.0,
+                "max_cell_lines": 5,
+                "average_row_lines": 2.4,
+            },
+        ],
+    },
+)
+
+
 def test_table_report_aggregation_flags_fallbacks(tmp_path: Path) -> None:
     report_path = tmp_path / "book.table-layout.jsonl"
     report_path.write_text(
         "\n".join(
             json.dumps(record)
-            for record in (
-                {
-                    "source_path": "content/chapter.md",
-                    "table_index": 2,
-                    "heading": "Risk Matrix",
-                    "selected_paper": "a3-landscape",
-                    "method": "lowest-score-fallback",
-                    "columns": 9,
-                    "evaluations": [
-                        {
-                            "paper": "a4-portrait",
-                            "acceptable": False,
-                            "score": 32.5,
-                            "unbreakable_overflow_mm": 18.2,
-                            "max_cell_lines": 17,
-                            "reasons": ["long-token"],
-                        },
-                        {
-                            "paper": "a3-landscape",
-                            "acceptable": False,
-                            "score": 12.0,
-                            "overflow_mm": 4.5,
-                            "average_row_lines": 6.2,
-                            "reasons": ["dense-table"],
-                        },
-                    ],
-                },
-                {
-                    "source_path": "content/chapter.md",
-                    "table_index": 3,
-                    "heading": "Risk Matrix",
-                    "selected_paper": "a4-landscape",
-                    "method": "override",
-                    "override": {
-                        "paper": "a4-landscape",
-                        "reason": "Editorial review keeps the table on one page.",
-                    },
-                },
-                {
-                    "source_path": "content/appendix.md",
-                    "table_index": 1,
-                    "heading": "Appendix Scores",
-                    "selected_paper": "a4-landscape",
-                    "method": "editorial-best-fit",
-                    "evaluations": [
-                        {
-                            "paper": "a4-portrait",
-                            "acceptable": False,
-                            "score": 21.0,
-                            "overflow_mm": 9.5,
-                            "reasons": ["narrow-columns"],
-                        },
-                        {
-                            "paper": "a4-landscape",
-                            "acceptable": True,
-                            "score": 3.0,
-                            "max_cell_lines": 5,
-                            "average_row_lines": 2.4,
-                        },
-                    ],
-                },
-            )
+            for record in _TABLE_REPORT_RECORDS
         )
         + "\n",
         encoding="utf-8",
@@ -715,6 +800,33 @@ def test_table_report_aggregation_flags_fallbacks(tmp_path: Path) -> None:
     assert findings[2].severity == "info"
 
 
+def test_columnar_table_report_reads_back_like_jsonl(tmp_path: Path) -> None:
+    jsonl = tmp_path / "book.table-layout.jsonl"
+    columnar = tmp_path / "book.table-layout.json.gz"
+    for path in (jsonl, columnar):
+        sink = TableReportSink.open(path)
+        for record in _TABLE_REPORT_RECORDS[:2]:
+            sink.add(dict(record))
+        sink.flush()
+        sink.add(dict(_TABLE_REPORT_RECORDS[2]))
+        sink.close()
+        assert TableReportSink.active(path) is None
+
+    assert len(jsonl.read_text(encoding="utf-8").splitlines()) == 3
+    assert [record for _, record, _ in iter_table_report(columnar)] == list(
+        _TABLE_REPORT_RECORDS
+    )
+    assert set(discover_table_layout_reports(tmp_path, ["."])) == {jsonl, columnar}
+
+    expected, expected_findings = analyze_table_reports(tmp_path, (jsonl,))
+    metrics, findings = analyze_table_reports(tmp_path, (columnar,))
+    assert metrics["decisions_total"] == expected["decisions_total"] == 3
+    assert metrics["method_counts"] == expected["method_counts"]
+    assert [finding.evidence for finding in findings] == [
+        finding.evidence for finding in expected_findings
+    ]
+
+
 def test_acceptance_writes_dossier_and_returns_failure(tmp_path: Path) -> None:
     metrics_report = tmp_path / "metrics.json"
     metrics_report.write_text(
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import json
+import shutil
+import subprocess
 import textwrap
 
+import pytest
+
 from gitbook_worker.tools.publishing.gitbook_style import (
     ensure_clean_summary,
     get_summary_layout,
+    plan_gitbook_renames,
     rename_to_gitbook_style,
 )
 
@@ -29,6 +34,58 @@ def test_rename_to_gitbook_style(tmp_path):
     assert (root / "sub-dir" / "ignore.py").exists()
 
 
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+def test_rename_plan_uses_one_index_update(tmp_path):
+    _git(tmp_path, "init")
+    root = tmp_path / "book"
+    (root / "Part One" / "Sub Chapter").mkdir(parents=True)
+    (root / "Part One" / "Chapter A.md").write_text("a", encoding="utf-8")
+    (root / "Part One" / "chapter-a.md").write_text("b", encoding="utf-8")
+    (root / "Part One" / "Sub Chapter" / "Deep File.md").write_text(
+        "c", encoding="utf-8"
+    )
+    _git(tmp_path, "add", ".")
+    (root / "Part One" / "Draft Note.md").write_text("d", encoding="utf-8")
+
+    plan = plan_gitbook_renames(root)
+
+    assert plan.describe() == [
+        "rename dir  Part One -> part-one",
+        "rename dir  part-one/Sub Chapter -> part-one/sub-chapter",
+        "rename file part-one/sub-chapter/Deep File.md -> "
+        "part-one/sub-chapter/deep-file.md",
+        "skip   untracked  Part One/Draft Note.md",
+        "skip   collision  Part One/Chapter A.md (chapter-a.md)",
+    ]
+    rename_to_gitbook_style(root, dry_run=True)
+    assert (root / "Part One").is_dir()
+
+    rename_to_gitbook_style(root)
+
+    assert _git(tmp_path, "ls-files").splitlines() == [
+        "book/part-one/Chapter A.md",
+        "book/part-one/chapter-a.md",
+        "book/part-one/sub-chapter/deep-file.md",
+    ]
+    assert (root / "part-one" / "Chapter A.md").read_text(encoding="utf-8") == "a"
+    assert (root / "part-one" / "chapter-a.md").read_text(encoding="utf-8") == "b"
+    assert (root / "part-one" / "Draft Note.md").exists()
+    assert _git(tmp_path, "status", "--porcelain", "--untracked-files=no") == "\n".join(
+        [
+            'A  "book/part-one/Chapter A.md"',
+            "A  book/part-one/chapter-a.md",
+            "A  book/part-one/sub-chapter/deep-file.md",
+            "",
+        ]
+    )
+
+
 def test_ensure_clean_summary(tmp_path):
     base = tmp_path / "book"
     base.mkdir()
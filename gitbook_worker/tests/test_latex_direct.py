@@ -0,0 +1,203 @@
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from gitbook_worker.tools.publishing import publisher
+from gitbook_worker.tools.publishing.latex_cache import HEADER_MARKER, LatexCache
+
+
+def _patch_font_stack(monkeypatch):
+    publisher._reset_pandoc_defaults_cache()
+    monkeypatch.setattr(publisher, "_get_pandoc_version", lambda: (3, 1, 12))
+    monkeypatch.setattr(
+        publisher, "_select_emoji_font", lambda color: ("Twemoji Mozilla", False)
+    )
+    monkeypatch.setattr(publisher, "_build_font_header", lambda **_: "% fonts\n")
+    monkeypatch.setattr(publisher, "_decide_bxcoloremoji", lambda options: False)
+
+
+def _fake_toolchain(runs: list[list[str]]):
+    """Pretend to be pandoc (writes the .tex) and lualatex (writes pdf/toc/log)."""
+
+    def fake_run(cmd, check=True, env=None, **kwargs):
+        runs.append(cmd)
+        if cmd[0] == "pandoc":
+            Path(cmd[cmd.index("-o") + 1]).write_text("\\documentclass{article}")
+            return
+        assert "TEXINPUTS" in env
+        workdir = Path(kwargs["cwd"])
+        jobname = Path(cmd[-1]).stem
+        engine_runs = sum(1 for run in runs if run[0] == "lualatex")
+        # The TOC settles after the second run, like a real document.
+        (workdir / f"{jobname}.toc").write_text(f"toc {min(engine_runs, 2)}")
+        (workdir / f"{jobname}.log").write_text("Output written")
+        (workdir / f"{jobname}.pdf").write_bytes(b"%PDF direct")
+
+    return fake_run
+
+
+def test_keep_latex_temp_runs_pandoc_once_and_drives_lualatex(monkeypatch, tmp_path):
+    md = tmp_path / "doc.md"
+    md.write_text("# Demo\n", encoding="utf-8")
+    pdf = tmp_path / "out" / "doc.pdf"
+    runs: list[list[str]] = []
+
+    _patch_font_stack(monkeypatch)
+    monkeypatch.setattr(publisher, "_run", _fake_toolchain(runs))
+    monkeypatch.setenv("ERDA_KEEP_LATEX_TEMP", "1")
+
+    publisher._run_pandoc(str(md), str(pdf), add_toc=True)
+
+    pandoc_runs = [cmd for cmd in runs if cmd[0] == "pandoc"]
+    engine_runs = [cmd for cmd in runs if cmd[0] == "lualatex"]
+    assert len(pandoc_runs) == 1
+    assert pandoc_runs[0][pandoc_runs[0].index("-o") + 1].endswith("doc.tex")
+    assert "--standalone" in pandoc_runs[0]
+    assert not any(arg.startswith("--pdf-engine") for arg in pandoc_runs[0])
+    assert len(engine_runs) == 3
+    assert "-shell-escape" in engine_runs[0]
+    assert any(arg.startswith("-output-directory=") for arg in engine_runs[0])
+    assert pdf.read_bytes() == b"%PDF direct"
+    kept = list((pdf.parent / "_latex-debug").glob("*/doc.tex"))
+    assert len(kept) == 1
+
+
+def test_compile_latex_stops_when_aux_files_are_stable(monkeypatch, tmp_path):
+    tex = tmp_path / "book.tex"
+    tex.write_text("\\documentclass{article}")
+    runs: list[list[str]] = [["pandoc"]]
+
+    def stable_run(cmd, check=True, env=None, **kwargs):
+        runs.append(cmd)
+        (tmp_path / "book.log").write_text("Output written")
+        (tmp_path / "book.pdf").write_bytes(b"%PDF")
+
+    monkeypatch.setattr(publisher, "_run", stable_run)
+
+    assert publisher._compile_latex("lualatex", tex, tmp_path / "o" / "b.pdf") == 1
+    assert (tmp_path / "o" / "b.pdf").exists()
+    assert publisher._latex_direct_engine("/usr/bin/lualatex") == "/usr/bin/lualatex"
+    assert publisher._latex_direct_engine("tectonic") is None
+
+
+def test_latex_cache_skips_pandoc_when_only_headers_change(monkeypatch, tmp_path):
+    md = tmp_path / "doc.md"
+    md.write_text("# Demo\n", encoding="utf-8")
+    pdf = tmp_path / "out" / "doc.pdf"
+    runs: list[list[str]] = []
+    compiled: list[str] = []
+
+    def fake_run(cmd, check=True, env=None, **kwargs):
+        runs.append(cmd)
+        if cmd[0] == "pandoc":
+            headers = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-H"]
+            media = Path(
+                next(a for a in cmd if a.startswith("--extract-media=")).split("=")[1]
+            )
+            media.mkdir(parents=True, exist_ok=True)
+            (media / "abc.png").write_bytes(b"png")
+            includes = "".join(Path(h).read_text(encoding="utf-8") for h in headers)
+            Path(cmd[cmd.index("-o") + 1]).write_text(
+                "\\documentclass{article}\n"
+                + includes
+                + "\\begin{document}\\includegraphics{"
+                + (media / "abc.png").as_posix()
+                + "}\\end{document}\n",
+                encoding="utf-8",
+            )
+            return
+        workdir = Path(kwargs["cwd"])
+        tex = (workdir / cmd[-1]).read_text(encoding="utf-8")
+        image = tex.split("\\includegraphics{")[1].split("}")[0]
+        assert Path(image).read_bytes() == b"png"
+        compiled.append(tex)
+        (workdir / f"{Path(cmd[-1]).stem}.pdf").write_bytes(b"%PDF")
+
+    header = {"text": "% fonts v1\n"}
+    _patch_font_stack(monkeypatch)
+    monkeypatch.setattr(publisher, "_build_font_header", lambda **_: header["text"])
+    monkeypatch.setattr(publisher, "_run", fake_run)
+    # A LaTeX cache enables single-pass mode without ERDA_LATEX_DIRECT.
+    monkeypatch.setenv("ERDA_LATEX_DIRECT", "")
+    monkeypatch.delenv("ERDA_LATEX_DIRECT")
+    monkeypatch.delenv("ERDA_KEEP_LATEX_TEMP", raising=False)
+    cache = LatexCache(root=tmp_path / "latex-cache")
+
+    def build() -> int:
+        publisher._run_pandoc(str(md), str(pdf), latex_cache=cache)
+        return sum(1 for cmd in runs if cmd[0] == "pandoc")
+
+    assert build() == 1
+    assert "% fonts v1" in compiled[-1]
+    assert HEADER_MARKER not in compiled[-1]
+
+    header["text"] = "% fonts v2\n"
+    assert build() == 1
+    assert "% fonts v2" in compiled[-1] and "% fonts v1" not in compiled[-1]
+
+    md.write_text("# Changed\n", encoding="utf-8")
+    assert build() == 2
+
+    monkeypatch.setenv("ERDA_LATEX_DIRECT", "0")
+    runs.clear()
+    monkeypatch.setattr(publisher, "_run", lambda cmd, **kwargs: runs.append(cmd))
+    publisher._run_pandoc(str(md), str(pdf), latex_cache=cache)
+    assert [cmd[0] for cmd in runs] == ["pandoc"]
+    assert "--pdf-engine" in runs[0]
+
+
+def test_latex_cache_prunes_media_by_reference(tmp_path):
+    cache = LatexCache(root=tmp_path / "cache", max_entries=1)
+    documents = {"a" * 64: "a-only.png", "b" * 64: "b-only.png"}
+    for index, (key, image) in enumerate(documents.items()):
+        temp_dir = tmp_path / f"tmp{index}"
+        (temp_dir / "media").mkdir(parents=True)
+        (temp_dir / "media" / image).write_bytes(b"png")
+        (temp_dir / "media" / "shared.png").write_bytes(b"png")
+        tex = temp_dir / "doc.tex"
+        tex.write_text(
+            f"\\includegraphics{{{temp_dir.as_posix()}/media/{image}}}"
+            f"\\includegraphics{{{temp_dir.as_posix()}/media/shared.png}}",
+            encoding="utf-8",
+        )
+        cache.store(key, tex, temp_dir)
+        if index == 0:
+            old = time.time() - 3600
+            os.utime(cache._entry(key), (old, old))
+            for media in cache.media_dir.iterdir():
+                os.utime(media, (old, old))
+
+    assert [entry.stem for entry in cache.entries()] == ["b" * 64]
+    assert sorted(p.name for p in cache.media_dir.iterdir()) == [
+        "b-only.png",
+        "shared.png",
+    ]
+
+
+def test_failed_build_restores_tmpdir_and_removes_temp_dir(monkeypatch, tmp_path):
+    md = tmp_path / "doc.md"
+    md.write_text("# Demo\n", encoding="utf-8")
+    temp_dirs: list[Path] = []
+
+    def failing_run(cmd, check=True, env=None, **kwargs):
+        temp_dirs.append(Path(os.environ["TMPDIR"]))
+        raise subprocess.CalledProcessError(1, cmd)
+
+    _patch_font_stack(monkeypatch)
+    monkeypatch.setattr(publisher, "_run", failing_run)
+    monkeypatch.delenv("ERDA_KEEP_LATEX_TEMP", raising=False)
+    monkeypatch.delenv("ERDA_LATEX_DIRECT", raising=False)
+    for key in ("TMPDIR", "TMP", "TEMP"):
+        monkeypatch.setenv(key, str(tmp_path))
+
+    with pytest.raises(subprocess.CalledProcessError):
+        publisher._run_pandoc(str(md), str(tmp_path / "out" / "doc.pdf"))
+
+    (temp_dir,) = temp_dirs
+    assert temp_dir.name.startswith("gbw-latex-")
+    assert not temp_dir.exists()
+    for key in ("TMPDIR", "TMP", "TEMP"):
+        assert os.environ[key] == str(tmp_path)
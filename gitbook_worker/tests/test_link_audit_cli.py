@@ -24,6 +24,7 @@ def test_main_discovers_markdown_files_from_root(monkeypatch: pytest.MonkeyPatch
         *,
         timeout: float,
         show_progress: bool,
+        checker: object,
     ) -> tuple[list[object], list[object]]:
         captured_md_files.extend(md_files)
         return [], []
@@ -1,3 +1,7 @@
+import random
+import time
+
+import pytest
 import yaml
 from gitbook_worker.tools.publishing import markdown_combiner
 
@@ -67,6 +71,21 @@ def test_combine_markdown(tmp_path):
     assert "\\newpage" in combined
 
 
+def test_iter_combined_markdown_yields_chapters_and_separators(tmp_path):
+    files = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.md"
+        path.write_text(f"# {name.upper()}\n", encoding="utf-8")
+        files.append(str(path))
+    missing = str(tmp_path / "missing.md")
+
+    chunks = list(markdown_combiner.iter_combined_markdown([missing, *files]))
+
+    assert len(chunks) == 3
+    assert chunks[1] == markdown_combiner.CHAPTER_SEPARATOR
+    assert "".join(chunks) == markdown_combiner.combine_markdown(files)
+
+
 def test_combine_markdown_escapes_square_brackets(tmp_path):
     f = tmp_path / "a.md"
     f.write_text("Value \\[m]", encoding="utf-8")
@@ -94,6 +113,77 @@ def test_normalize_md_handles_display_math_subscripts():
     assert normalized == "$$x_{1}$$"
 
 
+def _reference_normalize_md(text: str) -> str:
+    """Character loop ``normalize_md`` used before the translation tables."""
+    text = markdown_combiner._BRACKET_ESCAPE_RE.sub(r"[\1]", text)
+    out = []
+    in_math = False
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "$":
+            if i + 1 < len(text) and text[i + 1] == "$":
+                in_math = not in_math
+                out.append("$$")
+                i += 2
+                continue
+            in_math = not in_math
+            out.append("$")
+        elif ch in markdown_combiner._SUBS:
+            digit = markdown_combiner._SUBS[ch]
+            out.append(f"_{{{digit}}}" if in_math else f"$_{digit}$")
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def test_normalize_md_matches_reference_loop():
+    edge_cases = [
+        "",
+        "$",
+        "₁$",
+        "$₁",
+        "$$$₂",
+        "$$₃$$$₄$",
+        "a₅ $b₆$ $$c₇$$ d₈ $",
+        "\\[x₉\\] $$\n₀\n$$ tail₁",
+    ]
+    rng = random.Random(1234)
+    alphabet = "ab $\\[]\n" + "".join(markdown_combiner._SUBS)
+    fuzz = ["".join(rng.choices(alphabet, k=rng.randint(0, 60))) for _ in range(500)]
+    for text in edge_cases + fuzz:
+        assert markdown_combiner.normalize_md(text) == _reference_normalize_md(text)
+
+
+def _large_chapter() -> str:
+    prose = "Die Messreihe zeigt stabile Werte ohne größere Ausreißer. " * 12
+    formulas = "Wasser H₂O, Formel $x₁ + y₂$ und $$\\sum a₀$$ sowie CO₂.\n\n"
+    return (prose + formulas) * 500
+
+
+def test_normalize_md_matches_reference_loop_on_large_chapter():
+    chapter = _large_chapter()
+    assert markdown_combiner.normalize_md(chapter) == _reference_normalize_md(chapter)
+
+
+@pytest.mark.slow
+def test_normalize_md_is_faster_than_character_loop():
+    chapter = _large_chapter()
+
+    def best_of(func) -> float:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func(chapter)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    assert best_of(markdown_combiner.normalize_md) * 3 < best_of(
+        _reference_normalize_md
+    )
+
+
 def test_combine_markdown_respects_heading_targets_down(tmp_path):
     md_file = tmp_path / "doc.md"
     md_file.write_text("# Title\n\n## Child", encoding="utf-8")
@@ -3,11 +3,17 @@ from __future__ import annotations
 import textwrap
 from pathlib import Path
 
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from gitbook_worker.tools.testing.pdf_analysis import analyze_pdf_document
 from gitbook_worker.tools.testing.pdf_validator import (
     FontInfo,
     LogPatternMatch,
     PDFValidationResult,
     count_unicode_ranges,
+    extract_pdf_fonts_with_pypdf,
+    extract_pdf_text,
     font_name_matches,
     load_expected_fonts,
     normalize_font_name,
@@ -313,3 +319,132 @@ def test_result_to_dict_serializes_nested_paths(tmp_path: Path) -> None:
 
     assert data["pdf_path"] == str(tmp_path / "sample.pdf")
     assert data["forbidden_log_matches"][0]["path"] == str(log_path)
+
+
+def _write_text_pdf(path: Path, pages: int) -> None:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for number in range(1, pages + 1):
+        page = writer.add_blank_page(
+            width=842 if number % 3 == 0 else 595,
+            height=595 if number % 3 == 0 else 842,
+        )
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td (Seite {number}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+        if number % 4 == 1:
+            writer.add_outline_item(f"Kapitel {number}", number - 1)
+    with path.open("wb") as handle:
+        writer.write(handle)
+
+
+def test_pdf_analysis_reads_pages_once_and_matches_separate_extractors(
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "book.pdf"
+    _write_text_pdf(pdf, pages=9)
+
+    sequential = analyze_pdf_document(pdf, workers=1)
+    chunked = analyze_pdf_document(pdf, workers=2, chunk_pages=2)
+
+    assert chunked == sequential
+    assert [page.number for page in sequential.pages] == list(range(1, 10))
+    assert sequential.pages[2].width_pt > sequential.pages[2].height_pt
+    assert sequential.text == extract_pdf_text(pdf)
+    assert sequential.pypdf_fonts() == extract_pdf_fonts_with_pypdf(pdf)
+    assert [(entry.title, entry.page) for entry in sequential.toc_entries] == [
+        ("Kapitel 1", 1),
+        ("Kapitel 5", 5),
+        ("Kapitel 9", 9),
+    ]
+
+
+def test_validate_pdf_font_gate_uses_shared_analysis(tmp_path: Path) -> None:
+    config = tmp_path / "fonts.yml"
+    config.write_text(
+        textwrap.dedent(
+            """
+            version: 1.0.0
+            fonts:
+              SERIF:
+                name: Helvetica
+                paths: []
+                license: public
+                license_url: https://example.test/license
+            """
+        ),
+        encoding="utf-8",
+    )
+    pdf = tmp_path / "book.pdf"
+    _write_text_pdf(pdf, pages=2)
+    analysis = analyze_pdf_document(pdf, workers=1)
+    pdf.unlink()
+
+    result = validate_pdf_font_gate(
+        pdf,
+        fonts_config_path=config,
+        required_font_keys=("SERIF",),
+        required_text_ranges=(),
+        analysis=analysis,
+    )
+
+    assert result.fonts == tuple(analysis.resource_fonts)
+    assert result.required_fonts[0].matched_name == "/Helvetica"
+    assert result.errors == (
+        "Configured font SERIF='Helvetica' found as "
+        "'/Helvetica', but it is not embedded",
+    )
+
+
+def test_validate_pdf_font_gate_skips_analysis_when_text_is_given(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from gitbook_worker.tools.testing import pdf_validator
+
+    config = tmp_path / "fonts.yml"
+    config.write_text(
+        textwrap.dedent(
+            """
+            version: 1.0.0
+            fonts:
+              CJK:
+                name: ERDA CC-BY CJK
+                paths: []
+                license: public
+                license_url: https://example.test/license
+            """
+        ),
+        encoding="utf-8",
+    )
+    calls: list[object] = []
+
+    def fake_extract(path: Path, *, analysis=None) -> list[FontInfo]:
+        calls.append(analysis)
+        return [FontInfo("ERDACCbyCJK-Regular", "CID TrueType", None, True)]
+
+    def fail_analysis(*args, **kwargs):
+        raise AssertionError("text was given, no page pass expected")
+
+    monkeypatch.setattr(pdf_validator, "extract_pdf_fonts", fake_extract)
+    monkeypatch.setattr(pdf_validator, "analyze_pdf_document", fail_analysis)
+
+    result = validate_pdf_font_gate(
+        tmp_path / "book.pdf",
+        fonts_config_path=config,
+        required_font_keys=("CJK",),
+        text="中文",
+    )
+
+    assert result.passed
+    assert calls == [None]
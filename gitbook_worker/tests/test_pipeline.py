@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import dataclasses
+import os
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -132,6 +135,167 @@ def test_parse_publisher_args() -> None:
     )
 
 
+def _in_process_options(
+    manifest: Path, **overrides: object
+) -> pipeline.PipelineOptions:
+    values: dict[str, object] = dict(
+        root=manifest.parent,
+        manifest=manifest.resolve(),
+        commit=None,
+        base=None,
+        reset_others=False,
+        run_set_flag=False,
+        run_gitbook_rename=True,
+        run_gitbook_summary=True,
+        run_publisher=True,
+        gitbook_use_git=False,
+        run_frontmatter_check=False,
+        publisher_args=("--no-apt",),
+        dry_run=False,
+        language_id="de",
+        language_env={"GITBOOK_CONTENT_ID": "de"},
+    )
+    values.update(overrides)
+    return pipeline.PipelineOptions(**values)  # type: ignore[arg-type]
+
+
+def test_in_process_stages_call_functions_and_restore_environment(
+    monkeypatch: pytest.MonkeyPatch, publish_manifest: Path, tmp_path: Path
+) -> None:
+    from gitbook_worker.tools.publishing import gitbook_style, publisher
+
+    calls: list[tuple] = []
+
+    def fake_rename(root: Path, *, use_git: bool) -> None:
+        calls.append(
+            ("rename", root, use_git, Path.cwd(), os.environ["GITBOOK_CONTENT_ID"])
+        )
+
+    def fake_summary(root: Path, **kwargs: object) -> bool:
+        calls.append(("summary", kwargs["document_manifest"], kwargs["locale"]))
+        return False
+
+    def fake_publisher(argv: list[str]) -> None:
+        calls.append(("publisher", list(argv)))
+        os.environ["GITBOOK_WORKER_TEST_PUBLISHER"] = "1"
+        raise SystemExit(0)
+
+    def no_subprocess(*_: object, **__: object) -> None:  # pragma: no cover
+        raise AssertionError("in-process stages must not spawn Python")
+
+    monkeypatch.setattr(gitbook_style, "rename_to_gitbook_style", fake_rename)
+    monkeypatch.setattr(gitbook_style, "ensure_clean_summary", fake_summary)
+    monkeypatch.setattr(publisher, "main", fake_publisher)
+    monkeypatch.setattr(pipeline.subprocess, "run", no_subprocess)
+    monkeypatch.delenv("GITBOOK_CONTENT_ID", raising=False)
+    monkeypatch.chdir(tmp_path.parent)
+    options = _in_process_options(publish_manifest)
+
+    timings = pipeline.run_pipeline(options)
+
+    root = publish_manifest.parent.resolve()
+    assert calls == [
+        ("rename", root, False, root, "de"),
+        ("summary", options.manifest, "de"),
+        ("publisher", ["--manifest", str(options.manifest), "--no-apt"]),
+    ]
+    assert [(t["stage"], t["mode"], t["status"]) for t in timings] == [
+        ("gitbook", "in-process", "ok"),
+        ("publisher", "in-process", "ok"),
+    ]
+    assert Path.cwd() == tmp_path.parent
+    assert "GITBOOK_CONTENT_ID" not in os.environ
+    assert "GITBOOK_WORKER_TEST_PUBLISHER" not in os.environ
+
+
+def test_in_process_stages_restore_tempdir_and_font_dirs(
+    monkeypatch: pytest.MonkeyPatch, publish_manifest: Path, tmp_path: Path
+) -> None:
+    import tempfile
+
+    from gitbook_worker.tools.publishing import gitbook_style, publisher
+
+    monkeypatch.setattr(publisher, "_ADDITIONAL_FONT_DIRS", [])
+    original_tempdir = tempfile.gettempdir()
+    seen: list[tuple[str, list[Path]]] = []
+
+    def stage(name: str) -> None:
+        seen.append((tempfile.gettempdir(), list(publisher._ADDITIONAL_FONT_DIRS)))
+        # What the publisher does for its build workers (_init_build_worker).
+        worker_tmp = tmp_path / f"{name}-tmp"
+        worker_tmp.mkdir()
+        tempfile.tempdir = worker_tmp.as_posix()
+        publisher._remember_font_dir(tmp_path / f"{name}-fonts")
+
+    def fake_rename(root: Path, *, use_git: bool) -> None:
+        stage("rename")
+
+    def fake_publisher(argv: list[str]) -> None:
+        stage("publisher")
+
+    monkeypatch.setattr(gitbook_style, "rename_to_gitbook_style", fake_rename)
+    monkeypatch.setattr(publisher, "main", fake_publisher)
+    options = _in_process_options(publish_manifest, run_gitbook_summary=False)
+
+    pipeline.run_pipeline(options)
+
+    assert seen == [(original_tempdir, []), (original_tempdir, [])]
+    assert tempfile.gettempdir() == original_tempdir
+    assert publisher._ADDITIONAL_FONT_DIRS == []
+
+
+def test_in_process_publisher_failure_keeps_exit_status_and_timings(
+    monkeypatch: pytest.MonkeyPatch, publish_manifest: Path
+) -> None:
+    from gitbook_worker.tools.publishing import publisher
+
+    def failing_publisher(argv: list[str]) -> None:
+        raise SystemExit(43)
+
+    monkeypatch.setattr(publisher, "main", failing_publisher)
+    options = _in_process_options(
+        publish_manifest, run_gitbook_rename=False, run_gitbook_summary=False
+    )
+    timings: list[dict[str, object]] = []
+
+    with pytest.raises(pipeline.CommandError) as excinfo:
+        pipeline.run_pipeline(options, timings=timings)
+
+    assert excinfo.value.returncode == 43
+    assert [(t["stage"], t["status"]) for t in timings] == [
+        ("gitbook", "ok"),
+        ("publisher", "failed"),
+    ]
+
+
+def test_subprocess_flag_runs_stages_as_python_processes(
+    monkeypatch: pytest.MonkeyPatch, publish_manifest: Path
+) -> None:
+    commands: list[list[str]] = []
+
+    def fake_run(cmd: list[str], **_: object) -> subprocess.CompletedProcess:
+        commands.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(pipeline.subprocess, "run", fake_run)
+    args = pipeline.parse_args(
+        ["--root", str(publish_manifest.parent), "--subprocess", "--no-set-flag"]
+    )
+    options = pipeline._resolve_options(args)
+    assert options.in_process is False
+
+    timings = pipeline.run_pipeline(
+        dataclasses.replace(options, run_frontmatter_check=False)
+    )
+
+    assert [Path(cmd[1]).name for cmd in commands] == [
+        "gitbook_style.py",
+        "gitbook_style.py",
+        "publisher.py",
+    ]
+    assert {t["mode"] for t in timings} == {"subprocess"}
+
+
 # --- _should_skip_rename tests ---
 
 
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+
+from gitbook_worker.tools.publishing import markdown_combiner, preprocess_md
+from gitbook_worker.tools.publishing.preprocess_cache import PreprocessCache
+
+
+def _chapter(tmp_path: Path, text: str) -> Path:
+    chapter = tmp_path / "book" / "chapter.md"
+    chapter.parent.mkdir(parents=True, exist_ok=True)
+    chapter.write_text(text, encoding="utf-8")
+    return chapter
+
+
+def _counting_process(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    original = preprocess_md.process
+
+    def fake_process(path, **kwargs):
+        calls.append(str(path))
+        return original(path, **kwargs)
+
+    monkeypatch.setattr(preprocess_md, "process", fake_process)
+    return calls
+
+
+def test_combine_markdown_reuses_cached_chapters(monkeypatch, tmp_path):
+    chapter = _chapter(tmp_path, "# Title\n\nBody with link [x](other.md)\n")
+    cache = PreprocessCache(root=tmp_path / "cache")
+    calls = _counting_process(monkeypatch)
+
+    first = markdown_combiner.combine_markdown([str(chapter)], cache=cache)
+    second = markdown_combiner.combine_markdown([str(chapter)], cache=cache)
+
+    assert first == second
+    assert first == markdown_combiner.combine_markdown([str(chapter)])
+    assert len(calls) == 2  # cached run skipped process()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.log_stats("book.pdf")
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_cache_key_tracks_inputs(tmp_path):
+    chapter = _chapter(tmp_path, "# Title\n\n![img](pic.png)\n\n[next](next.md)\n")
+    cache = PreprocessCache(root=tmp_path / "cache")
+
+    def key(**overrides):
+        options = {"paper_format": "a4", "table_strategy": None, "target_level": 1}
+        options.update(overrides)
+        return cache.key(chapter, **options)
+
+    base = key()
+    assert key() == base
+    assert key(paper_format="a3") != base
+    assert key(target_level=2) != base
+    assert key(table_strategy={"mode": "fit"}) != base
+
+    image = chapter.parent / "pic.png"
+    image.write_bytes(b"png")
+    with_image = key()
+    assert with_image != base
+    os.utime(image, ns=(1, 1))
+    assert key() != with_image
+
+    (chapter.parent / "next.md").write_text("# Next\n", encoding="utf-8")
+    with_link = key()
+    chapter.write_text(chapter.read_text(encoding="utf-8") + "\nmore\n", "utf-8")
+    assert key() != with_link
+
+
+def test_cache_bypassed_when_table_report_requested(tmp_path):
+    chapter = _chapter(tmp_path, "# Title\n")
+    cache = PreprocessCache(root=tmp_path / "cache")
+
+    key = cache.key(
+        chapter,
+        paper_format="a4",
+        table_strategy={"report_path": str(tmp_path / "tables.jsonl")},
+        target_level=None,
+    )
+
+    assert key is None
+    assert cache.bypassed == 1
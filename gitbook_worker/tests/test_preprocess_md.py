@@ -150,6 +150,64 @@ def test_table_width_uses_usable_text_area() -> None:
     assert info.size_mm == (420, 297)
 
 
+def test_glyph_width_table_matches_unicode_classification() -> None:
+    from gitbook_worker.tools.publishing import table_strategy
+
+    for char in "aZ1 .,mW@ßäé—日한ｱ́ €🙂𝔸":
+        assert table_strategy.glyph_width_em(
+            char
+        ) == table_strategy._classify_glyph_width_em(char)
+    text = "Straße 12 — 日本語 🙂 code_id"
+    assert preprocess_md.estimate_text_width_mm(text) == sum(
+        table_strategy._classify_glyph_width_em(char)
+        * preprocess_md.TABLE_FONT_SIZE_PT
+        * preprocess_md.PT_TO_MM
+        for char in table_strategy.normalize_table_measurement_text(text)
+    )
+
+
+def test_table_cells_are_measured_once_for_all_candidates(monkeypatch) -> None:
+    from gitbook_worker.tools.publishing import table_strategy
+
+    table = [
+        "| Key | Beschreibung | Status |",
+        "| --- | --- | --- |",
+        *[
+            f"| K-{i} | {'lange Beschreibung ' * (i % 7 + 1)} | offen |"
+            for i in range(40)
+        ],
+    ]
+    table_strategy._measure_table.cache_clear()
+    calls: list[str] = []
+    original = table_strategy.normalize_table_measurement_text
+
+    def counting_normalize(value: str) -> str:
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(
+        table_strategy, "normalize_table_measurement_text", counting_normalize
+    )
+
+    a4 = preprocess_md.get_valid_paper_measurements("a4")
+    config = table_strategy.parse_table_strategy_config(None)
+    decision = table_strategy.choose_table_paper(table, base_paper=a4)
+
+    assert len(decision.evaluations) > 1
+    assert len(calls) == 41 * 3
+    candidates = {
+        paper.size_mm: (index, paper)
+        for index, paper in enumerate(table_strategy.iter_paper_candidates(a4))
+    }
+    for evaluation in decision.evaluations:
+        index, paper = candidates[evaluation.size_mm]
+        again = table_strategy.evaluate_candidate_layout(
+            table, paper, config, candidate_index=index
+        )
+        assert again == evaluation
+    assert len(calls) == 41 * 3
+
+
 def test_table_with_long_cells_uses_content_width(artifact_dir):
     md = _wide_content_table(artifact_dir)
     out = preprocess_md.process(str(md), paper_format="a4")
@@ -228,6 +286,29 @@ def test_table_strategy_custom_candidate_and_report(artifact_dir):
     assert report["evaluations"]
 
 
+def test_table_report_sink_writes_decisions_once_per_build(tmp_path):
+    from gitbook_worker.tools.publishing.table_strategy import TableReportSink
+
+    md = _wide_content_table(tmp_path)
+    report_path = tmp_path / "book.table-layout.jsonl"
+    sink = TableReportSink.open(report_path)
+    try:
+        for _ in range(3):
+            preprocess_md.process(
+                str(md),
+                paper_format="a4",
+                table_strategy={"report_path": str(report_path)},
+            )
+        assert not report_path.exists()
+        assert len(sink.records) == 3
+    finally:
+        sink.close()
+
+    lines = report_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])["evaluations"]
+
+
 def test_table_strategy_uses_wrapping_latex_columns(artifact_dir):
     md = _english_wide_decision_table(artifact_dir)
     out = preprocess_md.process(str(md), paper_format="a4")
@@ -650,7 +731,7 @@ def test_svg_skips_size_probe(monkeypatch, tmp_path):
 
     calls: list[Path] = []
 
-    def fake_get_image_width(path: Path) -> int:
+    def fake_get_image_width(path: Path, index=None) -> int:
         calls.append(path)
         return 0
 
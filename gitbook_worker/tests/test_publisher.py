@@ -78,6 +78,25 @@ def test_resource_paths_prioritise_source_dir(tmp_path):
     assert paths[1:4] == [".", "assets", ".gitbook/assets"]
 
 
+@pytest.mark.parametrize("asset_count", [10, 1000])
+def test_resource_paths_stay_bounded_by_asset_directories(tmp_path, asset_count):
+    md_file = tmp_path / "temp" / "combined.md"
+    assets = md_file.parent / ".gitbook" / "assets"
+    files = []
+    for index in range(asset_count):
+        asset = assets / f"dir{index % 3}" / f"img{index}.png"
+        asset.parent.mkdir(parents=True, exist_ok=True)
+        asset.write_bytes(b"png")
+        files.append(str(asset))
+
+    paths = publisher._resource_paths_for_source(str(md_file), files)
+
+    defaults = publisher._build_resource_paths([])
+    assert len(paths) == 1 + len(defaults) + 3
+    assert (assets / "dir1").as_posix() in paths
+    assert not any(path.endswith(".png") for path in paths)
+
+
 def test_font_header_includes_manual_fallback_block():
     # Requires luaotfload cache for fallback fonts; skip when cache is absent.
     pytest.skip(  # pragma: no cover - environment-dependent
@@ -643,9 +662,9 @@ def test_build_pdf_reads_uppercase_summary(tmp_path, monkeypatch):
 
     def fake_combine(files, paper_format="a4", **_):
         captured["files"] = [Path(f).name for f in files]
-        return "---\n---\n"
+        yield "---\n---\n"
 
-    monkeypatch.setattr(publisher, "combine_markdown", fake_combine)
+    monkeypatch.setattr(publisher, "iter_combined_markdown", fake_combine)
     monkeypatch.setattr(
         publisher, "add_geometry_package", lambda text, paper_format="a4": text
     )
@@ -685,9 +704,9 @@ def test_build_pdf_refreshes_summary_from_book_json(tmp_path, monkeypatch):
 
     def fake_combine(files, paper_format="a4", **_):
         captured["files"] = [Path(f).name for f in files]
-        return "---\n---\n"
+        yield "---\n---\n"
 
-    monkeypatch.setattr(publisher, "combine_markdown", fake_combine)
+    monkeypatch.setattr(publisher, "iter_combined_markdown", fake_combine)
     monkeypatch.setattr(
         publisher, "add_geometry_package", lambda text, paper_format="a4": text
     )
@@ -1103,3 +1122,261 @@ def test_decide_bxcoloremoji_disables_when_requested(monkeypatch):
     assert not publisher._decide_bxcoloremoji(
         publisher.EmojiOptions(color=True, bxcoloremoji=False)
     )
+
+
+def test_resolve_build_jobs_clamps_to_targets(monkeypatch):
+    monkeypatch.delenv("GITBOOK_WORKER_PUBLISH_JOBS", raising=False)
+    assert publisher._resolve_build_jobs(None, 5) == 1
+    assert publisher._resolve_build_jobs(8, 3) == 3
+    assert publisher._resolve_build_jobs(0, 100) >= 1
+
+    monkeypatch.setenv("GITBOOK_WORKER_PUBLISH_JOBS", "4")
+    assert publisher._resolve_build_jobs(None, 10) == 4
+
+
+def test_schedule_builds_sequential_keeps_order(monkeypatch):
+    calls: list[str] = []
+
+    def fake_build_pdf(**kwargs):
+        calls.append(kwargs["out"])
+        return kwargs["out"] != "b.pdf", None
+
+    monkeypatch.setattr(publisher, "build_pdf", fake_build_pdf)
+
+    results = publisher._schedule_builds(
+        [{"out": "a.pdf"}, {"out": "b.pdf"}, {"out": "c.pdf"}], jobs=1
+    )
+
+    assert calls == ["a.pdf", "b.pdf", "c.pdf"]
+    assert [ok for ok, _ in results] == [True, False, True]
+
+
+def test_schedule_builds_parallel_reports_failures_in_order(tmp_path):
+    jobs = []
+    for name in ("first", "second"):
+        folder = tmp_path / name
+        folder.mkdir()
+        jobs.append(
+            {
+                "path": folder,
+                "out": f"{name}.pdf",
+                "typ": "folder",
+                "publish_dir": str(tmp_path / "publish"),
+            }
+        )
+
+    results = publisher._schedule_builds(jobs, jobs=2)
+
+    assert len(results) == 2
+    for (ok, msg), name in zip(results, ("first", "second")):
+        assert ok is False
+        assert "No markdown files" in msg and name in msg
+
+
+def test_init_build_worker_isolates_tempdir(monkeypatch, tmp_path):
+    for key in ("TMPDIR", "TMP", "TEMP"):
+        monkeypatch.setenv(key, "/original")
+    monkeypatch.setattr(publisher.tempfile, "tempdir", None)
+    monkeypatch.setattr(publisher, "_ADDITIONAL_FONT_DIRS", [])
+
+    publisher._init_build_worker(str(tmp_path), [str(tmp_path / "fonts")])
+
+    worker_tmp = Path(publisher.os.environ["TMPDIR"])
+    assert worker_tmp.parent == tmp_path
+    assert publisher.os.environ["TMP"] == publisher.os.environ["TEMP"]
+    assert publisher.tempfile.tempdir == worker_tmp.as_posix()
+    assert (tmp_path / "fonts").resolve() in publisher._ADDITIONAL_FONT_DIRS
+
+
+def test_font_inventory_answers_lookups_from_one_fc_list_call(monkeypatch):
+    calls: list[list[str]] = []
+
+    class DummyResult:
+        stdout = "ERDA CC-BY CJK\nDejaVu Sans,DejaVu Sans Condensed\n"
+        stderr = ""
+        returncode = 0
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return DummyResult()
+
+    monkeypatch.setattr(
+        publisher, "_which", lambda name: name if name == "fc-list" else None
+    )
+    monkeypatch.setattr(publisher, "_run", fake_run)
+    monkeypatch.setattr(publisher, "_luaotfload_names_files", lambda: [])
+
+    assert publisher._check_fontconfig_has_font("ERDA CC-BY CJK")
+    assert publisher._check_fontconfig_has_font("DejaVu Sans Condensed")
+    assert not publisher._check_fontconfig_has_font("Twemoji Mozilla")
+    assert publisher._get_font_inventory().fontconfig_matches("DejaVu Sans")
+    assert len(calls) == 1
+
+    publisher._invalidate_font_inventory()
+    publisher._check_fontconfig_has_font("ERDA CC-BY CJK")
+    assert len(calls) == 2
+
+
+def test_font_inventory_reads_luaotfload_database(monkeypatch, tmp_path):
+    font_file = tmp_path / "twemoji.ttf"
+    font_file.write_bytes(b"\x00\x01\x00\x00" + b"\x00" * 128)
+    names_dir = tmp_path / "generic" / "names"
+    names_dir.mkdir(parents=True)
+    database = names_dir / "luaotfload-names.lua.gz"
+    database.write_bytes(
+        publisher.gzip.compress(
+            (
+                'return { ["mappings"]={ { ["basename"]="twemoji.ttf", '
+                '["familyname"]="twemojimozilla", ["fullname"]="twemojimozilla", '
+                f'["fullpath"]="{font_file.as_posix()}", '
+                '["plainname"]="Twemoji Mozilla", ["style"]={ ["x"]="y" } } } }'
+            ).encode("utf-8")
+        )
+    )
+
+    def fail_run(cmd, **kwargs):
+        raise AssertionError(f"unexpected subprocess: {cmd}")
+
+    monkeypatch.setattr(publisher, "_which", lambda name: None)
+    monkeypatch.setattr(publisher, "_run", fail_run)
+    monkeypatch.setattr(publisher, "_luaotfload_names_files", lambda: [database])
+
+    assert publisher._check_luaotfload_has_font("Twemoji Mozilla")
+    assert not publisher._check_luaotfload_has_font("Missing Font")
+
+
+def test_font_inventory_keeps_substring_fallback_for_fontconfig(monkeypatch):
+    class DummyResult:
+        stdout = "DejaVu Sans Mono\n"
+        stderr = ""
+        returncode = 0
+
+    monkeypatch.setattr(
+        publisher, "_which", lambda name: name if name == "fc-list" else None
+    )
+    monkeypatch.setattr(publisher, "_run", lambda cmd, **kwargs: DummyResult())
+    monkeypatch.setattr(publisher, "_luaotfload_names_files", lambda: [])
+
+    inventory = publisher._get_font_inventory()
+    assert inventory.fontconfig_matches("DejaVu Sans Mono")
+    # Like the former ``fc-list`` substring check, a family prefix still matches.
+    assert inventory.fontconfig_matches("DejaVu Sans")
+    assert not inventory.fontconfig_matches("DejaVu Serif")
+
+
+def test_parse_luaotfload_names_ignores_key_order():
+    text = (
+        'return { ["mappings"]={ { ["fullpath"]="/fonts/a \\"x\\".ttf", '
+        '["style"]={ ["fullpath"]="/nested.ttf" }, ["psname"]="A-Regular", '
+        '["basename"]="a.ttf" }, { ["familyname"]="{b}", '
+        '["fullpath"]="/fonts/b.otf" }, { ["familyname"]="no path" } } }'
+    )
+
+    names = publisher._parse_luaotfload_names(text)
+
+    assert names == {
+        publisher._normalize_font_name("A-Regular"): Path('/fonts/a "x".ttf'),
+        publisher._normalize_font_name("{b}"): Path("/fonts/b.otf"),
+    }
+    assert publisher._parse_luaotfload_names("garbage") == {}
+
+
+def test_font_tree_fingerprints_track_added_and_modified_trees(tmp_path):
+    stamp = tmp_path / "cache" / publisher._FONT_FINGERPRINT_FILE
+    first = publisher._font_tree_fingerprints(
+        {tmp_path / "a" / "one.ttf": "h1", tmp_path / "a" / "two.otf": "h2"}
+    )
+    publisher._store_font_fingerprints(stamp, first)
+    previous = publisher._load_font_fingerprints(stamp)
+    assert previous == first
+
+    assert publisher._changed_font_trees(previous, first) == ([], [])
+
+    current = publisher._font_tree_fingerprints(
+        {
+            tmp_path / "a" / "one.ttf": "h1",
+            tmp_path / "a" / "two.otf": "changed",
+            tmp_path / "b" / "new.ttf": "h3",
+        }
+    )
+    added, modified = publisher._changed_font_trees(previous, current)
+    assert added == [(tmp_path / "b").as_posix()]
+    assert modified == [(tmp_path / "a").as_posix()]
+
+
+def test_configure_texmf_cache_keeps_texmfcache_untouched(monkeypatch, tmp_path):
+    persistent = tmp_path / "texmf-var" / "luatex-cache"
+    monkeypatch.setattr(publisher, "_resolve_repo_root", lambda: tmp_path / "repo")
+    monkeypatch.setattr(
+        publisher, "_luatex_cache_roots", lambda: [persistent.resolve()]
+    )
+    monkeypatch.setenv("GITBOOK_WORKER_LUATEX_CACHE_DIR", str(persistent))
+    monkeypatch.setenv("TEXMFCACHE", "")
+    monkeypatch.delenv("TEXMFCACHE")
+    monkeypatch.setenv("TEXMFVAR", "")
+    monkeypatch.setenv("TEXMFCONFIG", "")
+
+    assert publisher._configure_texmf_cache(None) == persistent
+    assert persistent.is_dir()
+    assert "TEXMFCACHE" not in publisher.os.environ
+
+    monkeypatch.delenv("GITBOOK_WORKER_LUATEX_CACHE_DIR")
+    assert publisher._configure_texmf_cache(None) == tmp_path / "repo" / ".texmf-cache"
+    assert "TEXMFCACHE" not in publisher.os.environ
+
+
+def test_update_luaotfload_database_reports_exit_status(monkeypatch):
+    class DummyResult:
+        stdout = stderr = ""
+
+    returncodes = iter([0, 1])
+
+    def fake_run(cmd, **kwargs):
+        result = DummyResult()
+        result.returncode = next(returncodes)
+        return result
+
+    monkeypatch.setattr(publisher, "_which", lambda name: name)
+    monkeypatch.setattr(publisher, "_run", fake_run)
+
+    assert publisher._update_luaotfload_database() is True
+    assert publisher._update_luaotfload_database() is False
+    monkeypatch.setattr(publisher, "_which", lambda name: None)
+    assert publisher._update_luaotfload_database() is False
+
+
+def test_convert_folder_streams_combined_markdown(tmp_path, monkeypatch, caplog):
+    folder = tmp_path / "book"
+    folder.mkdir()
+    (folder / "a.md").write_text(
+        "# Tom & Jerry\n\n![x](../.gitbook/assets/x.png)\n", encoding="utf-8"
+    )
+    (folder / "b.md").write_text(
+        "# Second & more\n\nUnique body text\n", encoding="utf-8"
+    )
+    (folder / "SUMMARY.md").write_text("* [A](a.md)\n* [B](b.md)\n", encoding="utf-8")
+
+    captured: dict[str, str] = {}
+
+    def fake_run_pandoc(md_path, pdf_out, **kwargs):
+        captured["md"] = Path(md_path).read_text(encoding="utf-8")
+
+    monkeypatch.setattr(publisher, "_run_pandoc", fake_run_pandoc)
+
+    with caplog.at_level("INFO"):
+        publisher.convert_a_folder(
+            str(folder),
+            str(tmp_path / "out" / "book.pdf"),
+            use_summary=True,
+            publish_dir=str(tmp_path / "out"),
+        )
+
+    files = [str(folder / "a.md"), str(folder / "b.md")]
+    expected = publisher._rewrite_combined_markdown(
+        publisher.add_geometry_package(publisher.combine_markdown(files))
+    )
+    assert captured["md"] == expected
+    assert "# Tom \\& Jerry" in captured["md"]
+    assert "# Second & more" in captured["md"]
+    assert "(.gitbook/assets/x.png)" in captured["md"]
+    assert not any("Unique body text" in record.message for record in caplog.records)
@@ -0,0 +1,116 @@
+"""Tests for the incremental SUMMARY.md regeneration."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from gitbook_worker.tools.publishing import summary_index
+from gitbook_worker.tools.publishing.gitbook_style import ensure_clean_summary
+from gitbook_worker.tools.publishing.summary_index import (
+    SUMMARY_CACHE_DIR_ENV,
+    SummaryIndex,
+)
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def book(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv(SUMMARY_CACHE_DIR_ENV, str(tmp_path / "cache"))
+    root = tmp_path / "book"
+    _write(root / "README.md", "# Book\n")
+    _write(root / "chapters" / "README.md", "---\ntitle: Teil\n---\n# Chapters\n")
+    _write(root / "chapters" / "01-intro.md", "# Intro\n\nText\n")
+    _write(root / "chapters" / "02-next.md", "# Next\n")
+    _write(root / "anhang" / "README.md", "# Anhang A\n")
+    _write(root / "anhang" / "quellen.md", "# Appendix Sources\n")
+    return root
+
+
+def _run(
+    root: Path, monkeypatch: pytest.MonkeyPatch, **kwargs: object
+) -> Optional[SummaryIndex]:
+    indexes: list[SummaryIndex] = []
+    from_env = SummaryIndex.from_env
+
+    def tracking_from_env(*args: object, **kw: object) -> SummaryIndex:
+        indexes.append(from_env(*args, **kw))
+        return indexes[-1]
+
+    monkeypatch.setattr(SummaryIndex, "from_env", tracking_from_env)
+    ensure_clean_summary(root, run_git=False, summary_appendices_last=True, **kwargs)
+    monkeypatch.setattr(SummaryIndex, "from_env", from_env)
+    return indexes[0] if indexes else None
+
+
+def test_summary_index_rereads_only_changed_files(
+    book: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = _run(book, monkeypatch)
+    summary = (book / "SUMMARY.md").read_text(encoding="utf-8")
+    assert (first.hits, first.misses) == (0, 6)
+
+    second = _run(book, monkeypatch)
+    assert (second.hits, second.misses) == (6, 0)
+    assert (book / "SUMMARY.md").read_text(encoding="utf-8") == summary
+
+    intro = book / "chapters" / "01-intro.md"
+    intro.write_text("# Intro\n\nMore text\n", encoding="utf-8")
+    _write(book / "chapters" / "03-new.md", "# New\n")
+    third = _run(book, monkeypatch)
+    assert (third.hits, third.misses) == (5, 2)
+    assert "* [New](chapters/03-new.md)" in (book / "SUMMARY.md").read_text(
+        encoding="utf-8"
+    )
+
+    (book / "chapters" / "03-new.md").unlink()
+    assert _run(book, monkeypatch).misses == 0
+    assert (book / "SUMMARY.md").read_text(encoding="utf-8") == summary
+
+    # Same size and mtime: only the git change list reveals the edit.
+    stat = intro.stat()
+    intro.write_text("# Intra\n\nMore text\n", encoding="utf-8")
+    os.utime(intro, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _run(book, monkeypatch).misses == 0
+    forced = _run(book, monkeypatch, changed_files=[intro])
+    assert (forced.hits, forced.misses) == (5, 1)
+    assert "* [Intra](chapters/01-intro.md)" in (book / "SUMMARY.md").read_text(
+        encoding="utf-8"
+    )
+
+
+def test_summary_index_matches_full_rebuild(
+    book: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _run(book, monkeypatch)
+    _write(book / "chapters" / "01-intro.md", "# Appendix Z\n")
+    _write(book / "anhang" / "quellen.md", "Keine Überschrift\n")
+    _run(book, monkeypatch)
+    incremental = (book / "SUMMARY.md").read_text(encoding="utf-8")
+
+    assert _run(book, monkeypatch, use_summary_index=False) is None
+    assert (book / "SUMMARY.md").read_text(encoding="utf-8") == incremental
+    assert "* [Appendix Z](chapters/01-intro.md)" in incremental
+
+
+def test_summary_index_is_dropped_when_generator_changes(
+    book: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _run(book, monkeypatch)
+    monkeypatch.setattr(summary_index, "_source_fingerprint", lambda: "changed")
+    assert _run(book, monkeypatch).hits == 0
+
+
+def test_summary_index_defaults_to_the_test_cache_root(
+    tmp_path: Path, isolated_cache_root: Path
+) -> None:
+    index = SummaryIndex.from_env(tmp_path / "book")
+    assert index.path.parent == isolated_cache_root / "summary"
@@ -0,0 +1,123 @@
+"""Tests for the concurrent, cached URL checks used by ``link_audit``."""
+
+from __future__ import annotations
+
+import csv
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from gitbook_worker.tools.quality import link_audit
+from gitbook_worker.tools.quality.url_checker import (
+    UrlChecker,
+    UrlStatus,
+    UrlStatusCache,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: Counter = Counter()
+
+    def _respond(self) -> None:
+        type(self).hits[(self.command, self.path)] += 1
+        if self.path.startswith("/ok"):
+            self.send_response(200)
+        elif self.path == "/no-head" and self.command == "HEAD":
+            self.send_response(405)
+        elif self.path == "/no-head":
+            self.send_response(200)
+        else:
+            self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def http_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    _Handler.hits = Counter()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_links_are_checked_once_per_url_and_cached(
+    http_server: str, tmp_path: Path
+) -> None:
+    chapters = []
+    for index in range(3):
+        chapter = tmp_path / f"chapter-{index}.md"
+        chapter.write_text(
+            f"See [doi]({http_server}/ok/doi) and [gone]({http_server}/missing).\n"
+            f"Also [legacy]({http_server}/no-head) [doi]({http_server}/ok/doi)\n",
+            encoding="utf-8",
+        )
+        chapters.append(chapter)
+    cache = UrlStatusCache(path=tmp_path / "cache" / "status.json")
+    report = tmp_path / "report.csv"
+
+    checker = UrlChecker(workers=4, host_interval=0.0, cache=cache)
+    broken, good = link_audit.check_http_links(
+        chapters, report, show_progress=False, checker=checker
+    )
+
+    assert len(broken) == 3
+    assert len(good) == 9
+    assert {finding.status_code for finding in broken} == {"404"}
+    with report.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.reader(handle))
+    assert len(rows) == 13
+    assert [row[3] for row in rows[1:4]] == ["1", "1", "2"]
+    assert _Handler.hits == {
+        ("HEAD", "/ok/doi"): 1,
+        ("HEAD", "/missing"): 1,
+        ("GET", "/missing"): 1,
+        ("HEAD", "/no-head"): 1,
+        ("GET", "/no-head"): 1,
+    }
+
+    _Handler.hits.clear()
+    rerun = UrlChecker(
+        workers=4,
+        host_interval=0.0,
+        cache=UrlStatusCache(path=tmp_path / "cache" / "status.json"),
+    )
+    broken, good = link_audit.check_http_links(
+        chapters, report, show_progress=False, checker=rerun
+    )
+
+    assert (len(broken), len(good)) == (3, 9)
+    assert _Handler.hits == {("HEAD", "/missing"): 1, ("GET", "/missing"): 1}
+    checker.close()
+    rerun.close()
+
+
+def test_url_cache_entries_expire_after_ttl(http_server: str, tmp_path: Path) -> None:
+    url = f"{http_server}/ok/a"
+    cache = UrlStatusCache(path=tmp_path / "status.json", ttl_seconds=3600)
+    cache.put(UrlStatus(url, 200, "OK", time.time() - 7200))
+    checker = UrlChecker(host_interval=0.0, cache=cache)
+
+    first = checker.check_many([url])
+    second = checker.check_many([url])
+
+    assert not first[url].cached
+    assert second[url].cached
+    assert _Handler.hits[("HEAD", "/ok/a")] == 1
+    checker.close()
@@ -42,3 +42,65 @@ def test_copy_single_content_file(tmp_path: Path):
     copied = work_dir / "figure" / "pic.jpg"
     assert copied.exists()
     assert copied.read_bytes() == b"bin"
+
+
+class _CountingConverter:
+    name = "svglib"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def convert(self, *, svg_file: Path, pdf_file: Path) -> None:
+        self.calls += 1
+        pdf_file.write_bytes(b"%PDF " + svg_file.read_bytes())
+
+
+def test_staging_reuses_svg_conversions_across_targets(tmp_path: Path, monkeypatch):
+    from gitbook_worker.core.application import svg_to_pdf
+    from gitbook_worker.tools.utils.svg_pdf_cache import SvgPdfCache
+
+    converter = _CountingConverter()
+    monkeypatch.setattr(
+        svg_to_pdf, "default_svg_to_pdf_converters", lambda: [converter]
+    )
+    project = tmp_path / "project"
+    assets_dir = project / ".gitbook" / "assets"
+    assets_dir.mkdir(parents=True)
+    (assets_dir / "img.png").write_bytes(b"data")
+    (assets_dir / "diagram.svg").write_text("<svg/>", encoding="utf-8")
+    cache = SvgPdfCache(root=tmp_path / "svg-cache")
+
+    staged = []
+    for target in ("first", "second"):
+        work_dir = tmp_path / target
+        work_dir.mkdir()
+        tmp_md = work_dir / "tmp.md"
+        tmp_md.write_text("placeholder", encoding="utf-8")
+        paths: list[str] = []
+        copy_assets_to_temp(
+            tmp_md,
+            project,
+            [{"path": ".gitbook/assets"}],
+            resolved_resource_paths=paths,
+            svg_cache=cache,
+        )
+        staged.append(work_dir / ".gitbook" / "assets")
+        assert paths == [str(staged[-1])]
+
+    assert converter.calls == 1
+    for assets in staged:
+        assert (assets / "img.png").read_bytes() == b"data"
+        assert (assets / "diagram.pdf").read_bytes() == b"%PDF <svg/>"
+    assert len(cache.entries()) == 1
+
+    (assets_dir / "diagram.svg").write_text("<svg id='v2'/>", encoding="utf-8")
+    work_dir = tmp_path / "third"
+    work_dir.mkdir()
+    copy_assets_to_temp(
+        work_dir / "tmp.md", project, [{"path": ".gitbook/assets"}], svg_cache=cache
+    )
+    assert converter.calls == 2
+    assert b"v2" in (work_dir / ".gitbook" / "assets" / "diagram.pdf").read_bytes()
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import os
+import struct
 from pathlib import Path
 
 import pytest
 
-from gitbook_worker.tools.utils.image_info import get_image_width
+from gitbook_worker.tools.utils import image_info
+from gitbook_worker.tools.utils.image_info import (
+    ImageIndex,
+    ImageInfo,
+    get_image_width,
+    read_image_header,
+)
 
 
 @pytest.fixture()
@@ -37,3 +45,79 @@ def test_raster_image_width(tmp_path: Path):
     Image.new("RGB", (123, 45), color="red").save(path)
 
     assert get_image_width(path) == 123
+
+
+@pytest.mark.parametrize(
+    "name, mode, size, options",
+    [
+        ("a.png", "RGBA", (123, 45), {"dpi": (300, 300)}),
+        ("b.jpg", "RGB", (64, 48), {"dpi": (150, 150), "progressive": True}),
+        ("c.gif", "P", (33, 22), {}),
+        ("d.bmp", "RGB", (50, 60), {}),
+        ("e.webp", "RGB", (20, 10), {"lossless": True}),
+        ("f.webp", "RGBA", (21, 11), {}),
+    ],
+)
+def test_header_parser_matches_pillow(tmp_path: Path, name, mode, size, options):
+    pytest.importorskip("PIL.Image")
+    from PIL import Image
+
+    path = tmp_path / name
+    Image.new(mode, size).save(path, **options)
+
+    info = read_image_header(path)
+
+    assert (info.width, info.height) == size
+    if "dpi" in options:
+        assert info.dpi == pytest.approx(options["dpi"], abs=0.01)
+
+
+def _png(path: Path, width: int, height: int) -> None:
+    """Write a minimal PNG header (enough for the header parser)."""
+
+    ihdr = struct.pack(">II5B", width, height, 8, 2, 0, 0, 0)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", len(ihdr))
+        + b"IHDR"
+        + ihdr
+        + b"\0\0\0\0"
+        + b"\0\0\0\0IEND\xaeB`\x82"
+    )
+
+
+def test_image_index_persists_and_revalidates(tmp_path: Path, monkeypatch):
+    image = tmp_path / "assets" / "wide.png"
+    image.parent.mkdir()
+    _png(image, 4000, 10)
+    index = ImageIndex(path=tmp_path / "index" / "index.json")
+
+    assert get_image_width(image, index=index) == 4000
+    index.flush()
+
+    def no_parsing(path):
+        raise AssertionError(f"header of {path} parsed again")
+
+    monkeypatch.setattr(image_info, "read_image_header", no_parsing)
+    reloaded = ImageIndex(path=index.path)
+    assert reloaded.lookup(image) == ImageInfo(4000, 10)
+    assert reloaded.hits == 1
+
+    monkeypatch.undo()
+    _png(image, 800, 10)
+    os.utime(image, ns=(0, 1_000_000_000))
+    assert get_image_width(image, index=reloaded) == 800
+
+
+def test_warm_up_command_indexes_asset_tree(tmp_path: Path, capsys):
+    assets = tmp_path / ".gitbook" / "assets"
+    (assets / "sub").mkdir(parents=True)
+    _png(assets / "one.png", 10, 10)
+    _png(assets / "sub" / "two.png", 20, 20)
+    (assets / "diagram.svg").write_text("<svg/>", encoding="utf-8")
+
+    image_info.main([str(assets), "--index-dir", str(tmp_path / "index")])
+
+    assert "2 images indexed (2 parsed)" in capsys.readouterr().out
+    index = ImageIndex(path=tmp_path / "index" / "index.json")
+    assert index.warm([assets]) == (2, 0)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import subprocess
+import tempfile
 import textwrap
+import logging
 import os
 from pathlib import Path
 
@@ -655,6 +657,178 @@ project:
         _step_publisher(ctx)
 
 
+def test_publisher_step_runs_pipeline_in_process_and_reports_stage_timings(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from gitbook_worker.tools.publishing import pipeline
+    from gitbook_worker.tools.workflow_orchestrator import orchestrator
+
+    repo = tmp_path
+    manifest = repo / "publish.yml"
+    manifest.write_text("publish: []\nproject:\n  license: MIT\n", encoding="utf-8")
+    profile = OrchestratorProfile(
+        name="test",
+        steps=("publisher",),
+        docker=DockerSettings(use_registry=False, image=None, cache=False),
+    )
+    config = OrchestratorConfig(
+        root=repo,
+        manifest=manifest,
+        logs_dir=repo / "logs",
+        content_config_path=None,
+        language_id="default",
+        content_entry=ContentEntry(id="default", uri="./", type="local"),
+        language_root=repo,
+        profile=profile,
+        repo_visibility="public",
+        repository="example/repo",
+        commit=None,
+        base=None,
+        reset_others=False,
+        publisher_args=("--no-apt",),
+        dry_run=False,
+        isolated=False,
+    )
+    stages: list[tuple[str, bool, str | None]] = []
+
+    def record(name: str):
+        def _stage(options: pipeline.PipelineOptions) -> None:
+            stages.append((name, options.in_process, os.getenv("ORCHESTRATOR_PROFILE")))
+            # The publisher points tempfile at its build temp directories.
+            tempfile.tempdir = str(tmp_path / name)
+
+        return _stage
+
+    def no_subprocess(cmd, **_):  # pragma: no cover - must not be called
+        raise AssertionError(f"unexpected subprocess: {cmd}")
+
+    analytics: list[dict] = []
+    monkeypatch.delenv("ORCHESTRATOR_PROFILE", raising=False)
+    monkeypatch.setattr(RuntimeContext, "ensure_fonts", lambda self: None)
+    monkeypatch.setattr(RuntimeContext, "run_command", no_subprocess)
+    monkeypatch.setattr(pipeline, "_run_set_publish_flag", record("set"))
+    monkeypatch.setattr(pipeline, "_run_gitbook_steps", record("gitbook"))
+    monkeypatch.setattr(pipeline, "_run_publisher", record("publisher"))
+    monkeypatch.setattr(
+        orchestrator,
+        "_log_analytics",
+        lambda ctx, entries, level=None: analytics.extend(entries),
+    )
+
+    original_tempdir = tempfile.gettempdir()
+
+    run(config)
+
+    assert tempfile.gettempdir() == original_tempdir
+    assert stages == [
+        ("set", True, "test"),
+        ("gitbook", True, "test"),
+        ("publisher", True, "test"),
+    ]
+    assert "ORCHESTRATOR_PROFILE" not in os.environ
+    (entry,) = analytics
+    assert entry["status"] == "ok"
+    assert [stage["stage"] for stage in entry["stages"]] == [
+        "frontmatter-check",
+        "set-publish-flag",
+        "gitbook",
+        "publisher",
+    ]
+    assert {stage["mode"] for stage in entry["stages"]} == {"in-process"}
+    assert all(stage["duration_s"] >= 0 for stage in entry["stages"])
+
+
+def test_in_process_frontmatter_failure_is_recorded_as_failed_step(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from types import SimpleNamespace
+
+    from gitbook_worker.tools.publishing import pipeline
+    from gitbook_worker.tools.workflow_orchestrator import orchestrator
+
+    repo = tmp_path
+    manifest = repo / "publish.yml"
+    manifest.write_text("publish: []\nproject:\n  license: MIT\n", encoding="utf-8")
+    profile = OrchestratorProfile(
+        name="test",
+        steps=("publisher",),
+        docker=DockerSettings(use_registry=False, image=None, cache=False),
+    )
+    config = OrchestratorConfig(
+        root=repo,
+        manifest=manifest,
+        logs_dir=repo / "logs",
+        content_config_path=None,
+        language_id="default",
+        content_entry=ContentEntry(id="default", uri="./", type="local"),
+        language_root=repo,
+        profile=profile,
+        repo_visibility="public",
+        repository="example/repo",
+        commit=None,
+        base=None,
+        reset_others=False,
+        publisher_args=("--no-apt",),
+        dry_run=False,
+        isolated=False,
+    )
+    issue = SimpleNamespace(path="a.md", line=1, message="kaputt", snippet="")
+    analytics: list[dict] = []
+    levels: list[object] = []
+
+    def record_analytics(ctx, entries, level=None):
+        analytics.extend(entries)
+        levels.append(level)
+
+    monkeypatch.setattr(RuntimeContext, "ensure_fonts", lambda self: None)
+    monkeypatch.setattr(pipeline, "check_frontmatter_tree", lambda root: [issue])
+    monkeypatch.setattr(orchestrator, "_log_analytics", record_analytics)
+
+    with pytest.raises(pipeline.CommandError) as excinfo:
+        run(config)
+
+    assert excinfo.value.returncode == pipeline.FRONTMATTER_EXIT_CODE
+    (entry,) = analytics
+    assert entry["status"] == "failed"
+    assert [stage["stage"] for stage in entry["stages"]] == ["frontmatter-check"]
+    assert levels == [logging.ERROR]
+
+
+def test_publisher_step_pipeline_subprocess_flag_keeps_isolation(
+    tmp_path: Path, monkeypatch
+) -> None:
+    manifest = tmp_path / "publish.yml"
+    manifest.write_text("publish: []\nproject:\n  license: MIT\n", encoding="utf-8")
+    args = parse_args(
+        [
+            "run",
+            "--root",
+            str(tmp_path),
+            "--manifest",
+            str(manifest),
+            "--pipeline-subprocess",
+        ]
+    )
+    config = build_config(args)
+    assert config.pipeline_subprocess is True
+    ctx = RuntimeContext(config)
+    commands: list[list[str]] = []
+
+    def fake_run_command(cmd, *, cwd=None, env=None, check=True):
+        commands.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(ctx, "ensure_fonts", lambda: None)
+    monkeypatch.setattr(ctx, "run_command", fake_run_command)
+
+    _step_publisher(ctx)
+
+    (command,) = commands
+    assert Path(command[1]).name == "pipeline.py"
+    assert command[-1] == "--subprocess"
+    assert ctx.step_details["stages"][0]["mode"] == "subprocess"
+
+
 def test_step_generate_attribution_creates_files(tmp_path: Path) -> None:
     repo = tmp_path
     manifest = repo / "publish.yml"
@@ -19,6 +19,7 @@ Optionen:
     --profile       Profil für Orchestrator (default: local)
     --verbose       Mehr Logging-Output
     --use-dynamic   Verwende Dockerfile.dynamic statt Dockerfile (empfohlen)
+    --no-font-cache Kein persistentes LuaTeX/luaotfload-Cache-Volume mounten
 """
 
 import argparse
@@ -67,6 +68,26 @@ if str(TOOLS_PATH) not in sys.path:
     sys.path.insert(0, str(TOOLS_PATH))
 
 
+# Persistent LuaTeX cache (luaotfload font database) shared across container
+# runs. The volume is mounted on the image's default (root-writable) cache
+# directory, so luaotfload-tool and LuaLaTeX use it without a TEXMFCACHE
+# override; the publisher only refreshes the database when the fingerprint of
+# the registered font trees changes.
+LUATEX_CACHE_MOUNTS = {
+    # TeX Live from install-tl: TEXMFSYSVAR = /usr/local/texlive/<year>/texmf-var
+    True: "/usr/local/texlive/current/texmf-var/luatex-cache",
+    # Debian texlive packages: TEXMFSYSVAR = /var/lib/texmf
+    False: "/var/lib/texmf/luatex-cache",
+}
+
+
+def _font_cache_volume(tag: str) -> str:
+    """Return the named Docker volume for the LuaTeX cache of image ``tag``."""
+
+    # One volume per image: the database format follows the TeX Live version.
+    return f"{tag}-luatex-cache"
+
+
 def _dockerfile_name(use_dynamic: bool) -> str:
     return "Dockerfile.dynamic" if use_dynamic else "Dockerfile"
 
@@ -106,6 +127,7 @@ def build_docker_args(
     rebuild: bool = False,
     no_cache: bool = False,
     use_dynamic: bool = False,
+    font_cache: bool = True,
 ) -> list[str]:
     """Erstelle die Argumentliste für docker_runner."""
 
@@ -162,6 +184,17 @@ def build_docker_args(
         ]
     )
 
+    if font_cache:
+        cache_mount = LUATEX_CACHE_MOUNTS[use_dynamic]
+        args.extend(
+            [
+                "--run-arg=-v",
+                f"--run-arg={_font_cache_volume(tag)}:{cache_mount}",
+                "--env",
+                f"GITBOOK_WORKER_LUATEX_CACHE_DIR={cache_mount}",
+            ]
+        )
+
     if no_build:
         args.append("--no-build")
 
@@ -335,6 +368,12 @@ Beispiele:
         help="Verwende Dockerfile.dynamic statt Dockerfile (empfohlen für Best Practice)",
     )
 
+    parser.add_argument(
+        "--no-font-cache",
+        action="store_true",
+        help="Kein persistentes LuaTeX/luaotfload-Cache-Volume verwenden",
+    )
+
     args = parser.parse_args()
 
     # Wähle Dockerfile
@@ -386,6 +425,7 @@ Beispiele:
         rebuild=args.rebuild,
         no_cache=args.no_cache,
         use_dynamic=args.use_dynamic,
+        font_cache=not args.no_font_cache,
     )
 
     if args.verbose:
@@ -9,6 +9,7 @@ from .emoji_utils import (
     summarize_emojis,
 )
 from .inline_emojis import inline_file
+from .prefetch_emojis import main as prefetch_emojis_main
 from .report import emoji_report
 from .scan_emojis import main as scan_emojis_main
 
@@ -21,5 +22,6 @@ __all__ = [
     "summarize_emojis",
     "inline_file",
     "emoji_report",
+    "prefetch_emojis_main",
     "scan_emojis_main",
 ]
@@ -0,0 +1,208 @@
+"""Versioned on-disk store for the emoji assets used by ``inline_emojis``.
+
+``EmojiAssetFetcher`` used to keep downloads as loose files in
+``build/emoji-assets`` and remembered missing slugs only for one process, so
+every run requested the non-existent Twemoji variants again.
+:class:`EmojiAssetStore` keeps the asset bytes in immutable pack files below
+``~/.cache/gitbook-worker/emoji-assets/<pack>/`` and indexes them in
+``manifest.json``.  Keys are the provider file names the fetcher has always
+used (``twemoji_svg_1f642.svg``); an entry points to its pack, offset and
+length or records that the provider answered 404 (negative entry).  Packs are
+memory-mapped for reading, so a run whose emojis are all in the store needs
+no network access.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import env_int, resolve_cache_dir
+
+logger = get_logger(__name__)
+
+EMOJI_ASSET_DIR_ENV = "GITBOOK_WORKER_EMOJI_ASSET_DIR"
+EMOJI_MISS_TTL_ENV = "GITBOOK_WORKER_EMOJI_MISS_TTL_DAYS"
+
+DEFAULT_MISS_TTL_DAYS = 30
+
+_STORE_VERSION = 1
+
+HIT = "hit"
+MISSING = "missing"
+UNKNOWN = "unknown"
+
+
+@dataclass
+class EmojiAssetStore:
+    """Pack files plus a manifest of asset keys and provider misses."""
+
+    root: Path
+    miss_ttl_seconds: float = DEFAULT_MISS_TTL_DAYS * 86400
+    entries: Dict[str, dict] = field(default_factory=dict)
+    hits: int = 0
+    stored: int = 0
+    _pending: Dict[str, bytes] = field(default_factory=dict, repr=False)
+    _dirty: Dict[str, dict] = field(default_factory=dict, repr=False)
+    _maps: Dict[str, mmap.mmap] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _loaded: bool = field(default=False, repr=False)
+
+    @classmethod
+    def from_env(cls, pack: str, root: Optional[Path] = None) -> "EmojiAssetStore":
+        """Create the store of ``pack`` honouring ``GITBOOK_WORKER_EMOJI_*``."""
+
+        explicit = root or os.getenv(EMOJI_ASSET_DIR_ENV) or None
+        directory = resolve_cache_dir(
+            "emoji-assets", Path(explicit) if explicit else None
+        )
+        return cls(
+            root=directory / pack,
+            miss_ttl_seconds=env_int(EMOJI_MISS_TTL_ENV, DEFAULT_MISS_TTL_DAYS) * 86400,
+        )
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / "manifest.json"
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            payload = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _STORE_VERSION:
+            return {}
+        assets = payload.get("assets")
+        return assets if isinstance(assets, dict) else {}
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.entries = {**self._read(), **self.entries}
+            self._loaded = True
+
+    def _view(self, pack: str) -> mmap.mmap:
+        view = self._maps.get(pack)
+        if view is None:
+            with (self.root / pack).open("rb") as handle:
+                view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[pack] = view
+        return view
+
+    def lookup(self, key: str) -> Tuple[str, Optional[bytes]]:
+        """Return ``(HIT, data)``, ``(MISSING, None)`` or ``(UNKNOWN, None)``."""
+
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._pending:
+                self.hits += 1
+                return HIT, self._pending[key]
+            entry = self.entries.get(key)
+            if entry is None:
+                return UNKNOWN, None
+            if entry.get("missing"):
+                if time.time() - entry.get("checked_at", 0) > self.miss_ttl_seconds:
+                    return UNKNOWN, None
+                self.hits += 1
+                return MISSING, None
+            try:
+                view = self._view(entry["pack"])
+                start, length = entry["offset"], entry["length"]
+                if start + length > len(view):
+                    raise ValueError("entry beyond end of pack")
+                data = view[start : start + length]
+            except (OSError, KeyError, TypeError, ValueError) as exc:
+                logger.debug("Emoji-Asset %s nicht lesbar: %s", key, exc)
+                return UNKNOWN, None
+            self.hits += 1
+            return HIT, data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Add the asset ``key``; it is written to a new pack on :meth:`flush`."""
+
+        with self._lock:
+            self._pending[key] = data
+            self._dirty.pop(key, None)
+
+    def put_missing(self, key: str) -> None:
+        """Remember that the provider has no asset for ``key``."""
+
+        entry = {"missing": True, "checked_at": time.time()}
+        with self._lock:
+            self._pending.pop(key, None)
+            self.entries[key] = entry
+            self._dirty[key] = entry
+
+    def flush(self) -> None:
+        """Write pending assets as one pack and merge the manifest on disk."""
+
+        with self._lock:
+            if not self._pending and not self._dirty:
+                return
+            dirty = dict(self._dirty)
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                if self._pending:
+                    pack = f"pack-{time.time_ns()}-{os.getpid()}.bin"
+                    offset = 0
+                    staging = self.root / f".{pack}.tmp"
+                    with staging.open("wb") as handle:
+                        for key, data in sorted(self._pending.items()):
+                            handle.write(data)
+                            dirty[key] = {
+                                "pack": pack,
+                                "offset": offset,
+                                "length": len(data),
+                                "sha256": hashlib.sha256(data).hexdigest(),
+                            }
+                            offset += len(data)
+                    os.replace(staging, self.root / pack)
+                now = time.time()
+                merged = {
+                    key: entry
+                    for key, entry in {**self._read(), **dirty}.items()
+                    if not entry.get("missing")
+                    or now - entry.get("checked_at", 0) <= self.miss_ttl_seconds
+                }
+                payload = {"version": _STORE_VERSION, "assets": merged}
+                staging = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+                staging.write_text(json.dumps(payload, sort_keys=True), "utf-8")
+                os.replace(staging, self.manifest_path)
+            except OSError as exc:
+                logger.warning("⚠ Konnte Emoji-Asset-Store nicht speichern: %s", exc)
+                return
+            self.stored += sum(1 for entry in dirty.values() if "pack" in entry)
+            self.entries = merged
+            self._pending.clear()
+            self._dirty.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            for view in self._maps.values():
+                view.close()
+            self._maps.clear()
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of stored assets and negative entries."""
+
+        with self._lock:
+            self._ensure_loaded()
+            missing = sum(1 for entry in self.entries.values() if entry.get("missing"))
+            return {"assets": len(self.entries) - missing, "missing": missing}
+
+
+__all__ = [
+    "EMOJI_ASSET_DIR_ENV",
+    "EMOJI_MISS_TTL_ENV",
+    "EmojiAssetStore",
+    "HIT",
+    "MISSING",
+    "UNKNOWN",
+]
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import argparse
 import base64
+import copy
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 import requests
 from bs4 import BeautifulSoup, NavigableString, Tag
 
+from gitbook_worker.tools.utils.cache import env_int
+
+from .asset_store import HIT, MISSING, EmojiAssetStore
 from .emoji_utils import (
     emoji_cldr_name,
     emoji_to_slug,
@@ -29,7 +35,12 @@ TWEMOJI_PNG = (
 OPENMOJI_BLACK = (
     "https://raw.githubusercontent.com/hfg-gmuend/openmoji/master/black/svg/{slug_upper}.svg"
 )
-CACHE_DIR = Path("build/emoji-assets")
+CACHE_DIR = Path("build/emoji-assets")  # legacy loose files, read if present
+ASSET_PACK = f"v1-twemoji-{TWEMOJI_VERSION}"
+
+EMOJI_OFFLINE_ENV = "GITBOOK_WORKER_EMOJI_OFFLINE"
+EMOJI_FETCH_JOBS_ENV = "GITBOOK_WORKER_EMOJI_FETCH_JOBS"
+DEFAULT_FETCH_JOBS = 8
 
 SKIP_PARENTS = {"script", "style", "code", "pre", "kbd", "samp"}
 
@@ -42,15 +53,72 @@ class EmojiAsset:
 
 
 class EmojiAssetFetcher:
-    def __init__(self, prefer: str = "twemoji") -> None:
+    """Resolve emoji assets from the asset store, downloading missing ones.
+
+    With ``offline`` (or ``GITBOOK_WORKER_EMOJI_OFFLINE=1``) nothing is
+    downloaded; emojis that are not in the store count as missing.  ``fetch``
+    may run on several threads (see :meth:`prefetch`); ``cache``, ``stats``
+    and ``downloads`` are only updated under the fetcher lock.
+    """
+
+    def __init__(
+        self,
+        prefer: str = "twemoji",
+        *,
+        store: Optional[EmojiAssetStore] = None,
+        use_store: bool = True,
+        offline: Optional[bool] = None,
+        jobs: Optional[int] = None,
+    ) -> None:
         self.prefer = prefer
         self.cache: Dict[str, Optional[EmojiAsset]] = {}
         self.stats: Dict[str, int] = {"twemoji_svg": 0, "twemoji_png": 0, "openmoji": 0}
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if store is None and use_store:
+            store = EmojiAssetStore.from_env(ASSET_PACK)
+        self.store = store
+        if offline is None:
+            offline = os.environ.get(EMOJI_OFFLINE_ENV, "").lower() in {"1", "true", "on"}
+        self.offline = offline
+        self.jobs = jobs or max(1, env_int(EMOJI_FETCH_JOBS_ENV, DEFAULT_FETCH_JOBS))
+        self.downloads = 0
+        self._lock = threading.Lock()
+        if self.store is None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    def prefetch(self, emojis: Iterable[str]) -> Dict[str, Optional[EmojiAsset]]:
+        """Resolve every distinct emoji, downloading on ``jobs`` threads."""
+
+        distinct = list(dict.fromkeys(emojis))
+        pending = [emoji for emoji in distinct if emoji not in self.cache]
+        workers = 1 if self.offline else max(1, min(self.jobs, len(pending)))
+        if workers == 1:
+            for emoji in pending:
+                self.fetch(emoji)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(self.fetch, pending))
+        return {emoji: self.cache.get(emoji) for emoji in distinct}
+
+    def flush(self) -> None:
+        """Persist new assets and negative entries in the asset store."""
+
+        if self.store is not None:
+            self.store.flush()
+
+    def close(self) -> None:
+        """Flush the asset store and release its memory-mapped packs.
+
+        The store stays usable; packs are mapped again on the next lookup.
+        """
+
+        if self.store is not None:
+            self.store.flush()
+            self.store.close()
 
     def fetch(self, emoji: str) -> Optional[EmojiAsset]:
-        if emoji in self.cache:
-            return self.cache[emoji]
+        with self._lock:
+            if emoji in self.cache:
+                return self.cache[emoji]
 
         slug = emoji_to_slug(emoji)
         providers = self._provider_order()
@@ -63,12 +131,11 @@ class EmojiAssetFetcher:
             elif provider == "openmoji":
                 asset = self._fetch_openmoji(slug)
             if asset:
-                self.stats[provider] += 1
                 break
-        if asset is None:
-            self.cache[emoji] = None
-            return None
-        self.cache[emoji] = asset
+        with self._lock:
+            if asset is not None:
+                self.stats[provider] += 1
+            self.cache[emoji] = asset
         return asset
 
     def _provider_order(self) -> List[str]:
@@ -124,18 +191,38 @@ class EmojiAssetFetcher:
         kind: str,
         source: str,
     ) -> Optional[EmojiAsset]:
-        cache_file = CACHE_DIR / f"{source}_{slug}{suffix}"
+        key = f"{source}_{slug}{suffix}"
+        if self.store is not None:
+            status, data = self.store.lookup(key)
+            if status == MISSING:
+                return None
+            if status == HIT:
+                return self._make_asset(data, kind=kind, source=source)
+        cache_file = CACHE_DIR / key
         if cache_file.exists():
             data = cache_file.read_bytes()
+        elif self.offline:
+            return None
         else:
             try:
                 response = requests.get(url, timeout=10)
             except requests.RequestException:
                 return None
+            if response.status_code in (404, 410) and self.store is not None:
+                self.store.put_missing(key)
             if response.status_code != 200:
                 return None
             data = response.content
-            cache_file.write_bytes(data)
+            with self._lock:
+                self.downloads += 1
+            if self.store is None:
+                cache_file.write_bytes(data)
+        if self.store is not None:
+            self.store.put(key, data)
+        return self._make_asset(data, kind=kind, source=source)
+
+    @staticmethod
+    def _make_asset(data: bytes, *, kind: str, source: str) -> EmojiAsset:
         if kind == "svg":
             return EmojiAsset(kind="svg", content=data.decode("utf-8"), source=source)
         return EmojiAsset(kind="png", content=base64.b64encode(data).decode("ascii"), source=source)
@@ -156,12 +243,22 @@ class EmojiInliner:
         self.total = 0
         self.missing: Dict[str, int] = {}
         self._soup: Optional[BeautifulSoup] = None
+        self._svg_tags: Dict[str, Tag] = {}
 
     def process_soup(self, soup: BeautifulSoup) -> None:
+        """Replace all emojis, resolving each distinct one once up front."""
+
         self._soup = soup
-        for text_node in list(soup.find_all(string=True)):
-            if isinstance(text_node, NavigableString) and text_node.parent.name not in SKIP_PARENTS:
-                self._process_text_node(text_node)
+        text_nodes = [
+            text_node
+            for text_node in soup.find_all(string=True)
+            if isinstance(text_node, NavigableString) and text_node.parent.name not in SKIP_PARENTS
+        ]
+        self.asset_fetcher.prefetch(
+            emoji for text_node in text_nodes for emoji in iter_emoji_sequences(str(text_node))
+        )
+        for text_node in text_nodes:
+            self._process_text_node(text_node)
 
     def _split_text(self, text: str) -> List[Dict[str, str]]:
         segments: List[Dict[str, str]] = []
@@ -216,12 +313,16 @@ class EmojiInliner:
         span["title"] = emoji_cldr_name(emoji_char)
         span["data-source"] = asset.source
         if asset.kind == "svg":
-            svg_fragment = BeautifulSoup(asset.content, "html.parser")
-            svg_tag = svg_fragment.find("svg")
-            if svg_tag:
-                span.append(svg_tag)
-            else:
-                span.append(svg_fragment)
+            # Parse each SVG once per document and insert copies of the tag.
+            svg_tag = self._svg_tags.get(asset.content)
+            if svg_tag is None:
+                svg_fragment = BeautifulSoup(asset.content, "html.parser")
+                svg_tag = svg_fragment.find("svg")
+                if not svg_tag:
+                    span.append(svg_fragment)
+                    return span
+                self._svg_tags[asset.content] = svg_tag
+            span.append(copy.copy(svg_tag))
         else:
             img = factory.new_tag("img")
             img["src"] = f"data:image/png;base64,{asset.content}"
@@ -268,6 +369,7 @@ def inline_file(
     css_path: Optional[str] = None,
     coverage_path: Optional[Path] = None,
     asset_fetcher: Optional[EmojiAssetFetcher] = None,
+    offline: Optional[bool] = None,
 ) -> Dict[str, object]:
     html = input_path.read_text(encoding="utf-8")
     soup = BeautifulSoup(html, "html.parser")
@@ -288,8 +390,13 @@ def inline_file(
             coverage_path.write_text(json.dumps(coverage, indent=2), encoding="utf-8")
         return coverage
 
+    if asset_fetcher is None:
+        asset_fetcher = EmojiAssetFetcher(prefer=prefer, offline=offline)
     inliner = EmojiInliner(prefer=prefer, asset_fetcher=asset_fetcher)
-    inliner.process_soup(soup)
+    try:
+        inliner.process_soup(soup)
+    finally:
+        asset_fetcher.close()
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(str(soup), encoding="utf-8")
     coverage = inliner.coverage()
@@ -314,6 +421,12 @@ def parse_args() -> argparse.Namespace:
         "--coverage",
         help="Path to coverage JSON output (replaced vs total)",
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=None,
+        help="Only use the local emoji asset store (see prefetch_emojis)",
+    )
     return parser.parse_args()
 
 
@@ -328,6 +441,7 @@ def main() -> None:
         prefer=args.prefer,
         css_path=args.css,
         coverage_path=coverage_path,
+        offline=args.offline,
     )
     ratio = coverage.get("ratio", 0.0)
     print(
@@ -0,0 +1,65 @@
+"""Fill the emoji asset store with every emoji used in the Markdown sources."""
+
+from __future__ import annotations
+
+import argparse
+from typing import List, Optional, Sequence
+
+from .inline_emojis import EmojiAssetFetcher
+from .scan_emojis import DEFAULT_SOURCES, collect_emojis, discover_markdown_files
+
+
+def prefetch(
+    sources: Sequence[str],
+    *,
+    prefer: str = "twemoji",
+    asset_fetcher: Optional[EmojiAssetFetcher] = None,
+) -> dict:
+    """Resolve all emojis found in ``sources`` and persist the asset store."""
+
+    fetcher = asset_fetcher or EmojiAssetFetcher(prefer=prefer, offline=False)
+    emojis = sorted(collect_emojis(discover_markdown_files(sources)))
+    try:
+        resolved = fetcher.prefetch(emojis)
+    finally:
+        fetcher.close()
+    missing: List[str] = sorted(
+        emoji for emoji, asset in resolved.items() if asset is None
+    )
+    return {
+        "total": len(emojis),
+        "available": len(emojis) - len(missing),
+        "downloaded": fetcher.downloads,
+        "missing": missing,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sources",
+        nargs="*",
+        default=DEFAULT_SOURCES,
+        help="Directories to scan recursively for Markdown files.",
+    )
+    parser.add_argument(
+        "--prefer",
+        choices=["twemoji", "openmoji"],
+        default="twemoji",
+        help="Primary emoji asset source",
+    )
+    parser.add_argument("--jobs", type=int, help="Parallel downloads (default: 8)")
+    args = parser.parse_args(argv)
+
+    fetcher = EmojiAssetFetcher(prefer=args.prefer, offline=False, jobs=args.jobs)
+    result = prefetch(args.sources, asset_fetcher=fetcher)
+    print(
+        f"Emoji-Assets: {result['available']} / {result['total']} verfügbar, "
+        f"{result['downloaded']} heruntergeladen."
+    )
+    if result["missing"]:
+        print("Ohne Asset: " + " ".join(result["missing"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Content-addressed cache for finished PDF builds.
+
+``publisher._run_pandoc`` fingerprints everything a Pandoc/LuaLaTeX run
+consumes (combined Markdown, referenced images, header files, Lua filters,
+CLI metadata/variables, font configuration and tool versions).  When a
+fingerprint was built before, the cached PDF is restored instead of paying
+for another LaTeX run.  Entries are evicted least-recently-used once the
+cache exceeds its entry/size budget or an entry is older than ``max_age_days``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Mapping, Optional
+
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import (
+    env_int,
+    file_sha256,
+    prune_lru_entries,
+    resolve_cache_dir,
+)
+
+logger = get_logger(__name__)
+
+BUILD_CACHE_DIR_ENV = "GITBOOK_WORKER_BUILD_CACHE_DIR"
+BUILD_CACHE_MAX_ENTRIES_ENV = "GITBOOK_WORKER_BUILD_CACHE_MAX_ENTRIES"
+BUILD_CACHE_MAX_MB_ENV = "GITBOOK_WORKER_BUILD_CACHE_MAX_MB"
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_MB = 2048
+DEFAULT_MAX_AGE_DAYS = 30
+
+_FINGERPRINT_VERSION = 1
+
+
+class BuildFingerprint:
+    """Incrementally hash the inputs of one build into a cache key."""
+
+    def __init__(self) -> None:
+        self._digest = hashlib.sha256()
+        self.add_value("fingerprint-version", _FINGERPRINT_VERSION)
+
+    def add_value(self, label: str, value: Any) -> None:
+        payload = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+        self._digest.update(f"{label}\0{payload}\0".encode("utf-8"))
+
+    def add_file(self, label: str, path: Path) -> None:
+        try:
+            content_hash = file_sha256(path)
+        except OSError:
+            content_hash = "<missing>"
+        self.add_value(label, content_hash)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+@dataclass
+class BuildCache:
+    """Directory of cached PDFs addressed by their build fingerprint."""
+
+    root: Path
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS
+
+    @classmethod
+    def from_env(cls, root: Optional[Path] = None) -> "BuildCache":
+        """Create a cache honouring the ``GITBOOK_WORKER_BUILD_CACHE_*`` env."""
+
+        explicit = root or os.getenv(BUILD_CACHE_DIR_ENV) or None
+        return cls(
+            root=resolve_cache_dir("builds", Path(explicit) if explicit else None),
+            max_entries=env_int(BUILD_CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES),
+            max_bytes=env_int(BUILD_CACHE_MAX_MB_ENV, DEFAULT_MAX_MB) * 1024 * 1024,
+        )
+
+    def _entry_pdf(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pdf"
+
+    def restore(self, key: str, pdf_out: Path) -> bool:
+        """Copy the cached PDF for ``key`` to ``pdf_out``; return ``True`` on a hit."""
+
+        cached = self._entry_pdf(key)
+        if not cached.is_file():
+            return False
+        try:
+            pdf_out.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, pdf_out)
+            # Touch the entry so LRU eviction keeps frequently reused builds.
+            os.utime(cached, None)
+        except OSError as exc:
+            logger.warning("⚠ Build-Cache-Eintrag %s unlesbar: %s", cached, exc)
+            return False
+        return True
+
+    def store(
+        self, key: str, pdf_out: Path, info: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """Remember ``pdf_out`` under ``key`` and prune the cache afterwards."""
+
+        if not pdf_out.is_file():
+            return
+        target = self._entry_pdf(key)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staging = target.with_suffix(f".{os.getpid()}.tmp")
+            shutil.copyfile(pdf_out, staging)
+            os.replace(staging, target)
+            meta = {"output": pdf_out.name, "stored_at": time.time()}
+            meta.update(info or {})
+            target.with_suffix(".json").write_text(
+                json.dumps(meta, ensure_ascii=False, default=str), encoding="utf-8"
+            )
+        except OSError as exc:
+            logger.warning("⚠ Konnte PDF nicht im Build-Cache ablegen: %s", exc)
+            return
+        self.prune()
+
+    def entries(self) -> List[Path]:
+        return sorted(self.root.glob("*/*.pdf"))
+
+    def prune(self) -> int:
+        """Apply age, entry-count and size limits (LRU by mtime)."""
+
+        removed = prune_lru_entries(
+            self.entries(),
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+            max_age_days=self.max_age_days,
+            sidecar_suffixes=(".json",),
+        )
+        if removed:
+            logger.info("🧹 Build-Cache: %d Einträge entfernt (%s)", removed, self.root)
+        return removed
+
+
+__all__ = [
+    "BUILD_CACHE_DIR_ENV",
+    "BUILD_CACHE_MAX_ENTRIES_ENV",
+    "BUILD_CACHE_MAX_MB_ENV",
+    "BuildCache",
+    "BuildFingerprint",
+]
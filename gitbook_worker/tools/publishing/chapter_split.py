@@ -0,0 +1,90 @@
+"""Helpers for per-chapter ("chapter split") folder builds.
+
+With ``pdf_options.chapter_split`` enabled, ``publisher.convert_a_folder``
+renders every SUMMARY.md chapter into its own PDF fragment instead of one
+giant LaTeX run. Fragments go through the regular build cache, so only
+chapters whose preprocessed Markdown changed are recompiled. This module
+stitches the fragments back together: each fragment's outline is nested
+below a chapter bookmark and page labels (``<chapter>-<page>``) mirror the
+folios printed inside every fragment.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+from gitbook_worker.tools.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_ATX_HEADING_RE = re.compile(r"(?m)^#{1,6}\s+(.+?)\s*#*\s*$")
+_HEADING_ATTRS_RE = re.compile(r"\s*\{[^}]*\}\s*$")
+
+
+@dataclass(frozen=True)
+class ChapterFragment:
+    """One chapter of a split folder build."""
+
+    index: int
+    source: Path
+    markdown: Path
+    pdf: Path
+    title: Optional[str] = None
+
+
+def chapter_title(markdown: str) -> Optional[str]:
+    """Return the first ATX heading of ``markdown`` (without attributes)."""
+
+    match = _ATX_HEADING_RE.search(markdown)
+    if not match:
+        return None
+    title = _HEADING_ATTRS_RE.sub("", match.group(1)).strip()
+    return title or None
+
+
+def merge_chapter_pdfs(fragments: Sequence[ChapterFragment], pdf_out: Path) -> int:
+    """Merge the fragment PDFs into ``pdf_out`` and return the page count.
+
+    The first fragment carries the title page and keeps plain page labels;
+    every following fragment restarts its printed page numbers, so it gets a
+    ``<index>-`` label prefix to keep viewer page numbers in sync.
+    """
+
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    try:
+        for position, fragment in enumerate(fragments):
+            start = len(writer.pages)
+            writer.append(
+                str(fragment.pdf),
+                outline_item=fragment.title or fragment.source.stem,
+                import_outline=True,
+            )
+            end = len(writer.pages) - 1
+            if end < start:
+                logger.warning("⚠ Leeres Kapitel-PDF übersprungen: %s", fragment.pdf)
+                continue
+            prefix = None if position == 0 else f"{fragment.index}-"
+            writer.set_page_label(start, end, style="/D", prefix=prefix, start=1)
+
+        pdf_out.parent.mkdir(parents=True, exist_ok=True)
+        with pdf_out.open("wb") as handle:
+            writer.write(handle)
+        page_count = len(writer.pages)
+    finally:
+        writer.close()
+
+    logger.info(
+        "📚 %d Kapitel-PDFs zu %s zusammengeführt (%d Seiten).",
+        len(fragments),
+        pdf_out,
+        page_count,
+    )
+    return page_count
+
+
+__all__ = ["ChapterFragment", "chapter_title", "merge_chapter_pdfs"]
@@ -14,6 +14,8 @@ from typing import Dict, Iterable, List, Optional
 
 import yaml
 
+from gitbook_worker.tools.utils.content_snapshot import active_snapshot
+
 # Core catalog of supported document types
 DOC_TYPES = {
     "cover",
@@ -85,6 +87,13 @@ _FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
 
 def _parse_frontmatter(md_path: Path) -> tuple[dict, str]:
+    snapshot = active_snapshot(md_path)
+    if snapshot is not None:
+        document = snapshot.document(md_path)
+        frontmatter = document.frontmatter
+        if isinstance(frontmatter, dict):
+            frontmatter = dict(frontmatter)
+        return frontmatter, document.body
     text = md_path.read_text(encoding="utf-8")
     match = _FRONTMATTER_PATTERN.match(text)
     frontmatter: dict = {}
@@ -232,7 +241,13 @@ def collect_documents_with_issues(
     records: List[DocumentRecord] = []
     issues: List[dict] = []
 
-    for md_path in root_dir.rglob("*.md"):
+    snapshot = active_snapshot(root_dir)
+    md_paths = (
+        snapshot.rglob(root_dir, ".md")
+        if snapshot is not None
+        else root_dir.rglob("*.md")
+    )
+    for md_path in md_paths:
         if md_path.name.lower() in {"summary.md", "summary"}:
             continue
 
@@ -4,9 +4,11 @@ This module exposes two commands used by the ``gitbook-style`` GitHub Action:
 
 ``rename``
     Normalises file and directory names to the GitBook style by converting them
-    to lower case and replacing whitespace with ``-``. Renaming happens via
-    ``git mv`` when possible to preserve history, with a graceful fallback to a
-    standard filesystem rename when the repository context is unavailable.
+    to lower case and replacing whitespace with ``-``. All renames are planned
+    up front from one ``git ls-files`` listing (``--dry-run`` prints the plan),
+    applied on disk and recorded in the Git index with a single
+    ``git update-index`` call so history is preserved. Without a repository
+    context the files are simply renamed.
 
 ``summary``
     Regenerates ``SUMMARY.md`` based on ``book.json`` configuration. The
@@ -28,11 +30,16 @@ import shutil
 import subprocess
 import sys
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from gitbook_worker.tools.publishing import document_types, summary_generator
 from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.publishing.summary_index import (
+    SummaryIndex,
+    git_changed_paths,
+)
+from gitbook_worker.tools.utils.content_snapshot import invalidate_content
 
 SKIP_DIRS: set[str] = {
     ".git",
@@ -65,39 +72,6 @@ SUMMARY_MODE_MAP = {
 logger = get_logger(__name__)
 
 
-def _is_tracked(root: Path, rel_path: Path, *, is_dir: bool = False) -> bool:
-    """Return True if *rel_path* is tracked in the Git repository rooted at ``root``."""
-
-    try:
-        if is_dir:
-            cmd = ["git", "-C", str(root), "ls-files", "-z", rel_path.as_posix()]
-        else:
-            cmd = [
-                "git",
-                "-C",
-                str(root),
-                "ls-files",
-                "--error-unmatch",
-                rel_path.as_posix(),
-            ]
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-    except FileNotFoundError:
-        logger.debug(
-            "git executable not available – treating %s as untracked", rel_path
-        )
-        return False
-
-    if is_dir:
-        return bool(result.stdout)
-    return result.returncode == 0
-
-
 def _normalise_name(name: str) -> str:
     """Convert ``name`` to the canonical GitBook style."""
 
@@ -177,60 +151,305 @@ def is_appendix_line(line: str) -> bool:
     return any(re.match(pattern, line) for pattern in patterns)
 
 
-def rename_to_gitbook_style(root: Path, *, use_git: bool = True) -> None:
-    """Rename files and directories below ``root`` to match GitBook style."""
+@dataclass
+class TrackedIndex:
+    """Tracked files below a root, loaded with one ``git ls-files -s``.
+
+    ``files`` maps root-relative POSIX paths to their ``(mode, object)`` index
+    entry; ``dirs`` holds every directory that contains a tracked file.
+    ``prefix`` is the root's path relative to the repository top level, which
+    ``git update-index --index-info`` expects.
+    """
+
+    root: Path
+    files: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    dirs: set[str] = field(default_factory=set)
+    prefix: str = ""
+
+    @classmethod
+    def load(cls, root: Path) -> "TrackedIndex":
+        index = cls(root=root)
+        try:
+            prefix = subprocess.run(
+                ["git", "-C", str(root), "rev-parse", "--show-prefix"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            listing = subprocess.run(
+                ["git", "-C", str(root), "ls-files", "-s", "-z"],
+                capture_output=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            logger.debug(
+                "git executable not available – treating %s as untracked", root
+            )
+            return index
+        if prefix.returncode != 0 or listing.returncode != 0:
+            logger.debug("%s is not inside a Git work tree", root)
+            return index
+
+        index.prefix = prefix.stdout.strip()
+        for record in listing.stdout.split(b"\0"):
+            if not record:
+                continue
+            meta, _, raw_path = record.partition(b"\t")
+            mode, obj, stage = meta.decode("ascii").split(" ")
+            if stage != "0":
+                continue
+            path = raw_path.decode("utf-8", errors="surrogateescape")
+            index.files[path] = (mode, obj)
+            parent = PurePosixPath(path).parent
+            while parent.name and parent.as_posix() not in index.dirs:
+                index.dirs.add(parent.as_posix())
+                parent = parent.parent
+        return index
+
+    def is_tracked(self, rel_path: Path, *, is_dir: bool = False) -> bool:
+        key = Path(rel_path).as_posix()
+        return key in self.dirs if is_dir else key in self.files
+
+    def stage_renames(self, renamed: Mapping[str, str]) -> int:
+        """Move index entries according to ``renamed`` in one ``update-index``.
+
+        ``renamed`` maps original root-relative paths (files or directories)
+        to their new final path component. Returns the number of moved entries.
+        """
+
+        records: List[bytes] = []
+        for path, (mode, obj) in self.files.items():
+            parts = path.split("/")
+            new_parts = [
+                renamed.get("/".join(parts[: position + 1]), part)
+                for position, part in enumerate(parts)
+            ]
+            if new_parts == parts:
+                continue
+            old = f"{self.prefix}{path}".encode("utf-8", errors="surrogateescape")
+            new = f"{self.prefix}{'/'.join(new_parts)}".encode(
+                "utf-8", errors="surrogateescape"
+            )
+            records.append(b"0 " + b"0" * len(obj) + b"\t" + old)
+            records.append(f"{mode} {obj} 0\t".encode("ascii") + new)
+        if not records:
+            return 0
+        result = subprocess.run(
+            ["git", "-C", str(self.root), "update-index", "-z", "--index-info"],
+            input=b"\0".join(records) + b"\0",
+            capture_output=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            logger.warning(
+                "⚠ Git-Index konnte nicht aktualisiert werden: %s",
+                result.stderr.decode("utf-8", errors="replace").strip(),
+            )
+            return 0
+        # Refresh the stat data of the re-added entries so status stays cheap.
+        subprocess.run(
+            ["git", "-C", str(self.root), "update-index", "-q", "--refresh"],
+            capture_output=True,
+            check=False,
+        )
+        return len(records) // 2
+
+
+@dataclass(frozen=True)
+class RenameOperation:
+    """One planned rename.
+
+    ``original`` is the path before any rename; ``src`` and ``dst`` are the
+    paths at the time the operation runs (parent directories already renamed).
+    All paths are relative to the plan root.
+    """
+
+    original: Path
+    src: Path
+    dst: Path
+    is_dir: bool
+
+
+@dataclass
+class RenamePlan:
+    """All renames below ``root`` plus the entries that were left alone."""
+
+    root: Path
+    operations: List[RenameOperation] = field(default_factory=list)
+    skipped: List[Tuple[Path, str, str]] = field(default_factory=list)
+
+    @property
+    def collisions(self) -> List[Tuple[Path, str, str]]:
+        return [entry for entry in self.skipped if entry[1] == "collision"]
+
+    def describe(self) -> List[str]:
+        """Return one line per planned rename and skipped entry."""
+
+        lines = [
+            f"rename {'dir ' if op.is_dir else 'file'} {op.src.as_posix()} -> "
+            f"{op.dst.as_posix()}"
+            for op in self.operations
+        ]
+        lines.extend(
+            f"skip   {reason:<10} {path.as_posix()}"
+            + (f" ({detail})" if detail else "")
+            for path, reason, detail in self.skipped
+        )
+        return lines
+
+
+def plan_gitbook_renames(
+    root: Path,
+    *,
+    use_git: bool = True,
+    tracked: Optional[TrackedIndex] = None,
+) -> RenamePlan:
+    """Compute every GitBook-style rename below ``root`` without touching files.
+
+    Directories come before their contents so the operations can be applied in
+    order. Untracked entries (with ``use_git``) and case-only renames are
+    skipped as before; a rename whose target name is already taken in the same
+    directory is reported as a collision instead of replacing the target.
+    """
+
+    if use_git and tracked is None:
+        tracked = TrackedIndex.load(root)
+    plan = RenamePlan(root=root)
+    # Actual directory (original path) -> its path once the renames are applied.
+    planned_dirs: Dict[Path, Path] = {Path("."): Path(".")}
 
-    logger.info(f"Renaming files in {root} to GitBook style")
     for current_root, dirs, files in os.walk(root, topdown=True):
         current_path = Path(current_root)
         rel = current_path.relative_to(root)
         if any(part in SKIP_DIRS for part in rel.parts):
             dirs[:] = []
             continue
+        target_dir = planned_dirs[rel]
+        dirs.sort()
+        files.sort()
+
+        occupied = set(dirs) | set(files)
+        candidates: List[Tuple[str, str, bool]] = []
+        descend: List[str] = []
+        for directory in dirs:
+            if directory in SKIP_DIRS or directory.startswith(".git"):
+                logger.debug(f"Skipping directory: '{directory}'")
+                continue
+            descend.append(directory)
+            candidates.append((directory, _normalise_name(directory), True))
+        for file_name in files:
+            if file_name.startswith(".") or file_name.endswith(".py"):
+                logger.debug(f"Skipping file: '{file_name}'")
+                continue
+            candidates.append((file_name, _normalise_name(file_name), False))
+
+        moves: List[Tuple[str, str, bool]] = []
+        for name, new_name, is_dir in candidates:
+            if new_name == name:
+                continue
+            original = rel / name
+            if name.lower() == new_name:
+                # Case-only renames break on case-insensitive filesystems.
+                plan.skipped.append((original, "case-only", new_name))
+            elif use_git and not tracked.is_tracked(original, is_dir=is_dir):
+                plan.skipped.append((original, "untracked", ""))
+                if is_dir:
+                    descend.remove(name)
+            else:
+                moves.append((name, new_name, is_dir))
+
+        occupied -= {name for name, _, _ in moves}
+        renamed: Dict[str, str] = {}
+        for name, new_name, is_dir in moves:
+            original = rel / name
+            if new_name in occupied:
+                plan.skipped.append((original, "collision", new_name))
+                occupied.add(name)
+                continue
+            occupied.add(new_name)
+            renamed[name] = new_name
+            plan.operations.append(
+                RenameOperation(
+                    original=original,
+                    src=target_dir / name,
+                    dst=target_dir / new_name,
+                    is_dir=is_dir,
+                )
+            )
 
-        for index, directory in enumerate(list(dirs)):
-            try:
-                logger.debug(f"Processing directory: '{directory}'")
-                if directory in SKIP_DIRS or directory.startswith(".git"):
-                    dirs.remove(directory)
-                    logger.debug(f"Skipping directory: '{directory}'")
-                    continue
-
-                new_name = _normalise_name(directory)
-                if new_name != directory:
-                    src = current_path / directory
-                    dst = current_path / new_name
-                    rel_dir = (current_path / directory).relative_to(root)
-                    if use_git and not _is_tracked(root, rel_dir, is_dir=True):
-                        logger.debug("Skipping untracked directory '%s'", rel_dir)
-                        dirs.remove(directory)
-                        continue
-                    safe_git_mv(src, dst, use_git=use_git)
-                    logger.info(f"Renamed directory: '{src}' to '{dst}'")
-                    dirs[index] = new_name
-            except Exception as ex:  # pragma: no cover - best effort
-                logger.warning(f"Failed to rename directory '{directory}': {ex}")
-                dirs.remove(directory)
+        for directory in descend:
+            planned_dirs[rel / directory] = target_dir / renamed.get(
+                directory, directory
+            )
+        dirs[:] = descend
+    return plan
 
-        for file_name in files:
-            try:
-                logger.debug(f"Processing file: '{file_name}'")
-                if file_name.startswith(".") or file_name.endswith(".py"):
-                    logger.debug(f"Skipping file: '{file_name}'")
-                    continue
-                new_name = _normalise_name(file_name)
-                if new_name != file_name:
-                    src = current_path / file_name
-                    dst = current_path / new_name
-                    rel_file = (current_path / file_name).relative_to(root)
-                    if use_git and not _is_tracked(root, rel_file):
-                        logger.debug("Skipping untracked file '%s'", rel_file)
-                        continue
-                    safe_git_mv(src, dst, use_git=use_git)
-                    logger.info(f"Renamed file: '{src}' to '{dst}'")
-            except Exception as ex:  # pragma: no cover - best effort
-                logger.warning(f"Failed to rename file '{file_name}': {ex}")
+
+def apply_rename_plan(
+    plan: RenamePlan,
+    *,
+    use_git: bool = True,
+    tracked: Optional[TrackedIndex] = None,
+) -> int:
+    """Apply ``plan`` on disk and move the tracked entries in one index update.
+
+    Returns the number of completed renames. Failed renames are logged and
+    skipped like before; entries below a failed directory rename fail too.
+    """
+
+    renamed: Dict[str, str] = {}
+    for operation in plan.operations:
+        src = plan.root / operation.src
+        dst = plan.root / operation.dst
+        kind = "directory" if operation.is_dir else "file"
+        try:
+            if dst.exists():
+                raise FileExistsError(f"{dst} already exists")
+            src.rename(dst)
+        except OSError as ex:
+            logger.warning(f"Failed to rename {kind} '{src}': {ex}")
+            continue
+        logger.info(f"Renamed {kind}: '{src}' to '{dst}'")
+        renamed[operation.original.as_posix()] = operation.dst.name
+
+    if renamed:
+        invalidate_content(plan.root)
+    if use_git and renamed:
+        index = tracked or TrackedIndex.load(plan.root)
+        moved = index.stage_renames(renamed)
+        logger.info("Git-Index: %d Einträge in einem Schritt umbenannt", moved)
+    return len(renamed)
+
+
+def rename_to_gitbook_style(
+    root: Path, *, use_git: bool = True, dry_run: bool = False
+) -> RenamePlan:
+    """Rename files and directories below ``root`` to match GitBook style.
+
+    The tracked set is read once, all renames are planned up front (see
+    :func:`plan_gitbook_renames`) and applied with a single index update.
+    ``dry_run`` only logs the plan.
+    """
+
+    logger.info(f"Renaming files in {root} to GitBook style")
+    tracked = TrackedIndex.load(root) if use_git else None
+    plan = plan_gitbook_renames(root, use_git=use_git, tracked=tracked)
+    for collision, _, target in plan.collisions:
+        logger.warning(
+            "⚠ '%s' nicht umbenannt: Ziel '%s' existiert bereits", collision, target
+        )
+    if dry_run:
+        for line in plan.describe():
+            logger.info(line)
+        logger.info(
+            "Dry run: %d renames planned, %d entries skipped",
+            len(plan.operations),
+            len(plan.skipped),
+        )
+        return plan
+    apply_rename_plan(plan, use_git=use_git, tracked=tracked)
     logger.info("Renaming complete")
+    return plan
 
 
 def read_json(path: Path) -> dict:
@@ -441,8 +660,14 @@ def ensure_clean_summary(
     summary_appendices_last: bool = False,
     validate_doc_types: bool = False,
     fail_on_doc_type_issues: bool = False,
+    changed_files: Optional[Iterable[Path | str]] = None,
+    use_summary_index: bool = True,
 ) -> bool:
     """Regenerate SUMMARY.md from book.json structure.
+
+    Unless ``use_summary_index`` is false, titles of files that are neither
+    listed in ``changed_files`` nor modified on disk come from the persistent
+    :class:`~summary_index.SummaryIndex` of ``base_dir``.
     Returns True if the file was changed.
     """
     logger.info(f"Ensuring clean SUMMARY.md in {base_dir}")
@@ -549,23 +774,36 @@ def ensure_clean_summary(
             manifest_path=document_manifest_path,
             locale=locale,
         )
+        index = None
         if new_lines is None:
+            if use_summary_index:
+                index = SummaryIndex.from_env(
+                    context.root_dir, changed_files=changed_files
+                )
             new_lines = summary_generator.generate_summary(
                 root_dir=context.root_dir,
                 mode=mode,
                 submode=submode,
                 manual_order=manifest_order,
+                index=index,
             )
         new_content = "\n".join(new_lines).rstrip() + "\n"
     except Exception as e:
         logger.error(f"Failed to generate summary: {e}")
         return False
 
+    if index is not None:
+        if index.record_lines(new_lines):
+            logger.info("SUMMARY-Struktur seit dem letzten Lauf unverändert")
+        index.flush()
+        index.log_stats()
+
     if old_content == new_content:
         logger.info(f"No changes to {context.summary_path}")
         return False
 
     context.summary_path.write_text(new_content, encoding="utf-8")
+    invalidate_content(context.summary_path)
     if run_git:
         subprocess.run(["git", "add", str(context.summary_path)], check=False)
     logger.info(f"Updated {context.summary_path}")
@@ -585,6 +823,11 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     rename_parser.add_argument(
         "--no-git", action="store_true", help="Disable git integration (for tests)"
     )
+    rename_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the rename plan (renames, collisions, skips) without renaming",
+    )
 
     summary_parser = subparsers.add_parser(
         "summary", help="Ensure SUMMARY.md matches book.json"
@@ -646,6 +889,19 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         help="Bricht ab, wenn doc_type-Probleme gefunden werden (impliziert --validate-doc-types)",
     )
 
+    summary_parser.add_argument(
+        "--commit",
+        help="Ziel-Commit: geänderte Dateien werden im SUMMARY-Index neu gelesen",
+    )
+    summary_parser.add_argument(
+        "--base", help="Basis-Commit für die Änderungsdetektion (mit --commit)"
+    )
+    summary_parser.add_argument(
+        "--no-summary-index",
+        action="store_true",
+        help="Alle Titel neu lesen, ohne den persistenten SUMMARY-Index",
+    )
+
     return parser.parse_args(argv)
 
 
@@ -657,10 +913,17 @@ def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
 
     if args.command == "rename":
-        rename_to_gitbook_style(args.root.resolve(), use_git=not args.no_git)
+        plan = rename_to_gitbook_style(
+            args.root.resolve(), use_git=not args.no_git, dry_run=args.dry_run
+        )
+        if args.dry_run:
+            print("\n".join(plan.describe()) or "NO RENAMES")
         return 0
 
     if args.command == "summary":
+        changed_files = (
+            git_changed_paths(args.commit, args.base) if args.commit else None
+        )
         changed = ensure_clean_summary(
             args.root.resolve(),
             run_git=not args.no_git,
@@ -675,6 +938,8 @@ def main(argv: list[str] | None = None) -> int:
                 or getattr(args, "fail_on_doc_type_issues", False)
             ),
             fail_on_doc_type_issues=getattr(args, "fail_on_doc_type_issues", False),
+            changed_files=changed_files,
+            use_summary_index=not args.no_summary_index,
         )
         print("SUMMARY.MD UPDATED" if changed else "SUMMARY.MD OK")
         return 0
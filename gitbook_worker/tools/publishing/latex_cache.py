@@ -0,0 +1,189 @@
+"""Cache for the LaTeX documents Pandoc generates from combined Markdown.
+
+In single-pass mode (see ``publisher._compile_latex``) Pandoc only converts
+Markdown to a standalone ``.tex`` file.  That conversion - parsing, Lua
+filters, template rendering - does not depend on the LaTeX header files
+(font header from ``_build_font_header``, ``_combine_header_paths``), so
+Pandoc receives a one-line marker header instead and the real header files
+are spliced in afterwards.  The marker document is cached under a key over
+the Markdown, images, Lua filters and the Pandoc command line; when only the
+header files changed, the cached document is restored and Pandoc is skipped.
+
+Images extracted by ``--extract-media`` keep Pandoc's content-hash names and
+are stored once in a shared ``media`` directory; a media file is dropped once
+no cached document references it any more.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Set
+
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import (
+    env_int,
+    prune_lru_entries,
+    resolve_cache_dir,
+)
+
+logger = get_logger(__name__)
+
+LATEX_CACHE_DIR_ENV = "GITBOOK_WORKER_LATEX_CACHE_DIR"
+LATEX_CACHE_MAX_ENTRIES_ENV = "GITBOOK_WORKER_LATEX_CACHE_MAX_ENTRIES"
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_AGE_DAYS = 30
+
+HEADER_MARKER = "% gitbook-worker:header-includes"
+MEDIA_DIRNAME = "media"
+
+_MEDIA_GRACE_SECONDS = 60
+
+_TEMP_TOKEN = "@@GITBOOK_WORKER_LATEX_TMP@@"
+_MEDIA_REF_RE = re.compile(re.escape(f"{_TEMP_TOKEN}/{MEDIA_DIRNAME}/") + r"([^}\s]+)")
+
+
+def splice_header_includes(tex: str, header_files: Sequence[Path]) -> Optional[str]:
+    """Replace the marker line in ``tex`` with the content of ``header_files``.
+
+    Returns ``None`` when the document has no marker (custom templates that
+    drop ``header-includes``).
+    """
+
+    if HEADER_MARKER not in tex:
+        return None
+    includes = "\n".join(
+        Path(header).read_text(encoding="utf-8") for header in header_files
+    )
+    return tex.replace(HEADER_MARKER, includes, 1)
+
+
+@dataclass
+class LatexCache:
+    """Directory of Pandoc-generated LaTeX documents addressed by input key."""
+
+    root: Path
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS
+
+    @classmethod
+    def from_env(cls, root: Optional[Path] = None) -> "LatexCache":
+        """Create a cache honouring ``GITBOOK_WORKER_LATEX_CACHE_*``."""
+
+        explicit = root or os.getenv(LATEX_CACHE_DIR_ENV) or None
+        return cls(
+            root=resolve_cache_dir("latex", Path(explicit) if explicit else None),
+            max_entries=env_int(LATEX_CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES),
+        )
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.tex"
+
+    @property
+    def media_dir(self) -> Path:
+        return self.root / MEDIA_DIRNAME
+
+    def restore(self, key: str, tex_out: Path, temp_dir: Path) -> bool:
+        """Write the cached (marker) document for ``key`` to ``tex_out``.
+
+        Media referenced by the document are copied into ``temp_dir``.
+        Returns ``False`` on a miss or when a media file went missing.
+        """
+
+        entry = self._entry(key)
+        try:
+            text = entry.read_text(encoding="utf-8")
+        except OSError:
+            return False
+        media = sorted(set(_MEDIA_REF_RE.findall(text)))
+        target_media = temp_dir / MEDIA_DIRNAME
+        try:
+            for name in media:
+                source = self.media_dir / name
+                target_media.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(source, target_media / name)
+                os.utime(source, None)
+            tex_out.write_text(
+                text.replace(_TEMP_TOKEN, temp_dir.as_posix()), encoding="utf-8"
+            )
+            os.utime(entry, None)
+        except OSError as exc:
+            logger.warning("⚠ LaTeX-Cache-Eintrag %s unvollständig: %s", entry, exc)
+            return False
+        return True
+
+    def store(self, key: str, tex_file: Path, temp_dir: Path) -> None:
+        """Remember the marker document ``tex_file`` (and its media) under ``key``."""
+
+        try:
+            text = tex_file.read_text(encoding="utf-8")
+        except OSError:
+            return
+        for raw in {str(temp_dir), temp_dir.as_posix()}:
+            text = text.replace(raw, _TEMP_TOKEN)
+        entry = self._entry(key)
+        try:
+            source_media = temp_dir / MEDIA_DIRNAME
+            for name in set(_MEDIA_REF_RE.findall(text)):
+                target = self.media_dir / name
+                if not target.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(source_media / name, target)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            staging = entry.with_suffix(f".{os.getpid()}.tmp")
+            staging.write_text(text, encoding="utf-8")
+            os.replace(staging, entry)
+        except OSError as exc:
+            logger.warning("⚠ Konnte LaTeX-Dokument nicht cachen: %s", exc)
+            return
+        self.prune()
+
+    def entries(self) -> List[Path]:
+        return sorted(
+            path for path in self.root.glob("*/*.tex") if path.parent != self.media_dir
+        )
+
+    def prune(self) -> int:
+        """Evict documents LRU-style and drop media no document references."""
+
+        removed = prune_lru_entries(
+            self.entries(),
+            max_entries=self.max_entries,
+            max_age_days=self.max_age_days,
+        )
+        if removed:
+            self._prune_media()
+            logger.info("🧹 LaTeX-Cache: %d Einträge entfernt (%s)", removed, self.root)
+        return removed
+
+    def _prune_media(self) -> None:
+        referenced: Set[str] = set()
+        for entry in self.entries():
+            try:
+                referenced.update(
+                    _MEDIA_REF_RE.findall(entry.read_text(encoding="utf-8"))
+                )
+            except OSError:
+                continue
+        # A concurrent ``store`` copies media before writing its document.
+        cutoff = time.time() - _MEDIA_GRACE_SECONDS
+        for path in self.media_dir.glob("*"):
+            try:
+                if path.name not in referenced and path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+
+__all__ = [
+    "HEADER_MARKER",
+    "LATEX_CACHE_DIR_ENV",
+    "LATEX_CACHE_MAX_ENTRIES_ENV",
+    "LatexCache",
+    "splice_header_includes",
+]
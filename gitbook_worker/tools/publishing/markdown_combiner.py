@@ -2,7 +2,8 @@
 """Combine multiple Markdown files into a single document.
 
 Each input file is preprocessed using ``preprocess_md.py`` before being
-normalized and concatenated with a page break.
+normalized and concatenated with a page break. ``iter_combined_markdown``
+yields the document chapter by chapter so callers can stream it to disk.
 """
 from __future__ import annotations
 
@@ -10,7 +11,7 @@ import argparse
 import re
 import sys
 from pathlib import Path
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterator, List, Mapping, Optional
 
 from gitbook_worker.tools.logging_config import get_logger
 from gitbook_worker.tools.publishing import preprocess_md
@@ -20,6 +21,8 @@ from gitbook_worker.tools.publishing.header_level_adjuster import (
 from gitbook_worker.tools.publishing.geometry_package_injector import (
     add_geometry_package,
 )
+from gitbook_worker.tools.publishing.preprocess_cache import PreprocessCache
+from gitbook_worker.tools.utils.image_info import ImageIndex
 
 logger = get_logger(__name__)
 
@@ -38,52 +41,98 @@ _SUBS = {
 
 
 _BRACKET_ESCAPE_RE = re.compile(r"\\\[([^\n\\]*?)\]")
+_MATH_DELIM_RE = re.compile(r"(\$\$?)")
+_SUBSCRIPT_RE = re.compile(f"[{''.join(_SUBS)}]")
+# Replacement of each subscript digit in text and inside math segments.
+_SUBS_TEXT = {sub: f"$_{digit}$" for sub, digit in _SUBS.items()}
+_SUBS_MATH = {sub: f"_{{{digit}}}" for sub, digit in _SUBS.items()}
+_SVG_ASSET_RE = re.compile(r"(!\[[^\]]*\]\([^)]*\.gitbook/assets/[^)]+)\.svg\)")
+
+CHAPTER_SEPARATOR = "\n\n\\newpage\n\n"
 
 
 def normalize_md(text: str) -> str:
-    """Apply simple substitutions to ``text`` to normalise Markdown."""
+    """Apply simple substitutions to ``text`` to normalise Markdown.
+
+    Unicode subscript digits become ``$_n$`` in text and ``_{n}`` inside math.
+    Every ``$$`` or ``$`` (matched left to right) toggles the math state, so
+    the text is split on those delimiters into alternating text/math segments
+    and only the subscript matches are replaced, instead of walking every
+    character.
+    """
     text = _BRACKET_ESCAPE_RE.sub(r"[\1]", text)
-    out: List[str] = []
-    in_math = False
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        if ch == "$":
-            if i + 1 < len(text) and text[i + 1] == "$":
-                in_math = not in_math
-                out.append("$$")
-                i += 2
-                continue
-            in_math = not in_math
-            out.append("$")
-        elif ch in _SUBS:
-            digit = _SUBS[ch]
-            if in_math:
-                out.append(f"_{{{digit}}}")
-            else:
-                out.append(f"$_{digit}$")
-        else:
-            out.append(ch)
-        i += 1
-    return "".join(out)
+    if not _SUBSCRIPT_RE.search(text):
+        return text
+    segments = _MATH_DELIM_RE.split(text)
+    # segments = [text, delim, math, delim, text, ...]: every second segment
+    # is a delimiter, and the math state flips after each of them.
+    for index in range(0, len(segments), 2):
+        replace = _subscript_in_math if index % 4 else _subscript_in_text
+        segments[index] = _SUBSCRIPT_RE.sub(replace, segments[index])
+    return "".join(segments)
 
 
-def combine_markdown(
+def _subscript_in_text(match: re.Match[str]) -> str:
+    return _SUBS_TEXT[match.group()]
+
+
+def _subscript_in_math(match: re.Match[str]) -> str:
+    return _SUBS_MATH[match.group()]
+
+
+def _preprocess_chapter(
+    path: str,
+    *,
+    paper_format: str,
+    table_strategy: Optional[Mapping[str, Any]],
+    target_level: Optional[int],
+    cache: Optional[PreprocessCache],
+    image_index: Optional[ImageIndex] = None,
+) -> str:
+    """Preprocess one chapter and adjust its headings, via ``cache`` if given."""
+
+    key = (
+        cache.key(
+            Path(path),
+            paper_format=paper_format,
+            table_strategy=table_strategy,
+            target_level=target_level,
+        )
+        if cache is not None
+        else None
+    )
+    if key is not None:
+        cached = cache.load(key)
+        if cached is not None:
+            return cached
+
+    processed = preprocess_md.process(
+        path,
+        paper_format=paper_format,
+        table_strategy=table_strategy,
+        image_index=image_index,
+    )
+    processed = adjust_headings_for_inclusion(
+        processed, Path(path), target_level=target_level
+    )
+    if key is not None:
+        cache.store(key, processed)
+    return processed
+
+
+def iter_combined_markdown(
     files: List[str],
     paper_format: str = "a4",
     heading_targets: Optional[Mapping[str | Path, int]] = None,
     table_strategy: Optional[Mapping[str, Any]] = None,
-) -> str:
-    """Return a single Markdown string combining ``files``.
-
-    Each file is processed by :mod:`preprocess_md` before normalisation.
-    Missing files are skipped with a warning.
-
-    SVG image references are automatically converted to PDF references for
-    LaTeX compatibility (assumes SVG→PDF conversion happens during asset copying).
-
-    ``heading_targets`` allows callers to prescribe the desired first heading
-    level per file; a constant offset is applied to all headings in the file.
+    cache: Optional[PreprocessCache] = None,
+    image_index: Optional[ImageIndex] = None,
+) -> Iterator[str]:
+    """Yield the combined Markdown of ``files`` chunk by chunk.
+
+    Every processed chapter is one chunk; chapters are separated by a
+    :data:`CHAPTER_SEPARATOR` chunk. ``"".join(...)`` of the chunks equals
+    :func:`combine_markdown`. Only one chapter is held in memory at a time.
     """
     normalized_targets: dict[Path, int] = {}
     if heading_targets:
@@ -91,28 +140,63 @@ def combine_markdown(
             Path(path).resolve(): level for path, level in heading_targets.items()
         }
 
-    parts: List[str] = []
+    first = True
     for p in files:
         try:
-            processed = preprocess_md.process(
+            target_level = normalized_targets.get(Path(p).resolve())
+            processed = _preprocess_chapter(
                 p,
                 paper_format=paper_format,
                 table_strategy=table_strategy,
-            )
-            target_level = normalized_targets.get(Path(p).resolve())
-            processed = adjust_headings_for_inclusion(
-                processed, Path(p), target_level=target_level
+                target_level=target_level,
+                cache=cache,
+                image_index=image_index,
             )
             # Convert SVG references to PDF for LaTeX compatibility
-            processed = re.sub(
-                r"(!\[[^\]]*\]\([^)]*\.gitbook/assets/[^)]+)\.svg\)",
-                r"\1.pdf)",
-                processed,
-            )
-            parts.append(normalize_md(processed))
+            processed = _SVG_ASSET_RE.sub(r"\1.pdf)", processed)
+            chunk = normalize_md(processed)
         except Exception as e:  # pragma: no cover - best effort
             logger.warning("Konnte %s nicht lesen: %s", p, e)
-    return "\n\n\\newpage\n\n".join(parts)
+            continue
+        if not first:
+            yield CHAPTER_SEPARATOR
+        first = False
+        yield chunk
+
+
+def combine_markdown(
+    files: List[str],
+    paper_format: str = "a4",
+    heading_targets: Optional[Mapping[str | Path, int]] = None,
+    table_strategy: Optional[Mapping[str, Any]] = None,
+    cache: Optional[PreprocessCache] = None,
+    image_index: Optional[ImageIndex] = None,
+) -> str:
+    """Return a single Markdown string combining ``files``.
+
+    Each file is processed by :mod:`preprocess_md` before normalisation.
+    Missing files are skipped with a warning.
+
+    SVG image references are automatically converted to PDF references for
+    LaTeX compatibility (assumes SVG→PDF conversion happens during asset copying).
+
+    ``heading_targets`` allows callers to prescribe the desired first heading
+    level per file; a constant offset is applied to all headings in the file.
+
+    With a :class:`PreprocessCache`, unchanged chapters reuse their stored
+    preprocessed and heading-adjusted Markdown; ``image_index`` supplies the
+    image widths for the chapters that are preprocessed.
+    """
+    return "".join(
+        iter_combined_markdown(
+            files,
+            paper_format=paper_format,
+            heading_targets=heading_targets,
+            table_strategy=table_strategy,
+            cache=cache,
+            image_index=image_index,
+        )
+    )
 
 
 def main() -> None:
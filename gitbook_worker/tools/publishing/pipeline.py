@@ -23,9 +23,18 @@ Markdown file)::
     python gitbook_worker/tools/publishing/pipeline.py \
         --publisher-args "--keep-combined"
 
-The script intentionally shells out to the helper tools instead of importing
-internal functions.  This guarantees identical logging/CLI behaviour and keeps
-the orchestration lightweight.
+By default the GitBook rename/summary steps and the publisher run inside the
+pipeline process: ``rename_to_gitbook_style``, ``ensure_clean_summary`` and
+``publisher.main`` are called as functions, so the interpreter start-up, the
+imports and the font configuration are paid for once.  The language
+environment and working directory of each stage are applied for the duration
+of the call and restored afterwards.  ``--subprocess`` restores the previous
+behaviour of one Python interpreter per stage::
+
+    python gitbook_worker/tools/publishing/pipeline.py --subprocess
+
+``run_pipeline`` reports the duration of every stage, which the workflow
+orchestrator adds to its analytics.
 """
 
 from __future__ import annotations
@@ -35,13 +44,17 @@ import os
 import shlex
 import subprocess
 import sys
+import tempfile
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from typing import Iterable, Iterator, Mapping, MutableMapping, Sequence
 
 import yaml
 
 from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.content_snapshot import use_content_snapshot
 from gitbook_worker.tools.utils.language_context import (
     build_language_env,
     resolve_language_context,
@@ -78,10 +91,15 @@ class PipelineOptions:
     dry_run: bool
     language_id: str
     language_env: Mapping[str, str]
+    in_process: bool = True
 
 
 class CommandError(RuntimeError):
-    """Raised when a subprocess exits with a non-zero status."""
+    """Raised when a stage exits with a non-zero status."""
+
+    def __init__(self, message: str, returncode: int | None = None) -> None:
+        super().__init__(message)
+        self.returncode = returncode
 
 
 def _build_env(
@@ -116,12 +134,87 @@ def _run_command(
     )
     if check and result.returncode != 0:
         raise CommandError(
-            f"Command failed with exit status {result.returncode}: {display}"
+            f"Command failed with exit status {result.returncode}: {display}",
+            result.returncode,
         )
     return result
 
 
-def _load_manifest_data(manifest: Path) -> dict:
+_PUBLISHER_MODULE = "gitbook_worker.tools.publishing.publisher"
+
+
+@contextmanager
+def _preserved_process_state() -> Iterator[None]:
+    """Undo the process-wide state an in-process stage may change.
+
+    Restores the environment, the working directory and ``tempfile.tempdir``
+    (the publisher points it at its build temp directories) and resets the
+    publisher's registered font directories and font inventory.
+    """
+
+    saved_env = os.environ.copy()
+    saved_cwd = Path.cwd()
+    saved_tempdir = tempfile.tempdir
+    publisher = sys.modules.get(_PUBLISHER_MODULE)
+    saved_font_dirs = list(publisher._ADDITIONAL_FONT_DIRS) if publisher else []
+    try:
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+        tempfile.tempdir = saved_tempdir
+        publisher = sys.modules.get(_PUBLISHER_MODULE)
+        if publisher is not None:
+            publisher._ADDITIONAL_FONT_DIRS[:] = saved_font_dirs
+            publisher._invalidate_font_inventory()
+
+
+@contextmanager
+def _stage_environment(options: PipelineOptions) -> Iterator[None]:
+    """Run an in-process stage like ``_run_command`` would run its subprocess.
+
+    The language environment is applied and the working directory is switched
+    to the repository root; both are restored afterwards, including any
+    process state the stage changed itself (see ``_preserved_process_state``).
+    """
+
+    with _preserved_process_state():
+        os.environ.update(options.language_env)
+        os.chdir(options.root)
+        yield
+
+
+@contextmanager
+def _timed_stage(
+    timings: list[dict[str, object]], stage: str, options: PipelineOptions
+) -> Iterator[None]:
+    entry: dict[str, object] = {
+        "stage": stage,
+        "mode": "in-process" if options.in_process else "subprocess",
+    }
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        entry["status"] = "failed"
+        raise
+    else:
+        entry["status"] = "ok"
+    finally:
+        entry["duration_s"] = round(time.perf_counter() - started, 3)
+        timings.append(entry)
+        LOGGER.info(
+            "⏱ Pipeline-Schritt '%s' (%s): %.3f s",
+            stage,
+            entry["mode"],
+            entry["duration_s"],
+        )
+
+
+def _load_manifest_data(manifest: Path, data: Mapping | None = None) -> dict:
+    if data is not None:
+        return dict(data)
     try:
         data = yaml.safe_load(manifest.read_text(encoding="utf-8"))
     except Exception as exc:  # pragma: no cover - unlikely in unit tests
@@ -129,8 +222,10 @@ def _load_manifest_data(manifest: Path) -> dict:
     return data or {}
 
 
-def _validate_manifest_preconditions(manifest: Path) -> None:
-    data = _load_manifest_data(manifest)
+def _validate_manifest_preconditions(
+    manifest: Path, manifest_data: Mapping | None = None
+) -> None:
+    data = _load_manifest_data(manifest, manifest_data)
     project = data.get("project") if isinstance(data, dict) else None
     license_value = None
     if isinstance(project, Mapping):
@@ -141,7 +236,7 @@ def _validate_manifest_preconditions(manifest: Path) -> None:
         )
 
 
-def _should_skip_rename(manifest: Path) -> bool:
+def _should_skip_rename(manifest: Path, manifest_data: Mapping | None = None) -> bool:
     """Determine whether gitbook rename should be skipped.
 
     Returns *True* when:
@@ -153,7 +248,7 @@ def _should_skip_rename(manifest: Path) -> bool:
     Running the GitBook rename step would lowercase / kebab-case them,
     breaking the path references and causing FileNotFoundError.
     """
-    data = _load_manifest_data(manifest)
+    data = _load_manifest_data(manifest, manifest_data)
 
     # --- 1. explicit key ---
     explicit = data.get("gitbook_rename")
@@ -185,7 +280,17 @@ def _should_skip_rename(manifest: Path) -> bool:
     return False
 
 
-def _resolve_options(args: argparse.Namespace) -> PipelineOptions:
+def _resolve_options(
+    args: argparse.Namespace,
+    *,
+    manifest_data: Mapping | None = None,
+) -> PipelineOptions:
+    """Resolve ``args`` into pipeline options.
+
+    ``manifest_data`` is the already parsed manifest of a caller (the workflow
+    orchestrator); it is only used when it belongs to the resolved manifest.
+    """
+
     repo_root = args.root or detect_repo_root(Path.cwd())
     language_ctx = resolve_language_context(
         repo_root=repo_root,
@@ -198,7 +303,9 @@ def _resolve_options(args: argparse.Namespace) -> PipelineOptions:
         fetch_remote=True,
     )
     manifest = language_ctx.require_manifest()
-    _validate_manifest_preconditions(manifest)
+    if args.manifest is None or Path(args.manifest).resolve() != manifest.resolve():
+        manifest_data = None
+    _validate_manifest_preconditions(manifest, manifest_data)
     language_env = build_language_env(language_ctx)
     publisher_args = tuple(args.publisher_args or ())
 
@@ -206,7 +313,7 @@ def _resolve_options(args: argparse.Namespace) -> PipelineOptions:
     # then manifest key / auto-detect.
     if args.no_gitbook_rename:
         do_rename = False
-    elif _should_skip_rename(manifest):
+    elif _should_skip_rename(manifest, manifest_data):
         do_rename = False
     else:
         do_rename = True
@@ -227,6 +334,7 @@ def _resolve_options(args: argparse.Namespace) -> PipelineOptions:
         dry_run=args.dry_run,
         language_id=language_ctx.language_id,
         language_env=language_env,
+        in_process=not args.subprocess,
     )
 
 
@@ -251,48 +359,86 @@ def _run_set_publish_flag(options: PipelineOptions) -> None:
     )
 
 
+def _summary_appendices_last(manifest: Path) -> bool:
+    # If the manifest requests appendices to be moved to the end, forward the
+    # flag to the gitbook summary command so the initial SUMMARY regeneration
+    # (run by the pipeline) uses the same option the publisher later receives.
+    try:
+        manifest_text = manifest.read_text(encoding="utf-8")
+    except OSError:
+        return False
+    if "summary_appendices_last" not in manifest_text:
+        return False
+    # crude detection: check for a truthy setting in the manifest
+    for line in manifest_text.splitlines():
+        line_strip = line.strip()
+        if line_strip.startswith("summary_appendices_last"):
+            # Accept formats like 'summary_appendices_last: true' (yaml)
+            if ":" in line_strip:
+                _, val = line_strip.split(":", 1)
+                return val.strip().lower() in ("true", "yes", "y", "1")
+            return False
+    return False
+
+
 def _run_gitbook_steps(options: PipelineOptions) -> None:
+    from gitbook_worker.tools.publishing import gitbook_style
+
     script = SCRIPT_DIR / "gitbook_style.py"
     if options.run_gitbook_rename:
-        rename_args = ["rename", "--root", str(options.root)]
-        if not options.gitbook_use_git:
-            rename_args.append("--no-git")
-        _run_command(
-            _build_python_cmd(script, *rename_args),
-            cwd=options.root,
-            options=options,
-        )
+        if options.in_process:
+            LOGGER.info("→ rename_to_gitbook_style(%s)", options.root)
+            with _stage_environment(options):
+                gitbook_style.rename_to_gitbook_style(
+                    options.root.resolve(), use_git=options.gitbook_use_git
+                )
+        else:
+            rename_args = ["rename", "--root", str(options.root)]
+            if not options.gitbook_use_git:
+                rename_args.append("--no-git")
+            _run_command(
+                _build_python_cmd(script, *rename_args),
+                cwd=options.root,
+                options=options,
+            )
     else:
         LOGGER.info(
             "GitBook-Rename übersprungen (gitbook_rename=false oder "
             "alle Einträge sind source_type=file)"
         )
     if options.run_gitbook_summary:
+        appendices_last = _summary_appendices_last(options.manifest)
+        if options.in_process:
+            LOGGER.info("→ ensure_clean_summary(%s)", options.root)
+            with _stage_environment(options):
+                changed_files = (
+                    gitbook_style.git_changed_paths(options.commit, options.base)
+                    if options.commit
+                    else None
+                )
+                changed = gitbook_style.ensure_clean_summary(
+                    options.root.resolve(),
+                    run_git=options.gitbook_use_git,
+                    summary_mode="gitbook",
+                    document_manifest=options.manifest,
+                    locale=options.language_id or None,
+                    summary_appendices_last=appendices_last,
+                    changed_files=changed_files,
+                )
+            LOGGER.info("SUMMARY.MD UPDATED" if changed else "SUMMARY.MD OK")
+            return
         summary_args = ["summary", "--root", str(options.root)]
         if not options.gitbook_use_git:
             summary_args.append("--no-git")
         summary_args.extend(["--document-manifest", str(options.manifest)])
         if options.language_id:
             summary_args.extend(["--locale", options.language_id])
-        # If the manifest requests appendices to be moved to the end, forward
-        # the flag to the gitbook summary command so the initial SUMMARY
-        # regeneration (run by the pipeline) uses the same option the
-        # publisher later receives.
-        try:
-            manifest_text = (options.manifest).read_text(encoding="utf-8")
-        except OSError:
-            manifest_text = ""
-        if "summary_appendices_last" in manifest_text:
-            # crude detection: check for a truthy setting in the manifest
-            for line in manifest_text.splitlines():
-                line_strip = line.strip()
-                if line_strip.startswith("summary_appendices_last"):
-                    # Accept formats like 'summary_appendices_last: true' (yaml)
-                    if ":" in line_strip:
-                        _, val = line_strip.split(":", 1)
-                        if val.strip().lower() in ("true", "yes", "y", "1"):
-                            summary_args.append("--summary-appendices-last")
-                    break
+        if appendices_last:
+            summary_args.append("--summary-appendices-last")
+        if options.commit:
+            summary_args.extend(["--commit", options.commit])
+            if options.base:
+                summary_args.extend(["--base", options.base])
         _run_command(
             _build_python_cmd(script, *summary_args),
             cwd=options.root,
@@ -301,13 +447,40 @@ def _run_gitbook_steps(options: PipelineOptions) -> None:
 
 
 def _run_publisher(options: PipelineOptions) -> None:
-    script = SCRIPT_DIR / "publisher.py"
-    cmd = list(_build_python_cmd(script, "--manifest", str(options.manifest)))
-    cmd.extend(options.publisher_args)
-    _run_command(cmd, cwd=options.root, options=options)
+    publisher_args = ["--manifest", str(options.manifest), *options.publisher_args]
+    if not options.in_process:
+        script = SCRIPT_DIR / "publisher.py"
+        cmd = _build_python_cmd(script, *publisher_args)
+        _run_command(cmd, cwd=options.root, options=options)
+        return
+
+    from gitbook_worker.tools.publishing import publisher
 
+    LOGGER.info("→ publisher.main(%s)", _format_cmd(publisher_args))
+    with _stage_environment(options):
+        try:
+            publisher.main(publisher_args)
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                returncode = exc.code if isinstance(exc.code, int) else 1
+                raise CommandError(
+                    f"publisher.py failed with exit status {exc.code}", returncode
+                ) from exc
 
-def run_pipeline(options: PipelineOptions) -> None:
+
+def run_pipeline(
+    options: PipelineOptions,
+    *,
+    timings: list[dict[str, object]] | None = None,
+) -> list[dict[str, object]]:
+    """Run the enabled stages and return their timings.
+
+    Each timing is a ``{"stage", "mode", "status", "duration_s"}`` mapping.
+    Pass ``timings`` to collect them in a caller-owned list, which keeps the
+    stages that finished before a failure.
+    """
+
+    timings = [] if timings is None else timings
     LOGGER.info(
         "Starte Publishing-Pipeline (root=%s, manifest=%s)",
         options.root,
@@ -315,10 +488,18 @@ def run_pipeline(options: PipelineOptions) -> None:
     )
     if options.dry_run:
         LOGGER.info("Dry-Run aktiviert – Befehle werden nicht ausgeführt.")
-        return
+        return timings
+
+    # In-process stages share one listing/read of the content tree.
+    with use_content_snapshot(options.root):
+        _run_stages(options, timings)
+    return timings
+
 
+def _run_stages(options: PipelineOptions, timings: list[dict[str, object]]) -> None:
     if options.run_frontmatter_check:
-        fm_issues = check_frontmatter_tree(options.root)
+        with _timed_stage(timings, "frontmatter-check", options):
+            fm_issues = check_frontmatter_tree(options.root)
         if fm_issues:
             for issue in fm_issues:
                 LOGGER.error(
@@ -332,12 +513,15 @@ def run_pipeline(options: PipelineOptions) -> None:
             raise SystemExit(FRONTMATTER_EXIT_CODE)
 
     if options.run_set_flag:
-        _run_set_publish_flag(options)
+        with _timed_stage(timings, "set-publish-flag", options):
+            _run_set_publish_flag(options)
 
-    _run_gitbook_steps(options)
+    with _timed_stage(timings, "gitbook", options):
+        _run_gitbook_steps(options)
 
     if options.run_publisher:
-        _run_publisher(options)
+        with _timed_stage(timings, "publisher", options):
+            _run_publisher(options)
 
 
 def _split_publisher_args(raw: Iterable[str] | None) -> tuple[str, ...]:
@@ -420,6 +604,14 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         action="append",
         help="Extra arguments forwarded to publisher.py (repeat for multiple)",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help=(
+            "Run the GitBook steps and publisher.py as separate Python "
+            "processes instead of in-process"
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -0,0 +1,219 @@
+"""On-disk cache for preprocessed Markdown chapters.
+
+``markdown_combiner.combine_markdown`` runs ``preprocess_md.process`` (HTML
+figure conversion, internal link rewriting, table paper-strategy scoring and
+Pillow image probing) followed by ``adjust_headings_for_inclusion`` for every
+chapter of every build.  This cache stores the result keyed by everything
+those steps read: the chapter bytes and path, the paper format, the table
+strategy configuration, the heading target level, the size/mtime of
+referenced images, the existence of linked chapters and the source of the
+preprocessing modules themselves.  Unchanged chapters then skip
+preprocessing entirely.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Mapping, Optional
+
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.publishing.table_strategy import (
+    TablePaperStrategyConfig,
+    parse_table_strategy_config,
+)
+from gitbook_worker.tools.utils.cache import (
+    env_int,
+    prune_lru_entries,
+    resolve_cache_dir,
+)
+
+logger = get_logger(__name__)
+
+PREPROCESS_CACHE_DIR_ENV = "GITBOOK_WORKER_PREPROCESS_CACHE_DIR"
+PREPROCESS_CACHE_MAX_ENTRIES_ENV = "GITBOOK_WORKER_PREPROCESS_CACHE_MAX_ENTRIES"
+
+DEFAULT_MAX_ENTRIES = 8192
+DEFAULT_MAX_AGE_DAYS = 30
+
+_KEY_VERSION = 1
+
+# Modules whose behaviour is baked into a cached chapter.
+_SOURCE_MODULES = (
+    "preprocess_md.py",
+    "table_strategy.py",
+    "paper_info.py",
+    "header_level_adjuster.py",
+)
+
+_IMAGE_RE = re.compile(
+    r"!\[[^\]]*\]\(\s*<?(?P<md>[^)\s>]+)|<img\b[^>]*?\bsrc=[\"'](?P<html>[^\"']+)[\"']",
+    re.IGNORECASE,
+)
+_CHAPTER_LINK_RE = re.compile(
+    r"\]\(\s*<?(?P<target>[^)\s>#]+\.(?:md|markdown))", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    digest = hashlib.sha256()
+    module_dir = Path(__file__).resolve().parent
+    for name in _SOURCE_MODULES:
+        try:
+            digest.update((module_dir / name).read_bytes())
+        except OSError:
+            digest.update(f"<missing:{name}>".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _stat_token(path: Path) -> Any:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+@dataclass
+class PreprocessCache:
+    """Directory of preprocessed chapters addressed by their input key."""
+
+    root: Path
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+
+    @classmethod
+    def from_env(cls, root: Optional[Path] = None) -> "PreprocessCache":
+        """Create a cache honouring ``GITBOOK_WORKER_PREPROCESS_CACHE_*``."""
+
+        explicit = root or os.getenv(PREPROCESS_CACHE_DIR_ENV) or None
+        return cls(
+            root=resolve_cache_dir("preprocess", Path(explicit) if explicit else None),
+            max_entries=env_int(PREPROCESS_CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES),
+        )
+
+    def key(
+        self,
+        path: Path,
+        *,
+        paper_format: str,
+        table_strategy: Mapping[str, Any] | TablePaperStrategyConfig | None,
+        target_level: Optional[int],
+    ) -> Optional[str]:
+        """Return the cache key for one chapter or ``None`` to bypass the cache.
+
+        Chapters are not cached while a table-layout report is requested,
+        because the report is written as a side effect of preprocessing.
+        """
+
+        config = parse_table_strategy_config(table_strategy)
+        if config.report_path is not None:
+            self.bypassed += 1
+            return None
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+
+        resolved = path.resolve()
+        base_dir = resolved.parent
+        text = raw.decode("utf-8", errors="replace")
+        images: List[Any] = []
+        for match in _IMAGE_RE.finditer(text):
+            target = (match.group("md") or match.group("html") or "").strip()
+            if not target or "://" in target:
+                continue
+            images.append([target, _stat_token(base_dir / target)])
+        links = sorted(
+            {
+                (m.group("target"), (base_dir / m.group("target")).exists())
+                for m in _CHAPTER_LINK_RE.finditer(text)
+                if "://" not in m.group("target")
+            }
+        )
+
+        payload = {
+            "version": _KEY_VERSION,
+            "source": _source_fingerprint(),
+            "path": resolved.as_posix(),
+            "content": hashlib.sha256(raw).hexdigest(),
+            "paper_format": paper_format,
+            "table_strategy": dataclasses.asdict(config),
+            "target_level": target_level,
+            "images": images,
+            "links": links,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.md"
+
+    def load(self, key: str) -> Optional[str]:
+        """Return the cached chapter for ``key`` and count the hit or miss."""
+
+        entry = self._entry(key)
+        try:
+            text = entry.read_text(encoding="utf-8")
+            os.utime(entry, None)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def store(self, key: str, text: str) -> None:
+        entry = self._entry(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            staging = entry.with_suffix(f".{os.getpid()}.tmp")
+            staging.write_text(text, encoding="utf-8", newline="")
+            os.replace(staging, entry)
+        except OSError as exc:
+            logger.warning(
+                "⚠ Konnte Kapitel nicht im Preprocess-Cache ablegen: %s", exc
+            )
+
+    def prune(self) -> int:
+        removed = prune_lru_entries(
+            self.root.glob("*/*.md"),
+            max_entries=self.max_entries,
+            max_age_days=self.max_age_days,
+        )
+        if removed:
+            logger.info(
+                "🧹 Preprocess-Cache: %d Einträge entfernt (%s)", removed, self.root
+            )
+        return removed
+
+    def log_stats(self, label: str = "") -> None:
+        """Log and reset the hit/miss counters (one summary per build)."""
+
+        if self.hits or self.misses or self.bypassed:
+            logger.info(
+                "♻ Preprocess-Cache%s: %d Treffer, %d Fehlschläge, %d umgangen",
+                f" ({label})" if label else "",
+                self.hits,
+                self.misses,
+                self.bypassed,
+            )
+            if self.misses:
+                self.prune()
+        self.hits = self.misses = self.bypassed = 0
+
+
+__all__ = [
+    "PREPROCESS_CACHE_DIR_ENV",
+    "PREPROCESS_CACHE_MAX_ENTRIES_ENV",
+    "PreprocessCache",
+]
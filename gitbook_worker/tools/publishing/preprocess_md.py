@@ -53,7 +53,7 @@ from gitbook_worker.tools.publishing.table_strategy import (
     split_table_row,
     table_column_count,
 )
-from gitbook_worker.tools.utils.image_info import get_image_width
+from gitbook_worker.tools.utils.image_info import ImageIndex, get_image_width
 
 _FIGURE_START = re.compile(r"<figure\b", re.IGNORECASE)
 _FIGURE_END = re.compile(r"</figure>", re.IGNORECASE)
@@ -1071,8 +1071,13 @@ def process(
     path: str,
     paper_format: str = "a4",
     table_strategy: Mapping[str, Any] | TablePaperStrategyConfig | None = None,
+    image_index: ImageIndex | None = None,
 ) -> str:
-    """Process ``path`` and return transformed Markdown content."""
+    """Process ``path`` and return transformed Markdown content.
+
+    ``image_index`` answers image widths from the persistent metadata index
+    instead of reading every image header again.
+    """
     # Use utf-8-sig to transparently strip a UTF-8 BOM (\ufeff) if present.
     # BOMs can break Pandoc block parsing and lead to missing TOC/bookmarks.
     with open(path, "r", encoding="utf-8-sig") as f:
@@ -1144,7 +1149,7 @@ def process(
             img = m.group(1).split()[0]
             abs_img = os.path.join(base_dir, img)
 
-            width = get_image_width(Path(abs_img))
+            width = get_image_width(Path(abs_img), index=image_index)
             paper_info = paper_for_width(width, base_paper=current_paper_info)
             if paper_info != current_paper_info:
                 _collapse_trailing_newpage_before_wrap(out)
@@ -34,6 +34,7 @@ from __future__ import annotations
 import argparse
 import hashlib
 import contextlib
+import gzip
 import json
 import os
 import pathlib
@@ -53,10 +54,17 @@ from collections.abc import Mapping
 from functools import lru_cache
 from urllib.parse import urlparse
 
-from gitbook_worker.core.application.svg_to_pdf import ensure_svg_pdf
+from gitbook_worker.core.application.svg_to_pdf import (
+    SVG_JOBS_ENV,
+    ensure_svg_pdf,
+    ensure_svg_pdfs,
+)
 
 from gitbook_worker.tools.logging_config import get_logger
 from gitbook_worker.tools.utils.asset_copy import copy_assets_to_temp
+from gitbook_worker.tools.utils.image_info import ImageIndex
+from gitbook_worker.tools.utils.svg_pdf_cache import SvgPdfCache
+from gitbook_worker.tools.utils.cache import env_int, file_sha256
 from gitbook_worker.tools.utils.language_context import (
     build_language_env,
     resolve_language_context,
@@ -68,16 +76,30 @@ from gitbook_worker.tools.utils.smart_manifest import (
     resolve_manifest,
 )
 
+from gitbook_worker.tools.publishing.build_cache import BuildCache, BuildFingerprint
+from gitbook_worker.tools.publishing.chapter_split import (
+    ChapterFragment,
+    chapter_title,
+    merge_chapter_pdfs,
+)
 from gitbook_worker.tools.publishing.font_config import get_font_config
+from gitbook_worker.tools.publishing.latex_cache import (
+    HEADER_MARKER,
+    LatexCache,
+    splice_header_includes,
+)
 from gitbook_worker.tools.publishing.smart_font_stack import (
     SmartFontError,
     prepare_runtime_font_loader,
 )
 from gitbook_worker.tools.publishing.markdown_combiner import (
+    CHAPTER_SEPARATOR,
     add_geometry_package,
     combine_markdown,
+    iter_combined_markdown,
     normalize_md,
 )
+from gitbook_worker.tools.publishing.preprocess_cache import PreprocessCache
 from gitbook_worker.tools.publishing.preprocess_md import process
 from gitbook_worker.tools.publishing.gitbook_style import (
     DEFAULT_MANUAL_MARKER,
@@ -86,6 +108,11 @@ from gitbook_worker.tools.publishing.gitbook_style import (
     get_summary_layout,
 )
 from gitbook_worker.tools.publishing.emoji_report import emoji_report
+from gitbook_worker.tools.publishing.table_strategy import (
+    COLUMNAR_REPORT_SUFFIX,
+    TableReportSink,
+    parse_table_strategy_config,
+)
 
 # ------------------------------- Utils ------------------------------------- #
 
@@ -173,6 +200,7 @@ def _purge_disallowed_fonts(
 
 
 _TRUE_VALUES = {"1", "true", "yes", "on", "y"}
+_TEMP_ENV_KEYS: Tuple[str, ...] = ("TMPDIR", "TMP", "TEMP")
 
 _SEMVER_RE = re.compile(
     r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:[-+][0-9A-Za-z.-]+)?$"
@@ -313,6 +341,11 @@ EMOJI_RANGES = (
 _FONT_FILE_MIN_BYTES = 64
 _FONT_FILE_SIGNATURES = (b"\x00\x01\x00\x00", b"OTTO", b"true", b"typ1", b"ttcf")
 
+_LUATEX_CACHE_DIR_ENV = "GITBOOK_WORKER_LUATEX_CACHE_DIR"
+# Default chapter pool size when ``pdf_options.chapter_jobs`` is unset (0 = CPUs).
+CHAPTER_JOBS_ENV = "GITBOOK_WORKER_CHAPTER_JOBS"
+_FONT_FINGERPRINT_FILE = "gitbook-worker-fonts.json"
+
 
 @dataclass(frozen=True)
 class EmojiOptions:
@@ -460,7 +493,14 @@ def _configure_osfontdir(additional_dirs: Optional[Sequence[Path]] = None) -> No
                 logger.info("✓ FONTCONFIG_FILE fallback to %s", fallback_conf)
 
 
-def _configure_texmf_cache(manifest_path: Optional[Path]) -> None:
+def _luatex_cache_override() -> Optional[Path]:
+    """Return the persistent LuaTeX cache directory (``GITBOOK_WORKER_LUATEX_CACHE_DIR``)."""
+
+    value = os.environ.get(_LUATEX_CACHE_DIR_ENV, "").strip()
+    return Path(value).expanduser() if value else None
+
+
+def _configure_texmf_cache(manifest_path: Optional[Path]) -> Path:
     """Place TeX/luaotfload caches in a repo-local directory (optionally per language).
 
     This keeps font caches reproducible and avoids polluting global user caches.
@@ -469,6 +509,16 @@ def _configure_texmf_cache(manifest_path: Optional[Path]) -> None:
     luaotfload-tool --update does not respect this variable and updates the system
     cache instead. This causes a mismatch where CLI tools see fonts but LuaTeX runtime
     cannot find them. We only set TEXMFVAR/TEXMFCONFIG for TeX itself.
+
+    TEXMFCACHE is never overridden: ``luaotfload-tool`` and LuaLaTeX must read
+    the same database, and both find it in the default cache. To keep that
+    database across container runs, the Docker runner mounts a named volume on
+    the image's default ``luatex-cache`` directory and announces it via
+    ``GITBOOK_WORKER_LUATEX_CACHE_DIR``.
+
+    Returns:
+        Directory holding the font fingerprint stamp (the persistent LuaTeX
+        cache if configured, otherwise the repo-local cache root).
     """
 
     repo_root = _resolve_repo_root()
@@ -499,9 +549,25 @@ def _configure_texmf_cache(manifest_path: Optional[Path]) -> None:
 
     logger.info("ℹ TEXMFVAR gesetzt: %s", texmf_var)
     logger.info("ℹ TEXMFCONFIG gesetzt: %s", texmf_config)
+
     logger.info("ℹ TEXMFCACHE: using system default (not overridden)")
     logger.info("ℹ LUAOTFLOAD_CACHE: using system default (not overridden)")
 
+    persistent_cache = _luatex_cache_override()
+    if persistent_cache is not None:
+        persistent_cache.mkdir(parents=True, exist_ok=True)
+        if persistent_cache.resolve() in _luatex_cache_roots():
+            logger.info("ℹ LuaTeX-Cache persistent: %s", persistent_cache)
+        else:
+            logger.warning(
+                "⚠ %s ist nicht der LuaTeX-Cache von luaotfload - "
+                "Font-Datenbank wird nicht persistiert",
+                persistent_cache,
+            )
+        return persistent_cache
+
+    return cache_root
+
 
 def _resolve_repo_root() -> Path:
     """Return the repository root for the current checkout."""
@@ -627,6 +693,11 @@ def _clear_lualatex_caches() -> None:
         Path.home() / ".texlive2025" / "texmf-var" / "luatex-cache",
         Path("/var/lib/texmf/luatex-cache"),
     ]
+    persistent_cache = _luatex_cache_override()
+    if persistent_cache is not None:
+        # The directory itself is a volume mount; clear the luaotfload data
+        # below it and keep the font fingerprint stamp.
+        cache_locations.append(persistent_cache / "generic")
 
     cleared_count = 0
     for cache_dir in cache_locations:
@@ -647,6 +718,232 @@ def _clear_lualatex_caches() -> None:
         logger.debug("ℹ Keine LuaLaTeX Cache-Verzeichnisse gefunden")
 
 
+_LUAOTFLOAD_NAME_FIELDS = ("familyname", "fontname", "fullname", "plainname", "psname")
+_LUA_TOKEN_RE = re.compile(
+    r'\[\s*"(?P<key>(?:[^"\\]|\\.)*)"\s*\]\s*=\s*'
+    r'(?:"(?P<value>(?:[^"\\]|\\.)*)")?'
+    r'|"(?:[^"\\]|\\.)*"'
+    r"|(?P<brace>[{}])"
+)
+_LUA_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+def _luatex_cache_roots() -> List[Path]:
+    """Return the ``luatex-cache`` directories listed in kpathsea's TEXMFCACHE."""
+
+    roots: List[Path] = []
+    kpsewhich = _which("kpsewhich")
+    if kpsewhich:
+        try:
+            result = _run(
+                [kpsewhich, "-var-value", "TEXMFCACHE"],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=5,
+            )
+            separators = r"[;]" if sys.platform == "win32" else r"[;:]"
+            for raw in re.split(separators, (result.stdout or "").strip()):
+                if raw.strip():
+                    roots.append((Path(raw.strip()) / "luatex-cache").resolve())
+        except Exception as exc:
+            logger.debug("kpsewhich TEXMFCACHE fehlgeschlagen: %s", exc)
+    return roots
+
+
+def _luaotfload_names_files() -> List[Path]:
+    """Return candidate luaotfload name database files (Lua source, not .luc)."""
+
+    roots = _luatex_cache_roots()
+    roots.extend(
+        [
+            Path.home() / ".texlive2023" / "texmf-var" / "luatex-cache",
+            Path.home() / ".texlive2024" / "texmf-var" / "luatex-cache",
+            Path.home() / ".texlive2025" / "texmf-var" / "luatex-cache",
+            Path("/var/lib/texmf/luatex-cache"),
+        ]
+    )
+    files: List[Path] = []
+    for root in roots:
+        names_dir = root / "generic" / "names"
+        for name in ("luaotfload-names.lua.gz", "luaotfload-names.lua"):
+            candidate = names_dir / name
+            if candidate.is_file() and candidate not in files:
+                files.append(candidate)
+    return files
+
+
+def _parse_luaotfload_names(text: str) -> Dict[str, Path]:
+    """Map normalised font names to files from a serialised luaotfload DB.
+
+    The database is a nested Lua table; every table that carries a
+    ``fullpath`` string is a font mapping. Tables are tracked by brace depth
+    (braces inside strings are skipped), so the result does not depend on the
+    key order luaotfload uses when serialising.
+    """
+
+    names: Dict[str, Path] = {}
+    stack: List[Dict[str, str]] = []
+    for match in _LUA_TOKEN_RE.finditer(text):
+        brace = match.group("brace")
+        if brace == "{":
+            stack.append({})
+        elif brace == "}":
+            if not stack:
+                continue
+            fields = stack.pop()
+            fullpath = fields.get("fullpath")
+            if not fullpath:
+                continue
+            for key in _LUAOTFLOAD_NAME_FIELDS:
+                value = fields.get(key)
+                if value:
+                    names.setdefault(_normalize_font_name(value), Path(fullpath))
+        elif match.group("value") is not None and stack:
+            stack[-1].setdefault(
+                match.group("key"), _LUA_ESCAPE_RE.sub(r"\1", match.group("value"))
+            )
+    return names
+
+
+@dataclass
+class _FontInventory:
+    """One snapshot of the fontconfig and luaotfload font databases.
+
+    Built from a single ``fc-list`` call plus the luaotfload name database
+    file, so repeated font checks during ``prepare_publishing`` and
+    ``_run_pandoc`` are answered from memory. Names missing from the parsed
+    luaotfload database fall back to ``luaotfload-tool --find`` once per name.
+    """
+
+    # (normalised family string, normalised family names) per fc-list line
+    fontconfig_entries: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    luaotfload_names: Dict[str, Path]
+    luaotfload_lookups: Dict[str, Optional[str]]
+
+    @classmethod
+    def build(cls) -> "_FontInventory":
+        entries: List[Tuple[str, Tuple[str, ...]]] = []
+        fc_list = _which("fc-list")
+        if fc_list:
+            try:
+                result = _run(
+                    [fc_list, ":", "family", "--format", "%{family}\n"],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                for family in (result.stdout or "").splitlines():
+                    if not family.strip():
+                        continue
+                    names = tuple(
+                        _normalize_font_name(part) for part in family.split(",")
+                    )
+                    entries.append((_normalize_font_name(family), names))
+            except Exception as exc:
+                logger.debug("fc-list Inventar fehlgeschlagen: %s", exc)
+        else:
+            logger.debug("fc-list nicht verfügbar - kann fontconfig nicht prüfen")
+
+        lua_names: Dict[str, Path] = {}
+        for names_file in _luaotfload_names_files():
+            try:
+                if names_file.suffix == ".gz":
+                    text = gzip.decompress(names_file.read_bytes()).decode(
+                        "utf-8", errors="replace"
+                    )
+                else:
+                    text = names_file.read_text(encoding="utf-8", errors="replace")
+            except Exception as exc:
+                logger.debug("luaotfload DB %s unlesbar: %s", names_file, exc)
+                continue
+            parsed = _parse_luaotfload_names(text)
+            if not parsed:
+                logger.debug(
+                    "luaotfload DB %s ohne lesbare Einträge - nutze --find",
+                    names_file,
+                )
+            for name, path in parsed.items():
+                lua_names.setdefault(name, path)
+        logger.debug(
+            "Font-Inventar: %d fontconfig-Einträge, %d luaotfload-Namen",
+            len(entries),
+            len(lua_names),
+        )
+        return cls(
+            fontconfig_entries=tuple(entries),
+            luaotfload_names=lua_names,
+            luaotfload_lookups={},
+        )
+
+    def fontconfig_has_family(self, font_name: str) -> bool:
+        target = _normalize_font_name(font_name)
+        return any(target in family for family, _ in self.fontconfig_entries)
+
+    def fontconfig_matches(self, font_name: str) -> bool:
+        """Mimic ``fc-list <name>``: prefer an exact family match.
+
+        Falls back to the substring check ``_font_available`` always used, so
+        e.g. "DejaVu Sans" is still found when only "DejaVu Sans Mono" is
+        installed.
+        """
+
+        target = _normalize_font_name(font_name)
+        if any(target in names for _, names in self.fontconfig_entries):
+            return True
+        return self.fontconfig_has_family(font_name)
+
+    def luaotfload_find(self, font_name: str) -> Optional[str]:
+        """Return ``luaotfload-tool --find`` style output for ``font_name``."""
+
+        key = _normalize_font_name(font_name)
+        if key in self.luaotfload_names:
+            path = self.luaotfload_names[key]
+            return f'Resolved file name "{path.as_posix()}"'
+        if key in self.luaotfload_lookups:
+            return self.luaotfload_lookups[key]
+
+        output: Optional[str] = None
+        tool = _which("luaotfload-tool") or _which("luaotfload-tool.exe")
+        if not tool:
+            logger.debug(
+                "luaotfload-tool nicht verfügbar - kann LuaTeX cache nicht prüfen"
+            )
+        else:
+            try:
+                result = _run(
+                    [tool, "--find", font_name],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=5,
+                )
+                output = (result.stdout or "").strip() or None
+            except Exception as exc:
+                logger.debug("luaotfload-tool check fehlgeschlagen: %s", exc)
+        self.luaotfload_lookups[key] = output
+        return output
+
+
+_FONT_INVENTORY: Optional[_FontInventory] = None
+
+
+def _get_font_inventory() -> _FontInventory:
+    """Return the per-process font inventory, building it on first use."""
+
+    global _FONT_INVENTORY
+    if _FONT_INVENTORY is None:
+        _FONT_INVENTORY = _FontInventory.build()
+    return _FONT_INVENTORY
+
+
+def _invalidate_font_inventory() -> None:
+    """Drop the font inventory after fonts were added or caches rebuilt."""
+
+    global _FONT_INVENTORY
+    _FONT_INVENTORY = None
+
+
 def _check_fontconfig_has_font(font_name: str) -> bool:
     """Check if fontconfig cache knows about this font.
 
@@ -656,26 +953,7 @@ def _check_fontconfig_has_font(font_name: str) -> bool:
     Returns:
         True if font is in fontconfig cache, False otherwise
     """
-    fc_list = _which("fc-list")
-    if not fc_list:
-        logger.debug("fc-list nicht verfügbar - kann fontconfig nicht prüfen")
-        return False
-
-    try:
-        result = _run(
-            [fc_list, ":", "family", "--format", "%{family}\n"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        target = _normalize_font_name(font_name)
-        for line in (result.stdout or "").splitlines():
-            if target in _normalize_font_name(line):
-                return True
-        return False
-    except Exception as exc:
-        logger.debug("fc-list check fehlgeschlagen: %s", exc)
-        return False
+    return _get_font_inventory().fontconfig_has_family(font_name)
 
 
 def _check_luaotfload_has_font(font_name: str) -> bool:
@@ -687,37 +965,21 @@ def _check_luaotfload_has_font(font_name: str) -> bool:
     Returns:
         True if font is in LuaTeX cache, False otherwise
     """
-    tool = _which("luaotfload-tool") or _which("luaotfload-tool.exe")
-    if not tool:
-        logger.debug("luaotfload-tool nicht verfügbar - kann LuaTeX cache nicht prüfen")
+    stdout = _get_font_inventory().luaotfload_find(font_name)
+    if not stdout:
         return False
 
-    try:
-        result = _run(
-            [tool, "--find", font_name],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=5,
+    resolved = _extract_luaotfload_resolved_path(stdout)
+    if resolved and not _is_valid_font_file(resolved):
+        logger.warning(
+            "⚠ LuaTeX cache resolved font '%s' to invalid font file: %s",
+            font_name,
+            resolved,
         )
-        stdout = result.stdout.strip()
-        if not stdout:
-            return False
-
-        resolved = _extract_luaotfload_resolved_path(stdout)
-        if resolved and not _is_valid_font_file(resolved):
-            logger.warning(
-                "⚠ LuaTeX cache resolved font '%s' to invalid font file: %s",
-                font_name,
-                resolved,
-            )
-            return False
-
-        return True
-    except Exception as exc:
-        logger.debug("luaotfload-tool check fehlgeschlagen: %s", exc)
         return False
 
+    return True
+
 
 def _extract_luaotfload_resolved_path(output: str) -> Optional[Path]:
     match = re.search(r'Resolved file name "([^"]+)"', output)
@@ -789,19 +1051,91 @@ def _fonts_need_cache_update() -> bool:
         return True
 
 
-def _update_luaotfload_database() -> None:
-    """Refresh luaotfload font database so LuaLaTeX sees new fonts."""
+def _update_luaotfload_database() -> bool:
+    """Refresh luaotfload font database so LuaLaTeX sees new fonts.
+
+    Returns:
+        True if ``luaotfload-tool --update`` ran and exited with status 0.
+    """
 
     tool = _which("luaotfload-tool") or _which("luaotfload-tool.exe")
     if not tool:
         logger.debug("luaotfload-tool nicht gefunden – überspringe Update")
-        return
+        return False
 
     logger.info("🔄 Aktualisiere luaotfload Font-Datenbank ...")
+    updated = False
     try:
-        _run([tool, "--update", "--quiet"], check=False)
+        result = _run([tool, "--update", "--quiet"], check=False)
+        updated = result.returncode == 0
+        if not updated:
+            logger.warning(
+                "luaotfload-tool --update fehlgeschlagen (Exit-Code %s)",
+                result.returncode,
+            )
     except Exception as exc:  # pragma: no cover - best effort only
         logger.warning("luaotfload-tool --update fehlgeschlagen: %s", exc)
+    _invalidate_font_inventory()
+    return updated
+
+
+def _font_tree_fingerprints(font_hashes: Mapping[Path, str]) -> Dict[str, str]:
+    """Fingerprint registered fonts per directory ("font tree").
+
+    Each tree hash covers the file names and content hashes of its fonts, so
+    touching or re-copying a font does not count as a change.
+    """
+
+    trees: Dict[str, List[Tuple[str, str]]] = {}
+    for path, digest in font_hashes.items():
+        trees.setdefault(Path(path).parent.as_posix(), []).append(
+            (Path(path).name, digest)
+        )
+    fingerprints: Dict[str, str] = {}
+    for tree, entries in trees.items():
+        digest = hashlib.sha256()
+        for name, file_hash in sorted(entries):
+            digest.update(f"{name}\0{file_hash}\n".encode("utf-8"))
+        fingerprints[tree] = digest.hexdigest()
+    return fingerprints
+
+
+def _load_font_fingerprints(stamp: Path) -> Dict[str, str]:
+    try:
+        data = json.loads(stamp.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    trees = data.get("trees") if isinstance(data, dict) else None
+    if not isinstance(trees, dict):
+        return {}
+    return {str(key): str(value) for key, value in trees.items()}
+
+
+def _store_font_fingerprints(stamp: Path, fingerprints: Mapping[str, str]) -> None:
+    payload = {"version": 1, "trees": dict(sorted(fingerprints.items()))}
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        staging = stamp.with_suffix(f".{os.getpid()}.tmp")
+        staging.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(staging, stamp)
+    except OSError as exc:
+        logger.warning("⚠ Konnte Font-Fingerprint nicht speichern (%s): %s", stamp, exc)
+
+
+def _changed_font_trees(
+    previous: Mapping[str, str], current: Mapping[str, str]
+) -> Tuple[List[str], List[str]]:
+    """Return ``(added, modified)`` font trees relative to the last stamp.
+
+    Trees that disappeared are reported as modified: their fonts may still be
+    referenced by the luaotfload database.
+    """
+
+    added = sorted(tree for tree in current if tree not in previous)
+    modified = sorted(
+        tree for tree, digest in previous.items() if current.get(tree) != digest
+    )
+    return added, modified
 
 
 def _ensure_dir(path: str) -> None:
@@ -926,24 +1260,9 @@ def _font_available(name: str) -> bool:
 
     normalized = _normalize_font_name(name)
 
-    # 1. Try fontconfig first
-    fc_list = _which("fc-list")
-    if fc_list:
-        try:
-            result = subprocess.run(
-                [fc_list, name],
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-        except OSError:
-            result = None
-        else:
-            if result and result.stdout:
-                for line in result.stdout.splitlines():
-                    if normalized in _normalize_font_name(line):
-                        return True
+    # 1. Try fontconfig first (answered from the per-process font inventory)
+    if _get_font_inventory().fontconfig_matches(name):
+        return True
 
     # 2. Fallback: Check fonts.yml configured paths
     try:
@@ -2341,10 +2660,30 @@ def _dedupe_preserve_order(values: Iterable[str]) -> List[str]:
     return result
 
 
+def _resource_directory(entry: str) -> str:
+    """Return the search directory for one ``--resource-path`` entry.
+
+    Pandoc treats every entry as a directory; file entries (copied assets)
+    never match and only add a probe per image lookup, so they collapse to
+    their parent directory.
+    """
+
+    if not entry:
+        return entry
+    path = Path(entry)
+    return str(path.parent) if path.is_file() else entry
+
+
 def _build_resource_paths(additional: Optional[Iterable[str]] = None) -> List[str]:
+    """Return the deduplicated resource directories (defaults + ``additional``).
+
+    The result grows with the number of distinct asset directories, not with
+    the number of assets.
+    """
+
     defaults = [".", "assets", ".gitbook/assets", "content/.gitbook/assets"]
     if additional:
-        defaults.extend(additional)
+        defaults.extend(_resource_directory(str(entry)) for entry in additional)
     return _dedupe_preserve_order(defaults)
 
 
@@ -2387,6 +2726,32 @@ def _convert_svg_to_pdf(svg_file: Path) -> bool:
         return False
 
 
+def _convert_svgs_to_pdf(svg_files: Sequence[Path]) -> None:
+    """Batch variant of :func:`_convert_svg_to_pdf` (one process pool)."""
+
+    global _SVG_CONVERSION_WARNED
+
+    if not svg_files:
+        return
+    results = ensure_svg_pdfs(svg_files, prefer=("cairosvg", "svglib"), logger=logger)
+    if any(item.converted for item in results):
+        _mark_svg_pdf_available()
+    if all(item.converted for item in results):
+        return
+    for item in results:
+        if item.error:
+            logger.warning(
+                "Konnte SVG %s nicht nach PDF konvertieren: %s",
+                item.svg_file,
+                item.error,
+            )
+    if not _SVG_CONVERSION_WARNED:
+        logger.warning(
+            "Keine SVG-Konvertierung verfügbar – bitte cairosvg oder svglib/reportlab installieren."
+        )
+        _SVG_CONVERSION_WARNED = True
+
+
 def _prepare_asset_artifacts(path: Path) -> None:
     try:
         resolved = path.resolve()
@@ -2401,8 +2766,7 @@ def _prepare_asset_artifacts(path: Path) -> None:
         if key in _SVG_DIR_CACHE:
             return
         _SVG_DIR_CACHE.add(key)
-        for svg_file in resolved.rglob("*.svg"):
-            _convert_svg_to_pdf(svg_file)
+        _convert_svgs_to_pdf(sorted(resolved.rglob("*.svg")))
     elif resolved.is_file() and resolved.suffix.lower() == ".svg":
         _convert_svg_to_pdf(resolved)
 
@@ -2531,6 +2895,17 @@ def _parse_pdf_options(raw: Any) -> Dict[str, Any]:
         except (ValueError, TypeError):
             logger.warning("pdf_options.toc_depth ungültig: %r", raw["toc_depth"])
 
+    # -- per-chapter compilation (chapter_split.py) ------------------------ #
+    chapter_split = raw.get("chapter_split", raw.get("chapter-split"))
+    if chapter_split is not None:
+        parsed["chapter_split"] = _as_bool(chapter_split)
+    chapter_jobs = raw.get("chapter_jobs", raw.get("chapter-jobs"))
+    if chapter_jobs is not None:
+        try:
+            parsed["chapter_jobs"] = int(chapter_jobs)
+        except (ValueError, TypeError):
+            logger.warning("pdf_options.chapter_jobs ungültig: %r", chapter_jobs)
+
     # -- lang override (Pandoc metadata, not -V) ---------------------------- #
     if "lang" in raw:
         lang_val = str(raw["lang"]).strip()
@@ -2571,6 +2946,11 @@ def _resolve_table_strategy_options(
         resolved["report_path"] = str(
             (publish_dir / f"{stem}.table-layout.jsonl").resolve()
         )
+    elif report_mode == "columnar":
+        stem = Path(out_name).stem or "table-layout"
+        resolved["report_path"] = str(
+            (publish_dir / f"{stem}.table-layout{COLUMNAR_REPORT_SUFFIX}").resolve()
+        )
     return resolved
 
 
@@ -2750,7 +3130,7 @@ def prepare_publishing(
     prepareYAML()  # B.1
 
     manifest_path_obj = Path(manifest_path).resolve() if manifest_path else None
-    _configure_texmf_cache(manifest_path_obj)
+    font_cache_root = _configure_texmf_cache(manifest_path_obj)
 
     # Pandoc vorhanden?
     have_pandoc = _which("pandoc") is not None
@@ -2838,10 +3218,25 @@ def prepare_publishing(
                 cmd.append("-v")
             _run(cmd, check=False)
             font_cache_refreshed = True
+            # fc-cache only runs after _register_font added/replaced fonts
+            # (or disallowed fonts were purged): re-snapshot on next lookup.
+            _invalidate_font_inventory()
 
     if removed_fonts:
         _maybe_refresh_font_cache()
 
+    # Content hashes of every font file that feeds the font caches; grouped per
+    # directory they form the fingerprint that decides about luaotfload updates.
+    font_hashes: Dict[Path, str] = {}
+
+    def _font_hash(path_obj: Path) -> str:
+        key = path_obj.resolve()
+        digest = font_hashes.get(key)
+        if digest is None:
+            digest = file_sha256(key)
+            font_hashes[key] = digest
+        return digest
+
     def _register_font(font_path: Union[Path, str]) -> None:
         """Register a font file in OS-specific user font directories with hash checks."""
 
@@ -2851,6 +3246,7 @@ def prepare_publishing(
             path_obj = Path(font_path)
             if not path_obj.exists():
                 return
+            source_hash = _font_hash(path_obj)
 
             for user_font_dir in _user_font_directories():
                 user_font_dir.mkdir(parents=True, exist_ok=True)
@@ -2859,8 +3255,7 @@ def prepare_publishing(
                 needs_update = True
                 if target.exists():
                     try:
-                        source_hash = hashlib.sha256(path_obj.read_bytes()).hexdigest()
-                        target_hash = hashlib.sha256(target.read_bytes()).hexdigest()
+                        target_hash = file_sha256(target)
                         needs_update = source_hash != target_hash
 
                         if not needs_update:
@@ -2964,6 +3359,8 @@ def prepare_publishing(
         )
         for path in resolved_font.paths:
             _remember_font_dir(path.parent)
+            if path.is_file():
+                _font_hash(path)
 
     force_font_cache_update = _as_bool(
         os.environ.get("ERDA_FORCE_FONT_CACHE_UPDATE"), False
@@ -3090,8 +3487,25 @@ def prepare_publishing(
     # Smart font cache update: only if fonts are missing or were modified
     # NOTE: This runs AFTER OSFONTDIR is configured and fc-cache refreshed,
     # so fc-list can find fonts in fonts-storage/
+    # The fingerprint stamp lives next to the (possibly persistent) LuaTeX
+    # cache: unchanged font trees keep a warm luaotfload database, new trees
+    # only need an incremental update and modified trees a full rebuild.
+    fingerprint_stamp = font_cache_root / _FONT_FINGERPRINT_FILE
+    font_fingerprints = _font_tree_fingerprints(font_hashes)
+    added_trees, modified_trees = _changed_font_trees(
+        _load_font_fingerprints(fingerprint_stamp), font_fingerprints
+    )
+    for tree in added_trees:
+        logger.info("🔍 Neuer Font-Baum: %s", tree)
+    for tree in modified_trees:
+        logger.info("🔍 Font-Baum geändert: %s", tree)
+
     needs_cache_update = _fonts_need_cache_update()
-    cache_update_required = force_font_cache_update or needs_cache_update
+    cache_update_required = (
+        force_font_cache_update
+        or needs_cache_update
+        or bool(added_trees or modified_trees)
+    )
 
     if cache_update_required:
         if force_font_cache_update and not needs_cache_update:
@@ -3099,11 +3513,14 @@ def prepare_publishing(
         else:
             logger.info("🔄 Font caches veraltet - aktualisiere...")
 
-        # Clear LuaLaTeX font caches after font registration
-        # This ensures that LuaTeX picks up any font updates
-        logger.info("🔄 Clearing LuaLaTeX font caches...")
-        _clear_lualatex_caches()
-        _update_luaotfload_database()
+        if force_font_cache_update or modified_trees:
+            # Clear LuaLaTeX font caches after font registration
+            # This ensures that LuaTeX picks up replaced or removed fonts
+            logger.info("🔄 Clearing LuaLaTeX font caches...")
+            _clear_lualatex_caches()
+        else:
+            logger.info("ℹ Inkrementelles luaotfload-Update (Cache bleibt erhalten)")
+        database_updated = _update_luaotfload_database()
 
         # Final font cache refresh after all font operations
         if manifest_specs or removed_fonts or font_cache_refreshed:
@@ -3121,6 +3538,11 @@ def prepare_publishing(
         logger.info(
             "✓ Font caches aktuell - überspringe Update (spart ~15-30 Sekunden)"
         )
+        database_updated = True
+    # A failed update leaves the database stale: keep the old stamp so the
+    # next run retries instead of trusting the new fingerprints.
+    if database_updated:
+        _store_font_fingerprints(fingerprint_stamp, font_fingerprints)
 
 
 # --------------------------- PDF Build (C) --------------------------------- #
@@ -3139,6 +3561,237 @@ def _get_book_title(folder: str) -> Optional[str]:
         return None
 
 
+_IMAGE_REFERENCE_RE = re.compile(
+    r"!\[[^\]]*\]\(\s*<?(?P<md>[^)\s>]+)"
+    r"|<img\b[^>]*?\bsrc=[\"'](?P<html>[^\"']+)[\"']"
+    r"|\\includegraphics(?:\[[^\]]*\])?\{(?P<tex>[^}]+)\}"
+)
+
+
+def _referenced_image_files(md_path: Path, search_dirs: Sequence[str]) -> List[Path]:
+    """Resolve image references of ``md_path`` the way Pandoc would."""
+
+    try:
+        text = md_path.read_text(encoding="utf-8")
+    except OSError:
+        return []
+    bases = [md_path.parent] + [Path(entry) for entry in search_dirs]
+    found: Dict[str, Path] = {}
+    for match in _IMAGE_REFERENCE_RE.finditer(text):
+        target = match.group("md") or match.group("html") or match.group("tex") or ""
+        target = target.split("#", 1)[0].strip()
+        if not target or target in found or "://" in target:
+            continue
+        for base in bases:
+            candidate = base / target
+            if candidate.is_file():
+                found[target] = candidate
+                break
+    return [found[key] for key in sorted(found)]
+
+
+def _build_cache_key(
+    md_path: str,
+    pdf_out: str,
+    cmd: Sequence[str],
+    *,
+    temp_dir: Path,
+    header_args: Sequence[str],
+    filters: Sequence[str],
+    resource_dirs: Sequence[str],
+    pandoc_version: Tuple[int, ...],
+) -> str:
+    """Fingerprint every input of a Pandoc/LuaLaTeX run for :class:`BuildCache`.
+
+    Volatile paths (temporary Markdown, temp dir, output path, copied assets in
+    ``--resource-path``) are replaced by placeholders; the files behind them are
+    hashed by content instead.
+    """
+
+    fingerprint = BuildFingerprint()
+    fingerprint.add_file("markdown", Path(md_path))
+
+    volatile = {
+        md_path: "<markdown>",
+        pdf_out: "<pdf>",
+        str(temp_dir): "<tmp>",
+        temp_dir.as_posix(): "<tmp>",
+    }
+    canonical: List[str] = []
+    skip_value = False
+    for arg in cmd:
+        if skip_value:
+            skip_value = False
+            continue
+        if arg == "--resource-path":
+            skip_value = True
+            continue
+        for raw, placeholder in volatile.items():
+            arg = arg.replace(raw, placeholder)
+        canonical.append(arg)
+    fingerprint.add_value("command", canonical)
+
+    for index, header in enumerate(header_args):
+        header_path = Path(header)
+        if temp_dir in header_path.resolve().parents:
+            try:
+                content = header_path.read_text(encoding="utf-8")
+            except OSError:
+                content = "<missing>"
+            fingerprint.add_value(
+                f"header:{index}", content.replace(str(temp_dir), "<tmp>")
+            )
+        else:
+            fingerprint.add_file(f"header:{index}", header_path)
+    for index, filter_path in enumerate(filters):
+        fingerprint.add_file(f"lua-filter:{index}", Path(filter_path))
+
+    fingerprint.add_value("pandoc-version", list(pandoc_version))
+    # image-path-resolver.lua switches SVG references to PDF assets on this flag
+    fingerprint.add_value("svg-pdf-assets", os.environ.get(_SVG_PDF_ENV_FLAG))
+    try:
+        fingerprint.add_value("font-config-version", get_font_config().version)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.debug("Font-Config-Version nicht verfügbar: %s", exc)
+
+    md_dir = Path(md_path).parent
+    for image in _referenced_image_files(Path(md_path), resource_dirs):
+        try:
+            label = image.resolve().relative_to(md_dir.resolve()).as_posix()
+        except ValueError:
+            label = image.name
+        fingerprint.add_file(f"image:{label}", image)
+    return fingerprint.hexdigest()
+
+
+_LATEX_DIRECT_ENGINES = frozenset({"lualatex", "xelatex", "pdflatex"})
+_LATEX_MAX_RUNS = 3
+_LATEX_RERUN_RE = re.compile(
+    r"Rerun to get|Please \(?re\)?run|Label\(s\) may have changed|\(rerunfilecheck\)"
+)
+# Auxiliary files whose content feeds the next run (TOC, lists, PDF bookmarks).
+_LATEX_AUX_SUFFIXES = (".toc", ".lof", ".lot", ".out")
+
+
+def _latex_direct_engine(engine: Optional[str]) -> Optional[str]:
+    """Return ``engine`` if LaTeX can be driven directly instead of via Pandoc."""
+
+    if not engine:
+        return None
+    return engine if Path(engine).stem.lower() in _LATEX_DIRECT_ENGINES else None
+
+
+def _latex_aux_state(output_dir: Path, jobname: str) -> Dict[str, str]:
+    state: Dict[str, str] = {}
+    for suffix in _LATEX_AUX_SUFFIXES:
+        aux = output_dir / f"{jobname}{suffix}"
+        try:
+            state[suffix] = hashlib.sha256(aux.read_bytes()).hexdigest()
+        except OSError:
+            continue
+    return state
+
+
+def _compile_latex(engine: str, tex_source: Path, pdf_out: Path) -> int:
+    """Compile ``tex_source`` with ``engine`` and copy the PDF to ``pdf_out``.
+
+    Mirrors Pandoc's own PDF step: the engine runs inside the directory of the
+    ``.tex`` file with ``-output-directory`` and ``-shell-escape`` and is
+    repeated (at most three times) while the log asks for a rerun or the
+    TOC/bookmark files still change. Returns the number of engine runs.
+    """
+
+    output_dir = tex_source.parent
+    jobname = tex_source.stem
+    cmd = [
+        engine,
+        "-halt-on-error",
+        "-interaction=nonstopmode",
+        f"-output-directory={output_dir}",
+        "-shell-escape",
+        tex_source.name,
+    ]
+    texinputs = os.pathsep.join(
+        [str(output_dir), str(Path.cwd()), os.environ.get("TEXINPUTS", "")]
+    )
+    log_file = output_dir / f"{jobname}.log"
+
+    runs = 0
+    while True:
+        before = _latex_aux_state(output_dir, jobname)
+        runs += 1
+        logger.info("🚀 LaTeX-Lauf %d/%d: %s", runs, _LATEX_MAX_RUNS, tex_source.name)
+        _run(cmd, env={"TEXINPUTS": texinputs}, cwd=str(output_dir))
+        if runs >= _LATEX_MAX_RUNS:
+            break
+        try:
+            log_text = log_file.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            log_text = ""
+        if not (
+            _LATEX_RERUN_RE.search(log_text)
+            or _latex_aux_state(output_dir, jobname) != before
+        ):
+            break
+
+    produced = output_dir / f"{jobname}.pdf"
+    if not produced.exists():
+        raise subprocess.CalledProcessError(
+            1, cmd, output=f"{engine} hat keine PDF erzeugt: {produced}"
+        )
+    pdf_out.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(produced, pdf_out)
+    return runs
+
+
+def _render_latex_document(
+    cmd: Sequence[str],
+    tex_source: Path,
+    *,
+    temp_dir: Path,
+    marker_header: Path,
+    header_args: Sequence[str],
+    latex_cache: LatexCache,
+    latex_key: str,
+) -> None:
+    """Produce ``tex_source`` via the LaTeX cache or Pandoc and splice headers.
+
+    ``cmd`` renders the document with a marker header so the cached document
+    stays valid when only the real header files change.
+    """
+
+    hit = latex_cache.restore(latex_key, tex_source, temp_dir)
+    if hit:
+        logger.info(
+            "♻ LaTeX-Cache-Treffer %s – überspringe Pandoc für %s",
+            latex_key[:12],
+            tex_source.name,
+        )
+    else:
+        logger.info("🚀 Führe Pandoc aus: %s", list(cmd))
+        _run(list(cmd))
+
+    spliced = splice_header_includes(
+        tex_source.read_text(encoding="utf-8"), [Path(h) for h in header_args]
+    )
+    if spliced is None:
+        # Custom templates may drop header-includes: render with the real headers.
+        logger.warning(
+            "⚠ Header-Marker fehlt in %s – Pandoc-Lauf mit echten Headern",
+            tex_source.name,
+        )
+        real_cmd = list(cmd)
+        index = real_cmd.index(str(marker_header))
+        real_cmd[index - 1 : index + 1] = [
+            arg for header in header_args for arg in ("-H", header)
+        ]
+        _run(real_cmd)
+        return
+    if not hit:
+        latex_cache.store(latex_key, tex_source, temp_dir)
+    tex_source.write_text(spliced, encoding="utf-8")
+
+
 def _run_pandoc(
     md_path: str,
     pdf_out: str,
@@ -3158,11 +3811,14 @@ def _run_pandoc(
     emoji_options: Optional[EmojiOptions] = None,
     abort_if_missing_glyph: bool = True,
     code_block_wrap: bool = True,
+    build_cache: Optional[BuildCache] = None,
+    latex_cache: Optional[LatexCache] = None,
 ) -> None:
     _ensure_dir(os.path.dirname(pdf_out))
 
     defaults = _get_pandoc_defaults()
 
+    resource_path_values: List[str] = []
     if resource_paths:
         resource_path_values = _build_resource_paths(resource_paths)
         resource_path_arg = (
@@ -3360,279 +4016,379 @@ def _run_pandoc(
     header_override = header_path
 
     keep_latex_temp = os.getenv("ERDA_KEEP_LATEX_TEMP", "0").lower() in _TRUE_VALUES
+    # Single-pass mode: Pandoc writes the .tex once and the engine is driven
+    # directly, so debug builds (which keep the .tex) cost no extra Pandoc run.
+    # It is the default whenever a LaTeX cache is available (normal CLI
+    # builds); ERDA_LATEX_DIRECT=0 restores Pandoc's own PDF run.
+    direct_engine: Optional[str] = None
+    if keep_latex_temp or _as_bool(
+        os.getenv("ERDA_LATEX_DIRECT"), latex_cache is not None
+    ):
+        if to_format in (None, "", "latex"):
+            direct_engine = _latex_direct_engine(engine)
+        if direct_engine is None:
+            logger.info(
+                "ℹ Direkter LaTeX-Lauf nicht möglich (Engine %s, Format %s)",
+                engine,
+                to_format,
+            )
+    # Save TMPDIR/TMP/TEMP before anything can fail: the restore and the
+    # temp-dir cleanup below must also run when Pandoc or LaTeX fails, since
+    # --jobs workers reuse this process for further builds.
+    original_temp_env = {key: os.environ.get(key) for key in _TEMP_ENV_KEYS}
+    original_tmpdir = original_temp_env["TMPDIR"]
+    logger.info("ℹ Original TMPDIR: %s", original_tmpdir)
     temp_ctx = Path(tempfile.mkdtemp(prefix="gbw-latex-"))
-    with temp_ctx as temp_dir_raw:
-        logger.info(
-            "ℹ Verwende temporäres Verzeichnis für Pandoc/LaTeX: %s", temp_dir_raw
-        )
-        temp_dir = Path(temp_dir_raw).resolve()
-        header_file = temp_dir / "pandoc-fonts.tex"
-        font_header_content = _build_font_header(
-            main_font=main_font,
-            sans_font=sans_font,
-            mono_font=mono_font,
-            emoji_font=emoji_font,
-            include_mainfont=not supports_mainfont_fallback,
-            needs_harfbuzz=needs_harfbuzz,
-            manual_fallback_spec=manual_fallback_spec,
-            abort_if_missing_glyph=abort_if_missing_glyph,
-            code_block_wrap=code_block_wrap,
-            temp_dir=temp_dir,
-        )
-        header_file.write_text(font_header_content, encoding="utf-8")
-        logger.info(
-            "📄 FONT-STACK: pandoc-fonts.tex @ %s\n%s", header_file, font_header_content
-        )
-
-        # CRITICAL FIX: When manual Lua fallback is active, do NOT pass
-        # mainfont/sansfont/monofont as Pandoc --variable.  Pandoc's default
-        # template triggers babel's \babelfont{rm}[...]{font} which creates a
-        # SECOND font family without the RawFeature={fallback=mainfont} feature.
-        # That babel-registered font then takes precedence over our
-        # pandoc-fonts.tex \setmainfont for all document text, silently
-        # disabling the luaotfload fallback chain.
-        #
-        # By omitting these variables, the template's $if(mainfont)$ guard
-        # evaluates to false, skipping babel font setup entirely.  Our
-        # pandoc-fonts.tex is then the sole font authority and its
-        # \setmainfont[RawFeature={fallback=mainfont}] is the one that sticks.
-        if manual_fallback_spec:
-            for _font_key in ("mainfont", "sansfont", "monofont"):
-                variable_map.pop(_font_key, None)
+    try:
+        with temp_ctx as temp_dir_raw:
             logger.info(
-                "🔧 FONT-STACK: Removed mainfont/sansfont/monofont from "
-                "variable_map to prevent babel \\babelfont override of "
-                "luaotfload fallback chain"
+                "ℹ Verwende temporäres Verzeichnis für Pandoc/LaTeX: %s", temp_dir_raw
+            )
+            temp_dir = Path(temp_dir_raw).resolve()
+            header_file = temp_dir / "pandoc-fonts.tex"
+            font_header_content = _build_font_header(
+                main_font=main_font,
+                sans_font=sans_font,
+                mono_font=mono_font,
+                emoji_font=emoji_font,
+                include_mainfont=not supports_mainfont_fallback,
+                needs_harfbuzz=needs_harfbuzz,
+                manual_fallback_spec=manual_fallback_spec,
+                abort_if_missing_glyph=abort_if_missing_glyph,
+                code_block_wrap=code_block_wrap,
+                temp_dir=temp_dir,
+            )
+            header_file.write_text(font_header_content, encoding="utf-8")
+            logger.info(
+                "📄 FONT-STACK: pandoc-fonts.tex @ %s\n%s",
+                header_file,
+                font_header_content,
             )
 
-        # If a title was provided, prefer passing it via Pandoc metadata so the
-        # standard template handles \maketitle once. Injecting our own title
-        # header previously duplicated the title block (and an extra
-        # \AtBeginDocument{\maketitle}), which could break the preamble.
-        # Pandoc escapes titles for LaTeX, so we can safely rely on metadata.
-        title_header_path = None
-        if title:
-            metadata_map["title"] = [str(title)]
+            # CRITICAL FIX: When manual Lua fallback is active, do NOT pass
+            # mainfont/sansfont/monofont as Pandoc --variable.  Pandoc's default
+            # template triggers babel's \babelfont{rm}[...]{font} which creates a
+            # SECOND font family without the RawFeature={fallback=mainfont} feature.
+            # That babel-registered font then takes precedence over our
+            # pandoc-fonts.tex \setmainfont for all document text, silently
+            # disabling the luaotfload fallback chain.
+            #
+            # By omitting these variables, the template's $if(mainfont)$ guard
+            # evaluates to false, skipping babel font setup entirely.  Our
+            # pandoc-fonts.tex is then the sole font authority and its
+            # \setmainfont[RawFeature={fallback=mainfont}] is the one that sticks.
+            if manual_fallback_spec:
+                for _font_key in ("mainfont", "sansfont", "monofont"):
+                    variable_map.pop(_font_key, None)
+                logger.info(
+                    "🔧 FONT-STACK: Removed mainfont/sansfont/monofont from "
+                    "variable_map to prevent babel \\babelfont override of "
+                    "luaotfload fallback chain"
+                )
 
-        header_args = _combine_header_paths(
-            header_defaults,
-            header_override,
-            [
-                str(p)
-                for p in ([title_header_path] if title_header_path else [])
-                + [str(header_file)]
-            ],
-        )
+            # If a title was provided, prefer passing it via Pandoc metadata so the
+            # standard template handles \maketitle once. Injecting our own title
+            # header previously duplicated the title block (and an extra
+            # \AtBeginDocument{\maketitle}), which could break the preamble.
+            # Pandoc escapes titles for LaTeX, so we can safely rely on metadata.
+            title_header_path = None
+            if title:
+                metadata_map["title"] = [str(title)]
+
+            header_args = _combine_header_paths(
+                header_defaults,
+                header_override,
+                [
+                    str(p)
+                    for p in ([title_header_path] if title_header_path else [])
+                    + [str(header_file)]
+                ],
+            )
 
-        cmd: List[str] = ["pandoc", md_path, "-o", pdf_out]
-        if from_format:
-            cmd.extend(["-f", from_format])
-        if to_format:
-            cmd.extend(["-t", to_format])
-        if engine:
-            cmd.extend(["--pdf-engine", engine])
-        if resource_path_arg:
-            cmd.extend(["--resource-path", resource_path_arg])
-            logger.info("ℹ Pandoc resource paths: %s", resource_path_arg)
-        for header in header_args:
-            cmd.extend(["-H", header])
-        for filter_path in filters:
-            cmd.extend(["--lua-filter", filter_path])
-        logger.info(
-            "🚀 FONT-STACK ABNEHMER [Pandoc CLI]: Konstruiere -M Argumente aus metadata_map: %s",
-            metadata_map,
-        )
-        for key, values in metadata_map.items():
-            for value in values:
-                if (
-                    "emoji" in key.lower()
-                    or "color" in key.lower()
-                    or "bxcolor" in key.lower()
-                ):
-                    logger.info(
-                        "🚀 FONT-STACK ABNEHMER [Pandoc CLI]:   -M %s=%s", key, value
-                    )
-                cmd.extend(["-M", f"{key}={value}"])
-        logger.info(
-            "🚀 FONT-STACK ABNEHMER [Pandoc CLI]: Konstruiere --variable Argumente aus variable_map: %s",
-            variable_map,
-        )
-        for key, value in variable_map.items():
-            # If we injected a title header, avoid passing a title variable
-            # to Pandoc as this can create duplicate/unescaped title output
-            # in some templates.
-            if title_header_path and key == "title":
-                continue
-            cmd.extend(["--variable", f"{key}={value}"])
-        if add_toc:
-            cmd.append("--toc")
-            if toc_depth is not None:
-                cmd.extend(["--toc-depth", str(toc_depth)])
-        # Only pass the title via -V if we did not create a title header.
-        # When a title header exists we rely on the header file and must not
-        # also pass the title to Pandoc (see rationale above).
-        if title and not title_header_path:
-            # Escape LaTeX special characters to avoid errors like
-            # "Misplaced alignment tab character &" when the title contains
-            # an ampersand or other special chars.
-            safe_title = _escape_latex(str(title))
-            cmd.extend(["-V", f"title={safe_title}"])
-
-        # Add --verbose for better error diagnostics
-        cmd.append("--verbose")
-
-        cmd.extend(additional_args)
-
-        tex_source = Path(temp_dir) / Path(pdf_out).with_suffix(".tex").name
-        logger.info("ℹ LaTeX debug output target: %s", tex_source)
-
-        # ALWAYS set output directory to temp so LaTeX finds SVG conversions
-        cmd.extend(["--pdf-engine-opt", f"-output-directory={temp_dir}"])
-        # ALWAYS enable shell-escape for SVG conversion via Inkscape (NOTE: use = syntax!)
-        cmd.append("--pdf-engine-opt=-shell-escape")
-
-        # save current env tempdir setting
-        original_tmpdir = os.environ.get("TMPDIR")
-        logger.info("ℹ Original TMPDIR: %s", original_tmpdir)
-        # set a env variable to keep latex temp for debugging
-        os.environ["TMPDIR"] = temp_dir.as_posix()
-        os.environ["TMP"] = temp_dir.as_posix()
-        os.environ["TEMP"] = temp_dir.as_posix()
-        logger.info("ℹ Set TMPDIR for Pandoc/LaTeX run: %s", os.environ["TMPDIR"])
-
-        if keep_latex_temp:
-
-            # Emit a standalone LaTeX file for easier debugging without relying on --keep-tex
-            tex_cmd: List[str] = ["pandoc", md_path, "-o", str(tex_source)]
+            tex_source = Path(temp_dir) / Path(pdf_out).with_suffix(".tex").name
+            logger.info("ℹ LaTeX debug output target: %s", tex_source)
+
+            # With a LaTeX cache Pandoc only sees a marker header; the real header
+            # files are spliced in afterwards (see _render_latex_document).
+            marker_header: Optional[Path] = None
+            pandoc_headers = list(header_args)
+            if direct_engine and latex_cache is not None:
+                marker_header = temp_dir / "header-includes.tex"
+                marker_header.write_text(HEADER_MARKER + "\n", encoding="utf-8")
+                pandoc_headers = [str(marker_header)]
+
+            pandoc_out = str(tex_source) if direct_engine else pdf_out
+            cmd: List[str] = ["pandoc", md_path, "-o", pandoc_out]
             if from_format:
-                tex_cmd.extend(["-f", from_format])
-            # Force LaTeX output so we always keep a readable .tex file
-            tex_cmd.extend(["-t", "latex"])
+                cmd.extend(["-f", from_format])
+            if direct_engine:
+                # Pandoc's PDF writer implies --standalone and extracts images into
+                # its temp dir; do the same so the engine resolves every resource.
+                cmd.extend(["-t", "latex", "--standalone"])
+                cmd.append(f"--extract-media={temp_dir / 'media'}")
+            elif to_format:
+                cmd.extend(["-t", to_format])
+            if engine and not direct_engine:
+                cmd.extend(["--pdf-engine", engine])
             if resource_path_arg:
-                tex_cmd.extend(["--resource-path", resource_path_arg])
-            for header in header_args:
-                tex_cmd.extend(["-H", header])
+                cmd.extend(["--resource-path", resource_path_arg])
+                logger.info("ℹ Pandoc resource paths: %s", resource_path_arg)
+            for header in pandoc_headers:
+                cmd.extend(["-H", header])
             for filter_path in filters:
-                tex_cmd.extend(["--lua-filter", filter_path])
+                cmd.extend(["--lua-filter", filter_path])
+            logger.info(
+                "🚀 FONT-STACK ABNEHMER [Pandoc CLI]: Konstruiere -M Argumente aus metadata_map: %s",
+                metadata_map,
+            )
             for key, values in metadata_map.items():
                 for value in values:
-                    tex_cmd.extend(["-M", f"{key}={value}"])
+                    if (
+                        "emoji" in key.lower()
+                        or "color" in key.lower()
+                        or "bxcolor" in key.lower()
+                    ):
+                        logger.info(
+                            "🚀 FONT-STACK ABNEHMER [Pandoc CLI]:   -M %s=%s",
+                            key,
+                            value,
+                        )
+                    cmd.extend(["-M", f"{key}={value}"])
+            logger.info(
+                "🚀 FONT-STACK ABNEHMER [Pandoc CLI]: Konstruiere --variable Argumente aus variable_map: %s",
+                variable_map,
+            )
             for key, value in variable_map.items():
+                # If we injected a title header, avoid passing a title variable
+                # to Pandoc as this can create duplicate/unescaped title output
+                # in some templates.
                 if title_header_path and key == "title":
                     continue
-                tex_cmd.extend(["--variable", f"{key}={value}"])
+                cmd.extend(["--variable", f"{key}={value}"])
             if add_toc:
-                tex_cmd.append("--toc")
+                cmd.append("--toc")
                 if toc_depth is not None:
-                    tex_cmd.extend(["--toc-depth", str(toc_depth)])
+                    cmd.extend(["--toc-depth", str(toc_depth)])
+            # Only pass the title via -V if we did not create a title header.
+            # When a title header exists we rely on the header file and must not
+            # also pass the title to Pandoc (see rationale above).
             if title and not title_header_path:
+                # Escape LaTeX special characters to avoid errors like
+                # "Misplaced alignment tab character &" when the title contains
+                # an ampersand or other special chars.
                 safe_title = _escape_latex(str(title))
-                tex_cmd.extend(["-V", f"title={safe_title}"])
-            tex_cmd.append("--verbose")
-            tex_cmd.extend(additional_args)
-            logger.info(
-                "🧩 Keeping LaTeX source via dedicated pandoc -t latex run: %s",
-                tex_cmd,
-            )
-            _run(tex_cmd)
+                cmd.extend(["-V", f"title={safe_title}"])
+
+            # Add --verbose for better error diagnostics
+            cmd.append("--verbose")
+
+            cmd.extend(additional_args)
+
+            if not direct_engine:
+                # ALWAYS set output directory to temp so LaTeX finds SVG conversions
+                # (_compile_latex passes the same options in single-pass mode)
+                cmd.extend(["--pdf-engine-opt", f"-output-directory={temp_dir}"])
+                # ALWAYS enable shell-escape for SVG conversion via Inkscape (NOTE: use = syntax!)
+                cmd.append("--pdf-engine-opt=-shell-escape")
+
+            cache_key: Optional[str] = None
+            if build_cache is not None and not keep_latex_temp:
+                cache_key = _build_cache_key(
+                    md_path,
+                    pdf_out,
+                    cmd,
+                    temp_dir=temp_dir,
+                    header_args=header_args,
+                    filters=filters,
+                    resource_dirs=resource_path_values,
+                    pandoc_version=pandoc_version,
+                )
+                if build_cache.restore(cache_key, Path(pdf_out)):
+                    logger.info(
+                        "♻ Build-Cache-Treffer %s – überspringe Pandoc/LaTeX für %s",
+                        cache_key[:12],
+                        pdf_out,
+                    )
+                    return
+                logger.info(
+                    "ℹ Build-Cache-Fehlschlag %s für %s", cache_key[:12], pdf_out
+                )
 
-        try:
-            logger.info("🚀 Führe Pandoc aus: %s", cmd)
-            _run(cmd)
-        except subprocess.CalledProcessError:
-            # With -output-directory we expect LuaLaTeX to write .log files into
-            # the temporary output directory. Pandoc commonly uses a tex2pdf.*
-            # job name, so we must search broadly and pick the best candidate.
-            temp_root = Path(temp_dir)
-            pdf_path = Path(pdf_out)
-            pdf_name = pdf_path.stem
-            log_candidates: list[Path] = []
+            latex_key: Optional[str] = None
+            if marker_header is not None:
+                latex_key = _build_cache_key(
+                    md_path,
+                    pdf_out,
+                    cmd,
+                    temp_dir=temp_dir,
+                    header_args=(),
+                    filters=filters,
+                    resource_dirs=resource_path_values,
+                    pandoc_version=pandoc_version,
+                )
+
+            # set a env variable to keep latex temp for debugging
+            for key in _TEMP_ENV_KEYS:
+                os.environ[key] = temp_dir.as_posix()
+            logger.info("ℹ Set TMPDIR for Pandoc/LaTeX run: %s", os.environ["TMPDIR"])
+
+            if keep_latex_temp and not direct_engine:
+
+                # Emit a standalone LaTeX file for easier debugging without relying on --keep-tex
+                tex_cmd: List[str] = ["pandoc", md_path, "-o", str(tex_source)]
+                if from_format:
+                    tex_cmd.extend(["-f", from_format])
+                # Force LaTeX output so we always keep a readable .tex file
+                tex_cmd.extend(["-t", "latex"])
+                if resource_path_arg:
+                    tex_cmd.extend(["--resource-path", resource_path_arg])
+                for header in header_args:
+                    tex_cmd.extend(["-H", header])
+                for filter_path in filters:
+                    tex_cmd.extend(["--lua-filter", filter_path])
+                for key, values in metadata_map.items():
+                    for value in values:
+                        tex_cmd.extend(["-M", f"{key}={value}"])
+                for key, value in variable_map.items():
+                    if title_header_path and key == "title":
+                        continue
+                    tex_cmd.extend(["--variable", f"{key}={value}"])
+                if add_toc:
+                    tex_cmd.append("--toc")
+                    if toc_depth is not None:
+                        tex_cmd.extend(["--toc-depth", str(toc_depth)])
+                if title and not title_header_path:
+                    safe_title = _escape_latex(str(title))
+                    tex_cmd.extend(["-V", f"title={safe_title}"])
+                tex_cmd.append("--verbose")
+                tex_cmd.extend(additional_args)
+                logger.info(
+                    "🧩 Keeping LaTeX source via dedicated pandoc -t latex run: %s",
+                    tex_cmd,
+                )
+                _run(tex_cmd)
 
             try:
-                log_candidates = list(temp_root.glob("**/*.log"))
-            except Exception:
-                log_candidates = []
-
-            chosen_log: Path | None = None
-            if log_candidates:
-                preferred = [
-                    p
-                    for p in log_candidates
-                    if p.name.startswith("tex2pdf") and p.suffix.lower() == ".log"
-                ]
-                if not preferred:
+                if latex_cache is not None and marker_header and latex_key:
+                    _render_latex_document(
+                        cmd,
+                        tex_source,
+                        temp_dir=temp_dir,
+                        marker_header=marker_header,
+                        header_args=header_args,
+                        latex_cache=latex_cache,
+                        latex_key=latex_key,
+                    )
+                else:
+                    logger.info("🚀 Führe Pandoc aus: %s", cmd)
+                    _run(cmd)
+                if direct_engine:
+                    _compile_latex(direct_engine, tex_source, Path(pdf_out))
+                if build_cache is not None and cache_key:
+                    build_cache.store(cache_key, Path(pdf_out), {"source": md_path})
+            except subprocess.CalledProcessError:
+                # With -output-directory we expect LuaLaTeX to write .log files into
+                # the temporary output directory. Pandoc commonly uses a tex2pdf.*
+                # job name, so we must search broadly and pick the best candidate.
+                temp_root = Path(temp_dir)
+                pdf_path = Path(pdf_out)
+                pdf_name = pdf_path.stem
+                log_candidates: list[Path] = []
+
+                try:
+                    log_candidates = list(temp_root.glob("**/*.log"))
+                except Exception:
+                    log_candidates = []
+
+                chosen_log: Path | None = None
+                if log_candidates:
                     preferred = [
                         p
                         for p in log_candidates
-                        if p.stem == pdf_name and p.suffix.lower() == ".log"
+                        if p.name.startswith("tex2pdf") and p.suffix.lower() == ".log"
                     ]
-                pool = preferred or log_candidates
-                # Pick the newest log (best chance to contain the failure)
-                chosen_log = max(
-                    pool,
-                    key=lambda p: p.stat().st_mtime if p.exists() else 0,
-                )
-
-            if chosen_log and chosen_log.exists():
-                try:
-                    log_content = chosen_log.read_text(
-                        encoding="utf-8", errors="replace"
+                    if not preferred:
+                        preferred = [
+                            p
+                            for p in log_candidates
+                            if p.stem == pdf_name and p.suffix.lower() == ".log"
+                        ]
+                    pool = preferred or log_candidates
+                    # Pick the newest log (best chance to contain the failure)
+                    chosen_log = max(
+                        pool,
+                        key=lambda p: p.stat().st_mtime if p.exists() else 0,
                     )
-                    log_lines = log_content.splitlines()
-                    excerpt = (
-                        "\n".join(log_lines[-200:])
-                        if len(log_lines) > 200
-                        else log_content
-                    )
-                    logger.error(
-                        "=== TeX LOG FILE (%s) ===\n%s\n=== END TeX LOG ===",
-                        str(chosen_log),
-                        excerpt,
-                    )
-                    logger.error(
-                        "Hinweis: Für Debugging kann ERDA_KEEP_LATEX_TEMP=1 gesetzt werden, dann wird das Temp-Verzeichnis nach '_latex-debug' kopiert."
-                    )
-                except Exception as log_exc:
+
+                if chosen_log and chosen_log.exists():
+                    try:
+                        log_content = chosen_log.read_text(
+                            encoding="utf-8", errors="replace"
+                        )
+                        log_lines = log_content.splitlines()
+                        excerpt = (
+                            "\n".join(log_lines[-200:])
+                            if len(log_lines) > 200
+                            else log_content
+                        )
+                        logger.error(
+                            "=== TeX LOG FILE (%s) ===\n%s\n=== END TeX LOG ===",
+                            str(chosen_log),
+                            excerpt,
+                        )
+                        logger.error(
+                            "Hinweis: Für Debugging kann ERDA_KEEP_LATEX_TEMP=1 gesetzt werden, dann wird das Temp-Verzeichnis nach '_latex-debug' kopiert."
+                        )
+                    except Exception as log_exc:
+                        logger.warning(
+                            "Could not read TeX log file %s: %s", chosen_log, log_exc
+                        )
+                else:
                     logger.warning(
-                        "Could not read TeX log file %s: %s", chosen_log, log_exc
+                        "No TeX log file found under %s (pdf_out=%s)",
+                        temp_root,
+                        pdf_out,
                     )
-            else:
-                logger.warning(
-                    "No TeX log file found under %s (pdf_out=%s)", temp_root, pdf_out
-                )
-            raise
-        finally:
-            if keep_latex_temp:
-                try:
-                    debug_root = Path(pdf_out).parent / "_latex-debug"
-                    debug_root.mkdir(parents=True, exist_ok=True)
-                    target = debug_root / Path(temp_dir).name
-                    shutil.copytree(temp_dir, target, dirs_exist_ok=True)
-                    if tex_source.exists():
-                        dest_tex = target / tex_source.name
-                        shutil.copy2(tex_source, dest_tex)
+                raise
+            finally:
+                if keep_latex_temp:
+                    try:
+                        debug_root = Path(pdf_out).parent / "_latex-debug"
+                        debug_root.mkdir(parents=True, exist_ok=True)
+                        target = debug_root / Path(temp_dir).name
+                        shutil.copytree(temp_dir, target, dirs_exist_ok=True)
+                        if tex_source.exists():
+                            dest_tex = target / tex_source.name
+                            shutil.copy2(tex_source, dest_tex)
+                            logger.info(
+                                "🧩 Copied LaTeX source for debugging: %s", dest_tex
+                            )
                         logger.info(
-                            "🧩 Copied LaTeX source for debugging: %s", dest_tex
+                            "🧩 Kept LaTeX temp dir for debugging (ERDA_KEEP_LATEX_TEMP=1): %s",
+                            target,
                         )
-                    logger.info(
-                        "🧩 Kept LaTeX temp dir for debugging (ERDA_KEEP_LATEX_TEMP=1): %s",
-                        target,
-                    )
-                except Exception as copy_exc:
-                    logger.warning(
-                        "Konnte LaTeX Temp-Verzeichnis nicht sichern: %s", copy_exc
-                    )
-    if not keep_latex_temp:
-        try:
-            shutil.rmtree(temp_ctx, ignore_errors=True)
-            logger.info("🧹 Gelöscht LaTeX Temp-Verzeichnis: %s", temp_dir)
-        except Exception as tex_exc:
-            logger.warning("Konnte LaTeX Temp-Verzeichnis nicht löschen: %s", tex_exc)
+                    except Exception as copy_exc:
+                        logger.warning(
+                            "Konnte LaTeX Temp-Verzeichnis nicht sichern: %s", copy_exc
+                        )
+    finally:
+        if not keep_latex_temp:
+            try:
+                shutil.rmtree(temp_ctx, ignore_errors=True)
+                logger.info("🧹 Gelöscht LaTeX Temp-Verzeichnis: %s", temp_ctx)
+            except Exception as tex_exc:
+                logger.warning(
+                    "Konnte LaTeX Temp-Verzeichnis nicht löschen: %s", tex_exc
+                )
 
-    # restore original TMPDIR setting
-    if original_tmpdir and os.environ.get("TMPDIR") != original_tmpdir:
+        # restore original TMPDIR/TMP/TEMP so later builds in the same (worker)
+        # process do not inherit the deleted LaTeX temp dir
         logger.info("ℹ Restoring original TMPDIR: %s", original_tmpdir)
-        os.environ.update({"TMPDIR": original_tmpdir})
+        for key, value in original_temp_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
 
 
 @dataclass(frozen=True)
@@ -3798,6 +4554,9 @@ def convert_a_file(
     toc_override: Optional[bool] = None,
     toc_depth: Optional[int] = None,
     extra_args: Optional[Sequence[str]] = None,
+    build_cache: Optional[BuildCache] = None,
+    latex_cache: Optional[LatexCache] = None,
+    image_index: Optional[ImageIndex] = None,
 ) -> None:
     logger.info(
         "========================================================================"
@@ -3819,6 +4578,7 @@ def convert_a_file(
         md_file,
         paper_format=paper_format,
         table_strategy=table_strategy,
+        image_index=image_index,
     )
     logger.info("%s: Nach Preprocessing %d Zeichen.", md_file, len(processed))
     # normalize for pandoc
@@ -3885,6 +4645,8 @@ def convert_a_file(
             code_block_wrap=code_block_wrap,
             toc_depth=toc_depth,
             extra_args=extra_args,
+            build_cache=build_cache,
+            latex_cache=latex_cache,
         )
     finally:
         try:
@@ -3912,6 +4674,284 @@ def convert_a_file(
         )
 
 
+_FIRST_HEADING_RE = re.compile(r"(?m)^(#\s+)(.+)$")
+_PARENT_GITBOOK_ASSETS_RE = re.compile(r"\(\.\.\/\.gitbook\/assets\/")
+
+
+def _escape_first_heading(text: str) -> Tuple[str, bool]:
+    """LaTeX-escape the first top-level heading; report whether one was found."""
+
+    match = _FIRST_HEADING_RE.search(text)
+    if not match:
+        return text, False
+    escaped = match.group(1) + _escape_latex(match.group(2))
+    return text[: match.start()] + escaped + text[match.end() :], True
+
+
+def _fix_gitbook_asset_paths(text: str) -> str:
+    # 🔧 FIX: Strip ../ from .gitbook/assets/ image paths BEFORE Pandoc processing
+    return _PARENT_GITBOOK_ASSETS_RE.sub("(.gitbook/assets/", text)
+
+
+def _rewrite_combined_markdown(combined: str) -> str:
+    """Apply the folder-build rewrites Pandoc needs to combined Markdown."""
+
+    # Escape the first/top-level Markdown heading in the combined document to
+    # avoid LaTeX errors (e.g. unescaped '&' in titles).
+    combined, _ = _escape_first_heading(combined)
+    return _fix_gitbook_asset_paths(combined)
+
+
+def _rewrite_combined_chunks(
+    chunks: Iterable[str], *, paper_format: str
+) -> Iterable[str]:
+    """Streaming variant of ``add_geometry_package`` + the folder rewrites.
+
+    The geometry front matter is injected into the first chunk, the first
+    top-level heading is escaped once and asset paths are fixed per chunk, so
+    the combined document never has to exist as one string.
+    """
+
+    first = True
+    heading_escaped = False
+    for chunk in chunks:
+        if first:
+            chunk = add_geometry_package(chunk, paper_format=paper_format)
+            first = False
+        if not heading_escaped:
+            chunk, heading_escaped = _escape_first_heading(chunk)
+        yield _fix_gitbook_asset_paths(chunk)
+    if first:
+        yield add_geometry_package("", paper_format=paper_format)
+
+
+def _write_combined_markdown(chunks: Iterable[str], directory: Optional[str]) -> str:
+    """Stream ``chunks`` into a new temporary ``.md`` file and return its path."""
+
+    with tempfile.NamedTemporaryFile(
+        "w",
+        suffix=".md",
+        delete=False,
+        encoding="utf-8",
+        newline="\n",
+        dir=directory,
+    ) as tmp:
+        try:
+            for chunk in chunks:
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    size = os.path.getsize(tmp.name)
+    logger.info("ℹ Kombiniertes Markdown geschrieben: %s (%d Bytes)", tmp.name, size)
+    return tmp.name
+
+
+def _build_chapter_worker(kwargs: Dict[str, Any]) -> str:
+    """Process-pool entry point: render one chapter fragment via Pandoc."""
+
+    _run_pandoc(**kwargs)
+    return str(kwargs["pdf_out"])
+
+
+def _render_chapter_fragments(
+    fragment_jobs: Sequence[Dict[str, Any]], jobs: int
+) -> None:
+    """Run ``_run_pandoc`` for every fragment, in parallel when ``jobs > 1``.
+
+    Workers are initialised like target builds (:func:`_init_build_worker`) so
+    concurrent LuaLaTeX runs never share TMPDIR. The first failure is
+    re-raised after the remaining fragments finished.
+    """
+
+    if jobs <= 1 or len(fragment_jobs) <= 1:
+        for kwargs in fragment_jobs:
+            _build_chapter_worker(kwargs)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    temp_root = Path(tempfile.mkdtemp(prefix="gbw-chapters-"))
+    font_dirs = [str(path) for path in _ADDITIONAL_FONT_DIRS]
+    logger.info("ℹ Rendere %d Kapitel mit %d Prozessen.", len(fragment_jobs), jobs)
+    first_error: Optional[BaseException] = None
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_build_worker,
+            initargs=(str(temp_root), font_dirs),
+        ) as pool:
+            futures = [
+                pool.submit(_build_chapter_worker, kwargs) for kwargs in fragment_jobs
+            ]
+            for kwargs, future in zip(fragment_jobs, futures):
+                try:
+                    future.result()
+                except Exception as exc:
+                    logger.error(
+                        "Kapitel %s fehlgeschlagen: %s", kwargs["md_path"], exc
+                    )
+                    if first_error is None:
+                        first_error = exc
+    finally:
+        shutil.rmtree(temp_root, ignore_errors=True)
+    if first_error is not None:
+        raise first_error
+
+
+def _convert_folder_by_chapter(
+    md_collection: MarkdownCollection,
+    folder: str,
+    pdf_out: str,
+    *,
+    keep_converted_markdown: bool,
+    publish_dir: str,
+    paper_format: str,
+    summary_layout: Optional[SummaryContext],
+    assets: Optional[List[Dict[str, Any]]],
+    emoji_options: Optional[EmojiOptions],
+    variables: Optional[Dict[str, str]],
+    metadata: Optional[Dict[str, Sequence[str] | str]],
+    abort_if_missing_glyph: bool,
+    code_block_wrap: bool,
+    table_strategy: Optional[Mapping[str, Any]],
+    extra_args: Optional[Sequence[str]],
+    build_cache: Optional[BuildCache],
+    latex_cache: Optional[LatexCache],
+    preprocess_cache: Optional[PreprocessCache],
+    jobs: Optional[int],
+    svg_cache: Optional[SvgPdfCache] = None,
+    image_index: Optional[ImageIndex] = None,
+) -> None:
+    """Render every chapter to its own PDF fragment and stitch them together.
+
+    Each fragment is a regular :func:`_run_pandoc` run, so with a build cache
+    only chapters whose preprocessed Markdown (or shared inputs) changed are
+    recompiled. The printed TOC is replaced by the merged PDF outline; the
+    title page is rendered with the first chapter only.
+    """
+
+    tempfile.tempdir = Path(publish_dir) / "temp" if publish_dir else None
+    if tempfile.tempdir:
+        _ensure_dir(tempfile.tempdir)
+    chapters_dir = Path(
+        tempfile.mkdtemp(prefix=f"{Path(pdf_out).stem}-chapters-", dir=tempfile.tempdir)
+    )
+    logger.info("ℹ Kapitel-Modus: Fragmente unter %s", chapters_dir)
+
+    fragments: List[ChapterFragment] = []
+    bodies: List[str] = []
+    for md_file in md_collection.files:
+        body = combine_markdown(
+            [md_file],
+            paper_format=paper_format,
+            heading_targets=md_collection.heading_targets,
+            table_strategy=table_strategy,
+            cache=preprocess_cache,
+            image_index=image_index,
+        )
+        if not body.strip():
+            continue
+        index = len(fragments) + 1
+        # Every fragment is a document of its own and gets the same rewrites
+        # as the combined Markdown of a single-pass build.
+        text = _rewrite_combined_markdown(
+            add_geometry_package(body, paper_format=paper_format)
+        )
+        fragment_md = chapters_dir / f"{index:04d}.md"
+        fragment_md.write_text(text, encoding="utf-8", newline="\n")
+        fragments.append(
+            ChapterFragment(
+                index=index,
+                source=Path(md_file),
+                markdown=fragment_md,
+                pdf=fragment_md.with_suffix(".pdf"),
+                title=chapter_title(body),
+            )
+        )
+        bodies.append(body)
+    if not fragments:
+        raise Exception(f"No markdown content found in {folder}")
+
+    resolved_resource_paths: List[str] = []
+    if assets:
+        copy_assets_to_temp(
+            fragments[0].markdown,
+            Path(folder),
+            assets,
+            resolved_resource_paths=resolved_resource_paths,
+            svg_cache=svg_cache,
+        )
+    if summary_layout:
+        resolved_resource_paths.append(str(summary_layout.root_dir))
+    final_paths = [str(chapters_dir.resolve())]
+    final_paths.extend(resolved_resource_paths)
+    final_paths.extend(_build_resource_paths([]))
+
+    options = emoji_options or EmojiOptions()
+    combined_md: Optional[Path] = None
+    if options.report or keep_converted_markdown:
+        combined_md = chapters_dir / "combined.md"
+        chunks: List[str] = []
+        for body in bodies:
+            if chunks:
+                chunks.append(CHAPTER_SEPARATOR)
+            chunks.append(body)
+        combined_md.write_text(
+            "".join(_rewrite_combined_chunks(chunks, paper_format=paper_format)),
+            encoding="utf-8",
+            newline="\n",
+        )
+        _emit_emoji_report(str(combined_md), Path(pdf_out), options)
+
+    title = _get_book_title(folder)
+    metadata_map = dict(metadata) if metadata else {}
+    if title and "title" not in metadata_map:
+        metadata_map["title"] = [title]
+    chapter_metadata = {
+        key: value for key, value in metadata_map.items() if key != "title"
+    }
+
+    fragment_jobs: List[Dict[str, Any]] = []
+    for fragment in fragments:
+        first = fragment.index == 1
+        fragment_jobs.append(
+            {
+                "md_path": str(fragment.markdown),
+                "pdf_out": str(fragment.pdf),
+                "add_toc": False,
+                "title": title if first else None,
+                "resource_paths": final_paths,
+                "emoji_options": options,
+                "variables": variables,
+                "metadata": (metadata_map if first else chapter_metadata) or None,
+                "abort_if_missing_glyph": abort_if_missing_glyph,
+                "code_block_wrap": code_block_wrap,
+                "extra_args": extra_args,
+                "build_cache": build_cache,
+                "latex_cache": latex_cache,
+            }
+        )
+
+    if jobs is None:
+        jobs = env_int(CHAPTER_JOBS_ENV, 0)
+    try:
+        _render_chapter_fragments(
+            fragment_jobs, jobs=_resolve_build_jobs(jobs, len(fragment_jobs))
+        )
+        merge_chapter_pdfs(fragments, Path(pdf_out))
+    finally:
+        if keep_converted_markdown and combined_md is not None:
+            converted_markdown = pdf_out.replace(".pdf", ".md")
+            logger.info("ℹ Behalte kombiniertes Markdown in %s", converted_markdown)
+            try:
+                shutil.move(str(combined_md), converted_markdown)
+            except OSError as e:
+                logger.error("Failed to operate on converted markdown caused by %s", e)
+        shutil.rmtree(chapters_dir, ignore_errors=True)
+
+
 def convert_a_folder(
     folder: str,
     pdf_out: str,
@@ -3930,6 +4970,13 @@ def convert_a_folder(
     toc_override: Optional[bool] = None,
     toc_depth: Optional[int] = None,
     extra_args: Optional[Sequence[str]] = None,
+    build_cache: Optional[BuildCache] = None,
+    latex_cache: Optional[LatexCache] = None,
+    chapter_split: bool = False,
+    chapter_jobs: Optional[int] = None,
+    preprocess_cache: Optional[PreprocessCache] = None,
+    svg_cache: Optional[SvgPdfCache] = None,
+    image_index: Optional[ImageIndex] = None,
 ) -> None:
 
     logger.info(
@@ -3945,6 +4992,7 @@ def convert_a_folder(
     logger.info("Publish Dir             : %s", publish_dir)
     logger.info("Paper Format            : %s", paper_format)
     logger.info("Use Summary             : %s", use_summary)
+    logger.info("Chapter Split           : %s", chapter_split)
     if summary_layout:
         logger.info("Summary Layout Root Dir : %s", summary_layout.root_dir)
         logger.info("Summary Layout Summary  : %s", summary_layout.summary_path)
@@ -3959,41 +5007,31 @@ def convert_a_folder(
     if not md_files:
         logger.info("ℹ Keine Markdown-Dateien in %s – übersprungen.", folder)
         raise Exception(f"No markdown files found in {folder}")
-    combined = add_geometry_package(
-        combine_markdown(
-            md_files,
+    if chapter_split:
+        _convert_folder_by_chapter(
+            md_collection,
+            folder,
+            pdf_out,
+            keep_converted_markdown=keep_converted_markdown,
+            publish_dir=publish_dir,
             paper_format=paper_format,
-            heading_targets=heading_targets,
+            summary_layout=summary_layout,
+            assets=assets,
+            emoji_options=emoji_options,
+            variables=variables,
+            metadata=metadata,
+            abort_if_missing_glyph=abort_if_missing_glyph,
+            code_block_wrap=code_block_wrap,
             table_strategy=table_strategy,
-        ),
-        paper_format=paper_format,
-    )
-    # Escape the first/top-level Markdown heading in the combined document to
-    # avoid LaTeX errors (e.g. unescaped '&' in titles).
-    try:
-        import re
-
-        m = re.search(r"(?m)^(#\s+)(.+)$", combined)
-        if m:
-            prefix = m.group(1)
-            txt = m.group(2)
-            combined = (
-                combined[: m.start()]
-                + prefix
-                + _escape_latex(txt)
-                + combined[m.end() :]
-            )
-    except Exception:
-        # best-effort only
-        pass
-    # 🔧 FIX: Strip ../ from .gitbook/assets/ image paths BEFORE Pandoc processing
-    import re
-
-    logger.info("🔍 DEBUG combined length BEFORE fix: %d", len(combined))
-    logger.info("🔍 DEBUG contains ../.gitbook pattern: %s", "../.gitbook" in combined)
-    combined = re.sub(r"\(\.\.\/\.gitbook\/assets\/", r"(.gitbook/assets/", combined)
-    logger.info("🔍 DEBUG combined length AFTER fix: %d", len(combined))
-
+            extra_args=extra_args,
+            build_cache=build_cache,
+            latex_cache=latex_cache,
+            preprocess_cache=preprocess_cache,
+            jobs=chapter_jobs,
+            svg_cache=svg_cache,
+            image_index=image_index,
+        )
+        return
     # Prepare resource paths
     resolved_resource_paths: List[str] = []
 
@@ -4004,17 +5042,21 @@ def convert_a_folder(
         _ensure_dir(tempfile.tempdir)
     logger.info("ℹ Using temp dir: %s", tempfile.tempdir)
 
-    # Write combined md to temp file
-    with tempfile.NamedTemporaryFile(
-        "w",
-        suffix=".md",
-        delete=False,
-        encoding="utf-8",
-        newline="\n",
-        dir=tempfile.tempdir,
-    ) as tmp:
-        tmp.write(combined)
-        tmp_md = tmp.name
+    # Stream the combined md chapter by chapter into the temp file
+    tmp_md = _write_combined_markdown(
+        _rewrite_combined_chunks(
+            iter_combined_markdown(
+                md_files,
+                paper_format=paper_format,
+                heading_targets=heading_targets,
+                table_strategy=table_strategy,
+                cache=preprocess_cache,
+                image_index=image_index,
+            ),
+            paper_format=paper_format,
+        ),
+        tempfile.tempdir,
+    )
 
     logger.info("🔍 DEBUG REACHED asset copying section, tmp_md=%s", tmp_md)
 
@@ -4028,6 +5070,7 @@ def convert_a_folder(
             Path(folder),
             assets,
             resolved_resource_paths=resolved_resource_paths,
+            svg_cache=svg_cache,
         )
 
     try:
@@ -4068,6 +5111,8 @@ def convert_a_folder(
             code_block_wrap=code_block_wrap,
             toc_depth=toc_depth,
             extra_args=extra_args,
+            build_cache=build_cache,
+            latex_cache=latex_cache,
         )
     finally:
         try:
@@ -4081,10 +5126,6 @@ def convert_a_folder(
         except OSError as e:
             logger.error("Failed to operate on converted markdown caused by %s", e)
             pass
-        logger.info(
-            "------------------------------------------------------------------------"
-        )
-        logger.info("%s", combined)
         logger.info(
             "========================================================================"
         )
@@ -4117,6 +5158,13 @@ def build_pdf(
     toc_override: Optional[bool] = None,
     toc_depth: Optional[int] = None,
     extra_args: Optional[Sequence[str]] = None,
+    build_cache: Optional[BuildCache] = None,
+    latex_cache: Optional[LatexCache] = None,
+    chapter_split: bool = False,
+    chapter_jobs: Optional[int] = None,
+    preprocess_cache: Optional[PreprocessCache] = None,
+    svg_cache: Optional[SvgPdfCache] = None,
+    image_index: Optional[ImageIndex] = None,
 ) -> Tuple[bool, Optional[str]]:
     """
     Baut ein PDF gemäß Typ ('file'/'folder').
@@ -4139,6 +5187,10 @@ def build_pdf(
         else:
             _typ = "file"
 
+    # Table strategy decisions of this build are written in one batch.
+    table_report = TableReportSink.open(
+        parse_table_strategy_config(table_strategy).report_path
+    )
     try:
         if _typ == "file":
             # _convert_single_file(
@@ -4162,6 +5214,9 @@ def build_pdf(
                 toc_override=toc_override,
                 toc_depth=toc_depth,
                 extra_args=extra_args,
+                build_cache=build_cache,
+                latex_cache=latex_cache,
+                image_index=image_index,
             )
         elif _typ == "folder":
             summary_layout: Optional[SummaryContext] = None
@@ -4214,6 +5269,13 @@ def build_pdf(
                 toc_override=toc_override,
                 toc_depth=toc_depth,
                 extra_args=extra_args,
+                build_cache=build_cache,
+                latex_cache=latex_cache,
+                chapter_split=chapter_split,
+                chapter_jobs=chapter_jobs,
+                preprocess_cache=preprocess_cache,
+                svg_cache=svg_cache,
+                image_index=image_index,
             )
         else:
             logger.warning("⚠ Unbekannter type='%s' – übersprungen.", typ)
@@ -4271,11 +5333,111 @@ def build_pdf(
             error_details.append(f"STDERR:\n{stderr_str}")
 
         return False, "\n".join(error_details)
+    finally:
+        if preprocess_cache is not None:
+            preprocess_cache.log_stats(out)
+        if image_index is not None:
+            image_index.flush()
+        if table_report is not None:
+            table_report.close()
 
 
 # -------------------------------- Main (D) --------------------------------- #
 
 
+def _resolve_build_jobs(value: Optional[int], target_count: int) -> int:
+    """Return the effective number of parallel build workers.
+
+    ``None`` falls back to ``GITBOOK_WORKER_PUBLISH_JOBS`` (default ``1``) and
+    ``0`` means "one worker per CPU". The result never exceeds the number of
+    targets so tiny manifests do not pay for an idle process pool.
+    """
+
+    if value is None:
+        raw = os.environ.get("GITBOOK_WORKER_PUBLISH_JOBS", "").strip()
+        try:
+            value = int(raw) if raw else 1
+        except ValueError:
+            logger.warning(
+                "⚠ Ungültiger GITBOOK_WORKER_PUBLISH_JOBS=%r – nutze 1.", raw
+            )
+            value = 1
+    if value <= 0:
+        value = os.cpu_count() or 1
+    return max(1, min(value, target_count))
+
+
+def _init_build_worker(temp_root: str, font_dirs: Sequence[str]) -> None:
+    """Give a build worker process its own TMPDIR and the parent's font dirs.
+
+    ``_run_pandoc`` and ``convert_a_*`` mutate ``os.environ["TMPDIR"]`` and the
+    global ``tempfile.tempdir``; isolating every worker keeps concurrent
+    LuaLaTeX runs from sharing scratch space. Font directories are re-applied
+    because ``spawn``-based pools start with fresh module globals.
+    """
+
+    worker_tmp = Path(
+        tempfile.mkdtemp(prefix=f"gbw-worker-{os.getpid()}-", dir=temp_root)
+    )
+    for key in _TEMP_ENV_KEYS:
+        os.environ[key] = worker_tmp.as_posix()
+    tempfile.tempdir = worker_tmp.as_posix()
+    # Targets already run in parallel; nested SVG and chapter pools would
+    # oversubscribe.
+    os.environ.setdefault(SVG_JOBS_ENV, "1")
+    os.environ.setdefault(CHAPTER_JOBS_ENV, "1")
+    for font_dir in font_dirs:
+        _remember_font_dir(Path(font_dir))
+
+
+def _build_target_worker(kwargs: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Process-pool entry point: build one target via :func:`build_pdf`."""
+
+    return build_pdf(**kwargs)
+
+
+def _schedule_builds(
+    build_jobs: Sequence[Dict[str, Any]], jobs: int = 1
+) -> List[Tuple[bool, Optional[str]]]:
+    """Run ``build_pdf`` for every kwargs mapping and keep the input order.
+
+    With ``jobs <= 1`` targets are built sequentially in-process exactly like
+    before. Otherwise independent targets are distributed over a process pool;
+    a crashed worker is reported as a failed build instead of aborting the
+    remaining targets.
+    """
+
+    if jobs <= 1 or len(build_jobs) <= 1:
+        return [build_pdf(**kwargs) for kwargs in build_jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    temp_root = Path(tempfile.mkdtemp(prefix="gbw-jobs-"))
+    font_dirs = [str(path) for path in _ADDITIONAL_FONT_DIRS]
+    results: List[Tuple[bool, Optional[str]]] = []
+    logger.info("ℹ Baue %d Targets mit %d Prozessen.", len(build_jobs), jobs)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_build_worker,
+            initargs=(str(temp_root), font_dirs),
+        ) as pool:
+            futures = [
+                pool.submit(_build_target_worker, kwargs) for kwargs in build_jobs
+            ]
+            for kwargs, future in zip(build_jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    logger.error(
+                        "Build-Worker für %s abgebrochen: %s", kwargs["out"], exc
+                    )
+                    results.append((False, f"Exception: {type(exc).__name__}: {exc}"))
+    finally:
+        shutil.rmtree(temp_root, ignore_errors=True)
+    return results
+
+
 def _write_github_outputs(built: List[str], failed: List[str], manifest: str) -> None:
     gh_out = os.getenv("GITHUB_OUTPUT")
     if gh_out:
@@ -4289,8 +5451,11 @@ def _write_github_outputs(built: List[str], failed: List[str], manifest: str) ->
             logger.warning("Konnte GITHUB_OUTPUT nicht schreiben: %s", e)
 
 
-def main() -> None:
-    logger.info("Selective Publisher gestartet: argv=%s", sys.argv)
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    logger.info(
+        "Selective Publisher gestartet: argv=%s",
+        sys.argv if argv is None else [sys.argv[0], *argv],
+    )
     ap = argparse.ArgumentParser(description="Selective publisher für publish.yml")
     ap.add_argument("--root", type=Path, help="Repository root (Default: cwd)")
     ap.add_argument(
@@ -4328,6 +5493,29 @@ def main() -> None:
         help="The directory to publish to.",
         default="publish",
     )
+    ap.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help=(
+            "Anzahl paralleler Build-Prozesse (0 = alle CPUs, "
+            "Default: GITBOOK_WORKER_PUBLISH_JOBS oder 1)."
+        ),
+    )
+    ap.add_argument(
+        "--no-build-cache",
+        action="store_true",
+        help=(
+            "PDF-Build-Cache (sowie LaTeX- und SVG-PDF-Cache) deaktivieren und "
+            "jedes Target neu bauen."
+        ),
+    )
+    ap.add_argument(
+        "--no-preprocess-cache",
+        action="store_true",
+        help="Kapitel-Preprocessing-Cache (und Bild-Index) deaktivieren.",
+    )
     ap.add_argument(
         "--emoji-color",
         dest="emoji_color",
@@ -4363,7 +5551,7 @@ def main() -> None:
         "--emoji-report-dir",
         help="Optional output directory for emoji reports (defaults to publish dir).",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(None if argv is None else list(argv))
 
     raw_root = args.root.resolve() if args.root else Path.cwd()
     repo_root = detect_repo_root(raw_root)
@@ -4429,6 +5617,16 @@ def main() -> None:
     )
 
     # C + Reset je nach Erfolg
+    # Targets are planned first so independent builds can run concurrently;
+    # flag resets and outputs are then applied in manifest order.
+    jobs = _resolve_build_jobs(args.jobs, len(targets))
+    build_cache = None if args.no_build_cache else BuildCache.from_env()
+    latex_cache = None if args.no_build_cache else LatexCache.from_env()
+    preprocess_cache = None if args.no_preprocess_cache else PreprocessCache.from_env()
+    svg_cache = None if args.no_build_cache else SvgPdfCache.from_env()
+    image_index = None if args.no_preprocess_cache else ImageIndex.from_env()
+    planned: List[Tuple[Optional[Dict[str, Any]], str, Path, Optional[Path], str]] = []
+    build_jobs: List[Dict[str, Any]] = []
     for entry in targets:
         original_path = entry["path"]
         path = Path(original_path)
@@ -4439,7 +5637,7 @@ def main() -> None:
         if out_format.lower() != "pdf":
             msg = f"Unsupported out_format='{out_format}'"
             logger.warning("⚠ %s – Eintrag wird übersprungen.", msg)
-            failed.append(f"{out}: {msg}")
+            planned.append((None, original_path, path, None, f"{out}: {msg}"))
             continue
 
         typ = entry.get("source_type") or entry.get("type", "")
@@ -4543,33 +5741,54 @@ def main() -> None:
         else:
             entry_emoji_options = emoji_options
 
-        ok, msg = build_pdf(
-            path=path,
-            out=out,
-            typ=typ,
-            use_summary=entry["use_summary"],
-            use_book_json=entry.get("use_book_json", False),
-            keep_combined=entry["keep_combined"],
-            paper_format=args.paper_format,
-            publish_dir=str(publish_dir_path),
-            summary_mode=summary_mode,
-            summary_order_manifest=summary_manifest_path,
-            summary_manual_marker=summary_manual_marker,
-            summary_appendices_last=_as_bool(entry.get("summary_appendices_last")),
-            document_manifest=document_manifest_path if use_document_types else None,
-            locale=(language_ctx.language_id if use_document_types else None),
-            validate_doc_types=use_document_types,
-            assets=assets_to_copy if assets_to_copy else None,
-            emoji_options=entry_emoji_options,
-            variables=variable_overrides or None,
-            project_metadata=project_metadata,
-            abort_if_missing_glyph=bool(abort_missing_glyph),
-            code_block_wrap=bool(code_block_wrap),
-            table_strategy=table_strategy_options,
-            toc_override=toc_override,
-            toc_depth=toc_depth,
-            extra_args=entry_extra_args or None,
+        planned.append((entry, original_path, path, publish_dir_path, out))
+        build_jobs.append(
+            {
+                "path": path,
+                "out": out,
+                "typ": typ,
+                "use_summary": entry["use_summary"],
+                "use_book_json": entry.get("use_book_json", False),
+                "keep_combined": entry["keep_combined"],
+                "paper_format": args.paper_format,
+                "publish_dir": str(publish_dir_path),
+                "summary_mode": summary_mode,
+                "summary_order_manifest": summary_manifest_path,
+                "summary_manual_marker": summary_manual_marker,
+                "summary_appendices_last": _as_bool(
+                    entry.get("summary_appendices_last")
+                ),
+                "document_manifest": (
+                    document_manifest_path if use_document_types else None
+                ),
+                "locale": (language_ctx.language_id if use_document_types else None),
+                "validate_doc_types": use_document_types,
+                "assets": assets_to_copy if assets_to_copy else None,
+                "emoji_options": entry_emoji_options,
+                "variables": variable_overrides or None,
+                "project_metadata": project_metadata,
+                "abort_if_missing_glyph": bool(abort_missing_glyph),
+                "code_block_wrap": bool(code_block_wrap),
+                "table_strategy": table_strategy_options,
+                "toc_override": toc_override,
+                "toc_depth": toc_depth,
+                "extra_args": entry_extra_args or None,
+                "build_cache": build_cache,
+                "latex_cache": latex_cache,
+                "chapter_split": bool(pdf_options.get("chapter_split", False)),
+                "chapter_jobs": pdf_options.get("chapter_jobs"),
+                "preprocess_cache": preprocess_cache,
+                "svg_cache": svg_cache,
+                "image_index": image_index,
+            }
         )
+
+    results = iter(_schedule_builds(build_jobs, jobs=jobs))
+    for entry, original_path, path, publish_dir_path, out in planned:
+        if entry is None:
+            failed.append(out)
+            continue
+        ok, msg = next(results)
         if ok:
             built.append(str((publish_dir_path / out).resolve()))
             # Reset publish-Flag (D) – nur bei Erfolg und wenn reset_build_flag true ist
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -20,6 +20,10 @@ from gitbook_worker.tools.publishing.document_types import (
     load_document_type_config,
     validate_doc_types,
 )
+from gitbook_worker.tools.utils.content_snapshot import active_snapshot
+
+if TYPE_CHECKING:
+    from gitbook_worker.tools.publishing.summary_index import SummaryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -164,9 +168,9 @@ class SummaryTree:
 
         return sorted(nodes, key=sort_key)
 
-    def _is_appendix_path(self, path: Path) -> bool:
-        """Check if a path represents an appendix entry."""
-        name_lower = path.name.lower()
+    @staticmethod
+    def _is_appendix_name(path: Path) -> bool:
+        """Check if a file or directory name marks an appendix."""
         stem_lower = path.stem.lower()
 
         # Check filename patterns
@@ -177,23 +181,26 @@ class SummaryTree:
             return True
 
         # Check for standalone words
-        if re.search(r"\b(anhang|appendix)\b", stem_lower):
+        return bool(re.search(r"\b(anhang|appendix)\b", stem_lower))
+
+    @staticmethod
+    def _is_appendix_heading(content: str) -> bool:
+        """Check if the first heading line of ``content`` names an appendix."""
+        first_line = next(
+            (line for line in content.splitlines() if line.strip().startswith("#")),
+            "",
+        )
+        return bool(re.match(r"^#\s*(Anhang|Appendix)\b", first_line))
+
+    def _is_appendix_path(self, path: Path) -> bool:
+        """Check if a path represents an appendix entry."""
+        if self._is_appendix_name(path):
             return True
 
         # Try to read first heading if it's a markdown file
         if path.suffix.lower() == ".md":
             try:
-                content = path.read_text(encoding="utf-8")
-                first_line = next(
-                    (
-                        line
-                        for line in content.splitlines()
-                        if line.strip().startswith("#")
-                    ),
-                    "",
-                )
-                if re.match(r"^#\s*(Anhang|Appendix)\b", first_line):
-                    return True
+                return self._is_appendix_heading(path.read_text(encoding="utf-8"))
             except Exception as e:
                 logger.debug(f"Error reading {path}: {e}")
 
@@ -285,45 +292,73 @@ class SummaryTree:
         return [line for line in lines if line is not None]
 
 
+def _title_from_text(text: str, md_path: Path) -> str:
+    """Return the first heading after the front matter or a title from the stem."""
+
+    lines = iter(text.splitlines())
+    # Skip YAML front matter if present
+    try:
+        first = next(lines)
+    except StopIteration:
+        first = ""
+
+    if first.strip() == "---":
+        for line in lines:
+            if line.strip() == "---":
+                break
+    else:
+        # put back the first line if it wasn't front matter
+        lines = chain([first], lines)
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            return stripped.lstrip("#").strip()
+
+    stem = md_path.stem.replace("-", " ").replace("_", " ").strip()
+    return stem or md_path.stem
+
+
 def build_summary_tree(
     root_dir: Path,
     mode: SummaryMode,
     submode: SubMode,
     manual_order: Optional[Dict[str, int]] = None,
+    index: Optional["SummaryIndex"] = None,
 ) -> SummaryTree:
-    """Build a summary tree from the filesystem structure."""
+    """Build a summary tree from the filesystem structure.
+
+    With an ``index`` (see :mod:`summary_index`) unchanged files reuse their
+    cached title instead of being read again.
+    """
+
+    snapshot = active_snapshot(root_dir)
+
+    def read_markdown(md_path: Path) -> str:
+        if snapshot is not None:
+            return snapshot.read_text(md_path)
+        return md_path.read_text(encoding="utf-8")
+
+    def derive_file_info(md_path: Path, text: str) -> Tuple[str, bool]:
+        """Return the title and appendix heading flag of ``text``."""
+
+        return _title_from_text(text, md_path), SummaryTree._is_appendix_heading(text)
 
-    def extract_title(md_path: Path) -> str:
-        """Return a human readable title from ``md_path``."""
+    def describe_file(md_path: Path) -> Tuple[str, bool]:
+        """Return a human readable title and the appendix heading flag."""
 
+        if index is not None:
+            return index.describe(
+                md_path,
+                read_markdown,
+                lambda text: derive_file_info(md_path, text),
+            )
         try:
-            text = md_path.read_text(encoding="utf-8")
+            text = read_markdown(md_path)
         except Exception as exc:  # pragma: no cover - best effort fallback
             logger.debug("Failed to read %s: %s", md_path, exc)
             text = ""
-
-        lines = iter(text.splitlines())
-        # Skip YAML front matter if present
-        try:
-            first = next(lines)
-        except StopIteration:
-            first = ""
-
-        if first.strip() == "---":
-            for line in lines:
-                if line.strip() == "---":
-                    break
-        else:
-            # put back the first line if it wasn't front matter
-            lines = chain([first], lines)
-
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                return stripped.lstrip("#").strip()
-
-        stem = md_path.stem.replace("-", " ").replace("_", " ").strip()
-        return stem or md_path.stem
+        return derive_file_info(md_path, text)
 
     def process_directory(path: Path, level: int = 0) -> SummaryNode:
         if path == root_dir:
@@ -341,7 +376,13 @@ def build_summary_tree(
 
         readme_names = {"readme.md", "index.md"}
         summary_names = {"summary.md"}
-        md_files = sorted(path.glob("*.md"))
+        if snapshot is not None:
+            listing = list(snapshot.iter_dir(path))
+            md_files = sorted(p for p, _ in listing if p.name.endswith(".md"))
+            subdirs = sorted(p for p, entry in listing if entry.is_dir)
+        else:
+            md_files = sorted(path.glob("*.md"))
+            subdirs = sorted(p for p in path.iterdir() if p.is_dir())
 
         children: List[SummaryNode] = []
 
@@ -353,20 +394,21 @@ def build_summary_tree(
             if lower_name in readme_names:
                 relative_md = md_file.relative_to(root_dir)
                 dir_node.path = relative_md
-                dir_node.title = extract_title(md_file)
+                dir_node.title = describe_file(md_file)[0]
                 continue
 
             relative_md = md_file.relative_to(root_dir)
+            title, appendix_heading = describe_file(md_file)
             node = SummaryNode(
-                title=extract_title(md_file),
+                title=title,
                 path=relative_md,
                 level=level + 1,
-                is_appendix=tree._is_appendix_path(md_file),
+                is_appendix=tree._is_appendix_name(md_file) or appendix_heading,
                 source_path=relative_md,
             )
             children.append(node)
 
-        for subdir in sorted(p for p in path.iterdir() if p.is_dir()):
+        for subdir in subdirs:
             if subdir.name.startswith("."):
                 continue
             subdir_node = process_directory(subdir, level + 1)
@@ -432,6 +474,7 @@ def generate_summary(
     mode: str = "gitbook-style",
     submode: str = "none",
     manual_order: Optional[Dict[str, int]] = None,
+    index: Optional["SummaryIndex"] = None,
 ) -> List[str]:
     """Generate a SUMMARY.md content based on specified mode and submode.
 
@@ -440,6 +483,7 @@ def generate_summary(
         mode: One of 'ordered-by-filesystem', 'ordered-by-alphanumeric',
               'gitbook-style', or 'manual'
         submode: Mode-specific submode ('none', 'flip', 'appendix-last', 'no-change')
+        index: Optional persistent index that supplies unchanged titles
 
     Returns:
         List of lines for SUMMARY.md
@@ -456,6 +500,7 @@ def generate_summary(
         summary_mode,
         sub_mode,
         manual_order=manual_order,
+        index=index,
     )
     return tree.to_lines()
 
@@ -0,0 +1,238 @@
+"""Persistent per-book index behind incremental ``SUMMARY.md`` regeneration.
+
+``ensure_clean_summary`` rebuilt the whole summary tree on every run and read
+every Markdown file to extract its title, even when only a paragraph of one
+chapter had changed.  :class:`SummaryIndex` keeps, per book root, the title,
+the appendix flag, ``st_mtime_ns``, size and SHA-256 of every file in the
+tree plus the rendered summary lines in
+``~/.cache/gitbook-worker/summary/<root-hash>.json``.  The next run still
+walks the directories (new, moved and deleted files change the structure),
+but only re-reads files whose stat changed or that ``smart_git`` reports as
+changed between ``--base`` and ``--commit``; all other nodes reuse their
+cached title.
+
+Entries are tied to the summary generator's source, so a changed title
+heuristic invalidates the index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import (
+    env_int,
+    prune_lru_entries,
+    resolve_cache_dir,
+)
+
+logger = get_logger(__name__)
+
+SUMMARY_CACHE_DIR_ENV = "GITBOOK_WORKER_SUMMARY_CACHE_DIR"
+SUMMARY_CACHE_MAX_ENTRIES_ENV = "GITBOOK_WORKER_SUMMARY_CACHE_MAX_ENTRIES"
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_AGE_DAYS = 30
+
+_INDEX_VERSION = 1
+
+# (title, appendix heading) derived from one file's text.
+FileInfo = Tuple[str, bool]
+
+
+@lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    source = Path(__file__).resolve().parent / "summary_generator.py"
+    try:
+        return hashlib.sha256(source.read_bytes()).hexdigest()
+    except OSError:
+        return "<missing>"
+
+
+def git_changed_paths(commit: str, base: Optional[str] = None) -> Optional[List[Path]]:
+    """Return absolute paths changed between ``base`` and ``commit``.
+
+    Uses the repository of the current working directory, like
+    :func:`smart_git.get_changed_files`; ``None`` if that is not a git
+    checkout.
+    """
+
+    from gitbook_worker.tools.utils.smart_git import (
+        get_changed_files,
+        run_git_command,
+    )
+
+    try:
+        code, out, _err = run_git_command(["git", "rev-parse", "--show-toplevel"])
+    except OSError:
+        return None
+    if code != 0 or not out.strip():
+        return None
+    toplevel = Path(out.strip())
+    return [toplevel / name for name in get_changed_files(commit, base)]
+
+
+@dataclass
+class SummaryIndex:
+    """Cached per-file summary data of one book root."""
+
+    path: Path
+    root: Path
+    changed: frozenset[str] = frozenset()
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    files: Dict[str, list] = field(default_factory=dict)
+    lines: List[str] = field(default_factory=list)
+    hits: int = 0
+    misses: int = 0
+    _seen: Dict[str, list] = field(default_factory=dict, repr=False)
+    _loaded: bool = field(default=False, repr=False)
+
+    @classmethod
+    def from_env(
+        cls,
+        root: Path,
+        *,
+        changed_files: Optional[Iterable[Path | str]] = None,
+        cache_dir: Optional[Path] = None,
+    ) -> "SummaryIndex":
+        """Create the index of ``root`` honouring ``GITBOOK_WORKER_SUMMARY_*``.
+
+        ``changed_files`` (absolute or relative to the working directory) are
+        re-derived even if their stat still matches the index.
+        """
+
+        root = Path(os.path.abspath(root))
+        explicit = cache_dir or os.getenv(SUMMARY_CACHE_DIR_ENV) or None
+        directory = resolve_cache_dir("summary", Path(explicit) if explicit else None)
+        digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+        changed = set()
+        for changed_path in changed_files or ():
+            absolute = Path(os.path.abspath(changed_path))
+            if root in absolute.parents:
+                changed.add(absolute.relative_to(root).as_posix())
+        return cls(
+            path=directory / f"{digest}.json",
+            root=root,
+            changed=frozenset(changed),
+            max_entries=env_int(SUMMARY_CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES),
+        )
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != _INDEX_VERSION
+            or payload.get("generator") != _source_fingerprint()
+            or payload.get("root") != str(self.root)
+        ):
+            return
+        files = payload.get("files")
+        lines = payload.get("lines")
+        self.files = files if isinstance(files, dict) else {}
+        self.lines = lines if isinstance(lines, list) else []
+
+    def describe(
+        self,
+        md_path: Path,
+        read: Callable[[Path], str],
+        derive: Callable[[str], FileInfo],
+    ) -> FileInfo:
+        """Return the cached ``(title, appendix)`` of ``md_path`` or derive it.
+
+        The file is only read if it is listed as changed or its size or
+        ``st_mtime_ns`` differs from the index; a read whose SHA-256 matches
+        the index keeps the cached values.
+        """
+
+        self._load()
+        key = Path(os.path.abspath(md_path)).relative_to(self.root).as_posix()
+        try:
+            info = os.stat(md_path)
+        except OSError:
+            return derive("")
+        entry = self.files.get(key)
+        if (
+            entry is not None
+            and key not in self.changed
+            and entry[0] == info.st_mtime_ns
+            and entry[1] == info.st_size
+        ):
+            self.hits += 1
+            self._seen[key] = entry
+            return entry[3], entry[4]
+
+        self.misses += 1
+        try:
+            text = read(md_path)
+        except Exception as exc:  # noqa: BLE001 - same fallback as the generator
+            logger.debug("Failed to read %s: %s", md_path, exc)
+            return derive("")
+        sha256 = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if entry is not None and entry[2] == sha256:
+            title, appendix = entry[3], entry[4]
+        else:
+            title, appendix = derive(text)
+        self._seen[key] = [info.st_mtime_ns, info.st_size, sha256, title, appendix]
+        return title, appendix
+
+    def record_lines(self, lines: List[str]) -> bool:
+        """Remember the rendered summary; return ``True`` if it is unchanged."""
+
+        self._load()
+        unchanged = bool(self.lines) and self.lines == lines
+        self.lines = list(lines)
+        return unchanged
+
+    def flush(self) -> None:
+        """Write the files seen in this run and the rendered lines to disk."""
+
+        payload = {
+            "version": _INDEX_VERSION,
+            "generator": _source_fingerprint(),
+            "root": str(self.root),
+            "files": self._seen,
+            "lines": self.lines,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self.path.with_suffix(f".{os.getpid()}.tmp")
+            staging.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(staging, self.path)
+        except OSError as exc:
+            logger.warning("⚠ Konnte SUMMARY-Index nicht speichern: %s", exc)
+            return
+        self.files = dict(self._seen)
+        prune_lru_entries(
+            self.path.parent.glob("*.json"),
+            max_entries=self.max_entries,
+            max_age_days=DEFAULT_MAX_AGE_DAYS,
+        )
+
+    def log_stats(self) -> None:
+        if self.hits or self.misses:
+            logger.info(
+                "♻ SUMMARY-Index (%s): %d Dateien wiederverwendet, %d neu gelesen",
+                self.root,
+                self.hits,
+                self.misses,
+            )
+
+
+__all__ = [
+    "SUMMARY_CACHE_DIR_ENV",
+    "SUMMARY_CACHE_MAX_ENTRIES_ENV",
+    "SummaryIndex",
+    "git_changed_paths",
+]
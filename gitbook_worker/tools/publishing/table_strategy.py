@@ -8,14 +8,17 @@ for pathological oversized tables.
 
 from __future__ import annotations
 
+import gzip
 import json
+import logging
 import math
 import re
 import shlex
 import unicodedata
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, ClassVar, Iterable, Iterator, Mapping, Sequence
 
 from gitbook_worker.tools.logging_config import get_logger
 from gitbook_worker.tools.publishing.paper_info import (
@@ -53,6 +56,10 @@ _MARKDOWN_STYLE_MARK_RE = re.compile(r"(?<!\\)[*_~]+")
 _HTML_TAG = re.compile(r"<[^>]+>")
 _URL_RE = re.compile(r"(?:[a-zA-Z][a-zA-Z0-9+.-]*://|www\.)\S+")
 _TABLE_OVERRIDE_RE = re.compile(r"<!--\s*gbw-table(?P<body>.*?)-->", re.I)
+_BMP_SIZE = 0x10000
+COLUMNAR_REPORT_SUFFIX = ".json.gz"
+_COLUMNAR_REPORT_VERSION = 1
+_UNBREAKABLE_SEPARATORS = frozenset("-/._,:;|()[]{}")
 
 
 @dataclass(frozen=True)
@@ -94,6 +101,17 @@ class ColumnProfile:
     risk_flags: tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class TableMeasurement:
+    """Cell widths and column profiles of one table, shared by all candidates."""
+
+    rows: tuple[tuple[str, ...], ...]
+    text_widths_mm: tuple[tuple[float, ...], ...]
+    unbreakable_widths_mm: tuple[tuple[float, ...], ...]
+    profiles: tuple[ColumnProfile, ...]
+    estimated_width_mm: float
+
+
 @dataclass(frozen=True)
 class TableCandidateEvaluation:
     """Editorial layout score for one candidate paper."""
@@ -127,6 +145,79 @@ class TableStrategyDecision:
     override: TableOverride | None = None
 
 
+@dataclass
+class TableReportSink:
+    """Buffer table strategy decisions for one report file during a build.
+
+    ``open`` registers the sink for its path; ``_log_and_report_decision``
+    then only appends the record in memory and ``close`` writes the batch
+    with a single append.  Paths ending in ``.json.gz`` get a gzip member
+    with one columnar JSON batch per flush instead of JSONL.
+    """
+
+    path: Path
+    records: list[dict[str, Any]] = field(default_factory=list)
+
+    _active: ClassVar[dict[Path, "TableReportSink"]] = {}
+
+    @classmethod
+    def open(cls, path: Path | str | None) -> "TableReportSink | None":
+        """Start buffering decisions for ``path`` (``None`` disables)."""
+
+        if not path:
+            return None
+        key = Path(path)
+        sink = cls._active.get(key)
+        if sink is None:
+            sink = cls._active[key] = cls(key)
+        return sink
+
+    @classmethod
+    def active(cls, path: Path) -> "TableReportSink | None":
+        return cls._active.get(path)
+
+    @property
+    def columnar(self) -> bool:
+        return self.path.name.endswith(COLUMNAR_REPORT_SUFFIX)
+
+    def add(self, record: dict[str, Any]) -> None:
+        self.records.append(record)
+
+    def flush(self) -> int:
+        """Append the buffered decisions to the report file."""
+
+        count = len(self.records)
+        if not count:
+            return 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.columnar:
+                payload = json.dumps(
+                    _records_to_columns(self.records),
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+                with gzip.open(self.path, "ab") as handle:
+                    handle.write(payload.encode("utf-8") + b"\n")
+            else:
+                with self.path.open("a", encoding="utf-8") as handle:
+                    handle.writelines(
+                        json.dumps(record, ensure_ascii=False) + "\n"
+                        for record in self.records
+                    )
+        except OSError as exc:
+            logger.warning("Could not write table strategy report: %s", exc)
+        self.records.clear()
+        return count
+
+    def close(self) -> None:
+        """Flush and stop buffering for this path."""
+
+        if self._active.get(self.path) is self:
+            del self._active[self.path]
+        self.flush()
+
+
 def parse_table_strategy_config(
     raw: Mapping[str, Any] | TablePaperStrategyConfig | None,
 ) -> TablePaperStrategyConfig:
@@ -301,6 +392,13 @@ def normalize_table_measurement_text(value: str) -> str:
 def glyph_width_em(char: str) -> float:
     """Return an approximate glyph width in em units."""
 
+    codepoint = ord(char)
+    if codepoint < _BMP_SIZE:
+        return _bmp_glyph_widths_em()[codepoint]
+    return _astral_glyph_width_em(char)
+
+
+def _classify_glyph_width_em(char: str) -> float:
     category = unicodedata.category(char)
     if category.startswith("M"):
         return 0.0
@@ -323,32 +421,103 @@ def glyph_width_em(char: str) -> float:
     return 0.52
 
 
+_astral_glyph_width_em = lru_cache(maxsize=4096)(_classify_glyph_width_em)
+
+
+@lru_cache(maxsize=1)
+def _bmp_glyph_widths_em() -> tuple[float, ...]:
+    """Glyph widths for every BMP code point, classified once per process."""
+
+    return tuple(_classify_glyph_width_em(chr(cp)) for cp in range(_BMP_SIZE))
+
+
+@lru_cache(maxsize=1)
+def _bmp_glyph_widths_mm() -> tuple[float, ...]:
+    # Same operand order as ``_text_width_mm``'s fallback, so both paths
+    # produce identical sums.
+    return tuple(
+        width * TABLE_FONT_SIZE_PT * PT_TO_MM for width in _bmp_glyph_widths_em()
+    )
+
+
+def _text_width_mm(text: str, font_size_pt: float = TABLE_FONT_SIZE_PT) -> float:
+    """Width of already normalized ``text``; BMP-only text at the table font
+    size is summed straight from the lookup table."""
+
+    if font_size_pt == TABLE_FONT_SIZE_PT:
+        try:
+            return sum(map(_bmp_glyph_widths_mm().__getitem__, map(ord, text)))
+        except IndexError:
+            pass
+    return sum(glyph_width_em(char) * font_size_pt * PT_TO_MM for char in text)
+
+
 def estimate_text_width_mm(
     value: str, font_size_pt: float = TABLE_FONT_SIZE_PT
 ) -> float:
     """Estimate normalized text width in millimetres."""
 
-    text = normalize_table_measurement_text(value)
-    return sum(glyph_width_em(char) * font_size_pt * PT_TO_MM for char in text)
+    return _text_width_mm(normalize_table_measurement_text(value), font_size_pt)
 
 
 def estimate_table_width_mm(table_lines: Sequence[str]) -> float:
     """Estimate unwrapped table width in millimetres."""
 
-    rows = table_rows_for_measurement(table_lines)
-    if not rows:
-        return 0.0
+    return measure_table(table_lines).estimated_width_mm
 
-    column_count = max(len(row) for row in rows)
-    column_widths = [MIN_TABLE_COLUMN_WIDTH_MM] * column_count
-    for row in rows:
-        for index, cell in enumerate(row):
-            column_widths[index] = max(
-                column_widths[index], estimate_text_width_mm(cell)
-            )
 
-    raw_width = sum(column_widths) + column_count * TABLE_CELL_PADDING_MM
-    return raw_width * TABLE_WIDTH_SAFETY_FACTOR
+def measure_table(
+    table_lines: Sequence[str],
+    config: TablePaperStrategyConfig | None = None,
+) -> TableMeasurement:
+    """Measure every cell of a table once.
+
+    The result only depends on the table text and ``config``, so it is
+    memoized; ``choose_table_paper``, every ``evaluate_candidate_layout`` call
+    for the paper candidates and the wrap/height estimates in
+    ``preprocess_md`` share one measurement per table.
+    """
+
+    return _measure_table(
+        tuple(table_lines), config or parse_table_strategy_config(None)
+    )
+
+
+@lru_cache(maxsize=256)
+def _measure_table(
+    table_lines: tuple[str, ...], config: TablePaperStrategyConfig
+) -> TableMeasurement:
+    rows = tuple(tuple(row) for row in table_rows_for_measurement(table_lines))
+    normalized = tuple(
+        tuple(normalize_table_measurement_text(cell) for cell in row) for row in rows
+    )
+    text_widths = tuple(
+        tuple(_text_width_mm(cell) for cell in row) for row in normalized
+    )
+    unbreakable_widths = tuple(
+        tuple(_longest_unbreakable_text_width_mm(cell) for cell in row)
+        for row in normalized
+    )
+
+    estimated_width = 0.0
+    if rows:
+        column_count = max(len(row) for row in rows)
+        column_widths = [MIN_TABLE_COLUMN_WIDTH_MM] * column_count
+        for row_widths in text_widths:
+            for index, width in enumerate(row_widths):
+                column_widths[index] = max(column_widths[index], width)
+        raw_width = sum(column_widths) + column_count * TABLE_CELL_PADDING_MM
+        estimated_width = raw_width * TABLE_WIDTH_SAFETY_FACTOR
+
+    return TableMeasurement(
+        rows=rows,
+        text_widths_mm=text_widths,
+        unbreakable_widths_mm=unbreakable_widths,
+        profiles=_build_column_profiles(
+            normalized, text_widths, unbreakable_widths, config
+        ),
+        estimated_width_mm=estimated_width,
+    )
 
 
 def paper_for_columns(
@@ -424,7 +593,7 @@ def choose_table_paper(
     paper_by_columns = paper_for_columns(
         cols=cols, base_paper=base_info, config=strategy
     )
-    required_width = estimate_table_width_mm(table_lines)
+    required_width = measure_table(table_lines, strategy).estimated_width_mm
 
     if override and override.paper:
         selected = get_valid_paper_measurements(override.paper)
@@ -551,12 +720,12 @@ def evaluate_candidate_layout(
 ) -> TableCandidateEvaluation:
     """Evaluate expected table readability on one paper candidate."""
 
-    rows = table_rows_for_measurement(table_lines)
-    profiles = _build_column_profiles(rows, config)
+    measurement = measure_table(table_lines, config)
+    profiles = measurement.profiles
     usable_width = available_text_width_mm(paper_info)
     allocated_widths, overflow_mm = _allocate_column_widths(profiles, usable_width)
     max_cell_lines, max_header_lines, average_row_lines, unbreakable_overflow = (
-        _estimate_line_metrics(rows, allocated_widths)
+        _estimate_line_metrics(measurement, allocated_widths)
     )
     narrow_columns = sum(
         1
@@ -627,20 +796,117 @@ def decision_to_dict(decision: TableStrategyDecision) -> dict[str, Any]:
     return data
 
 
+def iter_table_report(
+    path: Path,
+) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """Yield ``(number, record, error)`` for every decision in a report.
+
+    JSONL reports are numbered by line; columnar ``.json.gz`` reports by
+    decision.  Unreadable lines yield ``record=None`` and an error message.
+    """
+
+    if path.name.endswith(COLUMNAR_REPORT_SUFFIX):
+        number = 0
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        batch = json.loads(line)
+                    except json.JSONDecodeError as exc:
+                        yield number + 1, None, str(exc)
+                        continue
+                    for record in _columns_to_records(batch):
+                        number += 1
+                        yield number, record, None
+        except (OSError, EOFError) as exc:
+            yield number + 1, None, str(exc)
+        return
+
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line), None
+            except json.JSONDecodeError as exc:
+                yield line_number, None, str(exc)
+
+
+def _records_to_columns(records: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    keys = sorted({key for record in records for key in record})
+    evaluation_fields = sorted(
+        {
+            key
+            for record in records
+            for evaluation in record.get("evaluations") or ()
+            for key in evaluation
+        }
+    )
+    columns: dict[str, list[Any]] = {}
+    for key in keys:
+        if key == "evaluations":
+            columns[key] = [
+                (
+                    None
+                    if record.get(key) is None
+                    else [
+                        [evaluation.get(name) for name in evaluation_fields]
+                        for evaluation in record[key]
+                    ]
+                )
+                for record in records
+            ]
+        else:
+            columns[key] = [record.get(key) for record in records]
+    return {
+        "version": _COLUMNAR_REPORT_VERSION,
+        "count": len(records),
+        "evaluation_fields": evaluation_fields,
+        "columns": columns,
+    }
+
+
+def _columns_to_records(batch: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+    columns = batch.get("columns") or {}
+    evaluation_fields = batch.get("evaluation_fields") or []
+    for index in range(int(batch.get("count") or 0)):
+        record: dict[str, Any] = {}
+        for key, values in columns.items():
+            value = values[index]
+            if value is None:
+                continue
+            if key == "evaluations":
+                value = [
+                    {
+                        name: item
+                        for name, item in zip(evaluation_fields, row)
+                        if item is not None
+                    }
+                    for row in value
+                ]
+            record[key] = value
+        yield record
+
+
 def _build_column_profiles(
-    rows: Sequence[Sequence[str]], config: TablePaperStrategyConfig
+    normalized_rows: Sequence[Sequence[str]],
+    text_widths: Sequence[Sequence[float]],
+    unbreakable_widths: Sequence[Sequence[float]],
+    config: TablePaperStrategyConfig,
 ) -> tuple[ColumnProfile, ...]:
-    column_count = max((len(row) for row in rows), default=0)
+    column_count = max((len(row) for row in normalized_rows), default=0)
     profiles: list[ColumnProfile] = []
     for index in range(column_count):
-        cells = [row[index] if index < len(row) else "" for row in rows]
-        normalized = [normalize_table_measurement_text(cell) for cell in cells]
-        widths = [estimate_text_width_mm(cell) for cell in cells]
+        normalized = [row[index] if index < len(row) else "" for row in normalized_rows]
+        widths = [row[index] if index < len(row) else 0.0 for row in text_widths]
         header_width = widths[0] if widths else 0.0
         max_width = max(widths, default=0.0)
         avg_width = sum(widths) / len(widths) if widths else 0.0
         longest_unbreakable = max(
-            (_longest_unbreakable_width_mm(cell) for cell in normalized), default=0.0
+            (row[index] for row in unbreakable_widths if index < len(row)),
+            default=0.0,
         )
         kind, flags = _classify_column(normalized)
         min_width = max(
@@ -705,8 +971,9 @@ def _allocate_column_widths(
 
 
 def _estimate_line_metrics(
-    rows: Sequence[Sequence[str]], allocated_widths: Sequence[float]
+    measurement: TableMeasurement, allocated_widths: Sequence[float]
 ) -> tuple[int, int, float, float]:
+    rows = measurement.text_widths_mm
     if not rows or not allocated_widths:
         return 1, 1, 1.0, 0.0
 
@@ -714,19 +981,17 @@ def _estimate_line_metrics(
     max_cell_lines = 1
     max_header_lines = 1
     max_unbreakable_overflow = 0.0
-    for row_index, row in enumerate(rows):
+    for row_index, (row, unbreakable) in enumerate(
+        zip(rows, measurement.unbreakable_widths_mm)
+    ):
         cell_lines: list[int] = []
-        for column_index, cell in enumerate(row):
+        for column_index, width in enumerate(row):
             allocated = max(
                 1.0,
                 allocated_widths[min(column_index, len(allocated_widths) - 1)],
             )
-            width = estimate_text_width_mm(cell)
             lines = max(1, int(math.ceil(width / allocated)))
-            token_overflow = max(
-                0.0,
-                _longest_unbreakable_width_mm(cell) - allocated,
-            )
+            token_overflow = max(0.0, unbreakable[column_index] - allocated)
             max_unbreakable_overflow = max(max_unbreakable_overflow, token_overflow)
             cell_lines.append(lines)
             max_cell_lines = max(max_cell_lines, lines)
@@ -789,12 +1054,20 @@ def _minimum_width_for_kind(kind: str) -> float:
 
 
 def _longest_unbreakable_width_mm(value: str) -> float:
-    text = normalize_table_measurement_text(value)
+    return _longest_unbreakable_text_width_mm(normalize_table_measurement_text(value))
+
+
+def _longest_unbreakable_text_width_mm(text: str) -> float:
     current = 0.0
     longest = 0.0
+    widths = _bmp_glyph_widths_mm()
     for char in text:
-        width = glyph_width_em(char) * TABLE_FONT_SIZE_PT * PT_TO_MM
-        if char.isspace() or char in "-/._,:;|()[]{}":
+        codepoint = ord(char)
+        if codepoint < _BMP_SIZE:
+            width = widths[codepoint]
+        else:
+            width = glyph_width_em(char) * TABLE_FONT_SIZE_PT * PT_TO_MM
+        if char.isspace() or char in _UNBREAKABLE_SEPARATORS:
             longest = max(longest, current)
             current = 0.0
             continue
@@ -884,7 +1157,6 @@ def _parse_override_body(body: str) -> dict[str, str]:
 def _log_and_report_decision(
     decision: TableStrategyDecision, config: TablePaperStrategyConfig
 ) -> None:
-    data = decision_to_dict(decision)
     logger.info(
         "Table strategy decision: selected=%s method=%s columns=%d "
         "estimated_width=%.1fmm reason=%s",
@@ -894,18 +1166,22 @@ def _log_and_report_decision(
         decision.estimated_width_mm,
         decision.reason,
     )
-    if decision.evaluations:
-        logger.info(
+    if decision.evaluations and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
             "Table strategy candidate scores: %s",
-            json.dumps(data["evaluations"], ensure_ascii=False),
+            json.dumps(
+                [asdict(evaluation) for evaluation in decision.evaluations],
+                ensure_ascii=False,
+            ),
         )
     if config.report_path:
-        try:
-            config.report_path.parent.mkdir(parents=True, exist_ok=True)
-            with config.report_path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(data, ensure_ascii=False) + "\n")
-        except OSError as exc:
-            logger.warning("Could not write table strategy report: %s", exc)
+        sink = TableReportSink.active(config.report_path)
+        if sink is not None:
+            sink.add(decision_to_dict(decision))
+        else:
+            sink = TableReportSink(config.report_path)
+            sink.add(decision_to_dict(decision))
+            sink.flush()
 
 
 def _as_sequence(value: Any) -> Sequence[Any]:
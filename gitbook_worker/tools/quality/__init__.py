@@ -6,7 +6,9 @@ __all__ = [
     "editorial_common",
     "editorial_metrics",
     "link_audit",
+    "pdf_metrics_cache",
     "profile_link_audit",
     "sources",
     "staatenprofil_links",
+    "url_checker",
 ]
@@ -526,6 +526,11 @@ def build_trend_record(
         "warn": counts.get("warn", 0),
         "info": counts.get("info", 0),
         "pdfs_total": len(pdf_artifacts),
+        "pdfs_reused": [
+            artifact.get("path")
+            for artifact in pdf_artifacts
+            if _pdf_metrics_cache_status(artifact) == "hit"
+        ],
         "pages_total": sum(
             _int_value(artifact.get("pages_total")) for artifact in pdf_artifacts
         ),
@@ -1229,6 +1234,13 @@ def _collect_pdf_artifacts(
     return artifacts
 
 
+def _pdf_metrics_cache_status(artifact: Mapping[str, Any]) -> str | None:
+    cache = artifact.get("metrics_cache")
+    if not isinstance(cache, Mapping):
+        return None
+    return str(cache.get("status") or "") or None
+
+
 def _parse_iso_datetime(value: Any) -> datetime | None:
     if not value:
         return None
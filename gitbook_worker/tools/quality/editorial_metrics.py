@@ -5,10 +5,12 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import re
 from collections import Counter
-from dataclasses import asdict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 from urllib.parse import unquote
@@ -21,6 +23,10 @@ from gitbook_worker.core.application.pdf_toc import extract_pdf_toc
 from gitbook_worker.tools.exit_codes import add_exit_code_help, handle_exit_code_help
 from gitbook_worker.tools.logging_config import get_logger
 from gitbook_worker.tools.publishing.gitbook_style import get_summary_layout
+from gitbook_worker.tools.publishing.table_strategy import (
+    COLUMNAR_REPORT_SUFFIX,
+    iter_table_report,
+)
 from gitbook_worker.tools.quality.ai_references import (
     load_inline_reference_tasks,
     load_reference_tasks,
@@ -38,11 +44,17 @@ from gitbook_worker.tools.quality.editorial_common import (
     write_json_report,
 )
 from gitbook_worker.tools.quality.link_audit import DuplicateHeading, list_todos
+from gitbook_worker.tools.quality.pdf_metrics_cache import PdfMetricsCache
+from gitbook_worker.tools.testing.pdf_analysis import (
+    PdfAnalysis,
+    analyze_pdf_document,
+)
 from gitbook_worker.tools.testing.pdf_validator import (
     extract_pdf_fonts,
     font_name_matches,
     scan_forbidden_log_patterns,
 )
+from gitbook_worker.tools.utils.content_snapshot import active_snapshot
 from gitbook_worker.tools.utils.smart_content import load_content_config
 from gitbook_worker.tools.validators.frontmatter_checker import (
     check_file as check_frontmatter_file,
@@ -65,6 +77,9 @@ _SUMMARY_LINK_RE = re.compile(
 )
 _PDF_REPORT_MODES = {"jsonl", "file", "true"}
 
+MARKDOWN_JOBS_ENV = "GITBOOK_WORKER_MARKDOWN_JOBS"
+_MARKDOWN_FILES_PER_JOB = 64
+
 
 def collect_editorial_metrics(
     *,
@@ -78,8 +93,13 @@ def collect_editorial_metrics(
     table_report_paths: Sequence[Path] | None = None,
     log_paths: Sequence[Path] | None = None,
     discover_table_reports: bool = False,
+    metrics_cache: PdfMetricsCache | None = None,
 ) -> dict[str, Any]:
-    """Collect metrics and return the canonical editorial metrics report."""
+    """Collect metrics and return the canonical editorial metrics report.
+
+    ``metrics_cache`` reuses the PDF analysis of unchanged artifacts (see
+    :mod:`gitbook_worker.tools.quality.pdf_metrics_cache`).
+    """
 
     root = repo_root.resolve()
     active_profile = profile or load_acceptance_profile()
@@ -109,9 +129,17 @@ def collect_editorial_metrics(
     pdf_findings: list[Finding] = []
     pdf_inputs = _dedupe_paths([*(pdf_paths or ()), *publish_scope["expected_pdfs"]])
     for pdf_path in pdf_inputs:
-        metrics, findings = analyze_pdf(root, pdf_path, active_profile, log_paths or ())
+        metrics, findings = analyze_pdf(
+            root,
+            pdf_path,
+            active_profile,
+            log_paths or (),
+            metrics_cache=metrics_cache,
+        )
         pdf_metrics.append(metrics)
         pdf_findings.extend(findings)
+    if metrics_cache is not None:
+        metrics_cache.log_stats(root.name)
 
     table_paths = list(table_report_paths or ())
     if discover_table_reports:
@@ -210,9 +238,12 @@ def discover_markdown_files(
     for root in roots:
         if not root.exists():
             continue
-        for path in sorted(root.rglob("*.md")):
-            if not path.is_file():
-                continue
+        snapshot = active_snapshot(root)
+        if snapshot is not None:
+            candidates = sorted(snapshot.rglob(root, ".md", files_only=True))
+        else:
+            candidates = [path for path in sorted(root.rglob("*.md")) if path.is_file()]
+        for path in candidates:
             rel_parts = path.resolve().relative_to(root.resolve()).parts
             if any(part in exclude_dirs for part in rel_parts):
                 continue
@@ -396,13 +427,44 @@ def discover_publish_scope(
     }
 
 
+@dataclass
+class _MarkdownFileScan:
+    """Partial Markdown metrics of one file (map step of the analysis)."""
+
+    path: Path
+    resolved: Path
+    lines: int = 0
+    words: int = 0
+    links: int = 0
+    images: int = 0
+    tables: int = 0
+    codeblocks: int = 0
+    todo_markers: int = 0
+    headings: list[dict[str, Any]] = field(default_factory=list)
+    findings: list[Finding] = field(default_factory=list)
+    frontmatter: Mapping[str, Any] | None = None
+    todo_entries: int = 0
+    duplicate_headings: list[DuplicateHeading] = field(default_factory=list)
+    frontmatter_issues: list[Any] = field(default_factory=list)
+    reference_tasks: int | None = None
+    inline_reference_keys: list[tuple[str, int, str]] = field(default_factory=list)
+
+
 def analyze_markdown_files(
     repo_root: Path,
     markdown_files: Sequence[Path],
     profile: AcceptanceProfile,
+    *,
+    workers: int | None = None,
 ) -> tuple[dict[str, Any], list[Finding]]:
-    """Collect Markdown structure metrics and frontmatter findings."""
+    """Collect Markdown structure metrics and frontmatter findings.
+
+    Every file is scanned independently (on a process pool for large scopes,
+    ``GITBOOK_WORKER_MARKDOWN_JOBS``); the partial results are merged in input
+    order, followed by the cross-file checks (translation drift, source ids).
+    """
 
+    scans = _scan_markdown_files(repo_root, markdown_files, profile, workers)
     metrics = {
         "files_total": len(markdown_files),
         "lines_total": 0,
@@ -429,118 +491,27 @@ def analyze_markdown_files(
     target_records: list[tuple[Path, Mapping[str, Any], str]] = []
     frontmatter_by_path: dict[Path, Mapping[str, Any]] = {}
 
-    for path in markdown_files:
-        rel = relative_artifact(path, repo_root)
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError as exc:
-            findings.append(
-                make_finding(
-                    rule_id="markdown.read_error",
-                    severity="blocked",
-                    category="markdown.io",
-                    artifact=rel,
-                    location="file",
-                    evidence=str(exc),
-                    editorial_impact="Markdown-Datei kann nicht geprueft werden.",
-                    healing="Dateizugriff pruefen und Metriklauf wiederholen.",
-                )
-            )
-            continue
-
-        lines = text.splitlines()
-        metrics["lines_total"] += len(lines)
-        metrics["words_total"] += len(re.findall(r"\b\w+\b", text, flags=re.UNICODE))
-        metrics["links_total"] += len(_LINK_RE.findall(text))
-        metrics["images_total"] += len(_IMAGE_RE.findall(text))
-        frontmatter_lines = _frontmatter_line_numbers(lines)
-        for line_number, line in enumerate(lines, start=1):
-            heading_match = _HEADING_RE.match(line)
-            if not heading_match:
-                continue
-            metrics["headings_total"] += 1
-            metrics["headings"].append(
-                {
-                    "artifact": rel,
-                    "line": line_number,
-                    "level": len(heading_match.group(1)),
-                    "title": heading_match.group(2).strip(),
-                }
-            )
-        metrics["tables_total"] += _count_markdown_tables(lines)
-        metrics["codeblocks_total"] += _count_fenced_code_blocks(lines)
-
-        todo_count = 0
-        for line_number, line in enumerate(lines, start=1):
-            if line_number in frontmatter_lines:
-                continue
-            if _TODO_RE.search(line):
-                todo_count += 1
-                findings.append(
-                    make_finding(
-                        rule_id="markdown.review_marker",
-                        severity="warn",
-                        category="markdown.editorial",
-                        artifact=rel,
-                        location=f"line {line_number}",
-                        evidence=line,
-                        editorial_impact="Offene redaktionelle Notiz vor Freigabe pruefen.",
-                        healing="TODO/FIXME/REVIEW klaeren oder bewusst als Restrisiko dokumentieren.",
-                    )
-                )
-            long_token = _find_long_token(line, profile.markdown.long_token_warn_chars)
-            if long_token:
-                findings.append(
-                    make_finding(
-                        rule_id="markdown.long_token",
-                        severity="warn",
-                        category="markdown.layout",
-                        artifact=rel,
-                        location=f"line {line_number}",
-                        evidence=long_token,
-                        editorial_impact="Sehr lange Tokens koennen PDF-Umbruch und Tabellenlayout belasten.",
-                        healing="Token umbrechen, als Code/URL behandeln oder Tabellenstrategie pruefen.",
-                    )
-                )
-        metrics["todo_markers_total"] += todo_count
-
-        frontmatter, frontmatter_error = _read_frontmatter(text)
-        if frontmatter_error:
-            findings.append(
-                make_finding(
-                    rule_id="markdown.frontmatter.invalid_yaml",
-                    severity="fail",
-                    category="markdown.frontmatter",
-                    artifact=rel,
-                    location="frontmatter",
-                    evidence=frontmatter_error,
-                    editorial_impact="Frontmatter ist nicht maschinenlesbar.",
-                    healing="YAML-Frontmatter korrigieren.",
-                )
-            )
-            continue
+    for scan in scans:
+        metrics["lines_total"] += scan.lines
+        metrics["words_total"] += scan.words
+        metrics["links_total"] += scan.links
+        metrics["images_total"] += scan.images
+        metrics["headings_total"] += len(scan.headings)
+        metrics["headings"].extend(scan.headings)
+        metrics["tables_total"] += scan.tables
+        metrics["codeblocks_total"] += scan.codeblocks
+        metrics["todo_markers_total"] += scan.todo_markers
+        findings.extend(scan.findings)
+
+        frontmatter = scan.frontmatter
         if frontmatter is None:
-            if path.name not in profile.markdown.skip_filenames:
-                findings.append(
-                    make_finding(
-                        rule_id="markdown.frontmatter.missing",
-                        severity="warn",
-                        category="markdown.frontmatter",
-                        artifact=rel,
-                        location="frontmatter",
-                        evidence="no YAML frontmatter",
-                        editorial_impact="Datei kann nicht eindeutig einem redaktionellen Profil zugeordnet werden.",
-                        healing="Erforderliche Frontmatter-Felder ergaenzen oder Datei im Profil ausnehmen.",
-                    )
-                )
             continue
-
         metrics["frontmatter_files"] += 1
-        frontmatter_by_path[path.resolve()] = frontmatter
+        frontmatter_by_path[scan.resolved] = frontmatter
         locale = str(frontmatter.get(profile.markdown.locale_field) or "").strip()
         metrics["metadata"].append(
             {
-                "artifact": rel,
+                "artifact": relative_artifact(scan.path, repo_root),
                 "title": str(frontmatter.get("title") or "").strip() or None,
                 "version": str(frontmatter.get("version") or "").strip() or None,
                 "locale": locale or None,
@@ -554,13 +525,12 @@ def analyze_markdown_files(
             by_locale = metrics["by_locale"]
             by_locale[locale] = int(by_locale.get(locale, 0)) + 1
 
-        findings.extend(_check_frontmatter_rules(repo_root, path, frontmatter, profile))
         role = _frontmatter_role(frontmatter, profile)
         identity = str(frontmatter.get(profile.markdown.identity_key) or "").strip()
         if role == "source" and identity:
-            source_ids[identity] = path.resolve()
+            source_ids[identity] = scan.resolved
         if role == "target":
-            target_records.append((path.resolve(), frontmatter, identity))
+            target_records.append((scan.resolved, frontmatter, identity))
             status = str(frontmatter.get("status") or "").strip()
             if status == "approved":
                 metrics["approved_targets_total"] += 1
@@ -574,34 +544,206 @@ def analyze_markdown_files(
             profile,
         )
     )
-    reused_metrics, reused_findings = _collect_reused_markdown_signals(
-        repo_root, markdown_files, profile
-    )
+    reused_metrics, reused_findings = _collect_reused_markdown_signals(repo_root, scans)
     metrics.update(reused_metrics)
     findings.extend(reused_findings)
     return metrics, findings
 
 
-def _collect_reused_markdown_signals(
+def _resolve_markdown_jobs(workers: int | None, files: int) -> int:
+    if workers is None:
+        raw = os.environ.get(MARKDOWN_JOBS_ENV, "").strip()
+        try:
+            workers = int(raw) if raw else 0
+        except ValueError:
+            workers = 0
+    if workers <= 0:
+        # A process pool only pays off once every worker gets a batch of files.
+        workers = min(os.cpu_count() or 1, files // _MARKDOWN_FILES_PER_JOB)
+    return max(1, min(workers, files))
+
+
+def _scan_markdown_files(
     repo_root: Path,
     markdown_files: Sequence[Path],
     profile: AcceptanceProfile,
+    workers: int | None,
+) -> list[_MarkdownFileScan]:
+    jobs = _resolve_markdown_jobs(workers, len(markdown_files))
+    scan = partial(_scan_markdown_file, repo_root, profile)
+    if jobs == 1:
+        return [scan(path) for path in markdown_files]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    logger.info(
+        "📝 Analysiere %d Markdown-Dateien in %d Prozessen",
+        len(markdown_files),
+        jobs,
+    )
+    chunksize = max(1, len(markdown_files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(scan, markdown_files, chunksize=chunksize))
+
+
+def _scan_markdown_file(
+    repo_root: Path, profile: AcceptanceProfile, path: Path
+) -> _MarkdownFileScan:
+    scan = _MarkdownFileScan(path=path, resolved=path.resolve())
+    _scan_markdown_structure(repo_root, path, profile, scan)
+    _scan_reused_markdown_signals(path, profile, scan)
+    return scan
+
+
+def _scan_markdown_structure(
+    repo_root: Path,
+    path: Path,
+    profile: AcceptanceProfile,
+    scan: _MarkdownFileScan,
+) -> None:
+    findings = scan.findings
+    rel = relative_artifact(path, repo_root)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        findings.append(
+            make_finding(
+                rule_id="markdown.read_error",
+                severity="blocked",
+                category="markdown.io",
+                artifact=rel,
+                location="file",
+                evidence=str(exc),
+                editorial_impact="Markdown-Datei kann nicht geprueft werden.",
+                healing="Dateizugriff pruefen und Metriklauf wiederholen.",
+            )
+        )
+        return
+
+    lines = text.splitlines()
+    scan.lines = len(lines)
+    scan.words = len(re.findall(r"\b\w+\b", text, flags=re.UNICODE))
+    scan.links = len(_LINK_RE.findall(text))
+    scan.images = len(_IMAGE_RE.findall(text))
+    frontmatter_lines = _frontmatter_line_numbers(lines)
+    for line_number, line in enumerate(lines, start=1):
+        heading_match = _HEADING_RE.match(line)
+        if not heading_match:
+            continue
+        scan.headings.append(
+            {
+                "artifact": rel,
+                "line": line_number,
+                "level": len(heading_match.group(1)),
+                "title": heading_match.group(2).strip(),
+            }
+        )
+    scan.tables = _count_markdown_tables(lines)
+    scan.codeblocks = _count_fenced_code_blocks(lines)
+
+    for line_number, line in enumerate(lines, start=1):
+        if line_number in frontmatter_lines:
+            continue
+        if _TODO_RE.search(line):
+            scan.todo_markers += 1
+            findings.append(
+                make_finding(
+                    rule_id="markdown.review_marker",
+                    severity="warn",
+                    category="markdown.editorial",
+                    artifact=rel,
+                    location=f"line {line_number}",
+                    evidence=line,
+                    editorial_impact="Offene redaktionelle Notiz vor Freigabe pruefen.",
+                    healing="TODO/FIXME/REVIEW klaeren oder bewusst als Restrisiko dokumentieren.",
+                )
+            )
+        long_token = _find_long_token(line, profile.markdown.long_token_warn_chars)
+        if long_token:
+            findings.append(
+                make_finding(
+                    rule_id="markdown.long_token",
+                    severity="warn",
+                    category="markdown.layout",
+                    artifact=rel,
+                    location=f"line {line_number}",
+                    evidence=long_token,
+                    editorial_impact="Sehr lange Tokens koennen PDF-Umbruch und Tabellenlayout belasten.",
+                    healing="Token umbrechen, als Code/URL behandeln oder Tabellenstrategie pruefen.",
+                )
+            )
+
+    frontmatter, frontmatter_error = _read_frontmatter(text)
+    if frontmatter_error:
+        findings.append(
+            make_finding(
+                rule_id="markdown.frontmatter.invalid_yaml",
+                severity="fail",
+                category="markdown.frontmatter",
+                artifact=rel,
+                location="frontmatter",
+                evidence=frontmatter_error,
+                editorial_impact="Frontmatter ist nicht maschinenlesbar.",
+                healing="YAML-Frontmatter korrigieren.",
+            )
+        )
+        return
+    if frontmatter is None:
+        if path.name not in profile.markdown.skip_filenames:
+            findings.append(
+                make_finding(
+                    rule_id="markdown.frontmatter.missing",
+                    severity="warn",
+                    category="markdown.frontmatter",
+                    artifact=rel,
+                    location="frontmatter",
+                    evidence="no YAML frontmatter",
+                    editorial_impact="Datei kann nicht eindeutig einem redaktionellen Profil zugeordnet werden.",
+                    healing="Erforderliche Frontmatter-Felder ergaenzen oder Datei im Profil ausnehmen.",
+                )
+            )
+        return
+
+    scan.frontmatter = frontmatter
+    findings.extend(_check_frontmatter_rules(repo_root, path, frontmatter, profile))
+
+
+def _scan_reused_markdown_signals(
+    path: Path, profile: AcceptanceProfile, scan: _MarkdownFileScan
+) -> None:
+    """Run the existing quality modules on one file (see the merge below)."""
+
+    scan.todo_entries = len(list_todos([path]))
+    scan.duplicate_headings = _check_near_duplicate_headings(
+        [path], profile.markdown.duplicate_heading_near_window
+    )
+    try:
+        scan.frontmatter_issues = check_frontmatter_file(path)
+    except OSError as exc:
+        logger.debug("Frontmatter checker could not read %s: %s", path, exc)
+    if path.is_file():
+        scan.reference_tasks = len(load_reference_tasks([path], language="de"))
+    scan.inline_reference_keys = [
+        (str(task.file.resolve()), task.lineno, task.line.strip())
+        for task in load_inline_reference_tasks(
+            [path],
+            include_markdown_links=False,
+            include_frontmatter_dois=True,
+        )
+    ]
+
+
+def _collect_reused_markdown_signals(
+    repo_root: Path,
+    scans: Sequence[_MarkdownFileScan],
 ) -> tuple[dict[str, Any], list[Finding]]:
     """Reuse existing quality modules and convert their signals to findings."""
 
     findings: list[Finding] = []
-    todo_entries = list_todos(markdown_files)
-    duplicate_headings = _check_near_duplicate_headings(
-        markdown_files, profile.markdown.duplicate_heading_near_window
-    )
-    frontmatter_issues = []
-    for markdown_file in markdown_files:
-        try:
-            frontmatter_issues.extend(check_frontmatter_file(markdown_file))
-        except OSError as exc:
-            logger.debug(
-                "Frontmatter checker could not read %s: %s", markdown_file, exc
-            )
+    duplicate_headings = [
+        duplicate for scan in scans for duplicate in scan.duplicate_headings
+    ]
+    frontmatter_issues = [issue for scan in scans for issue in scan.frontmatter_issues]
 
     for duplicate in duplicate_headings:
         rel = relative_artifact(duplicate.file, repo_root)
@@ -633,17 +775,20 @@ def _collect_reused_markdown_signals(
             )
         )
 
-    reference_tasks = load_reference_tasks(markdown_files, language="de")
-    inline_reference_tasks = load_inline_reference_tasks(
-        markdown_files,
-        include_markdown_links=False,
-        include_frontmatter_dois=True,
+    # load_reference_tasks keys its sources by file and load_inline_reference_tasks
+    # dedupes by (file, line); repeated paths in the scope count once as before.
+    reference_tasks_by_file = {
+        str(scan.path): scan.reference_tasks for scan in scans if scan.reference_tasks
+    }
+    reference_tasks = sum(reference_tasks_by_file.values())
+    inline_reference_tasks = len(
+        {key for scan in scans for key in scan.inline_reference_keys}
     )
     metrics = {
         "duplicate_headings_total": len(duplicate_headings),
-        "link_audit_todo_entries_total": len(todo_entries),
-        "ai_reference_tasks_total": len(reference_tasks),
-        "inline_reference_tasks_total": len(inline_reference_tasks),
+        "link_audit_todo_entries_total": sum(scan.todo_entries for scan in scans),
+        "ai_reference_tasks_total": reference_tasks,
+        "inline_reference_tasks_total": inline_reference_tasks,
         "frontmatter_syntax_issues_total": len(frontmatter_issues),
     }
     if reference_tasks or inline_reference_tasks:
@@ -655,8 +800,8 @@ def _collect_reused_markdown_signals(
                 artifact="markdown scope",
                 location="source extraction",
                 evidence=(
-                    f"source_tasks={len(reference_tasks)}, "
-                    f"inline_tasks={len(inline_reference_tasks)}"
+                    f"source_tasks={reference_tasks}, "
+                    f"inline_tasks={inline_reference_tasks}"
                 ),
                 editorial_impact="AI-Referenzcheck hat pruefbare Referenzkandidaten erkannt.",
                 healing="Bei Release-Abnahme optional ai_references mit Review-Protokoll laufen lassen.",
@@ -705,11 +850,45 @@ def analyze_pdf(
     pdf_path: Path,
     profile: AcceptanceProfile,
     log_paths: Sequence[Path] = (),
+    *,
+    metrics_cache: PdfMetricsCache | None = None,
 ) -> tuple[dict[str, Any], list[Finding]]:
-    """Collect metrics for one PDF artifact."""
+    """Collect metrics for one PDF artifact.
+
+    With ``metrics_cache`` the PDF analysis is reused for byte-identical PDFs
+    under the same profile; ``metrics["metrics_cache"]`` then records whether
+    the entry was reused (``hit``) or analysed and stored (``miss``).  Build
+    logs are always scanned.
+    """
 
     path = _resolve_path(repo_root, pdf_path)
     rel = relative_artifact(path, repo_root)
+    content = (
+        metrics_cache.content_hash(path)
+        if metrics_cache is not None and path.exists()
+        else None
+    )
+    if metrics_cache is None or content is None:
+        metrics, findings = _analyze_pdf_artifact(path, rel, profile)
+    else:
+        key = metrics_cache.key(content, rel, profile)
+        cached = metrics_cache.load(key)
+        if cached is None:
+            metrics, findings = _analyze_pdf_artifact(path, rel, profile)
+            metrics_cache.store(key, metrics, findings, pdf_sha256=content)
+            status = "miss"
+        else:
+            metrics, findings = cached
+            metrics["modified_at"] = _path_mtime_iso(path)
+            status = "hit"
+        metrics["metrics_cache"] = {"status": status, "pdf_sha256": content}
+    findings.extend(_check_log_patterns(repo_root, rel, log_paths))
+    return metrics, findings
+
+
+def _analyze_pdf_artifact(
+    path: Path, rel: str, profile: AcceptanceProfile
+) -> tuple[dict[str, Any], list[Finding]]:
     metrics: dict[str, Any] = {
         "path": rel,
         "exists": path.exists(),
@@ -779,9 +958,11 @@ def analyze_pdf(
     page_texts: dict[int, str] = {}
     page_line_counts: dict[int, int] = {}
     replacement_signals_by_page: list[dict[str, int]] = []
-    for page_index, page in enumerate(reader.pages, start=1):
-        width_pt = float(page.mediabox.width)
-        height_pt = float(page.mediabox.height)
+    analysis = analyze_pdf_document(path, reader=reader)
+    for page in analysis.pages:
+        page_index = page.number
+        width_pt = page.width_pt
+        height_pt = page.height_pt
         orientation = "landscape" if width_pt > height_pt else "portrait"
         orientations[orientation] += 1
         metrics["page_sizes"].append(
@@ -792,7 +973,7 @@ def analyze_pdf(
                 "orientation": orientation,
             }
         )
-        text = page.extract_text() or ""
+        text = page.text
         text_all.append(text)
         page_texts[page_index] = text
         line_count = len(_meaningful_text_lines(text))
@@ -886,7 +1067,7 @@ def analyze_pdf(
             )
         )
 
-    fonts = _safe_extract_fonts(path, rel, findings)
+    fonts = _safe_extract_fonts(path, rel, findings, analysis)
     metrics["fonts"] = [asdict(font) for font in fonts]
     findings.extend(_check_required_fonts(rel, fonts, profile))
     findings.extend(_check_pdf_page_targets(rel, metrics["pages_total"], profile))
@@ -901,10 +1082,9 @@ def analyze_pdf(
     )
     findings.extend(_check_pdf_text_overflow(rel, page_texts, profile))
     findings.extend(_check_pdf_script_samples(rel, metrics["script_samples"], fonts))
-    toc_entries = _safe_extract_pdf_toc(path, rel, findings)
+    toc_entries = _safe_extract_pdf_toc(path, rel, findings, analysis)
     metrics["toc_entries"] = [asdict(entry) for entry in toc_entries]
     metrics["toc_entries_total"] = len(toc_entries)
-    findings.extend(_check_log_patterns(repo_root, rel, log_paths))
     return metrics, findings
 
 
@@ -1230,7 +1410,7 @@ def _version_tuple(value: str) -> tuple[int, int, int]:
 def discover_table_layout_reports(
     repo_root: Path, markdown_inputs: Sequence[str]
 ) -> list[Path]:
-    """Find table layout JSONL reports near known content roots."""
+    """Find table layout reports (JSONL or columnar) near known content roots."""
 
     roots = [repo_root / raw for raw in markdown_inputs if raw and raw != "."] or [
         repo_root
@@ -1238,11 +1418,15 @@ def discover_table_layout_reports(
     reports: list[Path] = []
     seen: set[Path] = set()
     for root in roots:
-        for path in root.rglob("*.table-layout.jsonl"):
-            resolved = path.resolve()
-            if resolved not in seen:
-                seen.add(resolved)
-                reports.append(path)
+        for pattern in (
+            "*.table-layout.jsonl",
+            f"*.table-layout{COLUMNAR_REPORT_SUFFIX}",
+        ):
+            for path in root.rglob(pattern):
+                resolved = path.resolve()
+                if resolved not in seen:
+                    seen.add(resolved)
+                    reports.append(path)
     return reports
 
 
@@ -1252,7 +1436,7 @@ def analyze_table_reports(
     *,
     artifact_links: Mapping[str, str] | None = None,
 ) -> tuple[dict[str, Any], list[Finding]]:
-    """Aggregate table strategy JSONL reports."""
+    """Aggregate table strategy reports (JSONL or columnar ``.json.gz``)."""
 
     metrics: dict[str, Any] = {
         "reports_total": len(table_report_paths),
@@ -1296,14 +1480,8 @@ def analyze_table_reports(
                 )
             )
             continue
-        for line_number, line in enumerate(
-            path.read_text(encoding="utf-8").splitlines(), start=1
-        ):
-            if not line.strip():
-                continue
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError as exc:
+        for line_number, record, error in iter_table_report(path):
+            if record is None:
                 findings.append(
                     make_finding(
                         rule_id="tables.report.invalid_jsonl",
@@ -1311,7 +1489,7 @@ def analyze_table_reports(
                         category="tables.report",
                         artifact=rel,
                         location=f"line {line_number}",
-                        evidence=str(exc),
+                        evidence=str(error),
                         editorial_impact="Tabellenreport ist teilweise nicht lesbar.",
                         healing="Report neu erzeugen oder defekte JSONL-Zeile entfernen.",
                     )
@@ -1562,6 +1740,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=None,
         help="Build log file or directory to scan; repeatable",
     )
+    parser.add_argument(
+        "--no-metrics-cache",
+        action="store_true",
+        help="Analyse every PDF even if it is unchanged since a previous run",
+    )
     parser.add_argument(
         "--profile", default="local-preview", help="Editorial profile name"
     )
@@ -1623,6 +1806,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         table_report_paths=args.table_report,
         log_paths=args.log,
         discover_table_reports=args.discover_table_reports,
+        metrics_cache=None if args.no_metrics_cache else PdfMetricsCache.from_env(),
     )
     output = args.output or root / "logs" / "quality" / "editorial-metrics.json"
     write_json_report(report, output)
@@ -2093,6 +2277,9 @@ def _expected_table_report(
     if report_mode in _PDF_REPORT_MODES:
         stem = Path(out_name).stem or "table-layout"
         return (out_dir / f"{stem}.table-layout.jsonl").resolve()
+    if report_mode == "columnar":
+        stem = Path(out_name).stem or "table-layout"
+        return (out_dir / f"{stem}.table-layout{COLUMNAR_REPORT_SUFFIX}").resolve()
     return None
 
 
@@ -2410,7 +2597,14 @@ def _pdf_worker_version(metadata: Mapping[str, Any]) -> str | None:
     return None
 
 
-def _safe_extract_pdf_toc(path: Path, rel: str, findings: list[Finding]) -> list[Any]:
+def _safe_extract_pdf_toc(
+    path: Path,
+    rel: str,
+    findings: list[Finding],
+    analysis: PdfAnalysis | None = None,
+) -> list[Any]:
+    if analysis is not None:
+        return list(analysis.toc_entries)
     try:
         return extract_pdf_toc(path, logger=logger)
     except Exception as exc:  # noqa: BLE001 - TOC extraction is diagnostic only
@@ -2655,9 +2849,14 @@ def _pdf_text_replacement_signal_counts(text: str) -> Counter[str]:
     )
 
 
-def _safe_extract_fonts(path: Path, rel: str, findings: list[Finding]) -> list[Any]:
+def _safe_extract_fonts(
+    path: Path,
+    rel: str,
+    findings: list[Finding],
+    analysis: PdfAnalysis | None = None,
+) -> list[Any]:
     try:
-        return extract_pdf_fonts(path)
+        return extract_pdf_fonts(path, analysis=analysis)
     except Exception as exc:  # noqa: BLE001 - font extraction is diagnostic only
         findings.append(
             make_finding(
@@ -9,11 +9,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
-import requests
-from requests import Response
 import tqdm
 
 from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.quality.url_checker import LINK_CHECK_JOBS_ENV, UrlChecker
 
 logger = get_logger(__name__)
 
@@ -86,90 +85,99 @@ def _read_markdown_lines(md_file: Path) -> Iterator[Tuple[int, str]]:
         logger.warning("Failed to open %s: %s", md_file, exc)
 
 
-def _request_head(url: str, timeout: float) -> Optional[Response]:
-    try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
-        if response.status_code >= 400 or response.status_code == 405:
-            response = requests.get(url, timeout=timeout, allow_redirects=True)
-        return response
-    except Exception as exc:  # noqa: BLE001 - we want to record all failures
-        logger.debug("Request for %s failed: %s", url, exc)
-        return None
-
-
 def check_http_links(
     md_files: Iterable[Path],
     report_csv: Path,
     *,
     timeout: float = _DEFAULT_TIMEOUT,
     show_progress: bool = True,
+    checker: Optional[UrlChecker] = None,
 ) -> Tuple[List[HttpFinding], List[HttpFinding]]:
+    """Check every Markdown link and write one CSV row per occurrence.
+
+    URLs are collected first and checked once each by ``checker`` (default:
+    :meth:`UrlChecker.from_env`, concurrent and cached); rows keep the
+    file/line order of the occurrences.
+    """
+
     report_csv.parent.mkdir(parents=True, exist_ok=True)
     broken: List[HttpFinding] = []
     good: List[HttpFinding] = []
 
+    occurrences: List[Tuple[Path, int, str, str]] = []
+    md_list = list(md_files)
+    for md in tqdm.tqdm(md_list, desc="Files", unit="file", disable=not show_progress):
+        for lineno, line in _read_markdown_lines(md):
+            for url in _LINK_PATTERN.findall(line):
+                occurrences.append((md, lineno, line, url))
+
+    active_checker = checker or UrlChecker.from_env(timeout=timeout)
+    try:
+        statuses = active_checker.check_many(
+            (url for *_, url in occurrences), show_progress=show_progress
+        )
+    finally:
+        if checker is None:
+            active_checker.close()
+    logger.info("Checked %s distinct URLs for %s links", len(statuses), len(occurrences))
+
     with report_csv.open("w", encoding="utf-8", newline="") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["GO", "File", "Link", "Line#", "Line", "Status Code", "Error"])
-        md_list = list(md_files)
-        for md in tqdm.tqdm(md_list, desc="Files", unit="file", disable=not show_progress):
-            for lineno, line in _read_markdown_lines(md):
-                for url in _LINK_PATTERN.findall(line):
-                    response = _request_head(url, timeout)
-                    if response is None:
-                        finding = HttpFinding("💥❌", md, url, lineno, line, "unknown", "request failed")
-                        broken.append(finding)
-                        writer.writerow(finding.to_csv_row())
-                        logger.info("❌ Broken link (request failed) in %s: %s (line %s)", md, url, lineno)
-                        continue
-
-                    status_code = response.status_code
-                    if status_code >= 400:
-                        finding = HttpFinding(
-                            "❌",
-                            md,
-                            url,
-                            lineno,
-                            line,
-                            str(status_code),
-                            response.reason or "",
-                        )
-                        broken.append(finding)
-                        writer.writerow(finding.to_csv_row())
-                        logger.info("❌ Broken link in %s: %s (line %s)", md, url, lineno)
-                    else:
-                        finding = HttpFinding(
-                            "✅",
-                            md,
-                            url,
-                            lineno,
-                            line,
-                            str(status_code),
-                            "OK",
-                        )
-                        good.append(finding)
-                        writer.writerow(finding.to_csv_row())
-                        logger.info("✅ Good link in %s: %s (line %s)", md, url, lineno)
+        for md, lineno, line, url in occurrences:
+            status = statuses[url]
+            if status.status_code is None:
+                finding = HttpFinding("💥❌", md, url, lineno, line, "unknown", "request failed")
+                broken.append(finding)
+                writer.writerow(finding.to_csv_row())
+                logger.info("❌ Broken link (request failed) in %s: %s (line %s)", md, url, lineno)
+            elif not status.ok:
+                finding = HttpFinding("❌", md, url, lineno, line, str(status.status_code), status.reason)
+                broken.append(finding)
+                writer.writerow(finding.to_csv_row())
+                logger.info("❌ Broken link in %s: %s (line %s)", md, url, lineno)
+            else:
+                finding = HttpFinding("✅", md, url, lineno, line, str(status.status_code), "OK")
+                good.append(finding)
+                writer.writerow(finding.to_csv_row())
+                logger.info("✅ Good link in %s: %s (line %s)", md, url, lineno)
 
     logger.info("HTTP link check finished: %s broken, %s good", len(broken), len(good))
     return broken, good
 
 
-def check_images(md_files: Iterable[Path], *, timeout: float = _DEFAULT_TIMEOUT) -> List[ImageFinding]:
-    findings: List[ImageFinding] = []
+def check_images(
+    md_files: Iterable[Path],
+    *,
+    timeout: float = _DEFAULT_TIMEOUT,
+    checker: Optional[UrlChecker] = None,
+) -> List[ImageFinding]:
+    findings: List[Optional[ImageFinding]] = []
+    remote: List[Tuple[int, Path, int, str]] = []
     for md in md_files:
         for lineno, line in _read_markdown_lines(md):
             for target in _IMAGE_PATTERN.findall(line):
                 if target.startswith("http"):
-                    response = _request_head(target, timeout)
-                    if response is None or response.status_code >= 400:
-                        error = "request failed" if response is None else str(response.status_code)
-                        findings.append(ImageFinding(md, lineno, target, error))
+                    remote.append((len(findings), md, lineno, target))
+                    findings.append(None)
                 else:
                     full_path = (md.parent / target).resolve()
                     if not full_path.exists():
                         findings.append(ImageFinding(md, lineno, str(full_path), "not found"))
-    return findings
+
+    if remote:
+        active_checker = checker or UrlChecker.from_env(timeout=timeout)
+        try:
+            statuses = active_checker.check_many(target for *_, target in remote)
+        finally:
+            if checker is None:
+                active_checker.close()
+        for index, md, lineno, target in remote:
+            status = statuses[target]
+            if not status.ok:
+                error = "request failed" if status.status_code is None else str(status.status_code)
+                findings[index] = ImageFinding(md, lineno, target, error)
+    return [finding for finding in findings if finding is not None]
 
 
 def check_duplicate_headings(md_files: Iterable[Path]) -> List[DuplicateHeading]:
@@ -234,6 +242,8 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser.add_argument("--http-report", type=Path, help="Write HTTP link check CSV report to this path.")
     parser.add_argument("--timeout", type=float, default=_DEFAULT_TIMEOUT, help="Request timeout in seconds (default: 5).")
     parser.add_argument("--no-progress", action="store_true", help="Disable progress bar output.")
+    parser.add_argument("--jobs", type=int, default=None, help=f"Concurrent URL checks (default: ${LINK_CHECK_JOBS_ENV} or 16).")
+    parser.add_argument("--no-url-cache", action="store_true", help="Re-check URLs that were verified recently.")
     parser.add_argument("--check-images", action="store_true", help="Check remote and local images referenced in Markdown.")
     parser.add_argument("--check-duplicate-headings", action="store_true", help="Detect duplicate headings across files.")
     parser.add_argument("--check-citations", action="store_true", help="Verify consecutive numbering of citations.")
@@ -270,12 +280,17 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             ordered.append(candidate)
     md_files = ordered
 
+    checker = UrlChecker.from_env(timeout=args.timeout, use_cache=not args.no_url_cache)
+    if args.jobs is not None:
+        checker.workers = max(1, args.jobs)
+
     if args.http_report:
         broken, good = check_http_links(
             md_files,
             args.http_report,
             timeout=args.timeout,
             show_progress=not args.no_progress,
+            checker=checker,
         )
         if broken:
             logger.warning("Found %s broken links. See %s for details.", len(broken), args.http_report)
@@ -284,7 +299,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         logger.info("Recorded %s valid links.", len(good))
 
     if args.check_images:
-        findings = check_images(md_files, timeout=args.timeout)
+        findings = check_images(md_files, timeout=args.timeout, checker=checker)
         for finding in findings:
             logger.warning("Missing image in %s (line %s): %s [%s]", finding.file, finding.lineno, finding.target, finding.error)
         logger.info("Image check finished: %s issues detected.", len(findings))
@@ -313,6 +328,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             logger.info("TODO in %s (line %s): %s", todo.file, todo.lineno, todo.line)
         logger.info("TODO scan finished: %s entries found.", len(todos))
 
+    checker.close()
     return 0
 
 
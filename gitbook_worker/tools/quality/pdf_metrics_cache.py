@@ -0,0 +1,254 @@
+"""On-disk cache for the per-PDF results of ``editorial_metrics.analyze_pdf``.
+
+Quality runs re-read every published PDF even when it is byte-identical to
+the previous run.  This cache stores the metrics and findings of one PDF
+under a key made of the PDF content hash, the artifact path, the acceptance
+profile and the analysing code, so unchanged books are answered from disk.
+Build-log findings are not part of an entry because logs change independently
+of the PDF.  Entries are plain JSON and can be listed with::
+
+    python -m gitbook_worker.tools.quality.pdf_metrics_cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+from gitbook_worker import __version__
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.quality.editorial_common import (
+    AcceptanceProfile,
+    Finding,
+    utc_now_iso,
+)
+from gitbook_worker.tools.utils.cache import (
+    env_int,
+    file_sha256,
+    prune_lru_entries,
+    resolve_cache_dir,
+)
+
+logger = get_logger(__name__)
+
+PDF_METRICS_CACHE_DIR_ENV = "GITBOOK_WORKER_PDF_METRICS_CACHE_DIR"
+PDF_METRICS_CACHE_MAX_ENTRIES_ENV = "GITBOOK_WORKER_PDF_METRICS_CACHE_MAX_ENTRIES"
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_AGE_DAYS = 30
+
+_KEY_VERSION = 1
+
+# Modules whose behaviour is baked into cached metrics (relative to tools/).
+_SOURCE_MODULES = (
+    "quality/editorial_metrics.py",
+    "quality/editorial_common.py",
+    "testing/pdf_analysis.py",
+    "testing/pdf_validator.py",
+)
+
+
+@lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    digest = hashlib.sha256()
+    tools_dir = Path(__file__).resolve().parent.parent
+    for name in _SOURCE_MODULES:
+        try:
+            digest.update((tools_dir / name).read_bytes())
+        except OSError:
+            digest.update(f"<missing:{name}>".encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class PdfMetricsCache:
+    """Directory of ``analyze_pdf`` results addressed by PDF hash and profile."""
+
+    root: Path
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS
+    hits: int = 0
+    misses: int = 0
+
+    @classmethod
+    def from_env(cls, root: Optional[Path] = None) -> "PdfMetricsCache":
+        """Create a cache honouring ``GITBOOK_WORKER_PDF_METRICS_CACHE_*``."""
+
+        explicit = root or os.getenv(PDF_METRICS_CACHE_DIR_ENV) or None
+        return cls(
+            root=resolve_cache_dir("pdf-metrics", Path(explicit) if explicit else None),
+            max_entries=env_int(PDF_METRICS_CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES),
+        )
+
+    @staticmethod
+    def content_hash(pdf_path: Path) -> Optional[str]:
+        """Return the SHA-256 of ``pdf_path`` or ``None`` if it is unreadable."""
+
+        try:
+            return file_sha256(pdf_path)
+        except OSError:
+            return None
+
+    def key(self, content: str, artifact: str, profile: AcceptanceProfile) -> str:
+        """Return the cache key for a PDF with SHA-256 ``content``.
+
+        ``artifact`` (the report-relative path) is part of the key because it
+        appears in every finding.  Whether ``pdffonts`` is installed is part
+        of it too, since font metrics come from poppler when available.
+        """
+
+        payload = {
+            "version": _KEY_VERSION,
+            "worker_version": __version__,
+            "source": _source_fingerprint(),
+            "artifact": artifact,
+            "content": content,
+            "profile": profile.to_dict(),
+            "pdffonts": shutil.which("pdffonts") is not None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> Optional[tuple[dict[str, Any], list[Finding]]]:
+        """Return cached ``(metrics, findings)`` for ``key`` and count the lookup."""
+
+        entry = self._entry(key)
+        try:
+            data = json.loads(entry.read_text(encoding="utf-8"))
+            metrics = dict(data["metrics"])
+            findings = [Finding(**finding) for finding in data["findings"]]
+            os.utime(entry, None)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return metrics, findings
+
+    def store(
+        self,
+        key: str,
+        metrics: Mapping[str, Any],
+        findings: Sequence[Finding],
+        *,
+        pdf_sha256: str | None = None,
+    ) -> None:
+        entry = self._entry(key)
+        payload = {
+            "key": key,
+            "stored_at": utc_now_iso(),
+            "worker_version": __version__,
+            "artifact": metrics.get("path"),
+            "pdf_sha256": pdf_sha256,
+            "metrics": dict(metrics),
+            "findings": [finding.to_dict() for finding in findings],
+        }
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            staging = entry.with_suffix(f".{os.getpid()}.tmp")
+            staging.write_text(
+                json.dumps(payload, ensure_ascii=False, default=str), encoding="utf-8"
+            )
+            os.replace(staging, entry)
+        except OSError as exc:
+            logger.warning("⚠ Konnte PDF-Metriken nicht cachen: %s", exc)
+
+    def entries(self) -> list[Path]:
+        return sorted(self.root.glob("*/*.json"))
+
+    def iter_entries(self) -> Iterator[dict[str, Any]]:
+        """Yield a compact summary of every readable entry (newest first)."""
+
+        paths = sorted(
+            self.entries(), key=lambda path: path.stat().st_mtime, reverse=True
+        )
+        for path in paths:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                metrics = data.get("metrics") or {}
+                yield {
+                    "key": data.get("key") or path.stem,
+                    "artifact": data.get("artifact"),
+                    "pdf_sha256": data.get("pdf_sha256"),
+                    "stored_at": data.get("stored_at"),
+                    "worker_version": data.get("worker_version"),
+                    "pages_total": metrics.get("pages_total"),
+                    "findings_total": len(data.get("findings") or ()),
+                }
+            except (OSError, ValueError, AttributeError):
+                continue
+
+    def prune(self) -> int:
+        removed = prune_lru_entries(
+            self.entries(),
+            max_entries=self.max_entries,
+            max_age_days=self.max_age_days,
+        )
+        if removed:
+            logger.info(
+                "🧹 PDF-Metrik-Cache: %d Einträge entfernt (%s)", removed, self.root
+            )
+        return removed
+
+    def log_stats(self, label: str = "") -> None:
+        """Log and reset the hit/miss counters (one summary per metrics run)."""
+
+        if self.hits or self.misses:
+            logger.info(
+                "♻ PDF-Metrik-Cache%s: %d wiederverwendet, %d analysiert",
+                f" ({label})" if label else "",
+                self.hits,
+                self.misses,
+            )
+            if self.misses:
+                self.prune()
+        self.hits = self.misses = 0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="List cached editorial PDF metrics.")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=f"Cache directory (default: ${PDF_METRICS_CACHE_DIR_ENV} or the user cache)",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the entries as JSON lines"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    cache = PdfMetricsCache.from_env(args.cache_dir)
+    for entry in cache.iter_entries():
+        if args.json:
+            print(json.dumps(entry, ensure_ascii=False))
+        else:
+            print(
+                f"{entry['stored_at'] or '-':<25} "
+                f"{str(entry['pdf_sha256'] or '')[:12]:<12} "
+                f"pages={entry['pages_total']} findings={entry['findings_total']} "
+                f"{entry['artifact']}"
+            )
+    return 0
+
+
+__all__ = [
+    "PDF_METRICS_CACHE_DIR_ENV",
+    "PDF_METRICS_CACHE_MAX_ENTRIES_ENV",
+    "PdfMetricsCache",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,278 @@
+"""Concurrent HTTP status checks with a persistent URL status cache.
+
+``link_audit.check_http_links`` used to issue one ``requests.head`` (plus a
+``GET`` fallback) per URL occurrence, serially and without a session, so a
+DOI cited in 40 chapters cost 40 round trips on every run.  :class:`UrlChecker`
+deduplicates the URLs, checks them on a thread pool that shares one pooled
+``requests.Session`` and limits the concurrency and request rate per host.
+Healthy results are kept in ``~/.cache/gitbook-worker/urls/status.json``
+(:class:`UrlStatusCache`) for a configurable TTL, so recently verified links
+are not requested again; broken links are always re-checked.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+import tqdm
+from requests.adapters import HTTPAdapter
+
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import env_int, resolve_cache_dir
+
+logger = get_logger(__name__)
+
+URL_CACHE_DIR_ENV = "GITBOOK_WORKER_URL_CACHE_DIR"
+URL_CACHE_TTL_ENV = "GITBOOK_WORKER_URL_CACHE_TTL_HOURS"
+LINK_CHECK_JOBS_ENV = "GITBOOK_WORKER_LINK_CHECK_JOBS"
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_JOBS = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_HOST_INTERVAL = 0.1
+DEFAULT_TTL_HOURS = 24
+
+_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class UrlStatus:
+    """Outcome of one URL check (``status_code`` is ``None`` on errors)."""
+
+    url: str
+    status_code: Optional[int]
+    reason: str
+    checked_at: float
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code is not None and self.status_code < 400
+
+
+@dataclass
+class UrlStatusCache:
+    """Persistent ``url -> [status, reason, checked_at]`` map with a TTL."""
+
+    path: Path
+    ttl_seconds: float = DEFAULT_TTL_HOURS * 3600
+    entries: Dict[str, List] = field(default_factory=dict)
+    _dirty: Dict[str, List] = field(default_factory=dict, repr=False)
+    _loaded: bool = field(default=False, repr=False)
+
+    @classmethod
+    def from_env(cls, root: Optional[Path] = None) -> "UrlStatusCache":
+        """Create a cache honouring ``GITBOOK_WORKER_URL_CACHE_*``."""
+
+        explicit = root or os.getenv(URL_CACHE_DIR_ENV) or None
+        directory = resolve_cache_dir("urls", Path(explicit) if explicit else None)
+        return cls(
+            path=directory / "status.json",
+            ttl_seconds=env_int(URL_CACHE_TTL_ENV, DEFAULT_TTL_HOURS) * 3600,
+        )
+
+    def _read(self) -> Dict[str, List]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+            return {}
+        urls = payload.get("urls")
+        return urls if isinstance(urls, dict) else {}
+
+    def get(self, url: str) -> Optional[UrlStatus]:
+        """Return the cached status of ``url`` if it was verified within the TTL."""
+
+        if not self._loaded:
+            self.entries = {**self._read(), **self.entries}
+            self._loaded = True
+        entry = self.entries.get(url)
+        if not entry or time.time() - entry[2] > self.ttl_seconds:
+            return None
+        return UrlStatus(url, entry[0], entry[1], entry[2], cached=True)
+
+    def put(self, status: UrlStatus) -> None:
+        """Remember ``status`` if the URL answered successfully."""
+
+        if not status.ok:
+            self.entries.pop(status.url, None)
+            return
+        entry = [status.status_code, status.reason, status.checked_at]
+        self.entries[status.url] = entry
+        self._dirty[status.url] = entry
+
+    def flush(self) -> None:
+        """Merge new entries into the cache file and drop expired ones."""
+
+        if not self._dirty:
+            return
+        now = time.time()
+        merged = {
+            url: entry
+            for url, entry in {**self._read(), **self._dirty}.items()
+            if now - entry[2] <= self.ttl_seconds
+        }
+        payload = {"version": _CACHE_VERSION, "urls": merged}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self.path.with_suffix(f".{os.getpid()}.tmp")
+            staging.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(staging, self.path)
+        except OSError as exc:
+            logger.warning("⚠ Konnte URL-Status-Cache nicht speichern: %s", exc)
+            return
+        self.entries = merged
+        self._dirty.clear()
+
+
+class _HostLimiter:
+    """Bound concurrent requests and their spacing per host."""
+
+    def __init__(self, per_host: int, interval: float) -> None:
+        self._per_host = max(1, per_host)
+        self._interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._slots: Dict[str, threading.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def acquire(self, host: str) -> None:
+        with self._lock:
+            slot = self._slots.setdefault(host, threading.Semaphore(self._per_host))
+        slot.acquire()
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+    def release(self, host: str) -> None:
+        self._slots[host].release()
+
+
+@dataclass
+class UrlChecker:
+    """Check URLs concurrently with one pooled session and per-host limits."""
+
+    timeout: float = DEFAULT_TIMEOUT
+    workers: int = DEFAULT_JOBS
+    per_host: int = DEFAULT_PER_HOST
+    host_interval: float = DEFAULT_HOST_INTERVAL
+    cache: Optional[UrlStatusCache] = None
+    _session: Optional[requests.Session] = field(default=None, repr=False)
+
+    @classmethod
+    def from_env(
+        cls, *, timeout: float = DEFAULT_TIMEOUT, use_cache: bool = True
+    ) -> "UrlChecker":
+        """Create a checker honouring ``GITBOOK_WORKER_LINK_CHECK_JOBS``."""
+
+        return cls(
+            timeout=timeout,
+            workers=max(1, env_int(LINK_CHECK_JOBS_ENV, DEFAULT_JOBS)),
+            cache=UrlStatusCache.from_env() if use_cache else None,
+        )
+
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.workers, pool_maxsize=self.workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _request(self, url: str) -> UrlStatus:
+        session = self._get_session()
+        try:
+            response = session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code >= 400 or response.status_code == 405:
+                # Some servers reject HEAD; only the status line is needed.
+                response = session.get(
+                    url, timeout=self.timeout, allow_redirects=True, stream=True
+                )
+            response.close()
+        except Exception as exc:  # noqa: BLE001 - we want to record all failures
+            logger.debug("Request for %s failed: %s", url, exc)
+            return UrlStatus(url, None, "request failed", time.time())
+        return UrlStatus(url, response.status_code, response.reason or "", time.time())
+
+    def check(self, url: str, limiter: Optional[_HostLimiter] = None) -> UrlStatus:
+        host = urlsplit(url).netloc.lower()
+        limiter = limiter or _HostLimiter(self.per_host, self.host_interval)
+        limiter.acquire(host)
+        try:
+            return self._request(url)
+        finally:
+            limiter.release(host)
+
+    def check_many(
+        self, urls: Iterable[str], *, show_progress: bool = False
+    ) -> Dict[str, UrlStatus]:
+        """Return the status of every distinct URL in ``urls``.
+
+        Cached URLs are answered without a request; the rest run on a thread
+        pool of ``workers`` threads. The cache is written once at the end.
+        """
+
+        results: Dict[str, UrlStatus] = {}
+        pending: List[str] = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url) if self.cache is not None else None
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+        if results:
+            logger.info(
+                "♻ URL-Cache: %d von %d URLs kürzlich geprüft",
+                len(results),
+                len(results) + len(pending),
+            )
+
+        self._get_session()
+        limiter = _HostLimiter(self.per_host, self.host_interval)
+        workers = max(1, min(self.workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self.check, url, limiter) for url in pending]
+            for future in tqdm.tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="URLs",
+                unit="url",
+                disable=not show_progress,
+            ):
+                status = future.result()
+                results[status.url] = status
+                if self.cache is not None:
+                    self.cache.put(status)
+        if self.cache is not None:
+            self.cache.flush()
+        return results
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+__all__ = [
+    "LINK_CHECK_JOBS_ENV",
+    "URL_CACHE_DIR_ENV",
+    "URL_CACHE_TTL_ENV",
+    "UrlChecker",
+    "UrlStatus",
+    "UrlStatusCache",
+]
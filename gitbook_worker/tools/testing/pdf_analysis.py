@@ -0,0 +1,185 @@
+"""Single-pass PDF analysis shared by editorial metrics and the PDF validator.
+
+``editorial_metrics.analyze_pdf`` used to walk every page for text, then open
+the PDF again for the outline and a third time for font resources, and
+``pdf_validator`` parsed it once more for fonts and text.  For long books the
+pure-Python page walk dominates, so this module reads each page exactly once
+and collects page size, text and font resources together.  Page ranges are
+spread over a process pool for large documents; the outline is flattened
+from the same reader.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+from pypdf import PdfReader
+
+from gitbook_worker.core.ports.pdf_toc import PdfTocEntry
+from gitbook_worker.tools.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PDF_JOBS_ENV = "GITBOOK_WORKER_PDF_JOBS"
+DEFAULT_CHUNK_PAGES = 64
+
+
+@dataclass(frozen=True)
+class PdfPageInfo:
+    """Geometry and extracted text of one page (1-based ``number``)."""
+
+    number: int
+    width_pt: float
+    height_pt: float
+    text: str
+
+
+@dataclass(frozen=True)
+class PdfAnalysis:
+    """Everything the quality tools need from one read of a PDF."""
+
+    path: Path
+    pages: tuple[PdfPageInfo, ...]
+    toc_entries: tuple[PdfTocEntry, ...]
+    resource_fonts: tuple[Any, ...]
+    font_error: str | None = None
+
+    @property
+    def text(self) -> str:
+        """Concatenated page text (same as ``pdf_validator.extract_pdf_text``)."""
+
+        return "\n".join(page.text for page in self.pages)
+
+    def pypdf_fonts(self) -> list[Any]:
+        """Return the page-resource fonts; raise if they could not be read."""
+
+        if self.font_error:
+            raise RuntimeError(self.font_error)
+        return list(self.resource_fonts)
+
+
+@dataclass(frozen=True)
+class _PageRangeResult:
+    pages: tuple[PdfPageInfo, ...]
+    fonts: tuple[Any, ...]
+    font_error: str | None
+
+
+def _analyze_pages(reader: Any, start: int, end: int) -> _PageRangeResult:
+    from gitbook_worker.tools.testing.pdf_validator import page_resource_fonts
+
+    pages: list[PdfPageInfo] = []
+    fonts: list[Any] = []
+    font_error: str | None = None
+    for index in range(start, end):
+        page = reader.pages[index]
+        pages.append(
+            PdfPageInfo(
+                number=index + 1,
+                width_pt=float(page.mediabox.width),
+                height_pt=float(page.mediabox.height),
+                text=page.extract_text() or "",
+            )
+        )
+        if font_error is None:
+            try:
+                fonts.extend(page_resource_fonts(page))
+            except Exception as exc:  # noqa: BLE001 - diagnostics only
+                font_error = f"page {index + 1}: {exc}"
+    return _PageRangeResult(tuple(pages), tuple(fonts), font_error)
+
+
+def _analyze_page_range(pdf_path: str, start: int, end: int) -> _PageRangeResult:
+    return _analyze_pages(PdfReader(pdf_path), start, end)
+
+
+def _resolve_pdf_jobs(workers: int | None, chunks: int) -> int:
+    if workers is None:
+        raw = os.environ.get(PDF_JOBS_ENV, "").strip()
+        try:
+            workers = int(raw) if raw else 0
+        except ValueError:
+            workers = 0
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, chunks))
+
+
+def _outline_entries(reader: Any) -> tuple[PdfTocEntry, ...]:
+    from gitbook_worker.adapters.pdf.pypdf_toc_extractor import PyPdfTocExtractor
+
+    try:
+        return tuple(PyPdfTocExtractor().extract_from_reader(reader))
+    except Exception as exc:  # noqa: BLE001 - same tolerance as extract_pdf_toc
+        logger.debug("PDF-Outline nicht lesbar: %s", exc)
+        return ()
+
+
+def analyze_pdf_document(
+    pdf_path: Path | str,
+    *,
+    reader: Any | None = None,
+    workers: int | None = None,
+    chunk_pages: int = DEFAULT_CHUNK_PAGES,
+) -> PdfAnalysis:
+    """Read ``pdf_path`` once and return pages, outline and font resources.
+
+    ``reader`` reuses an already opened ``PdfReader``.  Documents with more
+    than ``chunk_pages`` pages are split into page ranges that worker
+    processes (``GITBOOK_WORKER_PDF_JOBS``, default: one per CPU) read
+    independently; parser errors propagate like a sequential read.
+    """
+
+    from gitbook_worker.tools.testing.pdf_validator import _dedupe_fonts
+
+    path = Path(pdf_path)
+    reader = reader if reader is not None else PdfReader(str(path))
+    page_count = len(reader.pages)
+    chunk_pages = max(1, chunk_pages)
+    ranges: Sequence[tuple[int, int]] = [
+        (start, min(start + chunk_pages, page_count))
+        for start in range(0, page_count, chunk_pages)
+    ]
+    jobs = _resolve_pdf_jobs(workers, len(ranges)) if ranges else 1
+
+    if jobs == 1:
+        results = [_analyze_pages(reader, start, end) for start, end in ranges]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        logger.info(
+            "📄 Analysiere %d PDF-Seiten in %d Prozessen: %s", page_count, jobs, path
+        )
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(
+                pool.map(
+                    _analyze_page_range,
+                    [str(path)] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                )
+            )
+
+    return PdfAnalysis(
+        path=path,
+        pages=tuple(page for result in results for page in result.pages),
+        toc_entries=_outline_entries(reader),
+        resource_fonts=tuple(
+            _dedupe_fonts(font for result in results for font in result.fonts)
+        ),
+        font_error=next(
+            (result.font_error for result in results if result.font_error), None
+        ),
+    )
+
+
+__all__ = [
+    "DEFAULT_CHUNK_PAGES",
+    "PDF_JOBS_ENV",
+    "PdfAnalysis",
+    "PdfPageInfo",
+    "analyze_pdf_document",
+]
@@ -18,6 +18,7 @@ from typing import Iterable, Mapping, Sequence
 from pypdf import PdfReader
 
 from gitbook_worker.tools.publishing.font_config import FontConfigLoader
+from gitbook_worker.tools.testing.pdf_analysis import PdfAnalysis, analyze_pdf_document
 
 DEFAULT_REQUIRED_FONT_KEYS = ("EMOJI", "CJK")
 DEFAULT_REQUIRED_TEXT_RANGES = ("CJK",)
@@ -153,8 +154,19 @@ def parse_pdffonts_output(output: str) -> list[FontInfo]:
     return _dedupe_fonts(fonts)
 
 
-def extract_pdf_fonts(pdf_path: Path) -> list[FontInfo]:
-    """Extract fonts with pdffonts first, then pypdf as fallback."""
+def extract_pdf_fonts(
+    pdf_path: Path, *, analysis: PdfAnalysis | None = None
+) -> list[FontInfo]:
+    """Extract fonts with pdffonts first, then pypdf as fallback.
+
+    With an ``analysis`` from :func:`analyze_pdf_document` the fallback uses
+    the fonts collected in that pass instead of parsing the PDF again.
+    """
+
+    def fallback() -> list[FontInfo]:
+        if analysis is not None:
+            return analysis.pypdf_fonts()
+        return extract_pdf_fonts_with_pypdf(pdf_path)
 
     try:
         completed = subprocess.run(
@@ -164,10 +176,10 @@ def extract_pdf_fonts(pdf_path: Path) -> list[FontInfo]:
             encoding="utf-8",
         )
     except (FileNotFoundError, subprocess.CalledProcessError):
-        return extract_pdf_fonts_with_pypdf(pdf_path)
+        return fallback()
 
     parsed = parse_pdffonts_output(completed.stdout)
-    return parsed or extract_pdf_fonts_with_pypdf(pdf_path)
+    return parsed or fallback()
 
 
 def extract_pdf_fonts_with_pypdf(pdf_path: Path) -> list[FontInfo]:
@@ -176,27 +188,34 @@ def extract_pdf_fonts_with_pypdf(pdf_path: Path) -> list[FontInfo]:
     reader = PdfReader(str(pdf_path))
     fonts: list[FontInfo] = []
     for page in reader.pages:
-        resources = page.get("/Resources")
-        if not resources:
-            continue
-        page_fonts = resources.get("/Font")
-        if not page_fonts:
-            continue
-        font_dict = page_fonts.get_object()
-        for font_ref in font_dict.values():
-            font_obj = font_ref.get_object()
-            fonts.append(
-                FontInfo(
-                    name=str(font_obj.get("/BaseFont", "Unknown")),
-                    font_type=str(font_obj.get("/Subtype", "Unknown")),
-                    encoding=str(font_obj.get("/Encoding", "")) or None,
-                    embedded=_font_object_is_embedded(font_obj),
-                    source="pypdf",
-                )
-            )
+        fonts.extend(page_resource_fonts(page))
     return _dedupe_fonts(fonts)
 
 
+def page_resource_fonts(page: object) -> list[FontInfo]:
+    """Return the fonts referenced by one pypdf page's resources."""
+
+    resources = page.get("/Resources")
+    if not resources:
+        return []
+    page_fonts = resources.get("/Font")
+    if not page_fonts:
+        return []
+    fonts: list[FontInfo] = []
+    for font_ref in page_fonts.get_object().values():
+        font_obj = font_ref.get_object()
+        fonts.append(
+            FontInfo(
+                name=str(font_obj.get("/BaseFont", "Unknown")),
+                font_type=str(font_obj.get("/Subtype", "Unknown")),
+                encoding=str(font_obj.get("/Encoding", "")) or None,
+                embedded=_font_object_is_embedded(font_obj),
+                source="pypdf",
+            )
+        )
+    return fonts
+
+
 def extract_pdf_text(pdf_path: Path) -> str:
     """Extract concatenated PDF text using pypdf."""
 
@@ -285,13 +304,23 @@ def validate_pdf_font_gate(
     log_paths: Sequence[Path | str] | None = None,
     forbidden_log_patterns: Sequence[str] = DEFAULT_FORBIDDEN_LOG_PATTERNS,
     fail_on_log_pattern: bool = False,
+    analysis: PdfAnalysis | None = None,
 ) -> PDFValidationResult:
-    """Validate that configured fonts and text ranges are visible in a PDF."""
+    """Validate that configured fonts and text ranges are visible in a PDF.
+
+    Fonts not passed explicitly come from pdffonts; only the text requires an
+    :func:`analyze_pdf_document` pass (skipped when ``text`` or ``analysis``
+    is given), whose resource fonts then also serve as pdffonts fallback.
+    """
 
     path = Path(pdf_path)
     expected_fonts = load_expected_fonts(fonts_config_path, required_font_keys)
-    extracted_fonts = tuple(fonts if fonts is not None else extract_pdf_fonts(path))
-    extracted_text = text if text is not None else extract_pdf_text(path)
+    if analysis is None and text is None:
+        analysis = analyze_pdf_document(path)
+    extracted_fonts = tuple(
+        fonts if fonts is not None else extract_pdf_fonts(path, analysis=analysis)
+    )
+    extracted_text = text if text is not None else analysis.text
     text_ranges = count_unicode_ranges(extracted_text, required_text_ranges)
     forbidden_log_matches = tuple(
         scan_forbidden_log_patterns(log_paths, forbidden_log_patterns)
@@ -1,27 +1,72 @@
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
-from typing import Any, Iterable, List, Mapping
+from typing import Any, Iterable, List, Mapping, Sequence, Tuple
 
-from gitbook_worker.core.application.svg_to_pdf import ensure_svg_pdf
+from gitbook_worker.core.application.svg_to_pdf import ensure_svg_pdfs
 from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import link_or_copy
+from gitbook_worker.tools.utils.svg_pdf_cache import SvgPdfCache
 
 logger = get_logger(__name__)
 
+_SVG_CONVERTER_PREFERENCE = ("svglib", "cairosvg")
+
+
+def _convert_staged_svgs(
+    svg_files: Sequence[Tuple[Path, Path]], svg_cache: SvgPdfCache | None
+) -> List[bool]:
+    """Convert ``(source, staged)`` SVG pairs to PDFs next to the staged copy.
+
+    All SVGs of a folder are converted in one process-pool batch. With a cache
+    the source SVG is converted, so relative references inside it resolve.
+    """
+
+    if svg_cache is not None:
+        results = svg_cache.ensure_many(
+            [(source, staged.with_suffix(".pdf")) for source, staged in svg_files],
+            prefer=_SVG_CONVERTER_PREFERENCE,
+            log=logger,
+        )
+        return [result.converted for result in results]
+    batch = ensure_svg_pdfs(
+        [(staged, staged.with_suffix(".pdf")) for _, staged in svg_files],
+        prefer=_SVG_CONVERTER_PREFERENCE,
+        logger=logger,
+    )
+    return [item.converted for item in batch]
+
 
 def copy_assets_to_temp(
     tmp_md: Path,
     folder: Path,
     assets: Iterable[Mapping[str, Any]],
     resolved_resource_paths: List[str] | None = None,
+    svg_cache: SvgPdfCache | None = None,
 ) -> None:
     """Copy configured assets next to the temporary Markdown file.
 
     Keeps GitBook-style `.gitbook/assets` layout intact so Pandoc can resolve
     images relative to the temporary file. Non-content files are skipped.
+    Files are hardlinked (or reflinked) instead of copied where possible, so
+    the staged files must be treated as read-only. With ``svg_cache`` SVG→PDF
+    conversions are looked up by content hash instead of being redone for
+    every staging directory. ``resolved_resource_paths`` receives each
+    directory that got staged files once.
     """
 
+    # Pandoc searches resource paths as directories, so every directory that
+    # received assets is recorded once instead of every single file.
+    recorded_dirs = set(resolved_resource_paths or ())
+
+    def _record_resource_dir(staged: Path) -> None:
+        if resolved_resource_paths is None:
+            return
+        directory = str(staged.parent)
+        if directory not in recorded_dirs:
+            recorded_dirs.add(directory)
+            resolved_resource_paths.append(directory)
+
     logger.info("🔍 DEBUG assets parameter: %s", assets)
     temp_dir = Path(tmp_md).parent
     folder_path = Path(folder).resolve()
@@ -52,6 +97,7 @@ def copy_assets_to_temp(
             dest_dir = temp_dir / ".gitbook" / "assets"
             dest_dir.mkdir(parents=True, exist_ok=True)
             files_copied = 0
+            svg_files: List[Tuple[Path, Path]] = []
 
             for item in asset_path.rglob("*"):
                 if not item.is_file():
@@ -74,37 +120,33 @@ def copy_assets_to_temp(
                 logger.info("🔍 DEBUG copying asset file %s to %s", item, dest_file)
 
                 if item.suffix.lower() == ".svg":
-                    shutil.copy2(item, dest_file)
-                    pdf_dest = dest_file.with_suffix(".pdf")
-
-                    result = ensure_svg_pdf(
-                        dest_file,
-                        pdf_file=pdf_dest,
-                        prefer=("svglib", "cairosvg"),
-                        logger=logger,
-                    )
-
-                    if result.converted and pdf_dest.exists():
-                        if resolved_resource_paths is not None:
-                            resolved_resource_paths.append(str(pdf_dest))
-                    else:
-                        logger.warning(
-                            "⚠️ SVG file %s found but no converter available - "
-                            "copying as-is (LaTeX will need Inkscape)",
-                            item.name,
-                        )
-                        if resolved_resource_paths is not None:
-                            resolved_resource_paths.append(str(dest_file))
-
+                    link_or_copy(item, dest_file)
+                    # Converted below in one batch for the whole folder.
+                    svg_files.append((item, dest_file))
                     files_copied += 1
                     continue
 
-                shutil.copy2(item, dest_file)
+                link_or_copy(item, dest_file)
                 files_copied += 1
-                if resolved_resource_paths is not None:
-                    resolved_resource_paths.append(str(dest_file))
+                _record_resource_dir(dest_file)
+
+            for (item, dest_file), converted in zip(
+                svg_files, _convert_staged_svgs(svg_files, svg_cache)
+            ):
+                pdf_dest = dest_file.with_suffix(".pdf")
+                if converted and pdf_dest.exists():
+                    _record_resource_dir(pdf_dest)
+                else:
+                    logger.warning(
+                        "⚠️ SVG file %s found but no converter available - "
+                        "copying as-is (LaTeX will need Inkscape)",
+                        item.name,
+                    )
+                    _record_resource_dir(dest_file)
 
             logger.info("📋 Copied %d files from %s to temp", files_copied, asset_path)
+            if svg_cache is not None:
+                svg_cache.log_stats(asset_path.as_posix())
             continue
 
         if asset_path.is_file():
@@ -116,7 +158,6 @@ def copy_assets_to_temp(
 
             dest_file = temp_dir / rel_to_content
             dest_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(asset_path, dest_file)
-            if resolved_resource_paths is not None:
-                resolved_resource_paths.append(str(dest_file))
+            link_or_copy(asset_path, dest_file)
+            _record_resource_dir(dest_file)
             logger.info("📋 Copied asset file: %s -> %s", asset_path.name, dest_file)
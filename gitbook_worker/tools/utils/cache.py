@@ -0,0 +1,165 @@
+"""Shared helpers for the persistent caches used by the publishing toolchain."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+from gitbook_worker.tools.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_ROOT_ENV = "GITBOOK_WORKER_CACHE_DIR"
+
+_CHUNK_SIZE = 1024 * 1024
+
+# ioctl request number of Linux' FICLONE (copy-on-write clone on Btrfs/XFS).
+_FICLONE = 0x40049409
+
+
+def default_cache_root() -> Path:
+    """Return the platform cache root (``GITBOOK_WORKER_CACHE_DIR`` wins)."""
+
+    override = os.getenv(CACHE_ROOT_ENV)
+    if override:
+        return Path(override).expanduser()
+    if sys.platform == "win32":
+        root = os.getenv("LOCALAPPDATA") or (Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Application Support"
+    else:
+        root = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return Path(root) / "gitbook-worker"
+
+
+def resolve_cache_dir(name: str, explicit: Optional[Path] = None) -> Path:
+    """Return (and create) the cache directory ``name`` below the cache root."""
+
+    directory = (
+        Path(explicit).expanduser().resolve()
+        if explicit
+        else default_cache_root() / name
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer cache setting from the environment."""
+
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("⚠ Ungültiger Wert für %s=%r – nutze %d.", name, raw, default)
+        return default
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of ``path`` without loading it at once."""
+
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(source: Path, dest: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+
+        with source.open("rb") as src, dest.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except (ImportError, OSError):
+        dest.unlink(missing_ok=True)
+        return False
+    shutil.copystat(source, dest)
+    return True
+
+
+def link_or_copy(source: Path, dest: Path) -> str:
+    """Place ``source`` at ``dest`` as cheaply as the filesystem allows.
+
+    Tries a hardlink, then a copy-on-write reflink and finally falls back to
+    ``shutil.copy2``. An existing ``dest`` is replaced. Returns the method
+    used (``"link"``, ``"reflink"`` or ``"copy"``). Callers must treat
+    ``dest`` as read-only because a hardlink shares its data with ``source``.
+    """
+
+    source = Path(source)
+    dest = Path(dest)
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(source, dest)
+        return "link"
+    except OSError:
+        pass
+    if _reflink(source, dest):
+        return "reflink"
+    shutil.copy2(source, dest)
+    return "copy"
+
+
+def prune_lru_entries(
+    entries: Iterable[Path],
+    *,
+    max_entries: int,
+    max_bytes: Optional[int] = None,
+    max_age_days: int = 0,
+    sidecar_suffixes: Sequence[str] = (),
+) -> int:
+    """Delete cache entries beyond the count/size/age budget (LRU by mtime).
+
+    Callers touch entries on every hit so recently reused ones survive.
+    ``sidecar_suffixes`` name metadata files stored next to an entry that must
+    be removed together with it. Returns the number of evicted entries.
+    """
+
+    now = time.time()
+    max_age = max_age_days * 86400
+    stats = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        stats.append((stat.st_mtime, stat.st_size, entry))
+    stats.sort(reverse=True)
+
+    removed = 0
+    kept = 0
+    kept_bytes = 0
+    for mtime, size, entry in stats:
+        expired = max_age > 0 and now - mtime > max_age
+        over_count = kept >= max_entries
+        over_size = max_bytes is not None and kept_bytes + size > max_bytes
+        if expired or over_count or over_size:
+            entry.unlink(missing_ok=True)
+            for suffix in sidecar_suffixes:
+                entry.with_suffix(suffix).unlink(missing_ok=True)
+            removed += 1
+            continue
+        kept += 1
+        kept_bytes += size
+    return removed
+
+
+__all__ = [
+    "CACHE_ROOT_ENV",
+    "default_cache_root",
+    "env_int",
+    "file_sha256",
+    "link_or_copy",
+    "prune_lru_entries",
+    "resolve_cache_dir",
+]
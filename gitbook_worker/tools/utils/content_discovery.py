@@ -33,6 +33,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from gitbook_worker.tools.utils.content_snapshot import active_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -142,9 +144,18 @@ def _collect_markdown_recursive(root_dir: Path) -> List[Path]:
         markdown_files.append(readme)
 
     # Collect all other .md and .markdown files
-    for pattern in ("**/*.md", "**/*.markdown"):
-        for file_path in sorted(root_dir.glob(pattern)):
-            if file_path.is_file() and file_path not in markdown_files:
+    snapshot = active_snapshot(root_dir)
+    for suffix in (".md", ".markdown"):
+        if snapshot is not None:
+            candidates = sorted(snapshot.rglob(root_dir, suffix, files_only=True))
+        else:
+            candidates = [
+                path
+                for path in sorted(root_dir.glob(f"**/*{suffix}"))
+                if path.is_file()
+            ]
+        for file_path in candidates:
+            if file_path not in markdown_files:
                 markdown_files.append(file_path)
 
     logger.debug("Found %d markdown files in %s", len(markdown_files), root_dir)
@@ -0,0 +1,296 @@
+"""Per-run snapshot of the content tree shared by the orchestrator steps.
+
+One orchestrator run used to walk the language root again and again: the
+README step, ``build_summary_tree``, ``content_discovery``,
+``document_types.collect_documents``, ``check_frontmatter_tree`` and
+``editorial_metrics.discover_markdown_files`` each listed the directories,
+read every chapter and parsed its frontmatter on their own.
+:class:`ContentSnapshot` keeps directory listings and, per Markdown file, its
+stat, text, SHA-256, parsed frontmatter and first heading, so the steps share
+a single walk and a single read per file.
+
+The snapshot is only used while it is active (:func:`use_content_snapshot`);
+callers look it up with :func:`active_snapshot` and fall back to the
+filesystem otherwise.  Entries are validated against ``st_mtime_ns`` (and the
+size for files) on every lookup, so files written by other steps or by
+subprocesses are picked up incrementally; steps that write files in-process
+also call :func:`invalidate_content` for the affected paths.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import stat
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Collection, Iterator, Optional
+
+import yaml
+
+from gitbook_worker.tools.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Same frontmatter block as ``document_types`` has always parsed.
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """One directory entry (``is_dir`` follows symlinks like ``Path.is_dir``)."""
+
+    name: str
+    is_dir: bool
+    is_file: bool
+    is_symlink: bool
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Entries of one directory in ``os.scandir`` order."""
+
+    path: Path
+    mtime_ns: int
+    entries: tuple[SnapshotEntry, ...]
+
+
+@dataclass
+class MarkdownDocument:
+    """Text and derived metadata of one Markdown file at a given stat."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    text: str
+
+    @cached_property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+    @cached_property
+    def _frontmatter_split(self) -> tuple[Any, str]:
+        match = FRONTMATTER_PATTERN.match(self.text)
+        if not match:
+            return {}, self.text
+        try:
+            frontmatter = yaml.safe_load(match.group(1)) or {}
+        except Exception:  # noqa: BLE001 - invalid YAML counts as no frontmatter
+            frontmatter = {}
+        return frontmatter, self.text[match.end() :]
+
+    @property
+    def frontmatter(self) -> Any:
+        """Parsed frontmatter (``{}`` if missing or invalid YAML)."""
+
+        return self._frontmatter_split[0]
+
+    @property
+    def body(self) -> str:
+        """Text after the frontmatter block."""
+
+        return self._frontmatter_split[1]
+
+    @cached_property
+    def first_heading(self) -> str:
+        """Text of the first ``#`` heading in the body (``""`` if none)."""
+
+        for line in self.body.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("#"):
+                return stripped.lstrip("#").strip()
+        return ""
+
+
+@dataclass
+class ContentSnapshot:
+    """Directory listings and Markdown documents below ``root``."""
+
+    root: Path
+    hits: int = 0
+    misses: int = 0
+    _listings: dict[Path, DirectoryListing] = field(default_factory=dict, repr=False)
+    _documents: dict[Path, MarkdownDocument] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self.root = Path(os.path.abspath(self.root))
+
+    @staticmethod
+    def _key(path: Path) -> Path:
+        return Path(os.path.abspath(path))
+
+    def contains(self, path: Path) -> bool:
+        key = self._key(path)
+        return key == self.root or self.root in key.parents
+
+    def list_dir(self, path: Path) -> DirectoryListing:
+        """Return the entries of ``path``; raise ``OSError`` like ``os.scandir``."""
+
+        key = self._key(path)
+        mtime_ns = os.stat(key).st_mtime_ns
+        with self._lock:
+            listing = self._listings.get(key)
+        if listing is not None and listing.mtime_ns == mtime_ns:
+            self.hits += 1
+            return listing
+        self.misses += 1
+        entries: list[SnapshotEntry] = []
+        with os.scandir(key) as scan:
+            for entry in scan:
+                try:
+                    is_dir = entry.is_dir()
+                    is_file = entry.is_file()
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_dir = is_file = is_symlink = False
+                entries.append(SnapshotEntry(entry.name, is_dir, is_file, is_symlink))
+        listing = DirectoryListing(key, mtime_ns, tuple(entries))
+        with self._lock:
+            self._listings[key] = listing
+        return listing
+
+    def iter_dir(self, path: Path) -> Iterator[tuple[Path, SnapshotEntry]]:
+        """Yield ``(child_path, entry)`` like ``Path.iterdir`` plus type info."""
+
+        base = Path(path)
+        for entry in self.list_dir(base).entries:
+            yield base / entry.name, entry
+
+    def rglob(
+        self,
+        base: Path,
+        suffix: str = ".md",
+        *,
+        skip_dirs: Collection[str] = (),
+        files_only: bool = False,
+    ) -> Iterator[Path]:
+        """Yield entries ending in ``suffix`` like ``base.rglob("*" + suffix)``.
+
+        The order matches ``Path.rglob``: a directory's matches come before its
+        subdirectories, which are visited in listing order without following
+        symlinks.  Directories named in ``skip_dirs`` are not descended into.
+        """
+
+        base = Path(base)
+        try:
+            listing = self.list_dir(base)
+        except OSError:
+            return
+        for entry in listing.entries:
+            if entry.name.endswith(suffix) and (entry.is_file or not files_only):
+                yield base / entry.name
+        for entry in listing.entries:
+            if entry.is_dir and not entry.is_symlink and entry.name not in skip_dirs:
+                yield from self.rglob(
+                    base / entry.name,
+                    suffix,
+                    skip_dirs=skip_dirs,
+                    files_only=files_only,
+                )
+
+    def document(self, path: Path) -> MarkdownDocument:
+        """Return the Markdown document at ``path``, reading it if it changed."""
+
+        key = self._key(path)
+        info = os.stat(key)
+        if not stat.S_ISREG(info.st_mode):
+            raise IsADirectoryError(f"Not a file: {path}")
+        with self._lock:
+            document = self._documents.get(key)
+        if (
+            document is not None
+            and document.mtime_ns == info.st_mtime_ns
+            and document.size == info.st_size
+        ):
+            self.hits += 1
+            return document
+        self.misses += 1
+        document = MarkdownDocument(
+            path=key,
+            size=info.st_size,
+            mtime_ns=info.st_mtime_ns,
+            text=key.read_text(encoding="utf-8"),
+        )
+        with self._lock:
+            self._documents[key] = document
+        return document
+
+    def read_text(self, path: Path) -> str:
+        return self.document(path).text
+
+    def invalidate(self, path: Path) -> None:
+        """Forget ``path``, everything below it and its parent's listing."""
+
+        key = self._key(path)
+        with self._lock:
+            for cache in (self._documents, self._listings):
+                for cached in [p for p in cache if p == key or key in p.parents]:
+                    del cache[cached]
+            self._listings.pop(key.parent, None)
+
+    def log_stats(self) -> None:
+        if self.hits or self.misses:
+            logger.info(
+                "♻ Content-Snapshot (%s): %d Zugriffe wiederverwendet, %d gelesen",
+                self.root,
+                self.hits,
+                self.misses,
+            )
+
+
+_active: Optional[ContentSnapshot] = None
+
+
+def active_snapshot(path: Path | None = None) -> Optional[ContentSnapshot]:
+    """Return the active snapshot if there is one and it covers ``path``."""
+
+    snapshot = _active
+    if snapshot is None or (path is not None and not snapshot.contains(path)):
+        return None
+    return snapshot
+
+
+@contextmanager
+def use_content_snapshot(root: Path) -> Iterator[ContentSnapshot]:
+    """Activate a snapshot of ``root`` (or reuse an active one that covers it)."""
+
+    global _active
+    current = active_snapshot(root)
+    if current is not None:
+        yield current
+        return
+    previous = _active
+    snapshot = ContentSnapshot(root)
+    _active = snapshot
+    try:
+        yield snapshot
+    finally:
+        _active = previous
+        snapshot.log_stats()
+
+
+def invalidate_content(*paths: Path) -> None:
+    """Tell the active snapshot (if any) that ``paths`` were written or moved."""
+
+    snapshot = _active
+    if snapshot is None:
+        return
+    for path in paths:
+        snapshot.invalidate(path)
+
+
+__all__ = [
+    "ContentSnapshot",
+    "DirectoryListing",
+    "FRONTMATTER_PATTERN",
+    "MarkdownDocument",
+    "SnapshotEntry",
+    "active_snapshot",
+    "invalidate_content",
+    "use_content_snapshot",
+]
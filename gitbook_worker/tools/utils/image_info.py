@@ -1,9 +1,29 @@
+"""Image dimension probing and the persistent image metadata index.
+
+``preprocess_md.process`` needs the pixel width of every referenced image to
+pick a paper format. Dimensions are read by a header-only parser (PNG, JPEG,
+GIF, BMP, WebP) that never decodes pixel data; other formats fall back to
+Pillow's lazy ``Image.open``. :class:`ImageIndex` keeps the results keyed by
+path, size and mtime in ``~/.cache/gitbook-worker/images/index.json`` so the
+same image is probed once across chapters, language variants and builds.
+
+Warm the index for a whole asset tree::
+
+    python -m gitbook_worker.tools.utils.image_info content/.gitbook/assets
+"""
+
 from __future__ import annotations
 
+import argparse
+import json
+import os
+import struct
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import resolve_cache_dir
 
 try:  # Pillow is optional; we degrade gracefully when unavailable
     from PIL import Image  # type: ignore
@@ -12,41 +32,352 @@ except Exception:  # pragma: no cover - Pillow may be missing in some environmen
 
 logger = get_logger(__name__)
 
+IMAGE_INDEX_DIR_ENV = "GITBOOK_WORKER_IMAGE_INDEX_DIR"
+
 _VECTOR_EXTENSIONS = {".svg", ".pdf"}
+_RASTER_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".bmp",
+    ".webp",
+    ".tif",
+    ".tiff",
+}
+_INDEX_VERSION = 1
+# JPEG start-of-frame markers (C4 = DHT, C8 = JPG, CC = DAC are not frames).
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD}
+_JPEG_STANDALONE = {0x01, *range(0xD0, 0xD9)}
 
 
-def get_image_width(path: Path) -> int:
-    """Return image width in pixels or 0 if unknown.
+@dataclass(frozen=True)
+class ImageInfo:
+    """Pixel dimensions and (if recorded) resolution of a raster image."""
 
-    Vector formats (SVG/PDF) are intentionally skipped because they scale
-    without loss; we log and return 0. Raster images are probed via Pillow
-    when available. Any error yields 0 to keep preprocessing resilient.
-    """
+    width: int
+    height: int
+    dpi: Optional[Tuple[float, float]] = None
 
-    path = Path(path)
-    suffix = path.suffix.lower()
 
-    if suffix in _VECTOR_EXTENSIONS:
-        logger.info("Überspringe Größenbestimmung für Vektorbild '%s'", path)
-        return 0
+def _png_header(handle: BinaryIO) -> Optional[ImageInfo]:
+    head = handle.read(24)
+    if len(head) < 24 or head[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", head[16:24])
+    handle.seek(8 + 8 + 13 + 4)  # signature, IHDR chunk header, data, CRC
+    dpi = None
+    while True:
+        chunk = handle.read(8)
+        if len(chunk) < 8:
+            break
+        length, kind = struct.unpack(">I4s", chunk)
+        if kind in (b"IDAT", b"IEND"):
+            break
+        if kind == b"pHYs" and length == 9:
+            ppu_x, ppu_y, unit = struct.unpack(">IIB", handle.read(9))
+            if unit == 1:  # pixels per metre
+                dpi = (ppu_x * 0.0254, ppu_y * 0.0254)
+            break
+        handle.seek(length + 4, os.SEEK_CUR)
+    return ImageInfo(width, height, dpi)
+
+
+def _jpeg_header(handle: BinaryIO) -> Optional[ImageInfo]:
+    handle.seek(2)
+    dpi = None
+    while True:
+        byte = handle.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+        marker = handle.read(1)
+        while marker == b"\xff":
+            marker = handle.read(1)
+        if not marker:
+            return None
+        code = marker[0]
+        if code in _JPEG_STANDALONE:
+            continue
+        raw_length = handle.read(2)
+        if len(raw_length) < 2:
+            return None
+        length = struct.unpack(">H", raw_length)[0] - 2
+        if code in _JPEG_SOF:
+            frame = handle.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            return ImageInfo(width, height, dpi)
+        segment = handle.read(length)
+        if code == 0xE0 and segment[:5] == b"JFIF\x00" and len(segment) >= 12:
+            unit, x_density, y_density = struct.unpack(">BHH", segment[7:12])
+            if unit == 1:
+                dpi = (float(x_density), float(y_density))
+            elif unit == 2:  # dots per centimetre
+                dpi = (x_density * 2.54, y_density * 2.54)
+
+
+def _gif_header(handle: BinaryIO) -> Optional[ImageInfo]:
+    head = handle.read(10)
+    if len(head) < 10:
+        return None
+    width, height = struct.unpack("<HH", head[6:10])
+    return ImageInfo(width, height)
+
+
+def _bmp_header(handle: BinaryIO) -> Optional[ImageInfo]:
+    head = handle.read(46)
+    if len(head) < 26:
+        return None
+    dib_size = struct.unpack("<I", head[14:18])[0]
+    if dib_size == 12:
+        width, height = struct.unpack("<HH", head[18:22])
+        return ImageInfo(width, height)
+    width, height = struct.unpack("<ii", head[18:26])
+    dpi = None
+    if dib_size >= 40 and len(head) >= 46:
+        ppm_x, ppm_y = struct.unpack("<ii", head[38:46])
+        if ppm_x > 0 and ppm_y > 0:
+            dpi = (ppm_x * 0.0254, ppm_y * 0.0254)
+    return ImageInfo(width, abs(height), dpi)
 
+
+def _webp_header(handle: BinaryIO) -> Optional[ImageInfo]:
+    head = handle.read(30)
+    if len(head) < 30:
+        return None
+    kind = head[12:16]
+    if kind == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageInfo(width & 0x3FFF, height & 0x3FFF)
+    if kind == b"VP8L":
+        bits = struct.unpack("<I", head[21:25])[0]
+        return ImageInfo((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if kind == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageInfo(width, height)
+    return None
+
+
+def _pillow_header(path: Path) -> Optional[ImageInfo]:
     if not Image:
         logger.debug(
             "Pillow nicht verfügbar – überspringe Größenermittlung für %s", path
         )
-        return 0
+        return None
+    # Image.open only parses the header; pixels are decoded lazily.
+    with Image.open(path) as im:
+        dpi = im.info.get("dpi")
+        return ImageInfo(
+            int(im.width),
+            int(im.height),
+            (float(dpi[0]), float(dpi[1])) if dpi else None,
+        )
 
-    if not path.exists():
-        return 0
 
-    try:
-        abs_path = path.resolve()
-    except Exception:
-        abs_path = path
+def read_image_header(path: Path) -> Optional[ImageInfo]:
+    """Return the dimensions of raster image ``path`` without decoding pixels.
+
+    Returns ``None`` for unreadable or unsupported files.
+    """
 
+    path = Path(path)
     try:
-        with Image.open(abs_path) as im:
-            return int(im.width)
+        with path.open("rb") as handle:
+            signature = handle.read(16)
+            handle.seek(0)
+            if signature.startswith(b"\x89PNG\r\n\x1a\n"):
+                return _png_header(handle)
+            if signature.startswith(b"\xff\xd8"):
+                return _jpeg_header(handle)
+            if signature[:6] in (b"GIF87a", b"GIF89a"):
+                return _gif_header(handle)
+            if signature.startswith(b"BM"):
+                return _bmp_header(handle)
+            if signature[:4] == b"RIFF" and signature[8:12] == b"WEBP":
+                return _webp_header(handle)
+        return _pillow_header(path)
     except Exception as exc:  # pragma: no cover - best effort only
-        logger.warning("Could not open image '%s' to get size: %s", abs_path, exc)
+        logger.warning("Could not open image '%s' to get size: %s", path, exc)
+        return None
+
+
+@dataclass
+class ImageIndex:
+    """Persistent ``path -> ImageInfo`` index validated by size and mtime."""
+
+    path: Path
+    entries: Dict[str, List] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    _dirty: Dict[str, List] = field(default_factory=dict, repr=False)
+    _loaded: bool = field(default=False, repr=False)
+
+    @classmethod
+    def from_env(cls, root: Optional[Path] = None) -> "ImageIndex":
+        """Create an index honouring ``GITBOOK_WORKER_IMAGE_INDEX_DIR``."""
+
+        explicit = root or os.getenv(IMAGE_INDEX_DIR_ENV) or None
+        directory = resolve_cache_dir("images", Path(explicit) if explicit else None)
+        return cls(path=directory / "index.json")
+
+    def _read(self) -> Dict[str, List]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _INDEX_VERSION:
+            return {}
+        images = payload.get("images")
+        return images if isinstance(images, dict) else {}
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.entries = {**self._read(), **self.entries}
+            self._loaded = True
+
+    def lookup(self, image: Path) -> Optional[ImageInfo]:
+        """Return the dimensions of ``image``, parsing its header on a miss."""
+
+        self._ensure_loaded()
+        try:
+            resolved = Path(image).resolve()
+            stat = resolved.stat()
+        except OSError:
+            return None
+        key = resolved.as_posix()
+        entry = self.entries.get(key)
+        if entry and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+            self.hits += 1
+            width, height, dpi = entry[2:5]
+            return ImageInfo(width, height, tuple(dpi) if dpi else None)
+
+        self.misses += 1
+        info = read_image_header(resolved)
+        if info is None:
+            return None
+        entry = [
+            stat.st_size,
+            stat.st_mtime_ns,
+            info.width,
+            info.height,
+            list(info.dpi) if info.dpi else None,
+        ]
+        self.entries[key] = entry
+        self._dirty[key] = entry
+        return info
+
+    def warm(self, roots: Iterable[Path]) -> Tuple[int, int]:
+        """Index every raster image below ``roots``; return (images, parsed)."""
+
+        misses_before = self.misses
+        images = 0
+        for root in roots:
+            root = Path(root)
+            candidates = [root] if root.is_file() else root.rglob("*")
+            for candidate in candidates:
+                if candidate.suffix.lower() not in _RASTER_EXTENSIONS:
+                    continue
+                if candidate.is_file() and self.lookup(candidate) is not None:
+                    images += 1
+        return images, self.misses - misses_before
+
+    def flush(self) -> None:
+        """Merge new entries into the index file (other builds may have added)."""
+
+        if not self._dirty:
+            return
+        merged = {**self._read(), **self._dirty}
+        payload = {"version": _INDEX_VERSION, "images": merged}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self.path.with_suffix(f".{os.getpid()}.tmp")
+            staging.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(staging, self.path)
+        except OSError as exc:
+            logger.warning("⚠ Konnte Bild-Index nicht speichern: %s", exc)
+            return
+        logger.info(
+            "🖼 Bild-Index: %d Treffer, %d neu eingelesen (%s)",
+            self.hits,
+            self.misses,
+            self.path,
+        )
+        self.entries = merged
+        self._dirty.clear()
+        self.hits = self.misses = 0
+
+
+def get_image_info(
+    path: Path, *, index: Optional[ImageIndex] = None
+) -> Optional[ImageInfo]:
+    """Return :class:`ImageInfo` for a raster image (``None`` if unknown).
+
+    With ``index`` the result is looked up in (and recorded to) the index.
+    """
+
+    path = Path(path)
+    if path.suffix.lower() in _VECTOR_EXTENSIONS or not path.exists():
+        return None
+    if index is not None:
+        return index.lookup(path)
+    return read_image_header(path)
+
+
+def get_image_width(path: Path, *, index: Optional[ImageIndex] = None) -> int:
+    """Return image width in pixels or 0 if unknown.
+
+    Vector formats (SVG/PDF) are intentionally skipped because they scale
+    without loss; we log and return 0. Raster images are probed by a
+    header-only parser (``index`` caches the result across builds). Any error
+    yields 0 to keep preprocessing resilient.
+    """
+
+    path = Path(path)
+    if path.suffix.lower() in _VECTOR_EXTENSIONS:
+        logger.info("Überspringe Größenbestimmung für Vektorbild '%s'", path)
         return 0
+
+    info = get_image_info(path, index=index)
+    return info.width if info else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Fill the image metadata index for asset trees"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Asset directories (e.g. content/.gitbook/assets) or image files",
+    )
+    parser.add_argument(
+        "--index-dir",
+        type=Path,
+        default=None,
+        help=f"Index directory (default: {IMAGE_INDEX_DIR_ENV} or the cache root)",
+    )
+    args = parser.parse_args(argv)
+
+    index = ImageIndex.from_env(args.index_dir)
+    images, parsed = index.warm(args.paths)
+    index.flush()
+    print(f"{images} images indexed ({parsed} parsed) in {index.path}")
+
+
+__all__ = [
+    "IMAGE_INDEX_DIR_ENV",
+    "ImageIndex",
+    "ImageInfo",
+    "get_image_info",
+    "get_image_width",
+    "read_image_header",
+]
+
+
+if __name__ == "__main__":
+    main()
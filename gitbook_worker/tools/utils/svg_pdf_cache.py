@@ -0,0 +1,216 @@
+"""Content-addressed cache for SVG→PDF conversions.
+
+``asset_copy.copy_assets_to_temp`` stages ``.gitbook/assets`` into a fresh
+temporary directory for every target, so the mtime check in
+``ensure_svg_pdf`` never finds an existing PDF there and every diagram was
+reconverted with cairosvg/svglib per target and run.  This cache stores each
+conversion once under the SHA-256 of the SVG content (plus the converter
+preference) and links the result into the staging directory, so conversions
+are shared across targets, worker processes and runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from gitbook_worker.core.application.svg_to_pdf import SvgToPdfResult, ensure_svg_pdfs
+from gitbook_worker.core.ports.svg_to_pdf import SvgToPdfConverterPort
+from gitbook_worker.tools.logging_config import get_logger
+from gitbook_worker.tools.utils.cache import (
+    env_int,
+    file_sha256,
+    link_or_copy,
+    prune_lru_entries,
+    resolve_cache_dir,
+)
+
+logger = get_logger(__name__)
+
+SVG_PDF_CACHE_DIR_ENV = "GITBOOK_WORKER_SVG_PDF_CACHE_DIR"
+SVG_PDF_CACHE_MAX_ENTRIES_ENV = "GITBOOK_WORKER_SVG_PDF_CACHE_MAX_ENTRIES"
+
+DEFAULT_MAX_ENTRIES = 8192
+DEFAULT_MAX_AGE_DAYS = 30
+
+_KEY_VERSION = 1
+
+
+@dataclass
+class SvgPdfCache:
+    """Directory of converted PDFs addressed by SVG content hash."""
+
+    root: Path
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS
+    hits: int = 0
+    misses: int = 0
+
+    @classmethod
+    def from_env(cls, root: Optional[Path] = None) -> "SvgPdfCache":
+        """Create a cache honouring ``GITBOOK_WORKER_SVG_PDF_CACHE_*``."""
+
+        explicit = root or os.getenv(SVG_PDF_CACHE_DIR_ENV) or None
+        return cls(
+            root=resolve_cache_dir("svg-pdf", Path(explicit) if explicit else None),
+            max_entries=env_int(SVG_PDF_CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES),
+        )
+
+    def key(self, svg_file: Path, prefer: Sequence[str] | None = None) -> str:
+        """Return the cache key for ``svg_file`` converted with ``prefer``.
+
+        The preference is part of the key because cairosvg and svglib render
+        differently.
+        """
+
+        payload = f"{_KEY_VERSION}|{file_sha256(svg_file)}|{','.join(prefer or ())}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pdf"
+
+    def _restore(self, key: str, pdf_file: Path) -> bool:
+        entry = self._entry(key)
+        if not entry.exists():
+            return False
+        try:
+            os.utime(entry, None)
+            link_or_copy(entry, pdf_file)
+        except OSError as exc:
+            logger.warning("⚠ SVG-PDF-Cache-Eintrag %s unlesbar: %s", entry, exc)
+            return False
+        return True
+
+    def ensure(
+        self,
+        svg_file: Path,
+        pdf_file: Path,
+        *,
+        prefer: Sequence[str] | None = None,
+        converters: Iterable[SvgToPdfConverterPort] | None = None,
+        log: logging.Logger | None = None,
+    ) -> SvgToPdfResult:
+        """Place the PDF for ``svg_file`` at ``pdf_file``, converting on a miss.
+
+        ``pdf_file`` may be a hardlink to the cache entry and must not be
+        modified in place.
+        """
+
+        return self.ensure_many(
+            [(svg_file, pdf_file)],
+            prefer=prefer,
+            converters=converters,
+            workers=1,
+            log=log,
+        )[0]
+
+    def ensure_many(
+        self,
+        jobs: Sequence[Tuple[Path, Path]],
+        *,
+        prefer: Sequence[str] | None = None,
+        converters: Iterable[SvgToPdfConverterPort] | None = None,
+        workers: int | None = None,
+        log: logging.Logger | None = None,
+    ) -> List[SvgToPdfResult]:
+        """Batch variant of :meth:`ensure` for ``(svg, pdf)`` pairs.
+
+        Hits are linked right away; the distinct misses are converted in one
+        :func:`ensure_svg_pdfs` run (process pool) and then stored.
+        """
+
+        results: List[Optional[SvgToPdfResult]] = [None] * len(jobs)
+        misses: Dict[str, List[int]] = {}
+        for index, (svg_file, pdf_file) in enumerate(jobs):
+            Path(pdf_file).parent.mkdir(parents=True, exist_ok=True)
+            try:
+                key = self.key(svg_file, prefer)
+            except OSError:
+                results[index] = SvgToPdfResult(converted=False, used_converter=None)
+                continue
+            if key not in misses and self._restore(key, pdf_file):
+                self.hits += 1
+                results[index] = SvgToPdfResult(converted=True, used_converter=None)
+                continue
+            misses.setdefault(key, []).append(index)
+
+        staging: Dict[str, Path] = {}
+        for key in misses:
+            entry = self._entry(key)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            staging[key] = entry.with_name(f"{key}.{os.getpid()}.tmp")
+            # A leftover from an aborted run would look up to date.
+            staging[key].unlink(missing_ok=True)
+        self.misses += len(misses)
+
+        batch = ensure_svg_pdfs(
+            [(jobs[indices[0]][0], staging[key]) for key, indices in misses.items()],
+            prefer=prefer,
+            converters=converters,
+            workers=workers,
+            logger=log or logger,
+        )
+        for (key, indices), item in zip(misses.items(), batch):
+            converted = SvgToPdfResult(
+                converted=True, used_converter=item.used_converter
+            )
+            try:
+                if not item.converted or not staging[key].exists():
+                    converted = SvgToPdfResult(converted=False, used_converter=None)
+                else:
+                    os.replace(staging[key], self._entry(key))
+                    for index in indices:
+                        link_or_copy(self._entry(key), jobs[index][1])
+            except OSError as exc:
+                logger.warning(
+                    "⚠ Konnte SVG-PDF nicht cachen (%s): %s", item.svg_file, exc
+                )
+                converted = SvgToPdfResult(converted=False, used_converter=None)
+            finally:
+                staging[key].unlink(missing_ok=True)
+            for index in indices:
+                results[index] = converted
+        return [
+            result or SvgToPdfResult(converted=False, used_converter=None)
+            for result in results
+        ]
+
+    def entries(self) -> List[Path]:
+        return sorted(self.root.glob("*/*.pdf"))
+
+    def prune(self) -> int:
+        removed = prune_lru_entries(
+            self.entries(),
+            max_entries=self.max_entries,
+            max_age_days=self.max_age_days,
+        )
+        if removed:
+            logger.info(
+                "🧹 SVG-PDF-Cache: %d Einträge entfernt (%s)", removed, self.root
+            )
+        return removed
+
+    def log_stats(self, label: str = "") -> None:
+        """Log and reset the hit/miss counters (one summary per asset folder)."""
+
+        if self.hits or self.misses:
+            logger.info(
+                "♻ SVG-PDF-Cache%s: %d Treffer, %d Konvertierungen",
+                f" ({label})" if label else "",
+                self.hits,
+                self.misses,
+            )
+            if self.misses:
+                self.prune()
+        self.hits = self.misses = 0
+
+
+__all__ = [
+    "SVG_PDF_CACHE_DIR_ENV",
+    "SVG_PDF_CACHE_MAX_ENTRIES_ENV",
+    "SvgPdfCache",
+]
@@ -6,6 +6,8 @@ from typing import Iterable, Sequence
 
 import yaml
 
+from gitbook_worker.tools.utils.content_snapshot import active_snapshot
+
 FRONTMATTER_EXIT_CODE = 42
 _SKIP_DIRS = {"publish", "temp", ".git", ".venv", ".gitbook"}
 
@@ -40,7 +42,11 @@ def _format_snippet(block: str, err_line: int, context: int = 2) -> str:
 
 
 def check_file(path: Path) -> list[FrontmatterIssue]:
-    text = path.read_text(encoding="utf-8")
+    snapshot = active_snapshot(path)
+    if snapshot is not None:
+        text = snapshot.read_text(path)
+    else:
+        text = path.read_text(encoding="utf-8")
     block, start_line = _extract_frontmatter(text)
     if block is None:
         return []
@@ -70,6 +76,11 @@ def iter_markdown_files(
     root: Path, *, exclude_dirs: Sequence[str] | None = None
 ) -> Iterable[Path]:
     excludes = set(exclude_dirs or ()) | _SKIP_DIRS
+    snapshot = active_snapshot(root)
+    if snapshot is not None:
+        # Excluded directories are pruned instead of walked and filtered.
+        yield from snapshot.rglob(root, ".md", skip_dirs=excludes)
+        return
     for path in root.rglob("*.md"):
         try:
             rel_parts = path.relative_to(root).parts
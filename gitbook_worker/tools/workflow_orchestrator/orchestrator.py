@@ -35,6 +35,11 @@ from gitbook_worker.tools.exit_codes import add_exit_code_help, handle_exit_code
 from gitbook_worker.tools.publishing.frontmatter_config import FrontMatterConfigLoader
 from gitbook_worker.tools.publishing.readme_config import ReadmeConfigLoader
 from gitbook_worker.tools.utils import git as git_utils
+from gitbook_worker.tools.utils.content_snapshot import (
+    active_snapshot,
+    invalidate_content,
+    use_content_snapshot,
+)
 from gitbook_worker.tools.utils.language_context import resolve_language_context
 from gitbook_worker.tools.utils.smart_manifest import (
     SmartManifestError,
@@ -99,6 +104,10 @@ def _log_run_configuration(config: OrchestratorConfig) -> None:
         config.language_id,
         config.dry_run,
     )
+    LOGGER.info(
+        "config | pipeline=%s",
+        "subprocess" if _pipeline_in_subprocess(config) else "in-process",
+    )
     LOGGER.info(
         "config | repo_visibility=%s repository=%s commit=%s base=%s reset_others=%s",
         config.repo_visibility,
@@ -199,6 +208,7 @@ class OrchestratorConfig:
     quality_accepted_findings: Path | None = None
     quality_gate: bool = False
     quality_scope: str = "current"
+    pipeline_subprocess: bool = False
 
 
 class RuntimeContext:
@@ -216,6 +226,8 @@ class RuntimeContext:
         self._manifest_data = manifest_data or {}
         self._frontmatter_loader: FrontMatterConfigLoader | None = None
         self._readme_loader: ReadmeConfigLoader | None = None
+        # Extra analytics fields reported by the running step (e.g. stage timings).
+        self.step_details: dict[str, object] = {}
         github_dir = self.root / ".github"
         package_dir = self.root / "gitbook_worker"
         legacy_worker_dir = github_dir / "gitbook_worker"
@@ -670,6 +682,7 @@ def build_config(args: argparse.Namespace) -> OrchestratorConfig:
         quality_accepted_findings=getattr(args, "quality_accepted_findings", None),
         quality_gate=getattr(args, "quality_gate", False),
         quality_scope=getattr(args, "quality_scope", "current"),
+        pipeline_subprocess=getattr(args, "pipeline_subprocess", False),
     )
 
 
@@ -701,49 +714,54 @@ def run(config: OrchestratorConfig) -> None:
         ", ".join(steps) or "<none>",
     )
     analytics: list[dict] = []
-    for step in steps:
-        handler = STEP_HANDLERS.get(step)
-        if handler is None:
-            raise KeyError(f"Unbekannter Schritt: {step}")
-        started = _dt.datetime.now(_dt.timezone.utc)
-        started_perf = time.perf_counter()
-        LOGGER.info("Schritt '%s' starten", step)
-        entry: dict[str, object] = {
-            "step": step,
-            "started": started.isoformat(),
-        }
-        if ctx.config.dry_run:
-            LOGGER.info("Dry-run aktiviert – Schritt '%s' wird übersprungen", step)
-            entry.update(
-                {
-                    "status": "skipped",
-                    "duration_s": 0.0,
-                }
-            )
-            analytics.append(entry)
-            continue
+    # One content-tree snapshot serves every in-process step of this run.
+    with use_content_snapshot(ctx.root):
+        for step in steps:
+            handler = STEP_HANDLERS.get(step)
+            if handler is None:
+                raise KeyError(f"Unbekannter Schritt: {step}")
+            started = _dt.datetime.now(_dt.timezone.utc)
+            started_perf = time.perf_counter()
+            LOGGER.info("Schritt '%s' starten", step)
+            entry: dict[str, object] = {
+                "step": step,
+                "started": started.isoformat(),
+            }
+            if ctx.config.dry_run:
+                LOGGER.info("Dry-run aktiviert – Schritt '%s' wird übersprungen", step)
+                entry.update(
+                    {
+                        "status": "skipped",
+                        "duration_s": 0.0,
+                    }
+                )
+                analytics.append(entry)
+                continue
 
-        try:
-            handler(ctx)
-        except Exception as exc:
-            entry.update(
-                {
-                    "status": "failed",
-                    "duration_s": round(time.perf_counter() - started_perf, 3),
-                    "error": repr(exc),
-                }
-            )
-            analytics.append(entry)
-            _log_analytics(ctx, analytics, level=logging.ERROR)
-            raise
-        else:
-            entry.update(
-                {
-                    "status": "ok",
-                    "duration_s": round(time.perf_counter() - started_perf, 3),
-                }
-            )
-            analytics.append(entry)
+            ctx.step_details = {}
+            try:
+                handler(ctx)
+            except Exception as exc:
+                entry.update(
+                    {
+                        "status": "failed",
+                        "duration_s": round(time.perf_counter() - started_perf, 3),
+                        "error": repr(exc),
+                        **ctx.step_details,
+                    }
+                )
+                analytics.append(entry)
+                _log_analytics(ctx, analytics, level=logging.ERROR)
+                raise
+            else:
+                entry.update(
+                    {
+                        "status": "ok",
+                        "duration_s": round(time.perf_counter() - started_perf, 3),
+                        **ctx.step_details,
+                    }
+                )
+                analytics.append(entry)
     LOGGER.info("Orchestrator abgeschlossen")
     _log_analytics(ctx, analytics)
 
@@ -869,16 +887,24 @@ def _step_ensure_readme(ctx: RuntimeContext) -> None:
     )
 
     # Walk through directories in the language/content root only
-    # Use iterdir + recursion to avoid expensive is_dir() checks on large repos
+    # Use iterdir + recursion to avoid expensive is_dir() checks on large repos;
+    # the run's content snapshot already knows the entry types.
+    snapshot = active_snapshot(content_base)
+
+    def list_children(base: Path) -> list[tuple[Path, bool | None]]:
+        if snapshot is not None:
+            return [(item, entry.is_dir) for item, entry in snapshot.iter_dir(base)]
+        return [(item, None) for item in base.iterdir()]
+
     def walk_dirs(base: Path) -> list[Path]:
         """Recursively collect directories, skipping hidden ones early."""
         dirs = []
         try:
-            for item in base.iterdir():
+            for item, is_dir in list_children(base):
                 # Skip hidden items (starting with .) except content base
                 if item.name.startswith(".") and item != content_base:
                     continue
-                if item.is_dir():
+                if is_dir if is_dir is not None else item.is_dir():
                     dirs.append(item)
                     # Recurse into subdirectory
                     dirs.extend(walk_dirs(item))
@@ -929,6 +955,7 @@ def _step_ensure_readme(ctx: RuntimeContext) -> None:
         # Create the README file
         try:
             target.write_text(content, encoding="utf-8")
+            invalidate_content(target)
             if config.logging.log_created:
                 LOGGER.info("Created: %s", rel / "README.md")
         except OSError as exc:
@@ -1259,47 +1286,113 @@ def _step_engineering_docs(ctx: RuntimeContext) -> None:
         LOGGER.debug("Skipped %d files (pattern exclusion)", len(skipped_pattern))
 
 
-def _step_publisher(ctx: RuntimeContext) -> None:
-    pipeline = ctx.tools_dir / "publishing" / "pipeline.py"
-    if not pipeline.exists():
-        raise FileNotFoundError(
-            f"pipeline.py nicht gefunden unter {pipeline}; bitte Tools-Verzeichnis bereitstellen"
-        )
+def _pipeline_in_subprocess(config: OrchestratorConfig) -> bool:
+    # --isolated promises a controlled interpreter (PYTHONNOUSERSITE, PYTHONPATH),
+    # which only a separate process can provide.
+    return config.pipeline_subprocess or config.isolated
 
-    try:
-        ctx.ensure_fonts()
-    except FontSyncError as exc:
-        raise SystemExit(43) from exc
 
-    cmd: list[str] = [
-        ctx.python,
-        str(pipeline),
+def _pipeline_args(ctx: RuntimeContext) -> list[str]:
+    args: list[str] = [
         "--root",
         str(ctx.root),
         "--manifest",
         str(ctx.config.manifest),
     ]
     if ctx.config.no_gitbook_rename:
-        cmd.append("--no-gitbook-rename")
+        args.append("--no-gitbook-rename")
     if ctx.config.dry_run:
-        cmd.append("--dry-run")
+        args.append("--dry-run")
     if ctx.config.commit:
-        cmd.extend(["--commit", ctx.config.commit])
+        args.extend(["--commit", ctx.config.commit])
     if ctx.config.base:
-        cmd.extend(["--base", ctx.config.base])
+        args.extend(["--base", ctx.config.base])
     if ctx.config.reset_others:
-        cmd.append("--reset-others")
-    for arg in ctx.config.publisher_args:
-        cmd.extend(["--publisher-args", arg])
+        args.append("--reset-others")
+    # ``=`` keeps argparse from reading values such as ``--no-apt`` as options.
+    args.extend(f"--publisher-args={arg}" for arg in ctx.config.publisher_args)
+    return args
+
+
+def _raise_font_exit(ctx: RuntimeContext, exc: BaseException) -> None:
+    hint = _font_sync_hint(ctx.root, ctx.config.manifest)
+    LOGGER.error(hint)
+    print(hint, file=sys.stderr)
+    raise SystemExit(43) from exc
+
+
+def _run_pipeline_in_process(ctx: RuntimeContext) -> None:
+    """Run ``pipeline.run_pipeline`` in this process with the step environment."""
+
+    from gitbook_worker.tools.publishing import pipeline as publishing_pipeline
+
+    argv = _pipeline_args(ctx)
+    LOGGER.info("→ pipeline.run_pipeline(%s)", " ".join(shlex.quote(a) for a in argv))
+    if ctx.config.dry_run:
+        LOGGER.info("Dry-run aktiv – Pipeline wird übersprungen.")
+        return
+    args = publishing_pipeline.parse_args(argv)
+    with publishing_pipeline._preserved_process_state():
+        os.environ.update(ctx.env())
+        try:
+            try:
+                options = publishing_pipeline._resolve_options(
+                    args, manifest_data=ctx._manifest_data
+                )
+                stages = ctx.step_details.setdefault("stages", [])
+                publishing_pipeline.run_pipeline(options, timings=stages)
+            except SystemExit as exc:
+                # e.g. the frontmatter check; a subprocess run reported these
+                # as CalledProcessError, which ``run`` records as a failed step.
+                if exc.code in (None, 0):
+                    return
+                returncode = exc.code if isinstance(exc.code, int) else 1
+                raise publishing_pipeline.CommandError(
+                    f"pipeline.py failed with exit status {exc.code}", returncode
+                ) from exc
+        except publishing_pipeline.CommandError as exc:
+            if exc.returncode == 43:
+                _raise_font_exit(ctx, exc)
+            raise
+
+
+def _step_publisher(ctx: RuntimeContext) -> None:
+    pipeline = ctx.tools_dir / "publishing" / "pipeline.py"
+    if not pipeline.exists():
+        raise FileNotFoundError(
+            f"pipeline.py nicht gefunden unter {pipeline}; bitte Tools-Verzeichnis bereitstellen"
+        )
+
+    try:
+        ctx.ensure_fonts()
+    except FontSyncError as exc:
+        raise SystemExit(43) from exc
+
+    # In-process execution uses the imported package; a different (legacy)
+    # tools directory is only reachable through its own interpreter.
+    bundled = Path(__file__).resolve().parents[1] / "publishing" / "pipeline.py"
+    is_bundled = pipeline.resolve() == bundled
+    if is_bundled and not _pipeline_in_subprocess(ctx.config):
+        _run_pipeline_in_process(ctx)
+        return
+
+    cmd: list[str] = [ctx.python, str(pipeline), *_pipeline_args(ctx)]
+    if is_bundled:
+        cmd.append("--subprocess")
+    stage: dict[str, object] = {"stage": "pipeline", "mode": "subprocess"}
+    ctx.step_details["stages"] = [stage]
+    started = time.perf_counter()
     try:
         ctx.run_command(cmd)
     except subprocess.CalledProcessError as exc:
+        stage["status"] = "failed"
         if exc.returncode == 43:
-            hint = _font_sync_hint(ctx.root, ctx.config.manifest)
-            LOGGER.error(hint)
-            print(hint, file=sys.stderr)
-            raise SystemExit(43) from exc
+            _raise_font_exit(ctx, exc)
         raise
+    else:
+        stage["status"] = "ok"
+    finally:
+        stage["duration_s"] = round(time.perf_counter() - started, 3)
 
 
 def _quality_content_build_enabled(entry: ContentEntry) -> bool:
@@ -1598,6 +1691,14 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="GitBook-Rename-Schritt überspringen (wird an pipeline.py weitergereicht)",
     )
+    run_parser.add_argument(
+        "--pipeline-subprocess",
+        action="store_true",
+        help=(
+            "Publishing-Pipeline (GitBook-Schritte und publisher.py) in eigenen "
+            "Python-Prozessen statt im Orchestrator-Prozess ausführen"
+        ),
+    )
     run_parser.add_argument(
         "--dry-run",
         action="store_true",